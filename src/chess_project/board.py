@@ -6,6 +6,8 @@ import copy
 from typing import Optional
 from .pieces import Piece, Pawn, Rook, Knight, Queen, King, Bishop
 from .move import Move
+from .fen import START_FEN, format_fen, parse_fen
+from .position_hash import CASTLING_KEYS, EN_PASSANT_KEYS, hash_squares
 
 
 class Board:
@@ -13,6 +15,11 @@ class Board:
 
     Attribute:
         squares: enthält den Wert einer Figur auf einem Schachbrett
+        turn: Spieler am Zug ('white' oder 'black')
+        en_passant_square: Zielfeld eines möglichen En-passant-Schlags (oder None)
+        halfmove_clock: Halbzüge seit dem letzten Bauernzug oder Schlag
+        fullmove_number: Nummer des aktuellen Zugs (beginnt bei 1)
+        position_history: position_key() jeder Stellung seit Spielbeginn
     """
 
     def __init__(self):
@@ -27,11 +34,200 @@ class Board:
         self.white_king = None
         self.black_king = None
 
+        # Stellungsdaten für FEN (werden von make_move fortgeschrieben)
+        self.turn = 'white'
+        self.en_passant_square: Optional[tuple] = None
+        self.halfmove_clock = 0
+        self.fullmove_number = 1
+
+        # Stapel der Stellungs-Hashes (für Stellungswiederholung), None bei
+        # Kopien aus deep_copy
+        self.position_history: Optional[list[int]] = []
+
+    @classmethod
+    def from_fen(cls, fen: str = START_FEN) -> 'Board':
+        """Baut ein Board aus einem FEN-String auf.
+
+        Die Rochaderechte werden auf die moved-Flags von König und Türmen
+        abgebildet, Bauern außerhalb ihrer Grundreihe gelten als gezogen.
+
+        Args:
+            fen: FEN-String (Halbzug- und Zugnummer optional)
+
+        Returns:
+            Neues Board
+
+        Raises:
+            ValueError: bei ungültigem FEN oder nicht genau einem König je Farbe
+        """
+        position = parse_fen(fen)
+        board = cls()
+        piece_classes = {'K': King, 'Q': Queen, 'R': Rook, 'B': Bishop, 'N': Knight, 'P': Pawn}
+
+        for row, col, color, notation in position.pieces:
+            piece = piece_classes[notation](color, (row, col))
+            board.squares[row, col] = piece
+            (board.white_pieces if color == 'white' else board.black_pieces).append(piece)
+
+            if notation == 'K':
+                if (board.white_king if color == 'white' else board.black_king) is not None:
+                    raise ValueError(f'Mehr als ein König für {color}!')
+                if color == 'white':
+                    board.white_king = piece
+                else:
+                    board.black_king = piece
+            elif notation == 'P':
+                piece.moved = row != (6 if color == 'white' else 1)
+            elif notation == 'R':
+                piece.moved = True
+
+        if board.white_king is None or board.black_king is None:
+            raise ValueError('FEN braucht einen König je Farbe!')
+
+        # Rochaderechte -> moved-Flags
+        for king, home_row, rights in ((board.white_king, 7, 'KQ'), (board.black_king, 0, 'kq')):
+            king.moved = True
+            if king.position != (home_row, 4):
+                continue
+            for right, rook_col in zip(rights, (7, 0)):
+                rook = board.squares[home_row, rook_col]
+                if right in position.castling and isinstance(rook, Rook) and rook.color == king.color:
+                    rook.moved = False
+                    king.moved = False
+
+        board.turn = position.turn
+        board.en_passant_square = position.en_passant
+        board.halfmove_clock = position.halfmove_clock
+        board.fullmove_number = position.fullmove_number
+        board.record_position()
+        return board
+
+    def to_fen(self) -> str:
+        """Gibt die Stellung als FEN-String zurück.
+
+        Rochaderechte werden aus den moved-Flags von König und Türmen abgeleitet.
+        """
+        return format_fen(
+            self.squares,
+            turn=self.turn,
+            castling=self.castling_rights(),
+            en_passant=self.en_passant_square,
+            halfmove_clock=self.halfmove_clock,
+            fullmove_number=self.fullmove_number,
+        )
+
+    def castling_rights(self) -> str:
+        """Gibt die Rochaderechte im FEN-Format zurück (z.B. "KQkq", '' = keine)."""
+        rights = ''
+        for king, home_row, symbols in ((self.white_king, 7, 'KQ'), (self.black_king, 0, 'kq')):
+            if king is None or king.moved or king.position != (home_row, 4):
+                continue
+            for symbol, rook_col in zip(symbols, (7, 0)):
+                rook = self.squares[home_row, rook_col]
+                if isinstance(rook, Rook) and rook.color == king.color and not rook.moved:
+                    rights += symbol
+        return rights
+
+    def en_passant_move(self) -> Optional[Move]:
+        """Rekonstruiert den Doppelschritt, der en_passant_square erzeugt hat.
+
+        ChessLogic prüft En passant anhand des letzten Zugs; nach from_fen
+        dient dieser Move als last_move.
+
+        Returns:
+            Move des Bauern-Doppelschritts oder None
+        """
+        if self.en_passant_square is None:
+            return None
+        row, col = self.en_passant_square
+        # Zielfeld auf Reihe 3 (row 5): Weiß hat gezogen, sonst Schwarz
+        pawn_row, from_row = (4, 6) if row == 5 else (3, 1)
+        pawn = self.squares[pawn_row, col]
+        if not isinstance(pawn, Pawn):
+            return None
+        return Move((from_row, col), (pawn_row, col), pawn)
+
+    def position_key(self) -> int:
+        """Hash der Stellung für die Erkennung von Stellungswiederholungen.
+
+        Neben Figuren und Spieler am Zug gehen die Rochaderechte und ein
+        En-passant-Feld ein, letzteres nur, wenn ein Bauer des Spielers am
+        Zug daneben steht und tatsächlich schlagen könnte.
+        """
+        key = hash_squares(self.squares, self.turn)
+        for symbol in self.castling_rights():
+            key ^= CASTLING_KEYS[symbol]
+        if self.en_passant_square is not None:
+            row, col = self.en_passant_square
+            pawn_row = 4 if row == 5 else 3
+            for pawn_col in (col - 1, col + 1):
+                pawn = self.squares[pawn_row, pawn_col] if 0 <= pawn_col < 8 else None
+                if isinstance(pawn, Pawn) and pawn.color == self.turn:
+                    key ^= EN_PASSANT_KEYS[col]
+                    break
+        return key
+
+    def record_position(self):
+        """Legt position_key() der aktuellen Stellung auf position_history."""
+        self.position_history.append(self.position_key())
+
+    def repetition_count(self) -> int:
+        """Wie oft die aktuelle Stellung bisher aufgetreten ist (inklusive jetzt).
+
+        Nach einem Bauernzug oder Schlag kann sich keine frühere Stellung
+        wiederholen; verglichen werden daher nur die letzten halfmove_clock
+        Einträge, und davon nur jeder zweite (gleicher Spieler am Zug).
+
+        Returns:
+            Anzahl (0, wenn position_history leer ist)
+        """
+        history = self.position_history
+        if not history:
+            return 0
+        current = history[-1]
+        first = max(len(history) - 1 - self.halfmove_clock, 0)
+        count = 1
+        for index in range(len(history) - 3, first - 1, -2):
+            if history[index] == current:
+                count += 1
+        return count
+
+    def is_threefold_repetition(self) -> bool:
+        """True, wenn die aktuelle Stellung zum dritten Mal auf dem Brett steht."""
+        return self.repetition_count() >= 3
+
+    def is_fifty_move_rule(self) -> bool:
+        """True nach 50 Zügen je Seite ohne Bauernzug oder Schlag."""
+        return self.halfmove_clock >= 100
+
+    def has_insufficient_material(self) -> bool:
+        """Prüft, ob keine Seite mehr mattsetzen kann.
+
+        Erkannt werden König gegen König, König und Leichtfigur gegen König
+        sowie Könige mit beliebig vielen Läufern, die alle auf Feldern
+        derselben Farbe stehen.
+        """
+        minors = []
+        for piece in self.white_pieces + self.black_pieces:
+            if piece.notation == 'K':
+                continue
+            if piece.notation not in ('B', 'N'):
+                return False
+            minors.append(piece)
+        if len(minors) <= 1:
+            return True
+        return (all(piece.notation == 'B' for piece in minors)
+                and len({sum(piece.position) % 2 for piece in minors}) == 1)
+
     def setup_startpos(self):
         """ Erzeugt die Startaufstellung eines Schachbrettes """
         # Listen leeren
         self.white_pieces = []
         self.black_pieces = []
+        self.turn = 'white'
+        self.en_passant_square = None
+        self.halfmove_clock = 0
+        self.fullmove_number = 1
         
         # Pawns
         for col in range(8):
@@ -103,6 +299,9 @@ class Board:
         
         self.black_pieces.append(self.black_king)
         self.white_pieces.append(self.white_king)
+
+        self.position_history = []
+        self.record_position()
     
     def remove_piece(self, piece: Piece):
         """Entfernt geschlagene Figur aus Listen."""
@@ -119,11 +318,67 @@ class Board:
             raise ValueError('Unknown Piece!')
 
     def deep_copy(self):
-        """Erstellt eine tiefe Kopie des Boards für Simulationen."""
-        return copy.deepcopy(self)
+        """Erstellt eine tiefe Kopie des Boards für Simulationen.
+
+        Figuren haben nur unveränderliche Attribute (Farbe, Position als
+        Tupel, Flags), daher genügt je Figur eine flache Kopie. Das ist um
+        ein Vielfaches schneller als copy.deepcopy über das numpy-Array,
+        das bei jeder Schach-Prüfung (would_leave_king_in_check) anfällt.
+        """
+        clone = copy.copy(self)
+        clone.squares = np.full((8, 8), None, dtype=object)
+        copies = {}
+
+        def copy_piece(piece):
+            twin = copies.get(id(piece))
+            if twin is None:
+                twin = object.__new__(piece.__class__)
+                twin.__dict__.update(piece.__dict__)
+                copies[id(piece)] = twin
+            return twin
+
+        for row in range(8):
+            for col in range(8):
+                piece = self.squares[row, col]
+                if piece is not None:
+                    clone.squares[row, col] = copy_piece(piece)
+
+        clone.white_pieces = [copy_piece(piece) for piece in self.white_pieces]
+        clone.black_pieces = [copy_piece(piece) for piece in self.black_pieces]
+        clone.white_king = copy_piece(self.white_king) if self.white_king else None
+        clone.black_king = copy_piece(self.black_king) if self.black_king else None
+        # Simulationen brauchen keine Stellungs-Hashes (siehe _update_position_state)
+        clone.position_history = None
+        return clone
 
     def make_move(self, last_move: Move):
         """ Zieht eine Figur auf dem Schachfeld """
+        self._move_piece(last_move)
+        self._update_position_state(last_move)
+
+    def _update_position_state(self, move: Move):
+        """Schreibt Spieler am Zug, En-passant-Feld und Zugzähler fort."""
+        from_row, col = move.from_pos
+        to_row = move.to_pos[0]
+
+        if move.piece.pawn or move.captured:
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+
+        if move.piece.pawn and abs(to_row - from_row) == 2:
+            self.en_passant_square = ((from_row + to_row) // 2, col)
+        else:
+            self.en_passant_square = None
+
+        if move.piece.color == 'black':
+            self.fullmove_number += 1
+        self.turn = 'black' if move.piece.color == 'white' else 'white'
+        if self.position_history is not None:
+            self.record_position()
+
+    def _move_piece(self, last_move: Move):
+        """ Setzt die Figur(en) eines Zugs auf dem Brett um """
 
         piece = last_move.piece
         old_pos = last_move.from_pos
@@ -195,7 +450,7 @@ class Board:
             
             # Erstelle Move für Turm und führe ihn aus
             rook_move = Move(rook.position, rook_new_pos, rook)
-            self.make_move(rook_move)
+            self._move_piece(rook_move)
             
     def is_square_attacked_by(self, position: tuple, color: str) -> bool:
         """Prüft ob ein Feld von Figuren der angegebenen Farbe angegriffen wird.
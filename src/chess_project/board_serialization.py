@@ -0,0 +1,133 @@
+"""JSON-Serialisierung von Board-Zuständen für Datenbank und Replay.
+
+Format (siehe README, Abschnitt "Board-Serialisierung"):
+    64 Einträge {"row", "col", "color", "notation"} gefolgt von einem
+    Metadaten-Eintrag {"turn", "white_time", "black_time", "draw_offers"}.
+"""
+
+import json
+from typing import Optional
+
+from .pieces import Piece, King, Queen, Rook, Bishop, Knight, Pawn
+
+
+# Mapping von Notation zu Klassen
+PIECE_CLASSES = {
+    'K': King,
+    'Q': Queen,
+    'R': Rook,
+    'B': Bishop,
+    'N': Knight,
+    'P': Pawn
+}
+
+
+def _square_entry(row: int, col: int, color: Optional[str], notation: Optional[str]) -> str:
+    return json.dumps({"row": row, "col": col, "color": color, "notation": notation})
+
+
+# Vorformatierte JSON-Einträge je Feld und Figur: serialize_board muss so
+# nur noch Strings verbinden (wichtig für Replay-Speicherung und PGN-Import)
+_EMPTY_ENTRIES = [_square_entry(index // 8, index % 8, None, None) for index in range(64)]
+_PIECE_ENTRIES = {
+    (color, notation): [_square_entry(index // 8, index % 8, color, notation) for index in range(64)]
+    for color in ('white', 'black') for notation in PIECE_CLASSES
+}
+
+
+def serialize_board(squares, turn: str, white_time=None, black_time=None,
+                    draw_offers: Optional[dict] = None) -> str:
+    """Serialisiert ein Board-Array als JSON-String.
+
+    Args:
+        squares: 8x8 Array mit Piece-Objekten oder None
+        turn: Spieler am Zug ('white' oder 'black')
+        white_time: Zeit von Weiß in Sekunden (oder None)
+        black_time: Zeit von Schwarz in Sekunden (oder None)
+        draw_offers: Dict {"white": bool, "black": bool}
+
+    Returns:
+        JSON-String mit Board-Zustand (identisch zu json.dumps der Eintragsliste)
+    """
+    entries = []
+    for index, piece in enumerate(squares.flat):
+        if piece is None:
+            entries.append(_EMPTY_ENTRIES[index])
+        else:
+            entries.append(_PIECE_ENTRIES[piece.color, piece.notation][index])
+
+    entries.append(json.dumps({
+        "turn": turn,
+        "white_time": white_time,
+        "black_time": black_time,
+        "draw_offers": draw_offers or {"white": False, "black": False},
+    }))
+
+    return '[' + ', '.join(entries) + ']'
+
+
+def decode_board_json(board_json: str) -> tuple[list, dict]:
+    """Dekodiert einen Board-JSON-String ohne Piece-Objekte zu erzeugen.
+
+    Args:
+        board_json: JSON-String mit Board-Zustand
+
+    Returns:
+        Tuple (squares, metadata): squares ist eine Liste mit 64 Einträgen
+        (row * 8 + col) mit (color, notation) oder None, metadata das
+        Metadaten-Dict (leer falls nicht vorhanden)
+    """
+    board_data = json.loads(board_json)
+
+    squares = [None] * 64
+    metadata = {}
+
+    for item in board_data:
+        if 'row' in item and 'col' in item:
+            color = item.get('color')
+            notation = item.get('notation')
+            if color and notation in PIECE_CLASSES:
+                squares[item['row'] * 8 + item['col']] = (color, notation)
+        elif isinstance(item, dict):
+            metadata = item
+
+    return squares, metadata
+
+
+def deserialize_board(board_json: str):
+    """Deserialisiert ein Board aus einem JSON-String.
+
+    Args:
+        board_json: JSON-String mit Board-Zustand
+
+    Returns:
+        numpy array mit Board-Zustand
+    """
+    import numpy as np
+
+    squares, _ = decode_board_json(board_json)
+
+    # Erstelle leeres 8x8 Board
+    board_array = np.empty((8, 8), dtype=object)
+
+    for index, entry in enumerate(squares):
+        if entry is not None:
+            row, col = divmod(index, 8)
+            color, notation = entry
+            board_array[row, col] = create_piece(color, notation, (row, col))
+
+    return board_array
+
+
+def create_piece(color: str, notation: str, position: tuple) -> Piece:
+    """Erzeugt eine Figur anhand von Farbe und Notation.
+
+    Args:
+        color: 'white' oder 'black'
+        notation: 'K', 'Q', 'R', 'B', 'N' oder 'P'
+        position: (row, col) Tupel
+
+    Returns:
+        Neues Piece-Objekt
+    """
+    return PIECE_CLASSES[notation](color, position)
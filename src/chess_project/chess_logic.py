@@ -109,7 +109,7 @@ class ChessLogic:
         Returns:
             True wenn En passant gültig ist
         """
-        if last_move.piece == captured:
+        if last_move is not None and last_move.piece == captured:
             if abs(last_move.from_pos[0] - last_move.to_pos[0]) == 2:
                 return True
         return False
@@ -6,195 +6,325 @@ Verwaltet die Zeit für beide Spieler mit:
 - Automatischer Wechsel zwischen Spielern
 - Pause/Resume-Funktionalität
 - Callback bei Zeitablauf
+- Inkrement, Delay und mehrere Perioden (siehe time_control.py)
+
+Die Zeit wird nicht durch Zählen von Ticks ermittelt, sondern aus
+monotonen Zeitstempeln in Millisekunden abgerechnet. Der Tick aktualisiert
+nur die Anzeige und prüft auf Zeitablauf - verzögerte oder ausgelassene
+Frames verfälschen die Uhr daher nicht.
+
+Zeit und Tick liefert eine Clock-Source (siehe clock_sources.py); ohne
+Angabe wird die Kivy Clock verwendet. Das Modul selbst importiert kein Kivy.
 """
 
-from kivy.clock import Clock
+from .clock_sources import KivyClockSource
+from .time_control import TimeControl
 
 
 class ChessTimer:
     """
     Schachuhr für zwei Spieler.
-    
+
     Jeder Spieler hat eine festgelegte Zeit. Die Uhr läuft für den
     aktiven Spieler und stoppt, wenn der Zug beendet wird.
     """
-    
-    def __init__(self, time_per_player_minutes, on_time_up_callback=None, stopwatch_mode=False):
+
+    # Intervall für Anzeige-Updates und Zeitablauf-Prüfung (Sekunden)
+    TICK_INTERVAL = 0.1
+
+    def __init__(self, time_per_player_minutes=None, on_time_up_callback=None, stopwatch_mode=False,
+                 clock=None, time_control=None):
         """
         Initialisiert die Schachuhr.
-        
+
         Args:
             time_per_player_minutes: Zeit pro Spieler in Minuten (int) - nur für Countdown
             on_time_up_callback: Funktion die aufgerufen wird wenn Zeit abläuft
                                  Parameter: color ('white' oder 'black')
             stopwatch_mode: Wenn True, zählt die Zeit hoch statt runter (Stoppuhr)
+            clock: Clock-Source für Zeit und Tick (Standard: KivyClockSource)
+            time_control: TimeControl (Inkrement/Delay/Perioden); ersetzt
+                          time_per_player_minutes, falls angegeben
         """
         self.stopwatch_mode = stopwatch_mode
-        
+        self.clock = clock if clock is not None else KivyClockSource()
+
         if stopwatch_mode:
-            # Stoppuhr-Modus: Zeit beginnt bei 0 und zählt hoch
-            self.white_time = 0
-            self.black_time = 0
-            self.initial_time = 0
+            # Stoppuhr-Modus: verbrauchte Zeit beginnt bei 0 und zählt hoch
+            self.time_control = None
+            self.initial_ms = 0
         else:
-            # Countdown-Modus: Zeit in Sekunden speichern
-            self.white_time = time_per_player_minutes * 60
-            self.black_time = time_per_player_minutes * 60
-            # Original-Zeit für Reset
-            self.initial_time = time_per_player_minutes * 60
-        
+            # Countdown-Modus: Restzeit in Millisekunden
+            if time_control is None:
+                time_control = TimeControl.from_minutes(time_per_player_minutes)
+            self.time_control = time_control
+            self.initial_ms = time_control.initial_ms
+
+        # Kontostand zu Beginn des laufenden Zugs bzw. nach dem letzten Zug
+        self._time_ms = {'white': self.initial_ms, 'black': self.initial_ms}
+        # Bereits abgerechnete Zeit im laufenden Zug (über Pausen hinweg)
+        self._turn_used_ms = 0
+        # Anzahl abgeschlossener Züge je Spieler (für Perioden)
+        self.moves_made = {'white': 0, 'black': 0}
+
         # Zustand
         self.current_player = 'white'  # Wer ist gerade am Zug
         self.is_running = False
         self.is_paused = False
-        
+
+        # Zeitstempel, ab dem die Uhr des aktuellen Spielers läuft (None = steht)
+        self._segment_started = None
+
         # Callback bei Zeitablauf
         self.on_time_up = on_time_up_callback
-        
-        # Kivy Clock Event für Timer-Update
+
+        # Tick-Event der Clock-Source für Anzeige-Updates
         self.clock_event = None
-        
+
         # UI-Update Callback (wird vom GameScreen gesetzt)
         self.on_timer_update = None
-    
+        self._last_display = None
+
+    # ==================== Zeitabfrage ====================
+
+    @property
+    def initial_time(self):
+        """Anfangszeit pro Spieler in Sekunden."""
+        return self.initial_ms / 1000
+
+    @property
+    def white_time(self):
+        """Aktuelle Zeit von Weiß in Sekunden (Millisekunden-genau)."""
+        return self.get_time_ms('white') / 1000
+
+    @property
+    def black_time(self):
+        """Aktuelle Zeit von Schwarz in Sekunden (Millisekunden-genau)."""
+        return self.get_time_ms('black') / 1000
+
+    def get_time_ms(self, color):
+        """
+        Gibt die aktuelle Zeit eines Spielers in Millisekunden zurück.
+
+        Für den Spieler am Zug wird die im laufenden Zug verbrauchte Zeit
+        eingerechnet (beim US-Delay erst nach Ablauf der Verzögerung).
+
+        Args:
+            color: 'white' oder 'black'
+
+        Returns:
+            Restzeit (Countdown) bzw. verbrauchte Zeit (Stoppuhr) in ms
+        """
+        value = self._time_ms[color]
+        if color != self.current_player:
+            return max(value, 0)
+
+        used = self._turn_used_ms
+        if self._segment_started is not None:
+            used += self._elapsed_ms()
+        if self.stopwatch_mode:
+            return value + used
+        return max(value - self._current_stage().chargeable_ms(used), 0)
+
+    # ==================== Steuerung ====================
+
     def start(self):
         """Startet den Timer für den aktuellen Spieler."""
         if self.is_running and not self.is_paused:
             return  # Schon aktiv
-        
+
         self.is_running = True
         self.is_paused = False
-        
-        # Starte Kivy Clock (wird jede Sekunde aufgerufen)
-        if self.clock_event:
-            self.clock_event.cancel()
-        self.clock_event = Clock.schedule_interval(self._tick, 1.0)
-    
+        self._segment_started = self.clock.now()
+        self._schedule_tick()
+
     def pause(self):
         """Pausiert den Timer."""
         if not self.is_running or self.is_paused:
             return
-        
+
+        # Bis zur Pause verbrauchte Zeit abrechnen
+        self._charge()
+        self._segment_started = None
         self.is_paused = True
-        
-        # Stoppe Clock
-        if self.clock_event:
-            self.clock_event.cancel()
-            self.clock_event = None
-    
+        self._cancel_tick()
+
     def resume(self):
         """Setzt den Timer nach einer Pause fort."""
         if not self.is_running or not self.is_paused:
             return
-        
+
         self.is_paused = False
-        
-        # Starte Clock wieder
-        if self.clock_event:
-            self.clock_event.cancel()
-        self.clock_event = Clock.schedule_interval(self._tick, 1.0)
-    
+        self._segment_started = self.clock.now()
+        self._schedule_tick()
+
     def stop(self):
         """Stoppt den Timer komplett."""
+        if self._segment_started is not None:
+            self._charge()
+        self._segment_started = None
         self.is_running = False
         self.is_paused = False
-        
-        if self.clock_event:
-            self.clock_event.cancel()
-            self.clock_event = None
-    
+        self._cancel_tick()
+
     def switch_player(self):
         """
         Wechselt zum anderen Spieler.
-        
-        Timer läuft weiter, aber für den anderen Spieler.
+
+        Die Zeit des ziehenden Spielers wird exakt bis zu diesem Moment
+        abgerechnet und die Regelung angewendet (Delay, Inkrement,
+        Periodenwechsel), danach läuft die Uhr für den anderen Spieler.
         """
+        if self.check_time_up():
+            # Zug nach Ablauf der Zeit zählt nicht mehr
+            return
+        self._finish_turn()
+
         if self.current_player == 'white':
             self.current_player = 'black'
         else:
             self.current_player = 'white'
-        
+
         # UI aktualisieren
-        if self.on_timer_update:
-            self.on_timer_update(self.white_time, self.black_time, self.current_player)
-    
+        self._notify(force=True)
+
+    def check_time_up(self):
+        """
+        Rechnet die Zeit des Spielers am Zug bis jetzt ab und prüft auf Zeitablauf.
+
+        Ist die Zeit abgelaufen, wird die Uhr gestoppt und on_time_up
+        aufgerufen - auch wenn der Tick den Zeitablauf noch nicht bemerkt hat.
+
+        Returns:
+            True wenn die Zeit des Spielers am Zug abgelaufen ist
+        """
+        if self._segment_started is not None:
+            self._charge()
+        if not self._is_flagged(self.current_player):
+            return False
+        if self.is_running:
+            self._time_up(self.current_player)
+        return True
+
     def reset(self):
         """Setzt den Timer auf die Anfangszeit zurück."""
         self.stop()
-        self.white_time = self.initial_time
-        self.black_time = self.initial_time
+        self._time_ms = {'white': self.initial_ms, 'black': self.initial_ms}
+        self._turn_used_ms = 0
+        self.moves_made = {'white': 0, 'black': 0}
         self.current_player = 'white'
-        
+
         # UI aktualisieren
-        if self.on_timer_update:
-            self.on_timer_update(self.white_time, self.black_time, self.current_player)
-    
+        self._notify(force=True)
+
+    # ==================== Interne Hilfsmethoden ====================
+
+    def _elapsed_ms(self):
+        """Seit dem letzten Abrechnen vergangene Zeit in (gerundeten) ganzen Millisekunden."""
+        return round((self.clock.now() - self._segment_started) * 1000)
+
+    def _current_stage(self):
+        """Periode, in der der Spieler am Zug gerade spielt."""
+        move_number = self.moves_made[self.current_player] + 1
+        return self.time_control.stages[self.time_control.stage_for_move(move_number)]
+
+    def _charge(self):
+        """Rechnet die seit dem letzten Abrechnen vergangene Zeit dem Zug zu.
+
+        Der Startzeitpunkt wird nur um die abgerechneten ganzen Millisekunden
+        verschoben, damit keine Bruchteile verloren gehen.
+        """
+        elapsed = self._elapsed_ms()
+        self._turn_used_ms += elapsed
+        self._segment_started += elapsed / 1000
+
+    def _finish_turn(self):
+        """Bucht den abgeschlossenen Zug auf das Konto des ziehenden Spielers."""
+        color = self.current_player
+        used = self._turn_used_ms
+        if self.stopwatch_mode:
+            self._time_ms[color] += used
+        else:
+            stage = self._current_stage()
+            self._time_ms[color] += stage.refund_ms(used) - stage.chargeable_ms(used)
+            self._time_ms[color] += self.time_control.time_added_after_move(self.moves_made[color] + 1)
+        self.moves_made[color] += 1
+        self._turn_used_ms = 0
+
+    def _is_flagged(self, color):
+        """True wenn die Countdown-Zeit des Spielers abgelaufen ist."""
+        return not self.stopwatch_mode and self.get_time_ms(color) <= 0
+
+    def _schedule_tick(self):
+        self._cancel_tick()
+        self.clock_event = self.clock.schedule_interval(self._tick, self.TICK_INTERVAL)
+
+    def _cancel_tick(self):
+        if self.clock_event:
+            self.clock_event.cancel()
+            self.clock_event = None
+
     def _tick(self, dt):
         """
-        Wird jede Sekunde aufgerufen (von Kivy Clock).
-        
-        Reduziert die Zeit des aktuellen Spielers (Countdown) oder
-        erhöht sie (Stopwatch).
+        Wird regelmäßig von der Clock-Source aufgerufen.
+
+        Führt keine Zeitbuchhaltung durch (dt wird ignoriert), sondern
+        prüft nur auf Zeitablauf und aktualisiert die Anzeige.
         """
-        if self.is_paused:
+        if self.is_paused or not self.is_running:
             return
-        
-        if self.stopwatch_mode:
-            # Stopwatch-Modus: Zeit hochzählen
-            if self.current_player == 'white':
-                self.white_time += 1
-            else:
-                self.black_time += 1
-        else:
-            # Countdown-Modus: Zeit reduzieren
-            if self.current_player == 'white':
-                self.white_time -= 1
-                if self.white_time <= 0:
-                    self.white_time = 0
-                    self._time_up('white')
-                    return
-            else:
-                self.black_time -= 1
-                if self.black_time <= 0:
-                    self.black_time = 0
-                    self._time_up('black')
-                    return
-        
+
+        if self._is_flagged(self.current_player):
+            self._time_up(self.current_player)
+            return
+
         # UI aktualisieren
-        if self.on_timer_update:
-            self.on_timer_update(self.white_time, self.black_time, self.current_player)
-    
+        self._notify()
+
+    def _notify(self, force=False):
+        """Ruft on_timer_update auf, sobald sich die angezeigten Sekunden ändern."""
+        if not self.on_timer_update:
+            return
+        white_time = self.white_time
+        black_time = self.black_time
+        display = (int(white_time), int(black_time), self.current_player)
+        if force or display != self._last_display:
+            self._last_display = display
+            self.on_timer_update(white_time, black_time, self.current_player)
+
     def _time_up(self, color):
         """
         Wird aufgerufen wenn die Zeit eines Spielers abgelaufen ist.
-        
+
         Args:
             color: 'white' oder 'black'
         """
         self.stop()
-        
+        self._time_ms[color] = 0
+        self._turn_used_ms = 0
+
         # Callback aufrufen
         if self.on_time_up:
             self.on_time_up(color)
-    
+
     def get_time_string(self, seconds):
         """
         Konvertiert Sekunden in MM:SS Format.
-        
+
         Args:
             seconds: Zeit in Sekunden
-            
+
         Returns:
             String im Format "MM:SS"
         """
         minutes = int(seconds // 60)
         secs = int(seconds % 60)
         return f"{minutes:02d}:{secs:02d}"
-    
+
     def get_white_time_string(self):
         """Gibt die verbleibende Zeit von Weiß als String zurück."""
         return self.get_time_string(self.white_time)
-    
+
     def get_black_time_string(self):
         """Gibt die verbleibende Zeit von Schwarz als String zurück."""
         return self.get_time_string(self.black_time)
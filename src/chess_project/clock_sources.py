@@ -0,0 +1,128 @@
+"""Zeitquellen für die Schachuhr.
+
+Der ChessTimer benötigt nur zwei Dinge: die aktuelle monotone Zeit und einen
+periodischen Tick (Anzeige-Update, Zeitablauf-Prüfung). Beides liefert eine
+Clock-Source, damit die Uhr ohne Kivy-Eventloop verwendet werden kann:
+
+- KivyClockSource: Tick über kivy.clock.Clock (Standard in der App)
+- AsyncioClockSource: Tick über eine asyncio-Eventloop (Server, Engine-Partien)
+- ManualClock: virtuelle Zeit, die per advance() vorgestellt wird (Tests, Simulation)
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+
+class ClockSource(ABC):
+    """Schnittstelle einer Zeitquelle (Unterklassen müssen schedule_interval implementieren)."""
+
+    def now(self) -> float:
+        """Aktuelle monotone Zeit in Sekunden."""
+        return time.monotonic()
+
+    @abstractmethod
+    def schedule_interval(self, callback: Callable[[float], None], interval: float):
+        """Ruft callback(dt) alle interval Sekunden auf.
+
+        Returns:
+            Objekt mit cancel()-Methode
+        """
+
+
+class KivyClockSource(ClockSource):
+    """Tick über die Kivy Clock; Kivy wird erst beim ersten Tick importiert."""
+
+    def schedule_interval(self, callback, interval):
+        from kivy.clock import Clock
+        return Clock.schedule_interval(callback, interval)
+
+
+class _AsyncioInterval:
+    """Wiederkehrender Aufruf über loop.call_later."""
+
+    def __init__(self, loop, callback, interval):
+        self._loop = loop
+        self._callback = callback
+        self._interval = interval
+        self._last = loop.time()
+        self._handle = loop.call_later(interval, self._fire)
+
+    def _fire(self):
+        now = self._loop.time()
+        dt, self._last = now - self._last, now
+        self._handle = self._loop.call_later(self._interval, self._fire)
+        self._callback(dt)
+
+    def cancel(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+
+class AsyncioClockSource(ClockSource):
+    """Tick über eine asyncio-Eventloop.
+
+    Ohne explizite Loop wird beim Planen die laufende Loop verwendet.
+    """
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self._loop = loop
+
+    def now(self):
+        loop = self._loop or asyncio.get_running_loop()
+        return loop.time()
+
+    def schedule_interval(self, callback, interval):
+        loop = self._loop or asyncio.get_running_loop()
+        return _AsyncioInterval(loop, callback, interval)
+
+
+class _ManualEvent:
+    def __init__(self, clock, callback, interval):
+        self.clock = clock
+        self.callback = callback
+        self.interval = interval
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class ManualClock(ClockSource):
+    """Virtuelle Uhr: die Zeit steht, bis sie mit advance() vorgestellt wird.
+
+    Fällige Ticks werden während advance() in zeitlicher Reihenfolge
+    ausgelöst - so lassen sich Partien ohne reale Wartezeit simulieren.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+        self._queue = []
+        self._counter = itertools.count()
+
+    def now(self):
+        return self._now
+
+    def schedule_interval(self, callback, interval):
+        event = _ManualEvent(self, callback, interval)
+        heapq.heappush(self._queue, (self._now + interval, next(self._counter), event))
+        return event
+
+    def advance(self, seconds: float):
+        """Stellt die Uhr vor und löst alle bis dahin fälligen Ticks aus."""
+        target = self._now + seconds
+        while self._queue and self._queue[0][0] <= target:
+            due, _, event = heapq.heappop(self._queue)
+            if event.cancelled:
+                continue
+            self._now = due
+            heapq.heappush(self._queue, (due + event.interval, next(self._counter), event))
+            event.callback(event.interval)
+        self._now = target
+
+
+__all__ = ["ClockSource", "KivyClockSource", "AsyncioClockSource", "ManualClock"]
@@ -0,0 +1,163 @@
+"""SQLite-Verbindungen für mehrere Threads.
+
+Der ConnectionPool hält genau eine Schreibverbindung und je Thread eine
+Leseverbindung (PRAGMA query_only). Datenbankdateien werden im WAL-Modus
+betrieben, Leser sehen also den zuletzt committeten Stand, während ein
+anderer Thread schreibt.
+
+Die Schreibverbindung gehört immer nur einem Thread: writing() wartet, bis
+sie frei ist, und gibt sie erst wieder ab, wenn keine Transaktion mehr
+offen ist. Mehrere Aufrufe, die zusammen eine Transaktion bilden (z.B. die
+Bulk-Methoden des PGN-Imports bis zum commit()), sind damit vor Schreib-
+zugriffen anderer Threads geschützt. Liest ein Thread, der gerade schreibt,
+verwendet er die Schreibverbindung und sieht seine eigenen, noch nicht
+committeten Änderungen.
+
+In-Memory-Datenbanken (':memory:') existieren nur in einer Verbindung; dort
+lesen alle Threads nacheinander über die Schreibverbindung.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+class ConnectionPool:
+    """
+    Schreib- und Leseverbindungen zu einer SQLite-Datenbank.
+
+    Attribute:
+        db_path: Pfad zur Datenbankdatei
+        writer: Die einzige Schreibverbindung
+        in_memory: True für ':memory:' (keine eigenen Leseverbindungen)
+    """
+
+    def __init__(self, db_path: str, timeout: float = 5.0):
+        """
+        Args:
+            db_path: Pfad zur SQLite-Datenbankdatei (oder ':memory:')
+            timeout: Sekunden, die auf Sperren anderer Prozesse gewartet wird
+        """
+        self.db_path = db_path
+        self.timeout = timeout
+        self.in_memory = db_path == ':memory:' or 'mode=memory' in db_path
+
+        self._lock = threading.Lock()
+        self._owner: Optional[int] = None  # Thread, dem die Schreibverbindung gehört
+        self._depth = 0  # Verschachtelte writing()-Blöcke des Besitzers
+        self._readers: dict[int, sqlite3.Connection] = {}  # Thread-ID -> Leseverbindung
+        self._readers_lock = threading.Lock()
+        self._local = threading.local()
+
+        self.writer = self._open()
+        if not self.in_memory:
+            self.writer.execute('PRAGMA journal_mode=WAL')
+
+    def _open(self, read_only: bool = False) -> sqlite3.Connection:
+        # check_same_thread=False: close() schließt Verbindungen aller Threads
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Ermöglicht Zugriff per Spaltenname
+        if read_only:
+            conn.execute('PRAGMA query_only = ON')
+        return conn
+
+    @contextmanager
+    def writing(self) -> Iterator[sqlite3.Connection]:
+        """
+        Exklusiver Zugriff auf die Schreibverbindung.
+
+        Blöcke dürfen verschachtelt werden. Ist am Ende des äußersten Blocks
+        noch eine Transaktion offen, bleibt die Verbindung bis commit() bzw.
+        rollback() bei diesem Thread. Endet ein Block mit einer Exception,
+        wird eine in diesem Block begonnene Transaktion verworfen; die
+        Verbindung wird also auch nach fehlgeschlagenen Schreibzugriffen frei.
+        """
+        me = threading.get_ident()
+        if self._owner != me:
+            self._lock.acquire()
+            self._owner = me
+        started = not self.writer.in_transaction
+        self._depth += 1
+        try:
+            yield self.writer
+        except Exception:
+            if started and self.writer.in_transaction:
+                self.writer.rollback()
+            raise
+        finally:
+            self._depth -= 1
+            self._release_if_idle()
+
+    @contextmanager
+    def reading(self) -> Iterator[sqlite3.Connection]:
+        """
+        Verbindung für Lesezugriffe des aktuellen Threads.
+
+        Die Leseverbindung des Threads; die Schreibverbindung, wenn der
+        Thread gerade schreibt oder die Datenbank im Speicher liegt.
+        """
+        if self._owner == threading.get_ident() or self.in_memory:
+            with self.writing() as conn:
+                yield conn
+            return
+
+        previous = getattr(self._local, 'conn', None)
+        conn = self._local.conn = self._reader()
+        try:
+            yield conn
+        finally:
+            self._local.conn = previous
+
+    def connection(self) -> sqlite3.Connection:
+        """Verbindung des aktuellen Kontexts (lesend, schreibend, sonst die Schreibverbindung)."""
+        if self._owner == threading.get_ident():
+            return self.writer
+        return getattr(self._local, 'conn', None) or self.writer
+
+    def commit(self):
+        """Schließt die Transaktion ab und gibt die Schreibverbindung frei."""
+        with self.writing() as conn:
+            conn.commit()
+
+    def rollback(self):
+        """Verwirft die Transaktion und gibt die Schreibverbindung frei."""
+        with self.writing() as conn:
+            conn.rollback()
+
+    def reader_data_versions(self) -> dict[int, int]:
+        """PRAGMA data_version aller Leseverbindungen, Schlüssel id(Verbindung)."""
+        with self._readers_lock:
+            return {id(conn): conn.execute('PRAGMA data_version').fetchone()[0]
+                    for conn in self._readers.values()}
+
+    def close(self):
+        """Schließt alle Verbindungen."""
+        with self._readers_lock:
+            for conn in self._readers.values():
+                conn.close()
+            self._readers.clear()
+        self.writer.close()
+
+    def _release_if_idle(self):
+        """Gibt die Schreibverbindung ab, wenn kein Block und keine Transaktion mehr offen ist."""
+        if self._depth == 0 and self._owner == threading.get_ident() and not self.writer.in_transaction:
+            self._owner = None
+            self._lock.release()
+
+    def _reader(self) -> sqlite3.Connection:
+        """Leseverbindung des aktuellen Threads (wird beim ersten Zugriff geöffnet)."""
+        me = threading.get_ident()
+        conn = self._readers.get(me)
+        if conn is None:
+            conn = self._open(read_only=True)
+            with self._readers_lock:
+                # Verbindungen beendeter Threads schließen
+                alive = {thread.ident for thread in threading.enumerate()}
+                for ident in [ident for ident in self._readers if ident not in alive]:
+                    self._readers.pop(ident).close()
+                self._readers[me] = conn
+        return conn
+
+
+__all__ = ['ConnectionPool']
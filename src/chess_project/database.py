@@ -1,9 +1,58 @@
-"""Datenbank-Management für Schach-Anwendung mit SQLite."""
+"""Datenbank-Management für Schach-Anwendung mit SQLite.
 
+Der DatabaseManager kann von mehreren Threads gleichzeitig verwendet werden
+(z.B. UI, Engine, Import im Hintergrund): Lesemethoden laufen über die
+Leseverbindung des jeweiligen Threads, Schreibmethoden über die einzige
+Schreibverbindung (siehe ConnectionPool). Methoden, die NICHT selbst
+committen (Bulk-Import), halten die Schreibverbindung bis zum commit() bzw.
+rollback() desselben Threads.
+"""
+
+import functools
 import sqlite3
-from typing import Optional, List
+from typing import Optional, List, Union
 from datetime import datetime
 
+from .connection_pool import ConnectionPool
+from .opening_explorer import MAX_PLY, opening_rows
+from .position_hash import hash_board_json, hash_fen
+from .ratings import (
+    ELO_DEFAULT, GLICKO_DEFAULT, GLICKO_RD_DEFAULT, GLICKO_VOLATILITY_DEFAULT,
+    RESULT_SCORES, Rating, batch_ratings, rate_game,
+)
+
+
+# start_time/end_time von Partien ohne bekanntes Datum (z.B. PGN ohne Date-Tag);
+# sortiert vor allen echten Zeitpunkten, die Partien gelten also als die ältesten
+UNKNOWN_START_TIME = '0000-01-01T00:00:00'
+
+
+def _reads(method):
+    """Führt eine Methode mit der Leseverbindung des aktuellen Threads aus (self.conn)."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._pool.reading():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _writes(method):
+    """Führt eine Methode mit exklusivem Zugriff auf die Schreibverbindung aus (self.conn).
+
+    Schlägt die Methode fehl, verwirft ConnectionPool.writing() die in ihr
+    begonnene Transaktion; die Caches können dann ungültige Werte enthalten.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            with self._pool.writing():
+                return method(self, *args, **kwargs)
+        except Exception:
+            self._invalidate_leaderboard()
+            self._invalidate_analytics()
+            raise
+    return wrapper
+
 
 class DatabaseManager:
     """Verwaltet alle Datenbankoperationen für Spieler, Spiele und Züge."""
@@ -15,28 +64,42 @@ class DatabaseManager:
         :param db_path: Pfad zur SQLite-Datenbankdatei
         """
         self.db_path = db_path
-        self.conn = None
+        self._pool = None
+        
+        # Caches (gültig solange PRAGMA data_version gleich bleibt, siehe _sync_caches)
+        self._leaderboard_cache = {}  # limit -> Zeilen der Rangliste
+        self._analytics_cache = {}  # player_id -> get_player_analytics
+        self._data_versions = {}  # id(Verbindung) -> zuletzt gesehene data_version
+        self._cache_generation = 0  # wird bei jeder Invalidierung erhöht
+        
         self._connect()
         self._create_tables()
     
     def _connect(self):
         """Stellt Verbindung zur Datenbank her."""
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row  # Ermöglicht Zugriff per Spaltenname
+        self._pool = ConnectionPool(self.db_path)
+    
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Verbindung des aktuellen Kontexts (Lese- bzw. Schreibverbindung, siehe ConnectionPool)."""
+        return self._pool.connection()
     
+    @_writes
     def _create_tables(self):
         """Erstellt die erforderlichen Tabellen falls sie nicht existieren."""
         cursor = self.conn.cursor()
         
         # Spieler-Tabelle
-        cursor.execute('''
+        rating_columns = ',\n                '.join(f'{name} {definition}' for name, definition in self._RATING_COLUMNS)
+        cursor.execute(f'''
             CREATE TABLE IF NOT EXISTS players (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 username TEXT UNIQUE NOT NULL,
                 points INTEGER DEFAULT 0,
                 games_played INTEGER DEFAULT 0,
                 games_won INTEGER DEFAULT 0,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                {rating_columns}
             )
         ''')
         
@@ -48,6 +111,7 @@ class DatabaseManager:
                 black_player_id INTEGER NOT NULL,
                 game_type TEXT NOT NULL,
                 time_per_player INTEGER,
+                time_control TEXT,
                 start_time TEXT NOT NULL,
                 end_time TEXT,
                 result TEXT,
@@ -71,6 +135,80 @@ class DatabaseManager:
             )
         ''')
         
+        self._migrate_tables(cursor)
+        
+        # Rangliste: die Top-N werden direkt aus dem Index gelesen (kein Sortieren)
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_players_leaderboard
+            ON players (points DESC, games_won DESC)
+        ''')
+        
+        # Indizes für die Spielhistorie (Keyset-Pagination nach start_time, id)
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_games_start_time
+            ON games (start_time DESC, id DESC)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_games_white_player
+            ON games (white_player_id, start_time DESC, id DESC)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_games_black_player
+            ON games (black_player_id, start_time DESC, id DESC)
+        ''')
+        # Boards eines Spiels (Replay, Export) ohne Scan der ganzen Tabelle
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_boards_game
+            ON boards (game_id, board_number)
+        ''')
+        
+        # Positionsindex: Zobrist-Hash jeder gespeicherten Stellung -> (Spiel, Halbzug).
+        # WITHOUT ROWID: die Tabelle ist direkt nach (hash, game_id, ply) sortiert,
+        # eine Suche liest nur die Einträge des gesuchten Hashes.
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS positions (
+                hash INTEGER NOT NULL,
+                game_id INTEGER NOT NULL,
+                ply INTEGER NOT NULL,
+                PRIMARY KEY (hash, game_id, ply),
+                FOREIGN KEY (game_id) REFERENCES games(id)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_positions_game
+            ON positions (game_id)
+        ''')
+        
+        # Eröffnungsbaum: Züge je Stellung mit Ergebnissen (siehe opening_explorer)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS opening_stats (
+                hash INTEGER NOT NULL,
+                next_hash INTEGER NOT NULL,
+                notation TEXT NOT NULL,
+                games INTEGER NOT NULL DEFAULT 0,
+                white_wins INTEGER NOT NULL DEFAULT 0,
+                draws INTEGER NOT NULL DEFAULT 0,
+                black_wins INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (hash, next_hash)
+            ) WITHOUT ROWID
+        ''')
+        
+        # Wertungsverlauf je Spieler (ein Eintrag je gewerteter Partie),
+        # nach (player_id, end_time) sortiert für Verlaufsdiagramme
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS rating_history (
+                player_id INTEGER NOT NULL,
+                end_time TEXT NOT NULL,
+                game_id INTEGER NOT NULL,
+                elo REAL NOT NULL,
+                glicko_rating REAL NOT NULL,
+                glicko_rd REAL NOT NULL,
+                PRIMARY KEY (player_id, end_time, game_id),
+                FOREIGN KEY (player_id) REFERENCES players(id),
+                FOREIGN KEY (game_id) REFERENCES games(id)
+            ) WITHOUT ROWID
+        ''')
+        
         # Remis-Angebote-Tabelle
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS draw_offers (
@@ -84,10 +222,32 @@ class DatabaseManager:
             )
         ''')
         
-        self.conn.commit()
+        self._commit()
+    
+    # Wertungsspalten der Spieler-Tabelle mit Startwerten (siehe ratings)
+    _RATING_COLUMNS = (
+        ('elo', f'REAL DEFAULT {ELO_DEFAULT}'),
+        ('glicko_rating', f'REAL DEFAULT {GLICKO_DEFAULT}'),
+        ('glicko_rd', f'REAL DEFAULT {GLICKO_RD_DEFAULT}'),
+        ('glicko_volatility', f'REAL DEFAULT {GLICKO_VOLATILITY_DEFAULT}'),
+    )
+    
+    def _migrate_tables(self, cursor):
+        """Ergänzt Spalten, die in älteren Datenbanken noch fehlen."""
+        cursor.execute('PRAGMA table_info(games)')
+        game_columns = {row['name'] for row in cursor.fetchall()}
+        if 'time_control' not in game_columns:
+            cursor.execute('ALTER TABLE games ADD COLUMN time_control TEXT')
+        
+        cursor.execute('PRAGMA table_info(players)')
+        player_columns = {row['name'] for row in cursor.fetchall()}
+        for name, definition in self._RATING_COLUMNS:
+            if name not in player_columns:
+                cursor.execute(f'ALTER TABLE players ADD COLUMN {name} {definition}')
     
     # ==================== SPIELER-VERWALTUNG ====================
     
+    @_writes
     def create_player(self, username: str) -> Optional[int]:
         """
         Erstellt einen neuen Spieler.
@@ -101,11 +261,15 @@ class DatabaseManager:
                 'INSERT INTO players (username) VALUES (?)',
                 (username,)
             )
-            self.conn.commit()
+            self._commit()
+            self._invalidate_leaderboard()
             return cursor.lastrowid
         except sqlite3.IntegrityError:
+            # Fehlgeschlagenes INSERT lässt die Transaktion offen
+            self.conn.rollback()
             return None  # Username existiert bereits
     
+    @_reads
     def get_player(self, player_id: int) -> Optional[dict]:
         """
         Holt einen Spieler nach ID.
@@ -118,6 +282,7 @@ class DatabaseManager:
         row = cursor.fetchone()
         return dict(row) if row else None
     
+    @_reads
     def get_player_by_username(self, username: str) -> Optional[dict]:
         """
         Holt einen Spieler nach Benutzername.
@@ -130,20 +295,77 @@ class DatabaseManager:
         row = cursor.fetchone()
         return dict(row) if row else None
     
+    @_reads
     def get_leaderboard(self, limit: int = 10) -> List[dict]:
         """
         Holt die Top-Spieler sortiert nach Punkten.
         
+        Das Ergebnis wird je limit zwischengespeichert. Eigene Änderungen an
+        den Spielern verwerfen den Cache direkt, Änderungen anderer
+        Verbindungen (z.B. eines zweiten Prozesses) über PRAGMA data_version.
+        
         :param limit: Anzahl der anzuzeigenden Spieler
         :return: Liste von Dicts mit Spielerdaten
         """
-        cursor = self.conn.cursor()
-        cursor.execute(
-            'SELECT * FROM players ORDER BY points DESC, games_won DESC LIMIT ?',
-            (limit,)
-        )
-        return [dict(row) for row in cursor.fetchall()]
+        self._sync_caches()
+        rows = self._leaderboard_cache.get(limit)
+        if rows is None:
+            generation = self._cache_generation
+            cursor = self.conn.cursor()
+            cursor.execute(
+                'SELECT * FROM players ORDER BY points DESC, games_won DESC LIMIT ?',
+                (limit,)
+            )
+            rows = [dict(row) for row in cursor.fetchall()]
+            # Nicht speichern, wenn währenddessen ein anderer Thread invalidiert hat
+            if generation == self._cache_generation:
+                self._leaderboard_cache[limit] = rows
+        return [dict(row) for row in rows]
+    
+    def _invalidate_leaderboard(self):
+        """Verwirft die zwischengespeicherte Rangliste."""
+        self._cache_generation += 1
+        self._leaderboard_cache.clear()
+    
+    def _invalidate_analytics(self, *player_ids):
+        """Verwirft die Auswertungen der angegebenen Spieler (ohne Angabe: aller Spieler)."""
+        self._cache_generation += 1
+        if not player_ids:
+            self._analytics_cache.clear()
+        for player_id in player_ids:
+            self._analytics_cache.pop(player_id, None)
+    
+    def _sync_caches(self):
+        """Verwirft alle Caches, wenn eine fremde Verbindung Daten geändert hat.
+        
+        data_version ändert sich je Verbindung, sobald eine andere Verbindung
+        committet; gemerkt wird daher der zuletzt gesehene Wert je Verbindung.
+        Commits der eigenen Schreibverbindung führt _commit nach.
+        """
+        conn = self.conn
+        version = conn.execute('PRAGMA data_version').fetchone()[0]
+        if self._data_versions.get(id(conn)) != version:
+            self._invalidate_leaderboard()
+            self._invalidate_analytics()
+            self._data_versions[id(conn)] = version
+    
+    def _commit(self):
+        """Committet die Schreibverbindung (innerhalb von _writes).
+        
+        Der eigene Commit ändert die data_version aller Leseverbindungen. Für
+        Leseverbindungen, die vorher auf dem gemerkten Stand waren, wird der
+        neue Wert übernommen: eigene Schreibzugriffe verwerfen die Caches nur
+        gezielt (z.B. finish_game), nicht über _sync_caches. Solange die
+        Transaktion Änderungen enthält, kann keine fremde Verbindung
+        dazwischen committen.
+        """
+        before = self._pool.reader_data_versions()
+        self.conn.commit()
+        for key, version in self._pool.reader_data_versions().items():
+            if key in before and before[key] == self._data_versions.get(key):
+                self._data_versions[key] = version
     
+    @_reads
     def get_all_players(self) -> List[dict]:
         """
         Holt alle Spieler sortiert nach Benutzername.
@@ -154,6 +376,7 @@ class DatabaseManager:
         cursor.execute('SELECT * FROM players ORDER BY username ASC')
         return [dict(row) for row in cursor.fetchall()]
     
+    @_writes
     def update_player_stats(self, player_id: int, points_delta: int, 
                            won: bool = False, lost: bool = False):
         """
@@ -164,20 +387,15 @@ class DatabaseManager:
         :param won: Ob der Spieler gewonnen hat
         :param lost: Ob der Spieler verloren hat
         """
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE players 
-            SET points = points + ?,
-                games_played = games_played + 1,
-                games_won = games_won + ?
-            WHERE id = ?
-        ''', (points_delta, 1 if won else 0, player_id))
-        self.conn.commit()
+        self.add_player_results_bulk([(player_id, points_delta, 1, 1 if won else 0)])
+        self._commit()
     
     # ==================== SPIEL-VERWALTUNG ====================
     
+    @_writes
     def create_game(self, white_player_id: int, black_player_id: int,
-                   game_type: str, time_per_player: Optional[int] = None) -> int:
+                   game_type: str, time_per_player: Optional[int] = None,
+                   time_control: Optional[str] = None) -> int:
         """
         Erstellt ein neues Spiel.
         
@@ -185,22 +403,28 @@ class DatabaseManager:
         :param black_player_id: ID des schwarzen Spielers
         :param game_type: 'timed' oder 'untimed'
         :param time_per_player: Minuten pro Spieler (nur bei timed)
+        :param time_control: Bedenkzeit im Textformat, z.B. '5+3' (nur bei timed)
         :return: ID des erstellten Spiels
         """
         cursor = self.conn.cursor()
         cursor.execute('''
             INSERT INTO games 
-            (white_player_id, black_player_id, game_type, time_per_player, start_time)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (white_player_id, black_player_id, game_type, time_per_player, 
+            (white_player_id, black_player_id, game_type, time_per_player, time_control, start_time)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (white_player_id, black_player_id, game_type, time_per_player, time_control,
               datetime.now().isoformat()))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
     
+    @_writes
     def finish_game(self, game_id: int, winner: str, result_type: str):
         """
         Beendet ein Spiel und aktualisiert Spieler-Statistiken.
         
+        Ergebnis, Statistiken und Wertungen beider Spieler sowie der
+        Eröffnungsbaum werden in einer Transaktion geschrieben; bei einem
+        Fehler wird alles verworfen.
+        
         :param game_id: ID des Spiels
         :param winner: 'white_win', 'black_win', 'draw' oder None
         :param result_type: 'checkmate', 'Remis', 'Patt', 'timeover', etc.
@@ -214,33 +438,46 @@ class DatabaseManager:
         else:
             result = 'draw'  # Bei None oder anderen Werten
         
-        # Spiel aktualisieren
-        cursor.execute('''
-            UPDATE games 
-            SET end_time = ?, result = ?, final_position = ?
-            WHERE id = ?
-        ''', (datetime.now().isoformat(), result, result_type, game_id))
-        
-        # Spieler-IDs holen
-        cursor.execute(
-            'SELECT white_player_id, black_player_id FROM games WHERE id = ?',
-            (game_id,)
-        )
-        white_id, black_id = cursor.fetchone()
-        
-        # Punkte vergeben
-        if winner == 'white_win':
-            self.update_player_stats(white_id, 3, won=True)  # Gewinner: +3
-            self.update_player_stats(black_id, 0, lost=True)  # Verlierer: 0
-        elif winner == 'black_win':
-            self.update_player_stats(black_id, 3, won=True)  # Gewinner: +3
-            self.update_player_stats(white_id, 0, lost=True)  # Verlierer: 0
-        else:  # draw
-            self.update_player_stats(white_id, 1)  # Remis: +1
-            self.update_player_stats(black_id, 1)  # Remis: +1
-        
-        self.conn.commit()
+        end_time = datetime.now().isoformat()
+        try:
+            # Spiel aktualisieren
+            cursor.execute('''
+                UPDATE games 
+                SET end_time = ?, result = ?, final_position = ?
+                WHERE id = ?
+            ''', (end_time, result, result_type, game_id))
+            
+            # Spieler-IDs holen
+            cursor.execute(
+                'SELECT white_player_id, black_player_id FROM games WHERE id = ?',
+                (game_id,)
+            )
+            white_id, black_id = cursor.fetchone()
+            self._invalidate_analytics(white_id, black_id)
+            
+            # Punkte vergeben: (player_id, points_delta, played_delta, won_delta)
+            if winner == 'white_win':
+                results = [(white_id, 3, 1, 1), (black_id, 0, 1, 0)]  # Gewinner: +3, Verlierer: 0
+            elif winner == 'black_win':
+                results = [(black_id, 3, 1, 1), (white_id, 0, 1, 0)]
+            else:  # draw
+                results = [(white_id, 1, 1, 0), (black_id, 1, 1, 0)]  # Remis: je +1
+            self.add_player_results_bulk(results)
+            
+            # Elo und Glicko-2 beider Spieler fortschreiben
+            self._rate_game(game_id, white_id, black_id, RESULT_SCORES[result], end_time)
+            
+            # Eröffnungsbaum um dieses Spiel ergänzen
+            self.add_opening_moves(opening_rows(self._game_plies(game_id), result))
+            
+            self._commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            self._invalidate_leaderboard()
     
+    @_reads
     def get_game(self, game_id: int) -> Optional[dict]:
         """
         Holt ein Spiel nach ID.
@@ -256,34 +493,123 @@ class DatabaseManager:
     def list_games(self, player_id: Optional[int] = None, 
                    limit: int = 50) -> List[dict]:
         """
-        Listet Spiele auf, optional gefiltert nach Spieler.
+        Listet die neuesten Spiele auf, optional gefiltert nach Spieler.
         
         :param player_id: Optional: nur Spiele dieses Spielers
         :param limit: Max. Anzahl zurückzugebender Spiele
         :return: Liste von Dicts mit Spieldaten
         """
-        cursor = self.conn.cursor()
+        return self.list_games_page(limit=limit, player_id=player_id)
+    
+    @_reads
+    def list_games_page(self, after: Optional[tuple] = None, limit: int = 50,
+                        player_id: Optional[int] = None, result: Optional[str] = None,
+                        game_type: Optional[str] = None, date_from: Optional[str] = None,
+                        date_to: Optional[str] = None) -> List[dict]:
+        """
+        Listet eine Seite von Spielen auf (Keyset-Pagination, neueste zuerst).
         
-        if player_id:
-            cursor.execute('''
-                SELECT * FROM games 
-                WHERE white_player_id = ? OR black_player_id = ?
-                ORDER BY start_time DESC LIMIT ?
-            ''', (player_id, player_id, limit))
-        else:
-            cursor.execute('''
-                SELECT * FROM games 
-                ORDER BY start_time DESC LIMIT ?
-            ''', (limit,))
+        Die Sortierung erfolgt nach (start_time, id) absteigend. Für die nächste
+        Seite wird der Schlüssel der letzten Zeile als ``after`` übergeben, so
+        dass tiefe Seiten genauso schnell sind wie die erste (kein OFFSET).
+        Die Spielernamen werden per JOIN mitgeliefert (white_username,
+        black_username), damit keine Einzelabfrage pro Spiel nötig ist.
+        
+        :param after: (start_time, id) der letzten Zeile der vorherigen Seite
+        :param limit: Max. Anzahl zurückzugebender Spiele
+        :param player_id: Optional: nur Spiele dieses Spielers
+        :param result: Optional: 'white_win', 'black_win' oder 'draw'
+        :param game_type: Optional: 'timed' oder 'untimed'
+        :param date_from: Optional: ISO-Datum, frühester Spielbeginn (inklusive)
+        :param date_to: Optional: ISO-Datum, spätester Spielbeginn (exklusive)
+        :return: Liste von Dicts mit Spieldaten
+        """
+        conditions, params = self._game_filters(player_id, result, game_type, date_from, date_to)
+        
+        if after is not None:
+            after_time, after_id = after
+            conditions.append('(g.start_time < ? OR (g.start_time = ? AND g.id < ?))')
+            params.extend([after_time, after_time, after_id])
+        
+        where = ('WHERE ' + ' AND '.join(conditions)) if conditions else ''
+        params.append(limit)
+        
+        cursor = self.conn.cursor()
+        cursor.execute(f'''
+            SELECT g.*, w.username AS white_username, b.username AS black_username
+            FROM games g
+            JOIN players w ON w.id = g.white_player_id
+            JOIN players b ON b.id = g.black_player_id
+            {where}
+            ORDER BY g.start_time DESC, g.id DESC
+            LIMIT ?
+        ''', params)
         
         return [dict(row) for row in cursor.fetchall()]
     
+    def iter_games(self, player_id: Optional[int] = None, result: Optional[str] = None,
+                   game_type: Optional[str] = None, date_from: Optional[str] = None,
+                   date_to: Optional[str] = None):
+        """
+        Liefert Spiele chronologisch (älteste zuerst) direkt aus dem Cursor.
+        
+        Im Gegensatz zu list_games_page wird das Ergebnis nicht in eine Liste
+        geladen: die Zeilen werden beim Iterieren gelesen, so dass auch sehr
+        große Archive in konstantem Speicher exportiert werden können.
+        
+        :param player_id: Optional: nur Spiele dieses Spielers
+        :param result: Optional: 'white_win', 'black_win' oder 'draw'
+        :param game_type: Optional: 'timed' oder 'untimed'
+        :param date_from: Optional: ISO-Datum, frühester Spielbeginn (inklusive)
+        :param date_to: Optional: ISO-Datum, spätester Spielbeginn (exklusive)
+        :return: Generator von Dicts mit Spieldaten (inkl. white_username, black_username)
+        """
+        conditions, params = self._game_filters(player_id, result, game_type, date_from, date_to)
+        where = ('WHERE ' + ' AND '.join(conditions)) if conditions else ''
+        
+        with self._pool.reading() as conn:
+            cursor = conn.execute(f'''
+                SELECT g.*, w.username AS white_username, b.username AS black_username
+                FROM games g
+                JOIN players w ON w.id = g.white_player_id
+                JOIN players b ON b.id = g.black_player_id
+                {where}
+                ORDER BY g.start_time, g.id
+            ''', params)
+            for row in cursor:
+                yield dict(row)
+    
+    @staticmethod
+    def _game_filters(player_id, result, game_type, date_from, date_to) -> tuple:
+        """Baut WHERE-Bedingungen und Parameter für die Spiel-Filter (Alias g)."""
+        conditions = []
+        params = []
+        if player_id:
+            conditions.append('(g.white_player_id = ? OR g.black_player_id = ?)')
+            params.extend([player_id, player_id])
+        if result:
+            conditions.append('g.result = ?')
+            params.append(result)
+        if game_type:
+            conditions.append('g.game_type = ?')
+            params.append(game_type)
+        if date_from:
+            conditions.append('g.start_time >= ?')
+            params.append(date_from)
+        if date_to:
+            conditions.append('g.start_time < ?')
+            params.append(date_to)
+        return conditions, params
+    
     # ==================== BRETT-VERWALTUNG ====================
     
+    @_writes
     def add_board(self, game_id: int, board_number: int, board_JSON: str, notation: str, white_time: str, black_time: str):
         """
         Fügt ein Brett zu einem Spiel hinzu.
         
+        Die Stellung wird gleichzeitig in den Positionsindex eingetragen.
+        
         :param game_id: ID des Spiels
         :param move_number: Zugnummer
         :param notation: Standard-Schachnotation (z.B. 'e4', 'Nf3')
@@ -293,8 +619,13 @@ class DatabaseManager:
             INSERT INTO boards (game_id, board_number, board_JSON, notation, white_time, black_time)
             VALUES (?, ?, ?, ?, ?, ?)
         ''', (game_id, board_number, board_JSON, notation, white_time, black_time))
-        self.conn.commit()
+        cursor.execute(
+            'INSERT OR IGNORE INTO positions (hash, game_id, ply) VALUES (?, ?, ?)',
+            (hash_board_json(board_JSON), game_id, board_number)
+        )
+        self._commit()
     
+    @_reads
     def get_game_boards(self, game_id: int) -> List[dict]:
         """
         Holt alle gespeicherten Board-Zustände eines Spiels in chronologischer Reihenfolge.
@@ -310,12 +641,519 @@ class DatabaseManager:
         ''', (game_id,))
         return [dict(row) for row in cursor.fetchall()]
     
+    def iter_game_boards(self, game_id: int):
+        """
+        Liefert die Board-Zustände eines Spiels chronologisch direkt aus dem Cursor.
+        
+        :param game_id: ID des Spiels
+        :return: Generator von sqlite3.Row (board_number, board_JSON, notation, white_time, black_time)
+        """
+        with self._pool.reading() as conn:
+            yield from conn.execute('''
+                SELECT board_number, board_JSON, notation, white_time, black_time
+                FROM boards
+                WHERE game_id = ?
+                ORDER BY board_number
+            ''', (game_id,))
+    
+    # ==================== BULK-IMPORT ====================
+    # Die folgenden Methoden committen NICHT selbst: der Aufrufer bündelt
+    # viele Spiele in einer Transaktion und ruft danach commit() auf.
+    
+    @_writes
+    def ensure_players(self, usernames) -> dict:
+        """
+        Legt fehlende Spieler an und gibt die IDs aller Namen zurück.
+        
+        :param usernames: Iterable von Benutzernamen
+        :return: Dict username -> player_id
+        """
+        names = list(dict.fromkeys(usernames))
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            'INSERT OR IGNORE INTO players (username) VALUES (?)',
+            ((name,) for name in names)
+        )
+        self._invalidate_leaderboard()
+        ids = {}
+        # In Blöcken abfragen (SQLite begrenzt die Anzahl der Parameter)
+        for start in range(0, len(names), 500):
+            chunk = names[start:start + 500]
+            cursor.execute(
+                f'SELECT id, username FROM players WHERE username IN ({",".join("?" * len(chunk))})',
+                chunk
+            )
+            ids.update({row['username']: row['id'] for row in cursor.fetchall()})
+        return ids
+    
+    @_writes
+    def next_game_id(self) -> int:
+        """
+        Gibt die nächste freie Spiel-ID zurück.
+        
+        Beim Bulk-Import werden die IDs vorab vergeben, damit Spiele und
+        Boards per executemany eingefügt werden können (kein lastrowid nötig).
+        
+        :return: Größte je vergebene Spiel-ID + 1
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT seq FROM sqlite_sequence WHERE name = ?', ('games',))
+        row = cursor.fetchone()
+        cursor.execute('SELECT COALESCE(MAX(id), 0) FROM games')
+        return max(row[0] if row else 0, cursor.fetchone()[0]) + 1
+    
+    @_writes
+    def insert_games_bulk(self, games):
+        """
+        Fügt Spiele mit vorab vergebener ID ein.
+        
+        :param games: Iterable von Tupeln (id, white_player_id, black_player_id, game_type,
+                      time_per_player, time_control, start_time, end_time, result, final_position)
+        """
+        self.conn.executemany('''
+            INSERT INTO games
+            (id, white_player_id, black_player_id, game_type, time_per_player, time_control,
+             start_time, end_time, result, final_position)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', games)
+        self._invalidate_analytics()
+    
+    @_writes
+    def insert_boards_bulk(self, boards):
+        """
+        Fügt Board-Zustände ein; boards darf ein Generator sein und wird gestreamt.
+        
+        Die Stellungen werden in den Positionsindex übernommen. Ein optionales
+        siebtes Tupel-Element ist der bereits berechnete Positions-Hash
+        (sonst wird er aus dem Board-JSON berechnet).
+        
+        :param boards: Iterable von Tupeln (game_id, board_number, board_JSON, notation,
+                       white_time, black_time[, position_hash])
+        """
+        positions = []
+        
+        def board_rows():
+            for row in boards:
+                position_hash = row[6] if len(row) > 6 else hash_board_json(row[2])
+                positions.append((position_hash, row[0], row[1]))
+                yield row[:6]
+        
+        self.conn.executemany('''
+            INSERT INTO boards (game_id, board_number, board_JSON, notation, white_time, black_time)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', board_rows())
+        self.conn.executemany(
+            'INSERT OR IGNORE INTO positions (hash, game_id, ply) VALUES (?, ?, ?)', positions
+        )
+    
+    @_writes
+    def add_player_results_bulk(self, results):
+        """
+        Addiert die Statistiken vieler Spiele auf einmal (wie update_player_stats).
+        
+        :param results: Iterable von Tupeln (player_id, points_delta, played_delta, won_delta)
+        """
+        self.conn.executemany('''
+            UPDATE players
+            SET points = points + ?,
+                games_played = games_played + ?,
+                games_won = games_won + ?
+            WHERE id = ?
+        ''', ((points, played, won, player_id) for player_id, points, played, won in results))
+        self._invalidate_leaderboard()
+    
+    # ==================== POSITIONSINDEX ====================
+    
+    @_reads
+    def find_games_by_position(self, position: Union[int, str], limit: int = 50) -> List[dict]:
+        """
+        Findet Spiele, in denen eine Stellung vorkommt (neueste zuerst).
+        
+        Verglichen werden Figurenstellung und Spieler am Zug über den
+        Positionsindex; Rochade- und En-passant-Rechte spielen keine Rolle.
+        
+        :param position: Positions-Hash (siehe position_hash) oder FEN-String
+        :param limit: Max. Anzahl zurückzugebender Spiele
+        :return: Liste von Dicts mit Spieldaten (inkl. white_username, black_username)
+                 und ply = erster Halbzug (board_number), in dem die Stellung auftritt
+        """
+        position_hash = hash_fen(position) if isinstance(position, str) else position
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT g.*, w.username AS white_username, b.username AS black_username, p.ply
+            FROM (
+                SELECT game_id, MIN(ply) AS ply FROM positions
+                WHERE hash = ?
+                GROUP BY game_id
+            ) p
+            JOIN games g ON g.id = p.game_id
+            JOIN players w ON w.id = g.white_player_id
+            JOIN players b ON b.id = g.black_player_id
+            ORDER BY g.start_time DESC, g.id DESC
+            LIMIT ?
+        ''', (position_hash, limit))
+        return [dict(row) for row in cursor.fetchall()]
+    
+    @_writes
+    def backfill_positions(self, batch_size: int = 500, progress=None) -> int:
+        """
+        Trägt den Positionsindex für Spiele nach, die noch keine Einträge haben.
+        
+        Gedacht für Datenbanken aus der Zeit vor dem Positionsindex; kann
+        jederzeit erneut aufgerufen werden. Committet nach jeweils batch_size Spielen.
+        
+        :param batch_size: Spiele pro Transaktion
+        :param progress: Optionaler Callback progress(anzahl_spiele) nach jedem Block
+        :return: Anzahl nachgetragener Spiele
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT g.id FROM games g
+            WHERE NOT EXISTS (SELECT 1 FROM positions p WHERE p.game_id = g.id)
+            ORDER BY g.id
+        ''')
+        game_ids = [row[0] for row in cursor.fetchall()]
+        
+        for start in range(0, len(game_ids), batch_size):
+            for game_id in game_ids[start:start + batch_size]:
+                self.conn.executemany(
+                    'INSERT OR IGNORE INTO positions (hash, game_id, ply) VALUES (?, ?, ?)',
+                    ((hash_board_json(row['board_JSON']), game_id, row['board_number'])
+                     for row in self.iter_game_boards(game_id))
+                )
+            self._commit()
+            if progress:
+                progress(min(start + batch_size, len(game_ids)))
+        return len(game_ids)
+    
+    # ==================== ERÖFFNUNGSBAUM ====================
+    
+    @_reads
+    def get_opening_moves(self, position_hash: int, limit: Optional[int] = None) -> List[dict]:
+        """
+        Holt die aus einer Stellung gespielten Züge mit Ergebnissen.
+        
+        Liest nur die Einträge der Stellung (Primärschlüssel hash, next_hash).
+        
+        :param position_hash: Hash der Stellung (siehe position_hash)
+        :param limit: Max. Anzahl Züge (None = alle)
+        :return: Liste von Dicts (notation, next_hash, games, white_wins, draws, black_wins),
+                 häufigste Züge zuerst
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT notation, next_hash, games, white_wins, draws, black_wins
+            FROM opening_stats
+            WHERE hash = ?
+            ORDER BY games DESC, notation
+            LIMIT ?
+        ''', (position_hash, -1 if limit is None else limit))
+        return [dict(row) for row in cursor.fetchall()]
+    
+    @_writes
+    def add_opening_moves(self, rows):
+        """
+        Addiert Züge zum Eröffnungsbaum (committet nicht selbst).
+        
+        :param rows: Iterable von Tupeln (hash, next_hash, notation, games,
+                     white_wins, draws, black_wins), z.B. aus opening_explorer.opening_rows
+        """
+        self.conn.executemany('''
+            INSERT INTO opening_stats (hash, next_hash, notation, games, white_wins, draws, black_wins)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (hash, next_hash) DO UPDATE SET
+                notation = excluded.notation,
+                games = games + excluded.games,
+                white_wins = white_wins + excluded.white_wins,
+                draws = draws + excluded.draws,
+                black_wins = black_wins + excluded.black_wins
+        ''', rows)
+    
+    @_writes
+    def rebuild_opening_stats(self) -> int:
+        """
+        Baut den Eröffnungsbaum aus allen beendeten Spielen neu auf.
+        
+        Für Datenbanken aus der Zeit vor dem Eröffnungsbaum (nach
+        backfill_positions); danach wird inkrementell aktualisiert.
+        
+        :return: Anzahl Einträge (Stellung, Zug)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('DELETE FROM opening_stats')
+        cursor.execute('''
+            INSERT INTO opening_stats (hash, next_hash, notation, games, white_wins, draws, black_wins)
+            SELECT before.hash, after.hash, MAX(b.notation), COUNT(*),
+                   SUM(g.result = 'white_win'), SUM(g.result = 'draw'), SUM(g.result = 'black_win')
+            FROM games g
+            JOIN positions after ON after.game_id = g.id AND after.ply BETWEEN 1 AND ?
+            JOIN positions before ON before.game_id = g.id AND before.ply = after.ply - 1
+            JOIN boards b ON b.game_id = g.id AND b.board_number = after.ply
+            WHERE g.result IN ('white_win', 'draw', 'black_win')
+            GROUP BY before.hash, after.hash
+        ''', (MAX_PLY,))
+        self._commit()
+        cursor.execute('SELECT COUNT(*) FROM opening_stats')
+        return cursor.fetchone()[0]
+    
+    @_reads
+    def _game_plies(self, game_id: int) -> list:
+        """(position_hash, notation) der ersten MAX_PLY Halbzüge eines Spiels."""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT p.hash, b.notation
+            FROM positions p
+            JOIN boards b ON b.game_id = p.game_id AND b.board_number = p.ply
+            WHERE p.game_id = ? AND p.ply <= ?
+            ORDER BY p.ply
+        ''', (game_id, MAX_PLY))
+        return [tuple(row) for row in cursor.fetchall()]
+    
+    # ==================== WERTUNGEN ====================
+    
+    @_reads
+    def get_player_rating(self, player_id: int) -> Rating:
+        """
+        Holt die aktuelle Elo- und Glicko-2-Wertung eines Spielers.
+        
+        :param player_id: ID des Spielers
+        :return: Rating (Startwerte, falls der Spieler nicht existiert)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            'SELECT elo, glicko_rating, glicko_rd, glicko_volatility FROM players WHERE id = ?',
+            (player_id,)
+        )
+        row = cursor.fetchone()
+        return Rating(*row) if row else Rating()
+    
+    @_reads
+    def get_rating_history(self, player_id: int) -> List[dict]:
+        """
+        Holt den Wertungsverlauf eines Spielers (älteste Partie zuerst).
+        
+        :param player_id: ID des Spielers
+        :return: Liste von Dicts mit game_id, end_time, elo, glicko_rating, glicko_rd
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT game_id, end_time, elo, glicko_rating, glicko_rd
+            FROM rating_history
+            WHERE player_id = ?
+            ORDER BY end_time, game_id
+        ''', (player_id,))
+        return [dict(row) for row in cursor.fetchall()]
+    
+    @_writes
+    def _rate_game(self, game_id: int, white_id: int, black_id: int, score: float, end_time: str):
+        """
+        Wertet ein beendetes Spiel für beide Spieler (ohne Commit).
+        
+        :param game_id: ID des Spiels
+        :param white_id: ID von Weiß
+        :param black_id: ID von Schwarz
+        :param score: Punkte für Weiß (1, 0.5 oder 0)
+        :param end_time: Spielende (für den Verlauf)
+        """
+        white, black = rate_game(self.get_player_rating(white_id), self.get_player_rating(black_id), score)
+        self._write_ratings(
+            [(white_id, white.elo, white.glicko, white.rd, white.volatility),
+             (black_id, black.elo, black.glicko, black.rd, black.volatility)],
+            [(white_id, end_time, game_id, white.elo, white.glicko, white.rd),
+             (black_id, end_time, game_id, black.elo, black.glicko, black.rd)],
+        )
+    
+    @_writes
+    def _write_ratings(self, players, history):
+        """
+        Schreibt Wertungen und Verlaufseinträge (ohne Commit).
+        
+        :param players: Iterable von (player_id, elo, glicko, rd, volatility)
+        :param history: Iterable von (player_id, end_time, game_id, elo, glicko, rd)
+        """
+        self.conn.executemany('''
+            UPDATE players
+            SET elo = ?, glicko_rating = ?, glicko_rd = ?, glicko_volatility = ?
+            WHERE id = ?
+        ''', ((elo, glicko, rd, volatility, player_id) for player_id, elo, glicko, rd, volatility in players))
+        self.conn.executemany('''
+            INSERT OR REPLACE INTO rating_history
+            (player_id, end_time, game_id, elo, glicko_rating, glicko_rd)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', history)
+        self._invalidate_leaderboard()
+    
+    @_writes
+    def recompute_ratings(self) -> int:
+        """
+        Berechnet alle Wertungen und den Verlauf aus der Spielhistorie neu.
+        
+        Die beendeten Spiele werden nach end_time gewertet (siehe
+        ratings.batch_ratings), z.B. nach einem PGN-Import mit älteren
+        Partien oder für Datenbanken von vor der Einführung der Wertungen.
+        
+        :return: Anzahl gewerteter Spiele
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT id FROM players ORDER BY id')
+        player_ids = [row[0] for row in cursor.fetchall()]
+        index = {player_id: i for i, player_id in enumerate(player_ids)}
+        
+        cursor.execute('''
+            SELECT id, white_player_id, black_player_id, result, end_time
+            FROM games
+            WHERE result IN ('white_win', 'draw', 'black_win') AND end_time IS NOT NULL
+            ORDER BY end_time, id
+        ''')
+        games = cursor.fetchall()
+        ratings = batch_ratings(
+            [index[game['white_player_id']] for game in games],
+            [index[game['black_player_id']] for game in games],
+            [RESULT_SCORES[game['result']] for game in games],
+            len(player_ids),
+        )
+        
+        history = ratings.history.tolist()
+        
+        def history_rows():
+            for game, sides in zip(games, history):
+                for player_id, (elo, glicko, rd) in zip((game['white_player_id'], game['black_player_id']), sides):
+                    yield (player_id, game['end_time'], game['id'], elo, glicko, rd)
+        
+        try:
+            cursor.execute('DELETE FROM rating_history')
+            self._write_ratings(
+                zip(player_ids, ratings.elo.tolist(), ratings.glicko.tolist(),
+                    ratings.rd.tolist(), ratings.volatility.tolist()),
+                history_rows(),
+            )
+            self._commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return len(games)
+    
+    # ==================== SPIELER-STATISTIKEN ====================
+    
+    # Beendete Spiele eines Spielers aus seiner Sicht; beide Teilabfragen
+    # nutzen idx_games_white_player bzw. idx_games_black_player
+    _PLAYER_GAMES = '''
+        WITH player_games AS (
+            SELECT id, 'white' AS color, black_player_id AS opponent_id,
+                   time_control, final_position, start_time, end_time,
+                   result = 'white_win' AS won, result = 'draw' AS drawn, result = 'black_win' AS lost
+            FROM games
+            WHERE white_player_id = :player_id AND result IS NOT NULL
+            UNION ALL
+            SELECT id, 'black', white_player_id,
+                   time_control, final_position, start_time, end_time,
+                   result = 'black_win', result = 'draw', result = 'white_win'
+            FROM games
+            WHERE black_player_id = :player_id AND result IS NOT NULL
+        )
+    '''
+    
+    # Auswertung -> (Spalten, GROUP BY, ORDER BY)
+    _ANALYTICS_GROUPS = {
+        'by_color': ('color', 'color', 'color'),
+        'by_time_control': ('time_control', 'time_control', 'games DESC, time_control'),
+        'by_opponent': ('opponent_id, (SELECT username FROM players WHERE id = opponent_id) AS opponent',
+                        'opponent_id', 'games DESC, opponent'),
+        'by_month': ('substr(start_time, 1, 7) AS month', 'month', 'month'),
+        'by_termination': ('final_position', 'final_position', 'games DESC, final_position'),
+    }
+    
+    @_reads
+    def get_player_results(self, player_id: int, group: str) -> List[dict]:
+        """
+        Ergebnisse eines Spielers, gruppiert nach einem Merkmal (eine GROUP-BY-Abfrage).
+        
+        :param player_id: ID des Spielers
+        :param group: 'by_color', 'by_time_control', 'by_opponent', 'by_month' oder 'by_termination'
+        :return: Liste von Dicts mit den Gruppenspalten sowie games, wins, draws, losses
+        :raises ValueError: bei unbekannter Gruppierung
+        """
+        if group not in self._ANALYTICS_GROUPS:
+            raise ValueError(f'Unbekannte Gruppierung: {group}')
+        columns, keys, order = self._ANALYTICS_GROUPS[group]
+        cursor = self.conn.cursor()
+        cursor.execute(f'''
+            {self._PLAYER_GAMES}
+            SELECT {columns},
+                   COUNT(*) AS games, SUM(won) AS wins, SUM(drawn) AS draws, SUM(lost) AS losses
+            FROM player_games
+            GROUP BY {keys}
+            ORDER BY {order}
+        ''', {'player_id': player_id})
+        return [dict(row) for row in cursor.fetchall()]
+    
+    @_reads
+    def get_player_game_lengths(self, player_id: int) -> dict:
+        """
+        Durchschnittliche Länge der beendeten Spiele eines Spielers.
+        
+        Die Halbzüge werden je Spiel über idx_boards_game ermittelt (höchste
+        board_number), ohne die Boards zu lesen.
+        
+        :param player_id: ID des Spielers
+        :return: Dict mit games, average_plies und average_seconds (None ohne Spiele)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(f'''
+            {self._PLAYER_GAMES}
+            SELECT COUNT(*) AS games,
+                   AVG((SELECT MAX(board_number) FROM boards WHERE game_id = player_games.id)) AS average_plies,
+                   AVG((julianday(end_time) - julianday(start_time)) * 86400) AS average_seconds
+            FROM player_games
+        ''', {'player_id': player_id})
+        return dict(cursor.fetchone())
+    
+    @_reads
+    def get_player_analytics(self, player_id: int) -> dict:
+        """
+        Alle Auswertungen eines Spielers (für die Statistik-Screens).
+        
+        Das Ergebnis wird je Spieler zwischengespeichert und verworfen, sobald
+        ein Spiel des Spielers endet, Spiele importiert werden oder eine
+        andere Verbindung die Datenbank ändert.
+        
+        :param player_id: ID des Spielers
+        :return: Dict mit den Listen by_color, by_time_control, by_opponent,
+                 by_month, by_termination (siehe get_player_results) und
+                 lengths (siehe get_player_game_lengths)
+        """
+        self._sync_caches()
+        analytics = self._analytics_cache.get(player_id)
+        if analytics is None:
+            generation = self._cache_generation
+            analytics = {group: self.get_player_results(player_id, group) for group in self._ANALYTICS_GROUPS}
+            analytics['lengths'] = self.get_player_game_lengths(player_id)
+            if generation == self._cache_generation:
+                self._analytics_cache[player_id] = analytics
+        return {
+            group: [dict(row) for row in rows] if isinstance(rows, list) else dict(rows)
+            for group, rows in analytics.items()
+        }
+    
+    def commit(self):
+        """Schließt die laufende Transaktion ab und gibt die Schreibverbindung frei."""
+        with self._pool.writing():
+            self._commit()
+        self._invalidate_leaderboard()
+        self._invalidate_analytics()
+    
+    def rollback(self):
+        """Verwirft die laufende Transaktion und gibt die Schreibverbindung frei."""
+        self._pool.rollback()
+        self._invalidate_leaderboard()
+        self._invalidate_analytics()
+    
     # ==================== UTILITY ====================
     
     def close(self):
-        """Schließt die Datenbankverbindung."""
-        if self.conn:
-            self.conn.close()
+        """Schließt alle Datenbankverbindungen."""
+        if self._pool:
+            self._pool.close()
     
     def __enter__(self):
         """Context Manager Unterstützung."""
@@ -0,0 +1,268 @@
+"""FEN- und EPD-Format für Stellungen.
+
+FEN (Forsyth-Edwards-Notation) beschreibt eine Stellung in sechs Feldern:
+    Figurenstellung, Spieler am Zug, Rochaderechte, En-passant-Feld,
+    Halbzugzähler (50-Züge-Regel), Zugnummer
+    z.B. "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"
+
+EPD (Extended Position Description) enthält nur die ersten vier Felder,
+gefolgt von Operationen ("opcode operand;"), z.B. in Testsammlungen:
+    "r3k2r/8/8/8/8/8/8/R3K2R w KQkq - bm O-O; id \"castle.1\";"
+Perft-Sammlungen hängen an einen vollständigen FEN ";D1 20 ;D2 400" an;
+beide Varianten liest parse_epd.
+
+Koordinaten wie im Board: row 0 ist die 8. Reihe (Schwarz), row 7 die 1. Reihe.
+Der Aufbau eines Boards aus einer FEN liegt in Board.from_fen/to_fen.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+
+
+START_FEN = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+
+_TURNS = {'w': 'white', 'b': 'black'}
+_CASTLING_ORDER = 'KQkq'
+
+_EPD_OPERATION = re.compile(r'\s*([A-Za-z_][A-Za-z0-9_+]*)\s*((?:"[^"]*"|[^;"])*);?')
+
+
+def square_name(position: tuple) -> str:
+    """Wandelt (row, col) in einen Feldnamen um, z.B. (6, 4) -> "e2"."""
+    row, col = position
+    return chr(ord('a') + col) + str(8 - row)
+
+
+def parse_square(name: str) -> tuple:
+    """
+    Wandelt einen Feldnamen in (row, col) um, z.B. "e2" -> (6, 4).
+
+    Raises:
+        ValueError: bei ungültigem Feldnamen
+    """
+    if len(name) != 2 or name[0] not in 'abcdefgh' or name[1] not in '12345678':
+        raise ValueError(f'Ungültiges Feld: {name!r}')
+    return 8 - int(name[1]), ord(name[0]) - ord('a')
+
+
+@dataclass
+class FenPosition:
+    """
+    Zerlegte FEN ohne Piece-Objekte.
+
+    Attributes:
+        pieces: Liste von (row, col, color, notation)
+        turn: 'white' oder 'black'
+        castling: Rochaderechte als Teilmenge von "KQkq" ('' = keine)
+        en_passant: Zielfeld eines möglichen En-passant-Schlags als (row, col) oder None
+        halfmove_clock: Halbzüge seit dem letzten Bauernzug oder Schlag
+        fullmove_number: Nummer des aktuellen Zugs (beginnt bei 1)
+    """
+    pieces: list
+    turn: str = 'white'
+    castling: str = ''
+    en_passant: Optional[tuple] = None
+    halfmove_clock: int = 0
+    fullmove_number: int = 1
+
+
+def _parse_placement(placement: str) -> list:
+    ranks = placement.split('/')
+    if len(ranks) != 8:
+        raise ValueError(f'FEN braucht 8 Reihen: {placement!r}')
+
+    pieces = []
+    for row, rank in enumerate(ranks):
+        col = 0
+        for char in rank:
+            if char.isdigit():
+                col += int(char)
+            else:
+                notation = char.upper()
+                if notation not in 'KQRBNP':
+                    raise ValueError(f'Unbekannte Figur in FEN: {char!r}')
+                if col > 7:
+                    raise ValueError(f'Reihe {8 - row} hat mehr als 8 Felder: {rank!r}')
+                pieces.append((row, col, 'white' if char.isupper() else 'black', notation))
+                col += 1
+        if col != 8:
+            raise ValueError(f'Reihe {8 - row} hat nicht 8 Felder: {rank!r}')
+    return pieces
+
+
+def parse_fen(fen: str) -> FenPosition:
+    """
+    Zerlegt einen FEN-String.
+
+    Fehlende Halbzug- und Zugnummer-Felder (z.B. aus EPD) gelten als "0 1".
+
+    Args:
+        fen: FEN-String
+
+    Returns:
+        FenPosition
+
+    Raises:
+        ValueError: bei ungültigem FEN-String
+    """
+    fields = fen.split()
+    if not 4 <= len(fields) <= 6:
+        raise ValueError(f'FEN braucht 4 bis 6 Felder: {fen!r}')
+
+    placement, turn, castling, en_passant = fields[:4]
+    if turn not in _TURNS:
+        raise ValueError(f'Ungültiger Spieler am Zug: {turn!r}')
+    if castling != '-' and (not castling or any(c not in _CASTLING_ORDER for c in castling)):
+        raise ValueError(f'Ungültige Rochaderechte: {castling!r}')
+
+    try:
+        halfmove_clock = int(fields[4]) if len(fields) > 4 else 0
+        fullmove_number = int(fields[5]) if len(fields) > 5 else 1
+    except ValueError:
+        raise ValueError(f'Ungültige Zugzähler: {fen!r}') from None
+
+    return FenPosition(
+        pieces=_parse_placement(placement),
+        turn=_TURNS[turn],
+        castling='' if castling == '-' else ''.join(c for c in _CASTLING_ORDER if c in castling),
+        en_passant=None if en_passant == '-' else parse_square(en_passant),
+        halfmove_clock=halfmove_clock,
+        fullmove_number=fullmove_number,
+    )
+
+
+def format_fen(squares, turn: str = 'white', castling: str = '', en_passant: Optional[tuple] = None,
+               halfmove_clock: int = 0, fullmove_number: int = 1) -> str:
+    """
+    Erstellt einen FEN-String aus einem Board-Array.
+
+    Args:
+        squares: 8x8 Array mit Piece-Objekten oder None
+        turn: 'white' oder 'black'
+        castling: Rochaderechte, z.B. "KQkq" ('' = keine)
+        en_passant: En-passant-Zielfeld als (row, col) oder None
+        halfmove_clock: Halbzüge seit dem letzten Bauernzug oder Schlag
+        fullmove_number: Nummer des aktuellen Zugs
+
+    Returns:
+        FEN-String
+    """
+    ranks = []
+    for row in range(8):
+        rank = ''
+        empty = 0
+        for col in range(8):
+            piece = squares[row, col]
+            if piece is None:
+                empty += 1
+                continue
+            if empty:
+                rank += str(empty)
+                empty = 0
+            rank += piece.notation if piece.color == 'white' else piece.notation.lower()
+        if empty:
+            rank += str(empty)
+        ranks.append(rank)
+
+    return ' '.join((
+        '/'.join(ranks),
+        'w' if turn == 'white' else 'b',
+        castling or '-',
+        square_name(en_passant) if en_passant else '-',
+        str(halfmove_clock),
+        str(fullmove_number),
+    ))
+
+
+@dataclass
+class EpdRecord:
+    """
+    Eine Zeile einer EPD-Datei.
+
+    Attributes:
+        fen: Vollständiger FEN-String (Zugzähler aus hmvc/fmvn bzw. "0 1")
+        operations: Opcode -> Operand (ohne Anführungszeichen), z.B. {"bm": "O-O", "D1": "20"}
+    """
+    fen: str
+    operations: dict = field(default_factory=dict)
+
+    @property
+    def id(self) -> Optional[str]:
+        return self.operations.get('id')
+
+
+def _parse_operations(text: str) -> dict:
+    if '"' not in text:
+        # Schneller Weg ohne Strings: einfach an ';' trennen
+        operations = {}
+        for part in text.split(';'):
+            opcode, _, operand = part.strip().partition(' ')
+            if opcode:
+                operations[opcode] = operand.strip()
+        return operations
+
+    operations = {}
+    for match in _EPD_OPERATION.finditer(text):
+        opcode, operand = match.groups()
+        operand = operand.strip()
+        if len(operand) >= 2 and operand[0] == operand[-1] == '"':
+            operand = operand[1:-1]
+        operations[opcode] = operand
+    return operations
+
+
+def parse_epd(line: str) -> EpdRecord:
+    """
+    Liest eine EPD-Zeile (oder FEN mit angehängten Operationen).
+
+    Die Stellung wird nur als Text zerlegt, nicht geprüft - so bleiben auch
+    große Testsammlungen schnell; Board.from_fen prüft beim Aufbau.
+
+    Args:
+        line: z.B. 'r3k2r/... w KQkq - bm O-O; id "castle.1";'
+
+    Returns:
+        EpdRecord
+
+    Raises:
+        ValueError: wenn weniger als vier Stellungsfelder vorhanden sind
+    """
+    position, separator, rest = line.strip().partition(';')
+    fields = position.split()
+    if separator and len(fields) >= 6 and fields[4].isdigit() and fields[5].isdigit():
+        # Perft-Format: vollständiger FEN, danach ";D1 20 ;D2 400"
+        return EpdRecord(' '.join(fields[:6]), _parse_operations(rest))
+
+    if len(fields) < 4:
+        raise ValueError(f'EPD braucht vier Stellungsfelder: {line!r}')
+
+    # Klassisches EPD: Operationen beginnen nach dem vierten Feld
+    operations = _parse_operations(' '.join(fields[4:]) + separator + rest)
+    clocks = (operations.get('hmvc', '0'), operations.get('fmvn', '1'))
+    return EpdRecord(' '.join(fields[:4] + list(clocks)), operations)
+
+
+def read_epd(lines: Iterable[str]) -> Iterator[EpdRecord]:
+    """
+    Liest EPD-Zeilen, z.B. aus einer geöffneten Datei.
+
+    Leere Zeilen und Kommentare (beginnend mit '#') werden übersprungen.
+    """
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            yield parse_epd(line)
+
+
+__all__ = [
+    'START_FEN',
+    'FenPosition',
+    'EpdRecord',
+    'square_name',
+    'parse_square',
+    'parse_fen',
+    'format_fen',
+    'parse_epd',
+    'read_epd',
+]
@@ -8,19 +8,21 @@ Der GameController verwaltet:
 
 Trennung der Verantwortlichkeiten:
 - kivy_main.py: UI-Darstellung (Frontend)
-- game_controller.py: Logik und Navigation
+- game_controller.py: Eingaben und Navigation
+- game_session.py: Ablauf eines Spiels (Regeln, Uhr, Persistenz) ohne UI
 - board.py/chess_logic.py: Spielregeln (Backend)
 """
 
-from typing import Optional
-from .board import Board
-from . import board
-from .pieces import Piece
-from .chess_logic import ChessLogic
+from typing import TYPE_CHECKING, Optional
 from .move import Move
-from .chess_timer import ChessTimer
+from .time_control import TimeControl
 from .database import DatabaseManager
-import json
+
+if TYPE_CHECKING:
+    # Board, GameSession und Replay ziehen numpy nach sich und werden erst
+    # beim ersten Spiel bzw. Replay importiert (schneller App-Start)
+    from .game_session import GameSession
+    from .replay import ReplayCache, ReplayNavigator
 
 
 class GameController:
@@ -35,12 +37,13 @@ class GameController:
     Design Pattern: Application Controller + Mediator
     """
     
-    def __init__(self, screen_manager, app):
+    def __init__(self, screen_manager, app, clock=None):
         """
         Initialisiert Controller.
         
         Args:
             screen_manager: Kivy ScreenManager für Navigation
+            clock: Clock-Source für die Schachuhr (Standard: Kivy Clock)
         """
         self.screen_manager = screen_manager
         
@@ -48,20 +51,13 @@ class GameController:
         self.current_screen = 'menu'  # Aktueller Screen
         self.app = app
         
-        # Datenbank
-        self.db = DatabaseManager()
-        self.current_game_id = None
+        # Datenbank (wird erst beim ersten Zugriff geöffnet, siehe db)
+        self._db: Optional[DatabaseManager] = None
+        self._player_cache: dict[int, dict] = {}  # player_id -> Spielerdaten
         
         # Spielzustand (nur während aktiven Spiels)
-        self.board = None
-        self.chess_logic = None
-        self.current_turn = None
+        self.session: Optional['GameSession'] = None
         self.selected_piece = None
-        self.game_is_over = False
-        self.last_move: Optional[Move] = None
-        self.checkmate: Optional[tuple] = None
-        self.move_history = []
-        self.valid_moves = []  # Alle gültigen Züge für aktuellen Spieler
         self.legal_moves = [] # Alle legalen Züge für die ausgewähle Figur 
         self.pending_promotion_move: Optional[Move] = None  # Move der auf Promotion wartet
         
@@ -70,14 +66,63 @@ class GameController:
         self.black_player = None
         self.use_timer = False
         self.time_per_player = None
-        self.draw_offer = False 
+        self.time_control: Optional[TimeControl] = None
 
-        # Timer
-        self.timer = None
+        # Clock-Source für die Schachuhr
+        self.clock = clock
         
         # UI-Referenzen (werden von Screens gesetzt)
         self.board_widget = None
         self.game_screen = None
+        
+        # Replay-Zustand
+        self._replay: Optional['ReplayNavigator'] = None
+        self._replay_cache: Optional['ReplayCache'] = None
+    
+    @property
+    def db(self) -> DatabaseManager:
+        """Datenbank; chess.db wird erst beim ersten Zugriff geöffnet."""
+        if self._db is None:
+            self._db = DatabaseManager()
+        return self._db
+    
+    # ==================== Spielzustand (aus der GameSession) ====================
+    
+    @property
+    def board(self):
+        return self.session.board if self.session else None
+    
+    @property
+    def current_turn(self):
+        return self.session.current_turn if self.session else None
+    
+    @property
+    def timer(self):
+        return self.session.timer if self.session else None
+    
+    @property
+    def move_history(self) -> list[Move]:
+        return self.session.move_history if self.session else []
+    
+    @property
+    def valid_moves(self) -> list[Move]:
+        return self.session.valid_moves if self.session else []
+    
+    @property
+    def last_move(self) -> Optional[Move]:
+        return self.session.last_move if self.session else None
+    
+    @property
+    def checkmate(self) -> Optional[tuple]:
+        return self.session.checkmate if self.session else None
+    
+    @property
+    def game_is_over(self) -> bool:
+        return self.session.game_is_over if self.session else False
+    
+    @property
+    def current_game_id(self) -> Optional[int]:
+        return self.session.game_id if self.session else None
     
     # ==================== Navigation ====================
     
@@ -162,7 +207,8 @@ class GameController:
     
     # ==================== Spiel-Management ====================
     
-    def set_players(self, white_player, black_player, use_timer=False, time_per_player=None):
+    def set_players(self, white_player, black_player, use_timer=False, time_per_player=None,
+                    time_control: Optional[TimeControl] = None):
         """
         Setzt Spieler-Informationen für neues Spiel.
         
@@ -171,81 +217,64 @@ class GameController:
             black_player: Dict mit Spieler-Daten (black)
             use_timer: Bool, ob Timer aktiviert
             time_per_player: Minuten pro Spieler (falls Timer aktiv)
+            time_control: Bedenkzeit-Regelung (Inkrement, Delay, Perioden);
+                          ohne Angabe gilt time_per_player ohne Inkrement
         """
+        if use_timer and time_control is None and time_per_player:
+            time_control = TimeControl.from_minutes(time_per_player)
+        if time_control is not None and time_per_player is None:
+            time_per_player = time_control.initial_minutes
+
         self.white_player = white_player
         self.black_player = black_player
         self.use_timer = use_timer
         self.time_per_player = time_per_player
+        self.time_control = time_control if use_timer else None
 
     def reset_game_state(self):
         """Setzt den Spielzustand zurück (ohne Spieler-Infos)."""
-        self.board = None
-        self.chess_logic = None
-        self.current_turn = None
         self.selected_piece = None
-        self.game_is_over = False
-        self.last_move = None
-        self.checkmate = None
-        self.move_history = []
-        self.valid_moves = []
         self.legal_moves = []
         self.pending_promotion_move = None
-        self.current_game_id = None
-        self.draw_offer = False
         
         # Timer stoppen
-        if self.timer:
+        if self.session:
             try:
-                self.timer.stop()
+                self.session.stop()
             except:
                 pass
-        self.timer = None
+        self.session = None
 
     def start_new_game(self):
         """
         Startet ein neues Spiel (wird aufgerufen wenn GameScreen geladen wird).
         
-        Erstellt Board und chess_logic erst HIER, nicht im __init__!
+        Erstellt die GameSession (Board, Regeln, Uhr) erst HIER, nicht im __init__!
         """
         try:
-            # Setze Spielzustand zurück
-            self.reset_game_state()
-            
-            # Initialisiere Spielzustand
-            self.current_turn = 'white'
+            from .game_session import GameSession
 
-            # Backend initialisieren
-            self.board = Board()
-            self.board.setup_startpos()  # Explizit aufrufen für neues Spiel
-            self.chess_logic = ChessLogic(self.board)
+            # GameScreen wird erst bei Bedarf gebaut und meldet dabei
+            # Board-Widget und Screen am Controller an
+            if self.game_screen is None and self.screen_manager is not None and self.screen_manager.has_screen('game'):
+                self.screen_manager.get_screen('game')
 
-            # Spiel in Datenbank erstellen
-            self._create_game_in_database()
-            
-            # Berechne initiale legale Züge
-            self.valid_moves = self.chess_logic.calculate_all_moves()  # Methode mit () aufrufen!
-            
-            # Timer initialisieren
-            if self.use_timer and self.time_per_player:
-                # Countdown-Timer (klassischer Schach-Timer)
-                self.timer = ChessTimer(
-                    time_per_player_minutes=self.time_per_player,
-                    on_time_up_callback=self._on_timer_expired,
-                    stopwatch_mode=False
-                )
-            else:
-                # Stoppuhr-Modus (zählt Zeit hoch)
-                self.timer = ChessTimer(
-                    time_per_player_minutes=0,
-                    on_time_up_callback=None,
-                    stopwatch_mode=True
-                )
+            # Setze Spielzustand zurück
+            self.reset_game_state()
             
+            self.session = GameSession(
+                white_player=self.white_player,
+                black_player=self.black_player,
+                use_timer=self.use_timer,
+                time_control=self.time_control,
+                db=self.db,
+                clock=self.clock
+            )
+            self.session.on_game_over = self._on_game_over
             # Setze UI-Update Callback
             if self.game_screen:
-                self.timer.on_timer_update = self.game_screen.update_timer_display
-            # Starte Timer
-            self.timer.start()
+                self.session.on_timer_update = self.game_screen.update_timer_display
+            self.session.start()
             
             # UI aktualisieren
             if self.board_widget:
@@ -255,7 +284,7 @@ class GameController:
             
             if self.game_screen:
                 # Spieler-Informationen an GameScreen weitergeben
-                self.game_screen.set_players(self.white_player, self.black_player, self.use_timer, self.time_per_player)
+                self.game_screen.set_players(self.white_player, self.black_player, self.use_timer, self.time_control)
                 self.game_screen.update_turn_info(self.current_turn)
                 self.game_screen.update_move_history([])
                 # Initiale Timer-Anzeige aktualisieren
@@ -297,34 +326,6 @@ class GameController:
     
     # ==================== Spiel-Logik ====================
     
-    def _update_valid_moves(self):
-        """Aktualisiert alle gültigen Züge für aktuellen Spieler."""
-
-        if not self.chess_logic:
-            raise ValueError('ChessLogic ist nicht initialisiert!')
-        
-        if not self.board:
-            raise ValueError('Board ist nicht initialisiert!')
-        
-        try:
-            moves = self.chess_logic.all_legal_moves(self.last_move, self.current_turn)
-            # Fallback: Falls all_legal_moves() None zurückgibt, leere Liste verwenden
-            if isinstance(moves, str):
-                # Spielende (Checkmate oder Stalemate)
-                self.game_over(moves, 'black' if self.current_turn == 'white' else 'white')
-                self.valid_moves = []
-            else:
-                self.valid_moves = moves
-            
-            # Prüfe ob der aktuelle König im Schach steht
-            king = self.board.white_king if self.current_turn == 'white' else self.board.black_king
-            if king and self.chess_logic.is_in_check(king, self.chess_logic.all_moves):
-                self.checkmate = king.position
-            else:
-                self.checkmate = None
-        except Exception as e:
-            self._handle_game_error(e, "bei der Berechnung gültiger Züge")
-    
     def on_square_clicked(self, row, col):
         """
         Callback wenn ein Schachfeld geklickt wird.
@@ -388,10 +389,7 @@ class GameController:
         self.selected_piece = piece
         
         # Finde legale Positionen für diese Figur aus valid_moves
-        legal_positions = []
-        for move in self.valid_moves:
-            if move.piece == piece:
-                legal_positions.append(move)
+        legal_positions = self.session.legal_moves_for(piece)
         
         # UI aktualisieren: Highlights setzen
         if self.board_widget:
@@ -495,47 +493,17 @@ class GameController:
         Args:
             move: Move-Objekt mit allen Zug-Informationen
         """
-        try:       
-            # Zug im Board ausführen
-            self.board.make_move(move)
-            
-            # last_move speichern
-            self.last_move = move
-            
-            # In Historie speichern
-            self.move_history.append(move)
-            
-            # Spieler wechseln
-            self.current_turn = 'black' if self.current_turn == 'white' else 'white'
-
+        try:
             # Auswahl aufheben
             self._deselect_piece()
 
-            # DB aktualisieren
-            if self.current_game_id:
-                self.db.add_board(
-                    game_id=self.current_game_id,
-                    board_number=len(self.move_history),
-                    board_JSON=self._serialize_board(),
-                    notation=self.get_move_notation(self.last_move),
-                    white_time=str(self.timer.white_time) if self.timer else "0",
-                    black_time=str(self.timer.black_time) if self.timer else "0"
-                )
-
-            # Remis-Angebot zurücksetzen
-            self.draw_offer = False
-            
-            # Gültige Züge für nächsten Spieler berechnen
-            self._update_valid_moves()
+            # Zug ausführen (DB, Uhr und Spielende übernimmt die Session)
+            self.session.play_move(move)
             
             # UI aktualisieren
             if self.board_widget:
                 self.board_widget.update_board(self.board.squares, self.checkmate)
 
-            # Timer umschalten
-            if self.timer:
-                self.timer.switch_player()
-
             if self.game_screen:
                 self.game_screen.update_turn_info(self.current_turn)
                 self.game_screen.update_move_history(self.move_history)
@@ -548,53 +516,36 @@ class GameController:
         Beendet das Spiel und zeigt Game-Over Popup an.
         
         Args:
-            result_type: 'checkmate' oder 'stalemate' oder 'timeover'
-            winner: 'white' oder 'black' (nur bei checkmate/timeover)
+            result_type: 'checkmate', 'stalemate', 'remis' oder 'timeover'
+            winner: wird ignoriert, die Session bestimmt den Gewinner
         """
-        # Timer stoppen
-        if self.timer:
-            self.timer.stop()   
+        if self.session:
+            self.session.finish(result_type)
 
-        self.game_is_over = True
+    def _on_game_over(self, result_type, winner):
+        """
+        Callback der GameSession bei Spielende: zeigt das passende Popup.
+        
+        Args:
+            result_type: 'checkmate', 'timeover' oder ein Schlüssel von DRAW_RESULTS
+            winner: 'white', 'black' oder None bei Remis
+        """
         self._deselect_piece()
         
-        # Gewinner ist der ANDERE Spieler (der gerade gezogen hat)
-        winner = 'black' if self.current_turn == 'white' else 'white'
+        # Punkte/Spiele haben sich geändert (update_player_stats)
+        self.invalidate_player_cache()
 
-        # Spielergebnis in Datenbank speichern
         if result_type == 'checkmate':
-            self._save_game_result(f'{winner}_win', 'checkmate')
             self._show_game_over_popup('checkmate', winner)
-            return
         elif result_type == 'stalemate':
-            self._save_game_result(None, 'Patt')
             self._show_game_over_popup('draw')
-            return
         elif result_type == 'remis':
-            self._save_game_result(None, 'Remis')
             self._show_game_over_popup('remis')
-            return
         elif result_type == 'timeover':
-            self._save_game_result(f'{winner}_win', 'timeover')
             self._show_time_up_popup(winner)
-            return
         else:
-            raise NotImplementedError('undefined')
-
-    # ==================== Timer-Management ====================
-    
-    def _on_timer_expired(self, color):
-        """
-        Callback wenn die Zeit eines Spielers abgelaufen ist.
-        
-        Args:
-            color: 'white' oder 'black' - wer hat keine Zeit mehr
-        """
-        # Gewinner ist der andere Spieler
-        winner = 'black' if color == 'white' else 'white'
-        
-        # Zeige Game-Over Popup
-        self.game_over('timeover', winner)
+            # Remis nach den Regeln (Stellungswiederholung, 50 Züge, Material)
+            self._show_game_over_popup(result_type)
 
     # ==================== Remis-Funktionalität ====================
     
@@ -606,12 +557,11 @@ class GameController:
         if self.game_is_over:
             return  # Kein Remis nach Spielende möglich
         
-        if self.timer:
-            self.timer.pause()
+        self.session.pause()
 
         if self.game_screen:
             self.game_screen.show_draw_confirm_popup()
-            self.draw_offer = True
+            self.session.offer_draw()
     
     def confirm_draw(self):
         """
@@ -620,7 +570,8 @@ class GameController:
         """
 
         # Spiel als beendet markieren
-        self.game_over('remis', None)
+        if self.session:
+            self.session.accept_draw()
     
     def cancel_draw(self):
         """
@@ -629,175 +580,23 @@ class GameController:
         """
 
         # Lässt den Timer weiter laufen
-        if self.timer and self.timer.is_paused:
-            self.timer.resume()
+        if self.session:
+            self.session.resume()
     
     # ==================== Hilfsmethoden ====================
 
     def get_move_notation(self, move: Move) -> str:
         """
-        Konvertiert einen Move in Schachnotation (z.B. "e2-e4").
+        Gibt die SAN eines ausgeführten Zugs zurück (z.B. "Nbd2", "Qh4#").
         
         Args:
-            move: Move-Objekt
+            move: Move aus move_history
         
         Returns:
             String mit Zugnotation
         """
-        # Rochade
-        if move.castelling:
-            if move.to_pos[1] == 6:  # Kurze Rochade
-                return "O-O"
-            else:  # Lange Rochade
-                return "O-O-O"
-        
-        # Normale Züge
-        to_row, to_col = move.to_pos
-        to_notation = chr(ord('a') + to_col) + str(8 - to_row)
-        
-        symbol = move.piece.notation
-        piece_symbol = '' if symbol == 'P' else symbol
-        capture_symbol = 'x' if move.captured else '-'
-        
-        notation = f"{piece_symbol}{capture_symbol}{to_notation}"
-        
-        # Promotion
-        if move.promotion:
-            notation += '=' + move.promotion.upper()
-        
-        return notation
+        return self.session.notation(move)
 
-    # ==================== Datenbank-Integration ====================
-    
-    def _create_game_in_database(self):
-        """Erstellt neues Spiel in der Datenbank."""
-        if not self.white_player or not self.black_player:
-            return  # Kein Spiel ohne Spieler
-        
-        # Spieler in Datenbank holen oder erstellen
-        white_username = self.white_player[1] if isinstance(self.white_player, tuple) else self.white_player.get('username')
-        black_username = self.black_player[1] if isinstance(self.black_player, tuple) else self.black_player.get('username')
-        
-        white_player_data = self.db.get_player_by_username(white_username)
-        if not white_player_data:
-            white_player_id = self.db.create_player(white_username)
-        else:
-            white_player_id = white_player_data['id']
-        
-        black_player_data = self.db.get_player_by_username(black_username)
-        if not black_player_data:
-            black_player_id = self.db.create_player(black_username)
-        else:
-            black_player_id = black_player_data['id']
-        
-        # Spiel erstellen
-        game_type = 'timed' if self.use_timer else 'untimed'
-        self.current_game_id = self.db.create_game(
-            white_player_id=white_player_id,
-            black_player_id=black_player_id,
-            game_type=game_type,
-            time_per_player=self.time_per_player
-        )
-        
-        # Startposition speichern (board_number = 0)
-        if self.current_game_id and self.board:
-            self.db.add_board(
-                game_id=self.current_game_id,
-                board_number=0,
-                board_JSON=self._serialize_board(),
-                notation="Startposition",
-                white_time=str(self.timer.white_time) if self.timer else "0",
-                black_time=str(self.timer.black_time) if self.timer else "0"
-            )
-    
-    def _save_game_result(self, winner, result_type):
-        """
-        Speichert Spielergebnis in Datenbank.
-        
-        Args:
-            winner: 'white', 'black', oder None für Remis
-        """
-        if not self.current_game_id:
-            return  # Kein Spiel zu speichern
-        
-        # Spiel beenden und Statistiken aktualisieren
-        self.db.finish_game(self.current_game_id, winner, result_type)
-        self.current_game_id = None
-    
-    def _serialize_board(self) -> str:
-        """
-        Serialisiert das aktuelle Board als JSON-String.
-        
-        Returns:
-            JSON-String mit Board-Zustand
-        """
-        if not self.board:
-            return ""
-        
-        board_data = []
-        
-        for row in range(8):
-            for col in range(8):
-                piece = self.board.squares[row, col]
-                board_data.append({
-                    "row": row,
-                    "col": col,
-                    "color": piece.color if piece else None,
-                    "notation": piece.notation if piece else None,
-                })
-
-        board_data.append({
-            "turn": self.current_turn,
-            "white_time": self.timer.white_time if self.timer else None,
-            "black_time": self.timer.black_time if self.timer else None,
-            "draw_offers": {"white": self.draw_offer and self.current_turn == 'black', "black": self.draw_offer and self.current_turn == 'white'},
-        })
-
-        return json.dumps(board_data)
-    
-    def _deserialize_board(self, board_json: str):
-        """
-        Deserialisiert ein Board aus einem JSON-String.
-        
-        Args:
-            board_json: JSON-String mit Board-Zustand
-            
-        Returns:
-            numpy array mit Board-Zustand
-        """
-        import numpy as np
-        from .pieces import King, Queen, Rook, Bishop, Knight, Pawn
-        
-        board_data = json.loads(board_json)
-        
-        # Erstelle leeres 8x8 Board
-        board_array = np.empty((8, 8), dtype=object)
-        
-        # Mapping von Notation zu Klassen
-        piece_classes = {
-            'K': King,
-            'Q': Queen,
-            'R': Rook,
-            'B': Bishop,
-            'N': Knight,
-            'P': Pawn
-        }
-        
-        # Fülle Board mit Figuren aus JSON
-        for item in board_data:
-            if 'row' in item and 'col' in item:
-                row, col = item['row'], item['col']
-                color = item.get('color')
-                notation = item.get('notation')
-                
-                if color and notation:
-                    # Erstelle entsprechende Figur
-                    piece_class = piece_classes.get(notation)
-                    if piece_class:
-                        board_array[row, col] = piece_class(color, (row, col))
-        
-        return board_array
-    
     # ==================== Öffentliche Datenbank-API für UI ====================
     
     def get_or_create_player(self, username: str):
@@ -830,18 +629,45 @@ class GameController:
         """
         return self.db.get_leaderboard(limit)
     
-    def get_games_list(self, limit: int = 50):
+    def get_rating_history(self, player_id: int):
+        """
+        Holt den Elo-/Glicko-2-Verlauf eines Spielers (für Verlaufsdiagramme).
+        
+        Args:
+            player_id: Die ID des Spielers
+            
+        Returns:
+            Liste von Dicts (älteste Partie zuerst), siehe DatabaseManager.get_rating_history
+        """
+        return self.db.get_rating_history(player_id)
+    
+    def get_player_analytics(self, player_id: int):
         """
-        Holt Spieleliste aus der Datenbank.
+        Holt die Auswertungen eines Spielers (Farbe, Bedenkzeit, Gegner, Monat, Spielende, Länge).
+        
+        Args:
+            player_id: Die ID des Spielers
+            
+        Returns:
+            Dict, siehe DatabaseManager.get_player_analytics
+        """
+        return self.db.get_player_analytics(player_id)
+    
+    def get_games_list(self, limit: int = 50, after: Optional[tuple] = None, **filters):
+        """
+        Holt eine Seite der Spieleliste aus der Datenbank.
         Diese Methode wird vom Frontend (HistoryScreen) aufgerufen.
         
         Args:
-            limit: Anzahl der anzuzeigenden Spiele
+            limit: Anzahl der Spiele pro Seite
+            after: (start_time, id) des letzten Spiels der vorherigen Seite
+            **filters: player_id, result, game_type, date_from, date_to
+                       (siehe DatabaseManager.list_games_page)
             
         Returns:
-            Liste von Spiel-Dicts
+            Liste von Spiel-Dicts (inkl. white_username/black_username)
         """
-        return self.db.list_games(limit=limit)
+        return self.db.list_games_page(after=after, limit=limit, **filters)
     
     def get_all_players(self):
         """
@@ -853,15 +679,48 @@ class GameController:
         """
         return self.db.get_all_players()
 
+    def get_opening_moves(self, squares, turn: str, limit: int = 8):
+        """
+        Holt die Züge des Eröffnungsbaums für eine Stellung.
+        Diese Methode wird vom Frontend (GameScreen, GameReplayScreen) aufgerufen.
+        
+        Args:
+            squares: 8x8 Board-Array der angezeigten Stellung
+            turn: Spieler am Zug
+            limit: Max. Anzahl Züge
+            
+        Returns:
+            Liste von ExplorerMove (häufigste zuerst)
+        """
+        from .opening_explorer import OpeningExplorer
+        return OpeningExplorer(self.db).moves_for_board(squares, turn, limit)
+
     def get_player_by_id(self, player_id: int):
         """
-        Holt einen Spieler anhand der ID aus der Datenbank.
+        Holt einen Spieler anhand der ID (aus dem Cache oder der Datenbank).
         Args:
             player_id: Die ID des Spielers
         Returns:
             Dict mit Spielerdaten oder None
         """
-        return self.db.get_player(player_id)
+        player = self._player_cache.get(player_id)
+        if player is None:
+            player = self.db.get_player(player_id)
+            if player is not None:
+                self._player_cache[player_id] = player
+        return player
+    
+    def invalidate_player_cache(self, player_id: Optional[int] = None):
+        """
+        Verwirft gecachte Spielerdaten (nach update_player_stats).
+        
+        Args:
+            player_id: Nur diesen Spieler verwerfen (None = alle)
+        """
+        if player_id is None:
+            self._player_cache.clear()
+        else:
+            self._player_cache.pop(player_id, None)
     
     # ==================== Game Replay Funktionalität ====================
     
@@ -889,23 +748,46 @@ class GameController:
         Returns:
             Tuple (game_data, boards_list) - Spieldaten und Liste der Board-Daten
         """
-        game_data = self.db.get_game(game_id)
+        from .replay import ReplayCache, ReplayNavigator
+
+        # Zuletzt angesehene (beendete) Spiele kommen dekodiert aus dem Cache
+        if self._replay_cache is None:
+            self._replay_cache = ReplayCache()
+        game = self._replay_cache.get(game_id, self._fetch_game_for_replay)
         
-        if not game_data:
+        if game is None:
+            self._replay = None
             return None, []
         
-        # Boards aus der Datenbank holen
-        boards = self.db.get_game_boards(game_id)
+        # Navigator mit lebendem Board für das Replay anlegen
+        self._replay = ReplayNavigator(game)
         
-        # Boards für Replay speichern
-        self._replay_boards = boards
+        return game.game_data, game.boards
+    
+    def _fetch_game_for_replay(self, game_id: int):
+        """
+        Holt Spiel und Boards aus der Datenbank (nur bei Replay-Cache-Miss).
         
-        return game_data, boards
+        Args:
+            game_id: ID des Spiels
+            
+        Returns:
+            Tuple (game_data, boards_list)
+        """
+        game_data = self.db.get_game(game_id)
+        if not game_data:
+            return None, []
+        return game_data, self.db.get_game_boards(game_id)
     
     def get_replay_position(self, move_index: int):
         """
         Gibt das Board-Array für eine bestimmte Zugposition im Replay zurück.
         
+        Benachbarte Positionen werden inkrementell aus der aktuellen Stellung
+        erreicht, nur bei Sprüngen wird ein vollständiger Snapshot geladen.
+        Das zurückgegebene Array gehört dem Replay-Board und wird beim
+        nächsten Aufruf wiederverwendet.
+        
         Args:
             move_index: Index des Boards (0 = Startposition)
             
@@ -913,22 +795,22 @@ class GameController:
             numpy array mit der Board-Position
         """
         # Prüfe ob Replay-Boards geladen sind
-        if not hasattr(self, '_replay_boards') or not self._replay_boards:
-            # Fallback: Erstelle Startposition
-            replay_board = board.Board()
-            replay_board.setup_startpos()
-            return replay_board.squares
-        
-        # Index 0 sollte die Startposition sein
-        if move_index < 0 or move_index >= len(self._replay_boards):
+        if self._replay is None or not len(self._replay) or not 0 <= move_index < len(self._replay):
             # Fallback: Erstelle Startposition
-            replay_board = board.Board()
+            from .board import Board
+            replay_board = Board()
             replay_board.setup_startpos()
             return replay_board.squares
         
-        # Lade das entsprechende Board aus der Datenbank
-        board_data = self._replay_boards[move_index]
-        board_json = board_data['board_JSON']
+        return self._replay.go_to(move_index)
+    
+    def get_replay_metadata(self) -> dict:
+        """
+        Gibt die Metadaten der aktuell angezeigten Replay-Position zurück.
         
-        # Deserialisiere und gib Board zurück
-        return self._deserialize_board(board_json)
+        Returns:
+            Dict mit turn, white_time, black_time und draw_offers (leer ohne Replay)
+        """
+        if self._replay is None:
+            return {}
+        return self._replay.metadata
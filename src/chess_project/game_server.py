@@ -0,0 +1,324 @@
+"""Asyncio-Schnittstelle für viele gleichzeitige Partien in einem Prozess.
+
+- AsyncDatabase: Methoden des DatabaseManager als Coroutinen. Sie laufen in
+  einem Thread-Pool (der DatabaseManager ist thread-sicher, siehe
+  connection_pool.py), die Eventloop wartet also nie auf SQLite.
+- GameServer: verwaltet die laufenden Partien (AsyncGame). Regeln und Uhr
+  jeder Partie laufen in der Eventloop (GameSession mit AsyncioClockSource).
+  Schreibzugriffe der Sessions (add_board, finish_game) landen in einer
+  Warteschlange, die eine Task der Reihe nach im Thread-Pool abarbeitet -
+  alle bis dahin angefallenen Aufrufe gesammelt in einem Durchlauf.
+
+Züge werden sofort ausgeführt (play_san, play_move); await flush() wartet,
+bis sie gespeichert sind. Spieler (z.B. simulierte Spieler in Tests) warten
+mit wait_for_turn() auf ihren Zug.
+
+Beispiel:
+    async with GameServer(DatabaseManager('chess.db')) as server:
+        game = await server.create_game('Alice', 'Bob')
+        game.play_san('e4')
+        await game.flush()
+        leaderboard = await server.db.get_leaderboard()
+"""
+
+import asyncio
+import functools
+import inspect
+import itertools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Optional
+
+from .clock_sources import AsyncioClockSource
+from .game_session import GameSession
+from .move import Move
+from .time_control import TimeControl
+
+
+class AsyncDatabase:
+    """
+    Asynchrone Hülle um einen DatabaseManager.
+
+    Jede öffentliche Methode des DatabaseManager ist als Coroutine verfügbar
+    (z.B. await adb.get_leaderboard(10)). Generatoren wie iter_games sind
+    ausgenommen, da sie die Verbindung über mehrere Aufrufe hinweg benutzen;
+    seitenweise liefert list_games_page dieselben Daten.
+
+    Attribute:
+        db: Der umschlossene DatabaseManager
+    """
+
+    def __init__(self, db, executor: Optional[Executor] = None, max_workers: int = 4):
+        """
+        Args:
+            db: DatabaseManager
+            executor: Thread-Pool für die Datenbankaufrufe (Standard: eigener Pool)
+            max_workers: Threads des eigenen Pools
+        """
+        self.db = db
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='chess-db')
+
+    async def run(self, function, *args, **kwargs):
+        """
+        Führt function(*args, **kwargs) im Thread-Pool aus.
+
+        Returns:
+            Rückgabewert von function
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(function, *args, **kwargs))
+
+    def __getattr__(self, name):
+        method = getattr(self.db, name)
+        if name.startswith('_') or not callable(method) or inspect.isgeneratorfunction(method):
+            raise AttributeError(f'{name} ist keine asynchron aufrufbare Methode des DatabaseManager')
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            return await self.run(method, *args, **kwargs)
+        return call
+
+    async def close(self):
+        """Wartet auf laufende Aufrufe und beendet den eigenen Thread-Pool."""
+        if self._own_executor:
+            await asyncio.to_thread(self._executor.shutdown)
+
+
+class _QueuedWrites:
+    """Ersetzt session.db: Schreibzugriffe der Session gehen in die Warteschlange des Servers."""
+
+    def __init__(self, game: 'AsyncGame'):
+        self._game = game
+
+    def add_board(self, *args, **kwargs):
+        self._game._write('add_board', args, kwargs)
+
+    def finish_game(self, *args, **kwargs):
+        self._game._write('finish_game', args, kwargs)
+
+
+def _run_writes(db, calls) -> list:
+    """Führt gesammelte Schreibaufrufe aus (im Thread-Pool); je Aufruf die Exception oder None."""
+    errors = []
+    for name, args, kwargs in calls:
+        try:
+            getattr(db, name)(*args, **kwargs)
+        except Exception as error:
+            # Die Schreibmethode hat ihre Transaktion bereits verworfen und die
+            # Schreibverbindung freigegeben (siehe ConnectionPool.writing)
+            errors.append(error)
+        else:
+            errors.append(None)
+    return errors
+
+
+class AsyncGame:
+    """
+    Eine Partie des GameServer.
+
+    Attribute:
+        key: Schlüssel der Partie in GameServer.games
+        session: Die GameSession (Stellung, legale Züge, Uhr, Ergebnis)
+        write_error: Erste Exception beim Speichern der Partie (oder None)
+    """
+
+    def __init__(self, server: 'GameServer', key: int, session: GameSession):
+        self.server = server
+        self.key = key
+        self.session = session
+        self.write_error: Optional[Exception] = None
+        self._changed = asyncio.Event()
+        self._last_write: Optional[asyncio.Future] = None
+
+        session.on_move = self._notify
+        session.on_game_over = self._on_game_over
+
+    @property
+    def game_id(self) -> Optional[int]:
+        """ID der Partie in der Datenbank (oder None ohne Datenbank)."""
+        return self.session.game_id
+
+    @property
+    def game_is_over(self) -> bool:
+        """True nach Spielende."""
+        return self.session.game_is_over
+
+    # ==================== Züge ====================
+
+    def play_san(self, san: str) -> Move:
+        """Führt einen Zug in SAN aus (siehe GameSession.play_san)."""
+        return self.session.play_san(san)
+
+    def play(self, from_pos: tuple, to_pos: tuple, promotion: str = 'Q') -> Move:
+        """Führt einen Zug anhand von Start- und Zielfeld aus (siehe GameSession.play)."""
+        return self.session.play(from_pos, to_pos, promotion)
+
+    def play_move(self, move: Move, promotion: Optional[str] = None):
+        """Führt einen Move aus session.valid_moves aus."""
+        self.session.play_move(move, promotion)
+
+    def offer_draw(self):
+        """Markiert ein Remis-Angebot des Spielers am Zug."""
+        self.session.offer_draw()
+
+    def accept_draw(self):
+        """Beendet die Partie mit einem vereinbarten Remis."""
+        self.session.accept_draw()
+
+    # ==================== Warten ====================
+
+    async def wait_for_turn(self, color: str) -> bool:
+        """
+        Wartet, bis color am Zug oder die Partie beendet ist.
+
+        Args:
+            color: 'white' oder 'black'
+
+        Returns:
+            True, wenn color ziehen kann; False nach Spielende
+        """
+        await self._wait_until(lambda: self.session.game_is_over or self.session.current_turn == color)
+        return not self.session.game_is_over
+
+    async def wait_finished(self) -> tuple:
+        """
+        Wartet auf das Spielende und darauf, dass das Ergebnis gespeichert ist.
+
+        Returns:
+            (result_type, winner) wie GameSession.result
+        """
+        await self._wait_until(lambda: self.session.game_is_over)
+        await self.flush()
+        return self.session.result
+
+    async def flush(self):
+        """
+        Wartet, bis alle bisherigen Schreibzugriffe der Partie ausgeführt sind.
+
+        Raises:
+            Exception: write_error, falls ein Schreibzugriff fehlgeschlagen ist
+        """
+        if self._last_write is not None:
+            await self._last_write
+        if self.write_error is not None:
+            raise self.write_error
+
+    async def _wait_until(self, predicate):
+        while not predicate():
+            await self._changed.wait()
+
+    # ==================== Intern ====================
+
+    def _notify(self, *args):
+        """Weckt alle Wartenden; sie prüfen ihre Bedingung erneut."""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _on_game_over(self, result_type, winner):
+        self.server.games.pop(self.key, None)
+        self._notify()
+
+    def _write(self, name: str, args: tuple, kwargs: dict):
+        self._last_write = self.server._enqueue(self, name, args, kwargs)
+
+
+class GameServer:
+    """
+    Hostet beliebig viele gleichzeitige Partien in einer Eventloop.
+
+    Attribute:
+        db: AsyncDatabase (oder None, dann wird nichts gespeichert)
+        games: Laufende Partien, Schlüssel -> AsyncGame
+    """
+
+    def __init__(self, db=None, executor: Optional[Executor] = None, max_workers: int = 4):
+        """
+        Args:
+            db: Optionaler DatabaseManager
+            executor: Thread-Pool für die Datenbankaufrufe (Standard: eigener Pool)
+            max_workers: Threads des eigenen Pools
+        """
+        self.db = AsyncDatabase(db, executor, max_workers) if db is not None else None
+        self.games: dict[int, AsyncGame] = {}
+        self._keys = itertools.count(1)
+        self._writes: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def create_game(self, white: str, black: str, time_control: Optional[TimeControl] = None,
+                          fen: Optional[str] = None) -> AsyncGame:
+        """
+        Legt eine Partie an (in der Datenbank im Thread-Pool) und startet sie.
+
+        Args:
+            white: Username von Weiß (wird bei Bedarf angelegt)
+            black: Username von Schwarz (wird bei Bedarf angelegt)
+            time_control: Bedenkzeit-Regelung (Standard: ohne Zeitbegrenzung)
+            fen: Optionale Startstellung als FEN
+
+        Returns:
+            Die laufende Partie
+        """
+        session = GameSession((None, white), (None, black), use_timer=time_control is not None,
+                              time_control=time_control, clock=AsyncioClockSource(), fen=fen)
+        game = AsyncGame(self, next(self._keys), session)
+        if self.db is not None:
+            session.game_id = await self.db.run(session.create_game_record, self.db.db)
+            session.db = _QueuedWrites(game)
+
+        self.games[game.key] = game
+        session.start()
+        return game
+
+    async def flush(self):
+        """Wartet, bis alle bisher angefallenen Schreibzugriffe ausgeführt sind."""
+        if self._writes is not None:
+            await self._writes.join()
+
+    async def close(self):
+        """Hält alle Uhren an, speichert ausstehende Züge und beendet den Thread-Pool."""
+        for game in self.games.values():
+            game.session.stop()
+        await self.flush()
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+        if self.db is not None:
+            await self.db.close()
+
+    def _enqueue(self, game: AsyncGame, name: str, args: tuple, kwargs: dict) -> asyncio.Future:
+        """Stellt einen Schreibaufruf in die Warteschlange; das Future ist erledigt, sobald er ausgeführt ist."""
+        if self._writes is None:
+            self._writes = asyncio.Queue()
+            self._writer_task = asyncio.get_running_loop().create_task(self._write_loop())
+        done = asyncio.get_running_loop().create_future()
+        self._writes.put_nowait((game, name, args, kwargs, done))
+        return done
+
+    async def _write_loop(self):
+        """Arbeitet die Warteschlange ab, alle wartenden Aufrufe in einem Durchlauf."""
+        while True:
+            batch = [await self._writes.get()]
+            while not self._writes.empty():
+                batch.append(self._writes.get_nowait())
+            try:
+                errors = await self.db.run(_run_writes, self.db.db, [entry[1:4] for entry in batch])
+            except Exception as error:
+                errors = [error] * len(batch)
+            for (game, _, _, _, done), error in zip(batch, errors):
+                if error is not None and game.write_error is None:
+                    game.write_error = error
+                done.set_result(None)
+                self._writes.task_done()
+
+
+__all__ = ['AsyncDatabase', 'AsyncGame', 'GameServer']
@@ -0,0 +1,470 @@
+"""
+Headless Spielkern für ein einzelnes Schachspiel.
+
+Die GameSession kapselt Regeln, Schachuhr und Persistenz eines Spiels ohne
+jede Abhängigkeit zu Kivy. Sie kann direkt programmatisch gesteuert werden
+(Simulation, Engine-Partien, Server) und wird in der App vom GameController
+umschlossen, der nur noch Eingaben und Darstellung übernimmt.
+
+Ereignisse werden über Callback-Attribute gemeldet (wie beim ChessTimer):
+- on_move(move): nach jedem ausgeführten Zug
+- on_game_over(result_type, winner): bei Spielende
+  (result_type: 'checkmate', 'timeover' oder ein Schlüssel von DRAW_RESULTS)
+- on_timer_update(white_time, black_time, current_player): Anzeige der Uhr
+
+Remis durch dreifache Stellungswiederholung, die 50-Züge-Regel oder
+ungenügendes Material wird nach jedem Zug automatisch erkannt und beendet
+das Spiel (ohne Reklamation durch einen Spieler).
+"""
+
+from typing import Optional
+
+from .board import Board
+from .board_serialization import serialize_board
+from .chess_logic import ChessLogic
+from .chess_timer import ChessTimer
+from .move import Move
+from .san import SanWriter
+from .time_control import TimeControl
+
+
+# Remis-Arten: result_type -> games.final_position
+DRAW_RESULTS = {
+    'stalemate': 'Patt',
+    'remis': 'Remis',
+    'repetition': 'Stellungswiederholung',
+    'fifty_moves': '50-Züge-Regel',
+    'insufficient_material': 'Ungenügendes Material',
+}
+
+
+class GameSession:
+    """
+    Ein laufendes Schachspiel ohne UI.
+
+    Attribute:
+        board: Das Board des Spiels
+        current_turn: Spieler am Zug ('white' oder 'black')
+        move_history: Liste aller ausgeführten Moves
+        move_notations: SAN der ausgeführten Moves, parallel zu move_history
+        valid_moves: Legale Züge des Spielers am Zug
+        checkmate: Position des Königs im Schach (oder None)
+        game_is_over: True nach Spielende
+        result: (result_type, winner) nach Spielende, sonst None
+        game_id: ID des Spiels in der Datenbank (oder None ohne Datenbank)
+    """
+
+    def __init__(self, white_player=None, black_player=None, use_timer=False,
+                 time_control: Optional[TimeControl] = None, db=None, clock=None,
+                 fen: Optional[str] = None):
+        """
+        Args:
+            white_player: Spieler Weiß als (id, username) oder Dict mit 'username'
+            black_player: Spieler Schwarz als (id, username) oder Dict mit 'username'
+            use_timer: True für Countdown-Uhr, sonst Stoppuhr
+            time_control: Bedenkzeit-Regelung (nur mit use_timer)
+            db: Optionaler DatabaseManager; ohne Datenbank wird nichts gespeichert
+            clock: Clock-Source für die Schachuhr (Standard: Kivy Clock)
+            fen: Optionale Startstellung als FEN (Standard: Grundstellung)
+        """
+        self.white_player = white_player
+        self.black_player = black_player
+        self.use_timer = use_timer and time_control is not None
+        self.time_control = time_control if self.use_timer else None
+        self.db = db
+        self.clock = clock
+        self.fen = fen
+
+        self.board: Optional[Board] = None
+        self.chess_logic: Optional[ChessLogic] = None
+        self.current_turn = 'white'
+        self.last_move: Optional[Move] = None
+        self.move_history: list[Move] = []
+        self.move_notations: list[str] = []
+        self.valid_moves: list[Move] = []
+        self.checkmate: Optional[tuple] = None
+        self.game_is_over = False
+        self.result: Optional[tuple] = None
+        self.draw_offer = False
+        self.timer: Optional[ChessTimer] = None
+        self.game_id: Optional[int] = None
+        self._current_san_writer: Optional[SanWriter] = None
+
+        # Ereignis-Callbacks (werden vom Besitzer gesetzt)
+        self.on_move = None
+        self.on_game_over = None
+        self.on_timer_update = None
+
+    # ==================== Spielablauf ====================
+
+    def start(self):
+        """Baut die Startposition auf, legt das Spiel an und startet die Uhr."""
+        if self.fen:
+            self.board = Board.from_fen(self.fen)
+            self.current_turn = self.board.turn
+            # Doppelschritt aus dem En-passant-Feld als letzter Zug
+            self.last_move = self.board.en_passant_move()
+        else:
+            self.board = Board()
+            self.board.setup_startpos()
+        self.chess_logic = ChessLogic(self.board)
+
+        if self.use_timer:
+            # Countdown-Timer (klassischer Schach-Timer)
+            self.timer = ChessTimer(
+                time_control=self.time_control,
+                on_time_up_callback=self._on_time_up,
+                clock=self.clock
+            )
+        else:
+            # Stoppuhr-Modus (zählt Zeit hoch)
+            self.timer = ChessTimer(stopwatch_mode=True, clock=self.clock)
+        self.timer.on_timer_update = self._on_timer_update
+        self.timer.current_player = self.current_turn
+
+        # Spiel in Datenbank erstellen
+        self._create_game_in_database()
+
+        # Legale Züge für den Spieler am Zug (Startstellung kann Matt/Patt sein)
+        outcome = self._update_valid_moves()
+        if outcome:
+            self.finish(outcome)
+
+        if not self.game_is_over:
+            self.timer.start()
+
+    def stop(self):
+        """Hält die Uhr an (z.B. beim Verlassen des Spiels)."""
+        if self.timer:
+            self.timer.stop()
+
+    def pause(self):
+        """Pausiert die Uhr."""
+        if self.timer:
+            self.timer.pause()
+
+    def resume(self):
+        """Setzt die Uhr nach einer Pause fort."""
+        if self.timer and self.timer.is_paused:
+            self.timer.resume()
+
+    def legal_moves_for(self, piece) -> list[Move]:
+        """Gibt die legalen Züge einer Figur zurück."""
+        return [move for move in self.valid_moves if move.piece == piece]
+
+    def find_move(self, from_pos: tuple, to_pos: tuple) -> Optional[Move]:
+        """Sucht den legalen Zug von from_pos nach to_pos (oder None)."""
+        for move in self.valid_moves:
+            if move.from_pos == from_pos and move.to_pos == to_pos:
+                return move
+        return None
+
+    def play(self, from_pos: tuple, to_pos: tuple, promotion: str = 'Q') -> Move:
+        """
+        Führt einen Zug anhand von Start- und Zielfeld aus.
+
+        Args:
+            from_pos: (row, col) der ziehenden Figur
+            to_pos: (row, col) des Zielfelds
+            promotion: Umwandlungsfigur ('Q', 'R', 'B' oder 'N'), nur bei Promotion
+
+        Returns:
+            Der ausgeführte Move
+
+        Raises:
+            ValueError: wenn der Zug nicht legal ist oder das Spiel beendet ist
+        """
+        move = self.find_move(from_pos, to_pos)
+        if move is None:
+            raise ValueError(f'Illegaler Zug: {from_pos} -> {to_pos}')
+        self.play_move(move, promotion)
+        return move
+
+    def play_move(self, move: Move, promotion: Optional[str] = None):
+        """
+        Führt einen legalen Zug aus.
+
+        Args:
+            move: Move aus valid_moves
+            promotion: Umwandlungsfigur, überschreibt move.promotion bei Promotion
+
+        Ist die Bedenkzeit des ziehenden Spielers bereits abgelaufen (der Tick
+        hat es nur noch nicht bemerkt), wird der Zug nicht ausgeführt, sondern
+        das Spiel mit 'timeover' beendet.
+
+        Raises:
+            ValueError: wenn das Spiel beendet ist
+        """
+        if self.game_is_over:
+            raise ValueError('Das Spiel ist bereits beendet!')
+
+        # Uhr vor dem Zug abrechnen: ein Zug nach Zeitablauf zählt nicht
+        if self.timer and self.timer.check_time_up():
+            return
+
+        if move.promotion is not None and promotion:
+            move.promotion = promotion
+
+        # SAN-Unterscheidung aus den legalen Zügen der Stellung vor dem Zug
+        san_writer = self._san_writer()
+
+        # Zug im Board ausführen
+        self.board.make_move(move)
+        self.last_move = move
+        self.move_history.append(move)
+
+        # Spieler wechseln
+        self.current_turn = 'black' if self.current_turn == 'white' else 'white'
+
+        # Gültige Züge für nächsten Spieler berechnen (liefert Schach/Matt für die Notation)
+        outcome = self._update_valid_moves()
+        notation = san_writer.san(move, check=self.checkmate is not None, mate=outcome == 'checkmate')
+        move.san = notation
+        self.move_notations.append(notation)
+
+        # DB aktualisieren
+        if self.db and self.game_id:
+            self.db.add_board(
+                game_id=self.game_id,
+                board_number=len(self.move_history),
+                board_JSON=self.serialize_board(),
+                notation=notation,
+                white_time=str(self.timer.white_time) if self.timer else "0",
+                black_time=str(self.timer.black_time) if self.timer else "0"
+            )
+
+        # Remis-Angebot zurücksetzen
+        self.draw_offer = False
+
+        # Matt oder Patt beendet das Spiel
+        if outcome:
+            self.finish(outcome)
+
+        # Timer umschalten
+        if self.timer and not self.game_is_over:
+            self.timer.switch_player()
+
+        if self.on_move:
+            self.on_move(move)
+
+    def play_san(self, san: str) -> Move:
+        """
+        Führt einen Zug in SAN aus (z.B. "Nbd2", "exd8=N", "O-O").
+
+        Der Zug wird unter den bereits berechneten legalen Zügen gesucht.
+
+        Args:
+            san: SAN-String
+
+        Returns:
+            Der ausgeführte Move
+
+        Raises:
+            ValueError: wenn der Zug ungültig, illegal oder mehrdeutig ist
+        """
+        move = self._san_writer().find(san)
+        self.play_move(move)
+        return move
+
+    def notation(self, move: Move) -> str:
+        """
+        Gibt die SAN eines ausgeführten Zugs zurück (mit Schach-/Mattzeichen).
+
+        Args:
+            move: Move aus move_history
+
+        Returns:
+            SAN-String, z.B. "Nbd2" oder "Qh4#"
+        """
+        return move.san
+
+    def offer_draw(self):
+        """Markiert ein Remis-Angebot des Spielers am Zug."""
+        if not self.game_is_over:
+            self.draw_offer = True
+
+    def accept_draw(self):
+        """Beendet das Spiel mit einem vereinbarten Remis."""
+        self.finish('remis')
+
+    def finish(self, result_type: str, winner: Optional[str] = None):
+        """
+        Beendet das Spiel und speichert das Ergebnis.
+
+        Args:
+            result_type: 'checkmate', 'timeover' oder ein Schlüssel von DRAW_RESULTS
+            winner: Gewinner bei 'checkmate'/'timeover' (Standard: der Spieler,
+                    der zuletzt gezogen hat)
+        """
+        if self.game_is_over:
+            return
+
+        # Timer stoppen
+        if self.timer:
+            self.timer.stop()
+
+        self.game_is_over = True
+
+        # Gewinner ist standardmäßig der ANDERE Spieler (der gerade gezogen hat)
+        if winner is None:
+            winner = 'black' if self.current_turn == 'white' else 'white'
+
+        if result_type == 'checkmate':
+            self._save_game_result(f'{winner}_win', 'checkmate')
+        elif result_type in DRAW_RESULTS:
+            winner = None
+            self._save_game_result(None, DRAW_RESULTS[result_type])
+        elif result_type == 'timeover':
+            self._save_game_result(f'{winner}_win', 'timeover')
+        else:
+            raise NotImplementedError('undefined')
+
+        self.result = (result_type, winner)
+        if self.on_game_over:
+            self.on_game_over(result_type, winner)
+
+    # ==================== Hilfsmethoden ====================
+
+    def serialize_board(self) -> str:
+        """
+        Serialisiert das aktuelle Board als JSON-String.
+
+        Returns:
+            JSON-String mit Board-Zustand
+        """
+        if not self.board:
+            return ""
+
+        return serialize_board(
+            self.board.squares,
+            turn=self.current_turn,
+            white_time=self.timer.white_time if self.timer else None,
+            black_time=self.timer.black_time if self.timer else None,
+            draw_offers={"white": self.draw_offer and self.current_turn == 'black', "black": self.draw_offer and self.current_turn == 'white'},
+        )
+
+    def _san_writer(self) -> SanWriter:
+        """SanWriter der aktuellen Stellung (einmal je Stellung erzeugt)."""
+        if self._current_san_writer is None:
+            self._current_san_writer = SanWriter(self.valid_moves)
+        return self._current_san_writer
+
+    def _update_valid_moves(self) -> Optional[str]:
+        """
+        Aktualisiert alle gültigen Züge für aktuellen Spieler.
+
+        Returns:
+            'checkmate' oder 'stalemate', wenn der Spieler am Zug keine
+            legalen Züge hat, 'repetition', 'fifty_moves' oder
+            'insufficient_material' bei Remis nach den Regeln, sonst None
+            (das Spiel beendet der Aufrufer)
+        """
+        moves = self.chess_logic.all_legal_moves(self.last_move, self.current_turn)
+        self._current_san_writer = None
+        outcome = None
+        if isinstance(moves, str):
+            # Spielende (Checkmate oder Stalemate)
+            self.valid_moves = []
+            outcome = moves
+        else:
+            self.valid_moves = moves
+            outcome = self._draw_outcome()
+
+        # Prüfe ob der aktuelle König im Schach steht
+        king = self.board.white_king if self.current_turn == 'white' else self.board.black_king
+        if king and self.chess_logic.is_in_check(king, self.chess_logic.all_moves):
+            self.checkmate = king.position
+        else:
+            self.checkmate = None
+        return outcome
+
+    def _draw_outcome(self) -> Optional[str]:
+        """Remis nach den Regeln in der aktuellen Stellung (oder None)."""
+        if self.board.has_insufficient_material():
+            return 'insufficient_material'
+        if self.board.is_threefold_repetition():
+            return 'repetition'
+        if self.board.is_fifty_move_rule():
+            return 'fifty_moves'
+        return None
+
+    def _on_time_up(self, color):
+        """Callback der Schachuhr: die Zeit von color ist abgelaufen, der Gegner gewinnt."""
+        self.finish('timeover', 'black' if color == 'white' else 'white')
+
+    def _on_timer_update(self, white_time, black_time, current_player):
+        if self.on_timer_update:
+            self.on_timer_update(white_time, black_time, current_player)
+
+    @staticmethod
+    def _username(player) -> Optional[str]:
+        if isinstance(player, tuple):
+            return player[1]
+        return player.get('username') if player else None
+
+    def create_game_record(self, db) -> Optional[int]:
+        """
+        Legt die Spieler (falls nötig) und das Spiel in der Datenbank an.
+
+        Wird von start() aufgerufen; der GameServer ruft die Methode vorab im
+        Thread-Pool auf und setzt game_id selbst.
+
+        Args:
+            db: DatabaseManager
+
+        Returns:
+            ID des neuen Spiels
+        """
+        # Spieler in Datenbank holen oder erstellen
+        player_ids = []
+        for player in (self.white_player, self.black_player):
+            username = self._username(player)
+            player_data = db.get_player_by_username(username)
+            if not player_data:
+                player_ids.append(db.create_player(username))
+            else:
+                player_ids.append(player_data['id'])
+
+        # Spiel erstellen
+        return db.create_game(
+            white_player_id=player_ids[0],
+            black_player_id=player_ids[1],
+            game_type='timed' if self.use_timer else 'untimed',
+            time_per_player=self.time_control.initial_minutes if self.time_control else None,
+            time_control=self.time_control.to_spec() if self.time_control else None
+        )
+
+    def _create_game_in_database(self):
+        """Erstellt neues Spiel in der Datenbank (außer game_id wurde vorab gesetzt)."""
+        if not self.db or not self.white_player or not self.black_player:
+            return  # Kein Spiel ohne Spieler
+
+        if self.game_id is None:
+            self.game_id = self.create_game_record(self.db)
+
+        # Startposition speichern (board_number = 0)
+        if self.game_id and self.board:
+            self.db.add_board(
+                game_id=self.game_id,
+                board_number=0,
+                board_JSON=self.serialize_board(),
+                notation="Startposition",
+                white_time=str(self.timer.white_time) if self.timer else "0",
+                black_time=str(self.timer.black_time) if self.timer else "0"
+            )
+
+    def _save_game_result(self, winner, result_type):
+        """
+        Speichert Spielergebnis in Datenbank.
+
+        Args:
+            winner: 'white_win', 'black_win', oder None für Remis
+            result_type: 'checkmate', 'timeover' oder ein Wert von DRAW_RESULTS
+        """
+        if not self.db or not self.game_id:
+            return  # Kein Spiel zu speichern
+
+        self.db.finish_game(self.game_id, winner, result_type)
+
+
+__all__ = ["GameSession", "DRAW_RESULTS"]
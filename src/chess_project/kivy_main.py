@@ -26,16 +26,61 @@ from kivy.core.window import Window
 from kivy.uix.screenmanager import ScreenManager
 
 from .game_controller import GameController
-from .ui.screens import (
-    StartMenuScreen,
-    PlayerSelectionScreen,
-    GameScreen,
-    PauseMenuScreen,
-    StatsMenuScreen,
-    LeaderboardScreen,
-    GameHistoryScreen,
-    GameReplayScreen,
-)
+from .pieces import warm_image_paths
+from .ui.menu_screen import StartMenuScreen
+
+
+# Screen-Name -> Klassenname in ui/screens.py (werden erst bei Bedarf gebaut)
+DEFERRED_SCREENS = {
+    "player_selection": "PlayerSelectionScreen",
+    "game": "GameScreen",
+    "pause": "PauseMenuScreen",
+    "stats_menu": "StatsMenuScreen",
+    "leaderboard": "LeaderboardScreen",
+    "game_history": "GameHistoryScreen",
+    "game_replay": "GameReplayScreen",
+}
+
+
+class LazyScreenManager(ScreenManager):
+    """
+    ScreenManager, der registrierte Screens erst beim ersten Zugriff baut.
+
+    Kivy löst jede Navigation (``manager.current = name``) über get_screen()
+    auf; dort wird ein noch fehlender Screen aus seiner Factory erzeugt und
+    hinzugefügt. So muss beim Start nur das Menü gebaut werden.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._screen_factories = {}
+
+    def register_screen(self, name, factory):
+        """
+        Registriert einen Screen, der erst bei Bedarf gebaut wird.
+
+        Args:
+            name: Screen-Name für die Navigation
+            factory: Callable factory(name) -> Screen
+        """
+        self._screen_factories[name] = factory
+
+    def get_screen(self, name):
+        factory = self._screen_factories.pop(name, None)
+        if factory is not None:
+            self.add_widget(factory(name))
+        return super().get_screen(name)
+
+    def has_screen(self, name):
+        return name in self._screen_factories or super().has_screen(name)
+
+
+def _deferred_screen(class_name, controller):
+    """Factory, die ui/screens.py erst beim ersten Bau eines Screens importiert."""
+    def build(name):
+        from .ui import screens
+        return getattr(screens, class_name)(name=name, controller=controller)
+    return build
 
 
 class ChessApp(App):
@@ -43,22 +88,17 @@ class ChessApp(App):
 
     def build(self):
         Window.size = (900, 700)
+        warm_image_paths()
 
-        screen_manager = ScreenManager()
+        screen_manager = LazyScreenManager()
         self.game_controller = GameController(screen_manager, app=self)
 
         screen_manager.add_widget(StartMenuScreen(name="menu", controller=self.game_controller))
-        screen_manager.add_widget(PlayerSelectionScreen(name="player_selection", controller=self.game_controller))
-        screen_manager.add_widget(GameScreen(name="game", controller=self.game_controller))
-        screen_manager.add_widget(PauseMenuScreen(name="pause", controller=self.game_controller))
-        screen_manager.add_widget(StatsMenuScreen(name="stats_menu", controller=self.game_controller))
-        screen_manager.add_widget(LeaderboardScreen(name="leaderboard", controller=self.game_controller))
-        screen_manager.add_widget(GameHistoryScreen(name="game_history", controller=self.game_controller))
-        screen_manager.add_widget(GameReplayScreen(name="game_replay", controller=self.game_controller))
+        for name, class_name in DEFERRED_SCREENS.items():
+            screen_manager.register_screen(name, _deferred_screen(class_name, self.game_controller))
 
         return screen_manager
 
 
 if __name__ == "__main__":
     ChessApp().run()
-
@@ -1,11 +1,14 @@
 """
 Chess Game - Main Entry Point
 Startet die Kivy-Anwendung.
+
+Optionen:
+    --profile-startup   Import-Zeit-Profil des App-Starts ausgeben, ohne die
+                        App zu öffnen (entspricht ``python -X importtime``)
 """
 
 import sys
 from pathlib import Path
-from chess_project.kivy_main import ChessApp
 
 
 # Optional: Projekt-Root zum Python-Path hinzufügen
@@ -15,6 +18,14 @@ sys.path.insert(0, str(project_root))
 
 def main():
     """Haupteinstiegspunkt der Anwendung."""
+    if '--profile-startup' in sys.argv[1:]:
+        # Vor jedem Kivy-Import prüfen, damit Kivy die Option nicht auswertet
+        from chess_project.startup_profile import profile_startup
+        profile_startup()
+        return
+
+    # Kivy erst hier importieren (öffnet Fenster/Config beim Import)
+    from chess_project.kivy_main import ChessApp
     app = ChessApp()
     app.run()
 
@@ -1,6 +1,6 @@
 """Move Datenstruktur für Schachzüge."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -19,6 +19,7 @@ class Move:
         promotion: Promotionstyp ('queen', 'rook', 'bishop', 'knight' oder None)
         castelling: Das Turm-Objekt bei Rochade (oder None)
         en_passant: True wenn Zug en-passant ist
+        san: SAN des ausgeführten Zugs (von GameSession gesetzt, sonst None)
     """
     from_pos: tuple
     to_pos: tuple
@@ -27,3 +28,4 @@ class Move:
     promotion: Optional[str] = None
     castelling: Optional['Piece'] = None
     en_passant: bool = False
+    san: Optional[str] = field(default=None, compare=False)
@@ -0,0 +1,150 @@
+"""Eröffnungsbaum aus den gespeicherten Partien.
+
+Für jede Stellung der ersten MAX_PLY Halbzüge wird in der Tabelle
+opening_stats festgehalten, welche Züge daraus gespielt wurden und wie die
+Partien ausgingen (Weiß gewinnt / Remis / Schwarz gewinnt). Die Tabelle ist
+nach (hash, next_hash) sortiert; eine Abfrage liest nur die Züge der
+gefragten Stellung, unabhängig von der Anzahl gespeicherter Spiele.
+
+Aktualisiert wird inkrementell: finish_game trägt das beendete Spiel ein,
+der PGN-Import ganze Blöcke, rebuild_opening_stats baut die Tabelle für
+ältere Datenbanken neu auf.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Optional, TYPE_CHECKING
+
+from .position_hash import hash_fen, hash_squares
+
+if TYPE_CHECKING:
+    from .database import DatabaseManager
+
+
+# Nur Züge bis zu diesem Halbzug gehen in den Eröffnungsbaum ein
+MAX_PLY = 30
+
+# games.result -> Index in (white_wins, draws, black_wins)
+_RESULT_INDEX = {'white_win': 0, 'draw': 1, 'black_win': 2}
+
+
+@dataclass
+class ExplorerMove:
+    """
+    Ein Zug im Eröffnungsbaum.
+
+    Attributes:
+        notation: Zugnotation (SAN)
+        next_hash: Positions-Hash der Stellung nach dem Zug
+        games: Anzahl Partien mit diesem Zug
+        white_wins: davon von Weiß gewonnen
+        draws: davon Remis
+        black_wins: davon von Schwarz gewonnen
+    """
+    notation: str
+    next_hash: int
+    games: int
+    white_wins: int
+    draws: int
+    black_wins: int
+
+    def _percent(self, count: int) -> float:
+        return 100.0 * count / self.games if self.games else 0.0
+
+    @property
+    def white_percent(self) -> float:
+        return self._percent(self.white_wins)
+
+    @property
+    def draw_percent(self) -> float:
+        return self._percent(self.draws)
+
+    @property
+    def black_percent(self) -> float:
+        return self._percent(self.black_wins)
+
+
+def opening_rows(plies: Iterable[tuple], result: Optional[str]) -> list:
+    """
+    Erzeugt die opening_stats-Zeilen einer beendeten Partie.
+
+    Args:
+        plies: (position_hash, notation) je Board in Reihenfolge, beginnend
+               mit der Startstellung (board_number 0)
+        result: 'white_win', 'black_win' oder 'draw' (sonst keine Zeilen)
+
+    Returns:
+        Liste von (hash, next_hash, notation, games, white_wins, draws, black_wins)
+    """
+    index = _RESULT_INDEX.get(result)
+    if index is None:
+        return []
+    counts = [0, 0, 0]
+    counts[index] = 1
+
+    rows = []
+    previous = None
+    for ply, (position_hash, notation) in enumerate(plies):
+        if ply > MAX_PLY:
+            break
+        if previous is not None:
+            rows.append((previous, position_hash, notation, 1, *counts))
+        previous = position_hash
+    return rows
+
+
+def merge_rows(rows: Iterable[tuple]) -> list:
+    """
+    Fasst opening_stats-Zeilen mehrerer Partien je (hash, next_hash) zusammen.
+
+    Args:
+        rows: Zeilen aus opening_rows
+
+    Returns:
+        Liste von Zeilen mit aufsummierten Zählern
+    """
+    merged = {}
+    for position_hash, next_hash, notation, games, white_wins, draws, black_wins in rows:
+        totals = merged.get((position_hash, next_hash))
+        if totals is None:
+            merged[position_hash, next_hash] = [notation, games, white_wins, draws, black_wins]
+        else:
+            totals[1] += games
+            totals[2] += white_wins
+            totals[3] += draws
+            totals[4] += black_wins
+    return [(position_hash, next_hash, *totals) for (position_hash, next_hash), totals in merged.items()]
+
+
+class OpeningExplorer:
+    """Abfragen des Eröffnungsbaums für eine Stellung."""
+
+    def __init__(self, db: 'DatabaseManager'):
+        """
+        Args:
+            db: Datenbank mit der Tabelle opening_stats
+        """
+        self.db = db
+
+    def moves(self, position_hash: int, limit: Optional[int] = None) -> list[ExplorerMove]:
+        """
+        Gibt die gespielten Züge einer Stellung zurück (häufigste zuerst).
+
+        Args:
+            position_hash: Hash der Stellung (siehe position_hash)
+            limit: Max. Anzahl Züge (None = alle)
+
+        Returns:
+            Liste von ExplorerMove
+        """
+        return [ExplorerMove(**row) for row in self.db.get_opening_moves(position_hash, limit)]
+
+    def moves_for_board(self, squares, turn: str, limit: Optional[int] = None) -> list[ExplorerMove]:
+        """Wie moves, für ein 8x8 Board-Array und den Spieler am Zug."""
+        return self.moves(hash_squares(squares, turn), limit)
+
+    def moves_for_fen(self, fen: str, limit: Optional[int] = None) -> list[ExplorerMove]:
+        """Wie moves, für eine FEN-Stellung."""
+        return self.moves(hash_fen(fen), limit)
+
+
+__all__ = ['MAX_PLY', 'ExplorerMove', 'OpeningExplorer', 'opening_rows', 'merge_rows']
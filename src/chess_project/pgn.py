@@ -0,0 +1,237 @@
+"""PGN-Format (Portable Game Notation) für Partien.
+
+read_pgn liest eine PGN-Datei Partie für Partie als Generator; im Speicher
+liegt immer nur die aktuelle Partie, so dass auch Archive mit mehreren
+Gigabyte in konstantem Speicher verarbeitet werden können.
+
+Aus dem Zugtext werden nur die Hauptvariante, die Zugnummern und das
+Ergebnis ausgewertet; Kommentare, Varianten und NAGs werden übersprungen.
+Uhrzeiten aus Kommentaren der Form ``{[%clk 0:03:12]}`` bleiben erhalten.
+
+format_pgn ist die Gegenrichtung: eine Partie im PGN-Exportformat
+(Seven Tag Roster zuerst, Zugtext auf höchstens 80 Zeichen umbrochen).
+"""
+
+import bz2
+import gzip
+import io
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional, TextIO
+
+
+RESULTS = ('1-0', '0-1', '1/2-1/2', '*')
+
+_TAG_PATTERN = re.compile(r'^\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+
+_TOKEN_PATTERN = re.compile(
+    r'\{(?P<comment>[^}]*)\}'
+    r'|;[^\n]*'
+    r'|(?P<open>\()'
+    r'|(?P<close>\))'
+    r'|\$\d+'
+    r'|(?P<result>1-0|0-1|1/2-1/2|\*)'
+    r'|\d+\.+'
+    r'|(?P<san>[^\s{}();$.]+)'
+)
+
+_CLOCK_PATTERN = re.compile(r'\[%clk\s+(\d+):(\d+):(\d+(?:\.\d+)?)\]')
+
+# Pflicht-Tags in Exportreihenfolge ("?" = unbekannt)
+SEVEN_TAG_ROSTER = ('Event', 'Site', 'Date', 'Round', 'White', 'Black', 'Result')
+
+LINE_LENGTH = 80
+
+
+@dataclass
+class PgnGame:
+    """
+    Eine Partie aus einer PGN-Datei.
+
+    Attributes:
+        headers: Tag-Paare in Dateireihenfolge, z.B. {"White": "...", "Result": "1-0"}
+        moves: SAN-Züge der Hauptvariante
+        clocks: Restzeit in Sekunden nach jedem Zug (None ohne %clk-Kommentar)
+        result: Ergebnis aus dem Zugtext bzw. dem Result-Tag ('*' = offen)
+    """
+    headers: dict = field(default_factory=dict)
+    moves: list = field(default_factory=list)
+    clocks: list = field(default_factory=list)
+    result: str = '*'
+
+
+def _parse_clock(comment: str) -> Optional[float]:
+    match = _CLOCK_PATTERN.search(comment)
+    if not match:
+        return None
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def parse_movetext(movetext: str, game: PgnGame):
+    """
+    Liest den Zugtext einer Partie in game.moves/clocks/result ein.
+
+    Args:
+        movetext: Zugtext (kann mehrere Zeilen umfassen)
+        game: PgnGame, das ergänzt wird
+    """
+    depth = 0
+    for match in _TOKEN_PATTERN.finditer(movetext):
+        if match.group('open') is not None:
+            depth += 1
+        elif match.group('close') is not None:
+            depth = max(depth - 1, 0)
+        elif depth:
+            continue  # Variante
+        elif match.group('san') is not None:
+            game.moves.append(match.group('san'))
+            game.clocks.append(None)
+        elif match.group('comment') is not None:
+            clock = _parse_clock(match.group('comment'))
+            if clock is not None and game.clocks:
+                game.clocks[-1] = clock
+        elif match.group('result') is not None:
+            game.result = match.group('result')
+
+
+def read_pgn(lines: Iterable[str]) -> Iterator[PgnGame]:
+    """
+    Liest Partien aus PGN-Zeilen (z.B. einer geöffneten Datei).
+
+    Args:
+        lines: Iterable von Zeilen
+
+    Yields:
+        PgnGame je Partie
+    """
+    headers = {}
+    movetext = []
+
+    def finish():
+        game = PgnGame(headers=headers)
+        game.result = headers.get('Result', '*')
+        parse_movetext(''.join(movetext), game)
+        return game
+
+    for line in lines:
+        if line.startswith('%'):
+            continue  # Escape-Zeile
+        stripped = line.strip()
+        if stripped.startswith('['):
+            match = _TAG_PATTERN.match(stripped)
+            if match:
+                if any(text.strip() for text in movetext):
+                    # Tag nach dem Zugtext: die vorherige Partie ist vollständig
+                    yield finish()
+                    headers, movetext = {}, []
+                headers[match.group(1)] = match.group(2).replace('\\"', '"').replace('\\\\', '\\')
+                continue
+        if stripped or movetext:
+            movetext.append(line if line.endswith('\n') else line + '\n')
+
+    if headers or any(text.strip() for text in movetext):
+        yield finish()
+
+
+def _format_clock(seconds: float) -> str:
+    tenths = round(max(seconds, 0) * 10)
+    minutes, tenths = divmod(tenths, 600)
+    hours, minutes = divmod(minutes, 60)
+    text = f'{hours}:{minutes:02d}:{tenths // 10:02d}'
+    return text + (f'.{tenths % 10}' if tenths % 10 else '')
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
+
+def format_movetext(game: PgnGame) -> str:
+    """
+    Erzeugt den Zugtext einer Partie (mit %clk-Kommentaren und Ergebnis).
+
+    Args:
+        game: Partie (moves, clocks, result)
+
+    Returns:
+        Zugtext, auf LINE_LENGTH Zeichen umbrochen
+    """
+    # Zugnummer und Seite am Zug der Startstellung (FEN-Tag bei SetUp)
+    fields = game.headers.get('FEN', '').split()
+    black_starts = len(fields) > 1 and fields[1] == 'b'
+    fullmove = int(fields[5]) if len(fields) > 5 and fields[5].isdigit() else 1
+
+    tokens = []
+    needs_number = True
+    clocks = game.clocks or [None] * len(game.moves)
+    for ply, (san, clock) in enumerate(zip(game.moves, clocks)):
+        white_to_move = (ply % 2 == 0) != black_starts
+        number = fullmove + (ply + black_starts) // 2
+        if white_to_move:
+            tokens.append(f'{number}.')
+        elif needs_number:
+            tokens.append(f'{number}...')
+        tokens.append(san)
+        needs_number = clock is not None
+        if clock is not None:
+            tokens.append(f'{{[%clk {_format_clock(clock)}]}}')
+    tokens.append(game.result)
+
+    lines = []
+    line = ''
+    for token in tokens:
+        if line and len(line) + 1 + len(token) > LINE_LENGTH:
+            lines.append(line)
+            line = token
+        else:
+            line = f'{line} {token}' if line else token
+    lines.append(line)
+    return '\n'.join(lines)
+
+
+def format_pgn(game: PgnGame) -> str:
+    """
+    Formatiert eine Partie im PGN-Exportformat.
+
+    Fehlende Tags des Seven Tag Roster werden mit "?" ergänzt, Result
+    kommt immer aus game.result.
+
+    Args:
+        game: Partie
+
+    Returns:
+        PGN-Text der Partie inklusive abschließender Leerzeile
+    """
+    headers = {tag: game.headers.get(tag, '?') for tag in SEVEN_TAG_ROSTER}
+    headers['Result'] = game.result
+    headers.update((tag, value) for tag, value in game.headers.items() if tag not in headers)
+
+    tags = ''.join(f'[{tag} "{_escape(value)}"]\n' for tag, value in headers.items())
+    return f'{tags}\n{format_movetext(game)}\n\n'
+
+
+def open_pgn(path: str, mode: str = 'r') -> TextIO:
+    """
+    Öffnet eine PGN-Datei als Text; .gz und .bz2 werden (ent)packt, '-' ist stdin.
+
+    Args:
+        path: Dateipfad oder '-' (nur zum Lesen)
+        mode: 'r' zum Lesen, 'w' zum Schreiben
+
+    Returns:
+        Textdatei-Objekt (zeilenweise lesbar bzw. schreibbar)
+    """
+    if path == '-':
+        return io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', errors='replace')
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8', errors='replace')
+    if path.endswith('.bz2'):
+        return bz2.open(path, mode + 't', encoding='utf-8', errors='replace')
+    return open(path, mode, encoding='utf-8', errors='replace')
+
+
+__all__ = [
+    'PgnGame', 'RESULTS', 'SEVEN_TAG_ROSTER', 'parse_movetext', 'read_pgn',
+    'format_movetext', 'format_pgn', 'open_pgn',
+]
@@ -0,0 +1,292 @@
+"""Streaming-Export gespeicherter Partien als PGN.
+
+Spiele und ihre Boards werden direkt aus den SQLite-Cursorn gelesen und
+Partie für Partie in die Ausgabe geschrieben; im Speicher liegen nur die
+aktuelle Partie und zwei dekodierte Stellungen.
+
+Die gespeicherte Spalte notation ist nicht für alle Spiele SAN (ältere
+Partien verwenden z.B. "-e4" oder "xd5" ohne Ausgangsspalte). Die Züge
+werden deshalb aus dem Unterschied zweier aufeinanderfolgender Stellungen
+rekonstruiert und mit move_to_san neu notiert, inklusive Unterscheidung
+gleichartiger Figuren sowie Schach- und Mattzeichen.
+
+Aufruf:
+    chess-export-pgn [--db chess.db] [-o partien.pgn] [--player NAME]
+                     [--result white_win|black_win|draw] [--from DATUM] [--to DATUM]
+    (alternativ: python -m chess_project.pgn_export ...; .gz/.bz2 werden gepackt)
+"""
+
+import argparse
+import sys
+from typing import Iterable, Optional, TextIO
+
+from .board import Board
+from .board_serialization import decode_board_json
+from .chess_logic import ChessLogic
+from .database import UNKNOWN_START_TIME, DatabaseManager
+from .fen import START_FEN
+from .pgn import PgnGame, format_pgn, open_pgn
+from .san import move_to_san
+from .time_control import TimeControl
+
+
+# games.result -> PGN-Ergebnis
+_RESULTS = {'white_win': '1-0', 'black_win': '0-1', 'draw': '1/2-1/2'}
+
+# games.final_position -> Termination-Tag
+_TERMINATIONS = {'timeover': 'time forfeit'}
+
+
+def _placement(squares: list) -> str:
+    """FEN-Figurenstellung aus 64 (color, notation)-Einträgen."""
+    ranks = []
+    for row in range(8):
+        rank = ''
+        empty = 0
+        for entry in squares[row * 8:row * 8 + 8]:
+            if entry is None:
+                empty += 1
+                continue
+            if empty:
+                rank += str(empty)
+                empty = 0
+            color, notation = entry
+            rank += notation if color == 'white' else notation.lower()
+        ranks.append(rank + (str(empty) if empty else ''))
+    return '/'.join(ranks)
+
+
+def start_fen(squares: list, turn: str) -> str:
+    """
+    FEN der gespeicherten Startstellung.
+
+    Rochaderechte werden angenommen, solange König und Turm auf ihren
+    Ausgangsfeldern stehen; ein En-passant-Feld ist im Board-JSON nicht
+    gespeichert.
+
+    Args:
+        squares: 64 (color, notation)-Einträge aus decode_board_json
+        turn: Spieler am Zug
+
+    Returns:
+        FEN-String
+    """
+    castling = ''
+    for symbols, home_row, color in (('KQ', 7, 'white'), ('kq', 0, 'black')):
+        if squares[home_row * 8 + 4] != (color, 'K'):
+            continue
+        for symbol, rook_col in zip(symbols, (7, 0)):
+            if squares[home_row * 8 + rook_col] == (color, 'R'):
+                castling += symbol
+    return f"{_placement(squares)} {'w' if turn == 'white' else 'b'} {castling or '-'} - 0 1"
+
+
+def _changed_squares(move) -> set:
+    """Felder (Index row * 8 + col), die sich durch den Zug ändern."""
+    positions = {move.from_pos, move.to_pos}
+    if move.en_passant and move.captured is not None:
+        positions.add(move.captured.position)
+    if move.castelling is not None:
+        row, col = move.castelling.position
+        positions.add((row, col))
+        positions.add((row, 5 if col == 7 else 3))
+    return {row * 8 + col for row, col in positions}
+
+
+def find_stored_move(legal_moves: list, before: list, after: list):
+    """
+    Findet den legalen Zug, der von Stellung before zu after führt.
+
+    Args:
+        legal_moves: Legale Züge der Stellung before
+        before: 64 Einträge der Stellung vor dem Zug
+        after: 64 Einträge der Stellung nach dem Zug
+
+    Returns:
+        Move (bei Promotion mit gesetzter Umwandlungsfigur) oder None
+    """
+    changed = {index for index in range(64) if before[index] != after[index]}
+    for move in legal_moves:
+        row, col = move.to_pos
+        arrived = after[row * 8 + col]
+        if arrived is None or arrived[0] != move.piece.color:
+            continue
+        if move.promotion is not None:
+            if arrived[1] not in 'QRBN':
+                continue
+        elif arrived[1] != move.piece.notation:
+            continue
+        if _changed_squares(move) == changed:
+            if move.promotion is not None:
+                move.promotion = arrived[1]
+            return move
+    return None
+
+
+def _clock(value) -> Optional[float]:
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    return seconds if seconds > 0 else None
+
+
+def _pgn_time_control(spec: Optional[str]) -> Optional[str]:
+    """TimeControl-Tag (Sekunden) aus dem gespeicherten Format, z.B. '3+2' -> '180+2'."""
+    if not spec:
+        return None
+    try:
+        control = TimeControl.parse(spec)
+    except ValueError:
+        return None
+    stages = []
+    for stage in control.stages:
+        text = f'{stage.base_ms / 1000:g}'
+        if stage.increment_ms:
+            text += f'+{stage.increment_ms / 1000:g}'
+        stages.append(f'{stage.moves}/{text}' if stage.moves else text)
+    return ':'.join(stages)
+
+
+def game_headers(game: dict) -> dict:
+    """
+    PGN-Tags zu einer Zeile aus iter_games/list_games_page.
+
+    Args:
+        game: Spieldaten inklusive white_username/black_username
+
+    Returns:
+        Dict der Tags (ohne FEN/SetUp)
+    """
+    start = game.get('start_time') or ''
+    if start == UNKNOWN_START_TIME:
+        start = ''
+    date, _, time_of_day = start.partition('T')
+    headers = {
+        'Event': 'Schach-Datenbank',
+        'Site': '?',
+        'Date': date.replace('-', '.') if date else '????.??.??',
+        'Round': '-',
+        'White': game.get('white_username') or '?',
+        'Black': game.get('black_username') or '?',
+        'Result': _RESULTS.get(game.get('result'), '*'),
+    }
+    if time_of_day:
+        headers['Time'] = time_of_day[:8]
+    time_control = _pgn_time_control(game.get('time_control'))
+    headers['TimeControl'] = time_control or '-'
+    final_position = game.get('final_position')
+    if final_position in _TERMINATIONS:
+        headers['Termination'] = _TERMINATIONS[final_position]
+    return headers
+
+
+def export_game(game: dict, boards: Iterable) -> PgnGame:
+    """
+    Baut eine PgnGame aus einem Spiel und seinen gespeicherten Boards.
+
+    Lässt sich ein Zug nicht rekonstruieren (fehlende oder inkonsistente
+    Boards), endet der Zugtext dort und das Ergebnis wird '*'.
+
+    Args:
+        game: Spieldaten (siehe game_headers)
+        boards: Boards in Reihenfolge, z.B. DatabaseManager.iter_game_boards
+
+    Returns:
+        PgnGame mit SAN-Zügen und Restzeiten (nur bei Spielen mit Bedenkzeit)
+    """
+    headers = game_headers(game)
+    pgn_game = PgnGame(headers=headers, result=headers['Result'])
+    boards = iter(boards)
+    first = next(boards, None)
+    if first is None:
+        return pgn_game
+
+    before, metadata = decode_board_json(first['board_JSON'])
+    fen = start_fen(before, metadata.get('turn', 'white'))
+    if fen != START_FEN:
+        headers['SetUp'] = '1'
+        headers['FEN'] = fen
+    board = Board.from_fen(fen)
+    chess_logic = ChessLogic(board)
+    legal_moves = chess_logic.all_legal_moves(None, board.turn)
+    timed = game.get('game_type') == 'timed'
+
+    for stored in boards:
+        after, _ = decode_board_json(stored['board_JSON'])
+        move = find_stored_move(legal_moves, before, after) if isinstance(legal_moves, list) else None
+        if move is None:
+            pgn_game.result = headers['Result'] = '*'
+            break
+
+        mover = board.turn
+        previous_moves = legal_moves
+        board.make_move(move)
+        legal_moves = chess_logic.all_legal_moves(move, board.turn)
+        king = board.white_king if board.turn == 'white' else board.black_king
+        mate = legal_moves == 'checkmate'
+        check = mate or chess_logic.is_in_check(king, chess_logic.all_moves)
+
+        pgn_game.moves.append(move_to_san(move, previous_moves, check=check, mate=mate))
+        pgn_game.clocks.append(_clock(stored[f'{mover}_time']) if timed else None)
+        before = after
+
+    return pgn_game
+
+
+def export_games(db: DatabaseManager, stream: TextIO, **filters) -> int:
+    """
+    Schreibt alle passenden Spiele als PGN in stream.
+
+    Args:
+        db: Quell-Datenbank
+        stream: Textausgabe (Datei, sys.stdout, ...)
+        **filters: Filter wie DatabaseManager.iter_games (player_id, result,
+                   game_type, date_from, date_to)
+
+    Returns:
+        Anzahl geschriebener Partien
+    """
+    count = 0
+    for game in db.iter_games(**filters):
+        stream.write(format_pgn(export_game(game, db.iter_game_boards(game['id']))))
+        count += 1
+    return count
+
+
+def main(argv=None):
+    """Kommandozeile: gespeicherte Spiele als PGN exportieren."""
+    parser = argparse.ArgumentParser(description='Spiele aus der Schach-Datenbank als PGN exportieren.')
+    parser.add_argument('--db', default='chess.db', help='Pfad zur Datenbank (Standard: chess.db)')
+    parser.add_argument('-o', '--output', default='-',
+                        help="Ausgabedatei (.pgn, .pgn.gz, .pgn.bz2; Standard: '-' für stdout)")
+    parser.add_argument('--player', help='Nur Spiele dieses Spielers (Benutzername)')
+    parser.add_argument('--result', choices=sorted(_RESULTS), help='Nur Spiele mit diesem Ergebnis')
+    parser.add_argument('--from', dest='date_from', help='Frühester Spielbeginn (ISO-Datum, inklusive)')
+    parser.add_argument('--to', dest='date_to', help='Spätester Spielbeginn (ISO-Datum, exklusive)')
+    args = parser.parse_args(argv)
+
+    with DatabaseManager(args.db) as db:
+        player_id = None
+        if args.player:
+            player = db.get_player_by_username(args.player)
+            if player is None:
+                parser.error(f'Spieler nicht gefunden: {args.player}')
+            player_id = player['id']
+
+        filters = dict(player_id=player_id, result=args.result,
+                       date_from=args.date_from, date_to=args.date_to)
+        if args.output == '-':
+            count = export_games(db, sys.stdout, **filters)
+        else:
+            with open_pgn(args.output, 'w') as stream:
+                count = export_games(db, stream, **filters)
+
+    print(f'{count} Partien exportiert', file=sys.stderr)
+
+
+__all__ = ['export_game', 'export_games', 'find_stored_move', 'game_headers', 'start_fen', 'main']
+
+
+if __name__ == '__main__':
+    main()
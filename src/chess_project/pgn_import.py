@@ -0,0 +1,385 @@
+"""Streaming-Import von PGN-Archiven in die Datenbank.
+
+Die Partien werden aus read_pgn gestreamt, Zug für Zug mit ChessLogic
+geprüft und blockweise eingefügt: pro Block eine Transaktion, Spiele,
+Spieler-Statistiken, Boards, Positionsindex und Eröffnungsbaum jeweils
+per executemany. Ein Block wird vollständig nachgespielt, bevor die
+Schreibverbindung belegt wird; batch_size begrenzt also sowohl den
+Speicherbedarf als auch die Zeit, die andere Schreiber warten.
+Nach dem Import werden die Elo-/Glicko-2-Wertungen aus der gesamten
+Spielhistorie neu berechnet (importierte Partien sind oft älter als
+vorhandene).
+
+Aufruf:
+    chess-import-pgn archiv.pgn [--db chess.db] [--batch-size 1000] [--workers 4] [--no-validate]
+    (alternativ: python -m chess_project.pgn_import ...; .gz/.bz2 und '-' für stdin)
+"""
+
+import argparse
+import itertools
+import multiprocessing
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+from .board import Board
+from .board_serialization import serialize_board
+from .chess_logic import ChessLogic
+from .database import UNKNOWN_START_TIME, DatabaseManager
+from .fen import START_FEN
+from .opening_explorer import merge_rows, opening_rows
+from .pgn import PgnGame, open_pgn, read_pgn
+from .position_hash import hash_squares
+from .san import find_san_move
+from .time_control import TimeControl
+
+
+# PGN-Ergebnis -> games.result
+_RESULTS = {'1-0': 'white_win', '0-1': 'black_win', '1/2-1/2': 'draw'}
+
+
+@dataclass
+class ImportStats:
+    """
+    Fortschritt eines Imports.
+
+    Attributes:
+        games: Importierte Partien
+        skipped: Übersprungene Partien (ungültige Züge, fehlende Spieler)
+        moves: Importierte Halbzüge
+        elapsed: Laufzeit in Sekunden
+        errors: Die letzten Fehlermeldungen (höchstens 20)
+    """
+    games: int = 0
+    skipped: int = 0
+    moves: int = 0
+    elapsed: float = 0.0
+    errors: list = field(default_factory=list)
+
+    @property
+    def games_per_minute(self) -> float:
+        return self.games * 60 / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (f'{self.games} Partien ({self.skipped} übersprungen), {self.moves} Züge, '
+                f'{self.elapsed:.1f} s, {self.games_per_minute:.0f} Partien/min')
+
+
+def _start_time(headers: dict) -> Optional[str]:
+    """Spielbeginn aus den Tags Date/UTCDate und Time/UTCTime (ISO-Format)."""
+    date = headers.get('UTCDate') or headers.get('Date') or ''
+    try:
+        day = datetime.strptime(date, '%Y.%m.%d')
+    except ValueError:
+        return None
+    clock = headers.get('UTCTime') or headers.get('Time') or ''
+    try:
+        moment = datetime.strptime(clock, '%H:%M:%S').time()
+        day = datetime.combine(day.date(), moment)
+    except ValueError:
+        pass
+    return day.isoformat()
+
+
+def _time_control(headers: dict) -> Optional[TimeControl]:
+    """Bedenkzeit aus dem TimeControl-Tag (Sekunden, z.B. "300+3" oder "40/5400:1800")."""
+    spec = headers.get('TimeControl', '')
+    if not spec or spec in ('-', '?'):
+        return None
+    parts = []
+    for stage in spec.split(':'):
+        moves, _, stage = stage.rpartition('/')
+        base, _, increment = stage.partition('+')
+        try:
+            text = f'{float(base) / 60:g}' + (f'+{float(increment):g}' if increment else '')
+        except ValueError:
+            return None
+        parts.append(f'{moves}/{text}' if moves else text)
+    try:
+        return TimeControl.parse(', '.join(parts))
+    except ValueError:
+        return None
+
+
+def _final_position(game: PgnGame, result: Optional[str]) -> Optional[str]:
+    """Ergebnistyp wie in finish_game ('checkmate', 'timeover', 'Remis', ...)."""
+    if result is None:
+        return None
+    if result == 'draw':
+        return 'Remis'
+    if game.moves and game.moves[-1].endswith('#'):
+        return 'checkmate'
+    if 'time' in game.headers.get('Termination', '').lower():
+        return 'timeover'
+    return 'imported'
+
+
+def replay_game(game: PgnGame, validate: bool = True) -> list:
+    """
+    Spielt eine Partie nach und erzeugt die Board-Zeilen (ohne game_id).
+
+    Args:
+        game: Partie aus read_pgn
+        validate: Wenn False, werden eindeutige Züge ohne Schach-Prüfung übernommen
+
+    Returns:
+        Liste von (board_number, board_JSON, notation, white_time, black_time, position_hash)
+
+    Raises:
+        ValueError: bei ungültigem FEN-Tag oder illegalem/unlesbarem Zug
+    """
+    board = Board.from_fen(game.headers.get('FEN') or START_FEN)
+    # Die Partie ist bereits beendet, Stellungswiederholungen werden nicht geprüft
+    board.position_history = None
+    chess_logic = ChessLogic(board)
+    last_move = board.en_passant_move()
+    times = {'white': None, 'black': None}
+
+    rows = [(0, serialize_board(board.squares, turn=board.turn), 'Startposition', '0', '0',
+             hash_squares(board.squares, board.turn))]
+    for number, (san, clock) in enumerate(zip(game.moves, game.clocks), start=1):
+        mover = board.turn
+        move = find_san_move(chess_logic, san, mover, last_move, validate=validate)
+        board.make_move(move)
+        last_move = move
+        if clock is not None:
+            times[mover] = clock
+        rows.append((
+            number,
+            serialize_board(board.squares, turn=board.turn,
+                            white_time=times['white'], black_time=times['black']),
+            san,
+            str(times['white'] if times['white'] is not None else 0),
+            str(times['black'] if times['black'] is not None else 0),
+            hash_squares(board.squares, board.turn),
+        ))
+    return rows
+
+
+def _replay_chunk(args) -> list:
+    """Worker-Funktion: spielt mehrere Partien nach (Fehler als Text statt Exception)."""
+    games, validate = args
+    replayed = []
+    for game in games:
+        try:
+            replayed.append((game, replay_game(game, validate)))
+        except ValueError as error:
+            replayed.append((game, str(error)))
+    return replayed
+
+
+class PgnImporter:
+    """
+    Importiert PGN-Partien blockweise in einen DatabaseManager.
+
+    Das Nachspielen der Partien (SAN-Prüfung, Board-JSON) kann auf mehrere
+    Prozesse verteilt werden; geschrieben wird immer im aufrufenden Prozess.
+
+    Attribute:
+        stats: ImportStats des laufenden bzw. letzten Imports
+    """
+
+    # Partien pro Arbeitspaket eines Worker-Prozesses
+    CHUNK_SIZE = 25
+
+    def __init__(self, db: DatabaseManager, batch_size: int = 1000, validate: bool = True,
+                 progress: Optional[Callable[[ImportStats], None]] = None, workers: int = 1,
+                 update_ratings: bool = True):
+        """
+        Args:
+            db: Ziel-Datenbank
+            batch_size: Partien pro Transaktion
+            validate: Wenn False, werden eindeutige Züge ohne Schach-Prüfung
+                      übernommen (schneller, nur für geprüfte Archive)
+            progress: Callback progress(stats) nach jedem Block
+            workers: Anzahl Prozesse zum Nachspielen (1 = im aufrufenden Prozess)
+            update_ratings: Wertungen nach jedem Import neu berechnen (sonst
+                            muss der Aufrufer recompute_ratings aufrufen)
+        """
+        self.db = db
+        self.batch_size = batch_size
+        self.validate = validate
+        self.progress = progress
+        self.workers = workers
+        self.update_ratings = update_ratings
+        self.stats = ImportStats()
+        self._player_ids: dict[str, int] = {}
+        self._pool = None
+
+    def import_file(self, path: str) -> ImportStats:
+        """Importiert eine PGN-Datei (auch .gz/.bz2 oder '-' für stdin)."""
+        with open_pgn(path) as stream:
+            return self.import_games(read_pgn(stream))
+
+    def import_games(self, games: Iterable[PgnGame]) -> ImportStats:
+        """
+        Importiert Partien aus einem (beliebig langen) Iterable.
+
+        Args:
+            games: z.B. read_pgn(datei)
+
+        Returns:
+            ImportStats
+        """
+        self.stats = ImportStats()
+        started = time.perf_counter()
+        games = iter(games)
+        if self.workers > 1:
+            self._pool = multiprocessing.Pool(self.workers)
+
+        try:
+            while True:
+                batch = list(itertools.islice(games, self.batch_size))
+                if not batch:
+                    break
+                try:
+                    self._import_batch(batch)
+                    self.db.commit()
+                except Exception:
+                    self.db.rollback()
+                    # Im Block angelegte Spieler sind mit verworfen worden
+                    self._player_ids.clear()
+                    raise
+                self.stats.elapsed = time.perf_counter() - started
+                if self.progress:
+                    self.progress(self.stats)
+        finally:
+            if self._pool is not None:
+                self._pool.terminate()
+                self._pool = None
+
+        if self.update_ratings and self.stats.games:
+            self.db.recompute_ratings()
+        self.stats.elapsed = time.perf_counter() - started
+        return self.stats
+
+    def _replayed(self, batch: list):
+        """Liefert (game, rows) bzw. (game, Fehlertext) in Reihenfolge des Blocks."""
+        chunks = [(batch[i:i + self.CHUNK_SIZE], self.validate)
+                  for i in range(0, len(batch), self.CHUNK_SIZE)]
+        if self._pool is None:
+            results = map(_replay_chunk, chunks)
+        else:
+            results = self._pool.imap(_replay_chunk, chunks)
+        for replayed in results:
+            yield from replayed
+
+    def _import_batch(self, batch: list):
+        """Fügt einen Block Partien in einer Transaktion ein.
+
+        Die Partien werden zuerst nachgespielt, erst danach wird die
+        Schreibverbindung belegt: Schreibzugriffe anderer Threads (z.B.
+        laufender Partien) warten nur auf das Einfügen, nicht auf die
+        SAN-Prüfung.
+        """
+        replayed = []
+        openings = []
+        for game, rows in self._replayed(batch):
+            if isinstance(rows, str):
+                self._skip(game, rows)
+                continue
+            replayed.append((game, rows))
+            openings.extend(opening_rows(((row[5], row[2]) for row in rows), _RESULTS.get(game.result)))
+
+        # Ab hier bis zum commit() gehört die Schreibverbindung diesem Thread
+        self._player_ids.update(self.db.ensure_players(
+            name for game in batch for name in self._player_names(game)
+            if name not in self._player_ids
+        ))
+
+        game_rows = []
+        results = {}  # player_id -> [points, played, won]
+        first_id = self.db.next_game_id()
+        for game_id, (game, rows) in enumerate(replayed, first_id):
+            game_rows.append(self._game_row(game, game_id, results))
+            self.stats.games += 1
+            self.stats.moves += len(rows) - 1
+
+        self.db.insert_boards_bulk(
+            (game_id, *row)
+            for game_id, (game, rows) in enumerate(replayed, first_id)
+            for row in rows
+        )
+        self.db.insert_games_bulk(game_rows)
+        self.db.add_player_results_bulk(
+            (player_id, *totals) for player_id, totals in results.items()
+        )
+        self.db.add_opening_moves(merge_rows(openings))
+
+    @staticmethod
+    def _player_names(game: PgnGame) -> tuple:
+        return (game.headers.get('White') or 'Unbekannt', game.headers.get('Black') or 'Unbekannt')
+
+    def _skip(self, game: PgnGame, error: str):
+        self.stats.skipped += 1
+        if len(self.stats.errors) < 20:
+            white, black = self._player_names(game)
+            self.stats.errors.append(f'{white} - {black}: {error}')
+
+    def _game_row(self, game: PgnGame, game_id: int, results: dict) -> tuple:
+        """Erzeugt die games-Zeile und sammelt die Spieler-Statistiken."""
+        white_id, black_id = (self._player_ids[name] for name in self._player_names(game))
+        result = _RESULTS.get(game.result)
+        time_control = _time_control(game.headers)
+        start_time = _start_time(game.headers) or UNKNOWN_START_TIME
+
+        if result is not None:
+            # Punkte wie in finish_game: Sieg +3, Remis +1
+            for player_id, points, won in (
+                (white_id, 3 if result == 'white_win' else int(result == 'draw'), result == 'white_win'),
+                (black_id, 3 if result == 'black_win' else int(result == 'draw'), result == 'black_win'),
+            ):
+                totals = results.setdefault(player_id, [0, 0, 0])
+                totals[0] += points
+                totals[1] += 1
+                totals[2] += int(won)
+
+        return (
+            game_id, white_id, black_id,
+            'timed' if time_control else 'untimed',
+            time_control.initial_minutes if time_control else None,
+            time_control.to_spec() if time_control else None,
+            start_time,
+            start_time if result is not None else None,
+            result,
+            _final_position(game, result),
+        )
+
+
+def main(argv=None):
+    """Kommandozeile: PGN-Dateien in die Datenbank importieren."""
+    parser = argparse.ArgumentParser(description='PGN-Archive in die Schach-Datenbank importieren.')
+    parser.add_argument('files', nargs='+', help="PGN-Dateien (.pgn, .pgn.gz, .pgn.bz2 oder '-' für stdin)")
+    parser.add_argument('--db', default='chess.db', help='Pfad zur Datenbank (Standard: chess.db)')
+    parser.add_argument('--batch-size', type=int, default=1000, help='Partien pro Transaktion')
+    parser.add_argument('--no-validate', action='store_true',
+                        help='Eindeutige Züge ohne Schach-Prüfung übernehmen (schneller)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Prozesse zum Nachspielen der Partien (Standard: 1)')
+    args = parser.parse_args(argv)
+
+    def report(stats):
+        print(f'\r{stats}', end='', file=sys.stderr, flush=True)
+
+    with DatabaseManager(args.db) as db:
+        importer = PgnImporter(db, batch_size=args.batch_size, validate=not args.no_validate,
+                               progress=report, workers=args.workers, update_ratings=False)
+        imported = 0
+        for path in args.files:
+            stats = importer.import_file(path)
+            imported += stats.games
+            print(f'\r{path}: {stats}', file=sys.stderr)
+            for error in stats.errors:
+                print(f'  übersprungen: {error}', file=sys.stderr)
+        # Wertungen einmal für alle Dateien neu berechnen
+        if imported:
+            print(f'{db.recompute_ratings()} Partien gewertet', file=sys.stderr)
+
+
+__all__ = ['ImportStats', 'PgnImporter', 'replay_game', 'main']
+
+
+if __name__ == '__main__':
+    main()
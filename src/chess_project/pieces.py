@@ -7,6 +7,34 @@ if TYPE_CHECKING:
     from . import board as bd
 
 
+PIECE_COLORS = ('white', 'black')
+PIECE_NOTATIONS = ('K', 'Q', 'R', 'B', 'N', 'P')
+
+# Aufgelöste Bildpfade je (color, notation), siehe image_path()
+_IMAGE_PATHS: dict[tuple, str] = {}
+
+
+def image_path(color: str, notation: str) -> str:
+    """ Gibt den (einmalig aufgelösten) Pfad zum Bild einer Figur zurück """
+    path = _IMAGE_PATHS.get((color, notation))
+    if path is None:
+        try:
+            # Versuche, die Ressource aus dem Paket zu laden
+            path = str(importlib.resources.files('chess_project').joinpath('pieces', f'{color}_{notation}.png'))
+        except (AttributeError, FileNotFoundError):
+            # Fallback für ältere Python-Versionen oder wenn nicht installiert
+            path = f'pieces/{color}_{notation}.png'
+        _IMAGE_PATHS[(color, notation)] = path
+    return path
+
+
+def warm_image_paths():
+    """ Löst die Bildpfade aller Figuren vorab auf (beim App-Start) """
+    for color in PIECE_COLORS:
+        for notation in PIECE_NOTATIONS:
+            image_path(color, notation)
+
+
 class Piece:
     """  Elternklasse der Spielfiguren """
     # Rochade möglich Attribut/Methode
@@ -22,13 +50,7 @@ class Piece:
     
     def get_image_path(self) -> str:
         """ Gibt den Pfad zum Bild der Figur zurück """
-        try:
-            # Versuche, die Ressource aus dem Paket zu laden
-            path = importlib.resources.files('chess_project').joinpath('pieces', f'{self.color}_{self.notation}.png')
-            return str(path)
-        except (AttributeError, FileNotFoundError):
-            # Fallback für ältere Python-Versionen oder wenn nicht installiert
-            return f'pieces/{self.color}_{self.notation}.png'
+        return image_path(self.color, self.notation)
 
     @property
     def position(self) -> tuple:
@@ -309,17 +331,17 @@ class Pawn(Piece):
                          promotion=promotion)
                 )
 
-        # En-passant
-        if 0 <= col - 1 and col + 1 < 8:
-            for y in [col + 1, col - 1]:
-                target = board.squares[row, y]
-                square_ahead = board.squares[next_row, col]
-                if (target is not None and target.pawn and
-                    target.color != self.color and square_ahead is None):
-                    legal_moves.append(
-                        Move(self.position, (next_row, y), self, target,
-                             en_passant=True)
-                    )
+        # En-passant (Zielfeld ist das leere Feld hinter dem gegnerischen Bauern)
+        for y in [col + 1, col - 1]:
+            if not self._is_valid_square(next_row, y):
+                continue
+            target = board.squares[row, y]
+            if (target is not None and target.pawn and
+                target.color != self.color and board.squares[next_row, y] is None):
+                legal_moves.append(
+                    Move(self.position, (next_row, y), self, target,
+                         en_passant=True)
+                )
 
         # Zwei Felder vorwärts (erster Zug)
         double_row = row + 2 * direction
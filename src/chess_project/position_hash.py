@@ -0,0 +1,146 @@
+"""64-Bit-Hashes von Stellungen (Zobrist-Hashing).
+
+Jede Kombination aus Figur und Feld bekommt eine feste Zufallszahl; der
+Hash einer Stellung ist das XOR der Zahlen aller Figuren (plus einer Zahl,
+wenn Schwarz am Zug ist). Die Zahlen werden mit festem Seed erzeugt, die
+Hashes sind also über Programmstarts hinweg stabil und können in der
+Datenbank gespeichert werden (Tabelle positions).
+
+Die Werte liegen im Bereich eines vorzeichenbehafteten 64-Bit-Integers,
+damit SQLite sie als INTEGER speichern kann. Rochade- und En-passant-Rechte
+gehen nicht ein, da sie im Board-JSON nicht gespeichert sind; nur
+Board.position_key (Erkennung von Stellungswiederholungen) rechnet sie mit
+CASTLING_KEYS und EN_PASSANT_KEYS ein.
+
+Aufruf (Positionsindex und Eröffnungsbaum für vorhandene Spiele nachtragen):
+    chess-index-positions [--db chess.db]
+"""
+
+import argparse
+import random
+import sys
+from typing import Optional
+
+from .board_serialization import PIECE_CLASSES, decode_board_json
+from .fen import parse_fen
+
+
+def _random_keys(rng: random.Random, count: int) -> list:
+    return [rng.getrandbits(64) - (1 << 63) for _ in range(count)]
+
+
+_rng = random.Random(0x5C4AC4)
+
+# (color, notation) -> 64 Zufallszahlen, Index row * 8 + col
+PIECE_KEYS = {
+    (color, notation): _random_keys(_rng, 64)
+    for color in ('white', 'black') for notation in PIECE_CLASSES
+}
+
+# Wird eingerechnet, wenn Schwarz am Zug ist
+BLACK_TO_MOVE_KEY = _random_keys(_rng, 1)[0]
+
+# Nur für Board.position_key (Stellungswiederholung): Rochaderechte im
+# FEN-Format und Spalte eines schlagbaren En-passant-Felds
+CASTLING_KEYS = dict(zip('KQkq', _random_keys(_rng, 4)))
+EN_PASSANT_KEYS = _random_keys(_rng, 8)
+
+del _rng
+
+
+def hash_entries(squares: list, turn: str) -> int:
+    """
+    Hash aus 64 (color, notation)-Einträgen (wie decode_board_json).
+
+    Args:
+        squares: 64 Einträge (row * 8 + col) mit (color, notation) oder None
+        turn: Spieler am Zug
+
+    Returns:
+        Hash als vorzeichenbehafteter 64-Bit-Integer
+    """
+    value = BLACK_TO_MOVE_KEY if turn == 'black' else 0
+    for index, entry in enumerate(squares):
+        if entry is not None:
+            value ^= PIECE_KEYS[entry][index]
+    return value
+
+
+def hash_squares(squares, turn: str) -> int:
+    """
+    Hash aus einem 8x8 Board-Array mit Piece-Objekten.
+
+    Args:
+        squares: 8x8 Array (Board.squares)
+        turn: Spieler am Zug
+
+    Returns:
+        Hash als vorzeichenbehafteter 64-Bit-Integer
+    """
+    value = BLACK_TO_MOVE_KEY if turn == 'black' else 0
+    for index, piece in enumerate(squares.flat):
+        if piece is not None:
+            value ^= PIECE_KEYS[piece.color, piece.notation][index]
+    return value
+
+
+def hash_board_json(board_json: str) -> int:
+    """
+    Hash eines gespeicherten Board-JSON-Strings.
+
+    Args:
+        board_json: JSON-String mit Board-Zustand
+
+    Returns:
+        Hash als vorzeichenbehafteter 64-Bit-Integer
+    """
+    squares, metadata = decode_board_json(board_json)
+    return hash_entries(squares, metadata.get('turn', 'white'))
+
+
+def hash_fen(fen: str) -> int:
+    """
+    Hash einer FEN-Stellung (Figurenstellung und Spieler am Zug).
+
+    Args:
+        fen: FEN-String
+
+    Returns:
+        Hash als vorzeichenbehafteter 64-Bit-Integer
+
+    Raises:
+        ValueError: bei ungültigem FEN
+    """
+    position = parse_fen(fen)
+    squares: list[Optional[tuple]] = [None] * 64
+    for row, col, color, notation in position.pieces:
+        squares[row * 8 + col] = (color, notation)
+    return hash_entries(squares, position.turn)
+
+
+def main(argv=None):
+    """Kommandozeile: Positionsindex und Eröffnungsbaum für vorhandene Spiele nachtragen."""
+    from .database import DatabaseManager
+
+    parser = argparse.ArgumentParser(description='Positionsindex und Eröffnungsbaum der Schach-Datenbank nachtragen.')
+    parser.add_argument('--db', default='chess.db', help='Pfad zur Datenbank (Standard: chess.db)')
+    args = parser.parse_args(argv)
+
+    def report(games):
+        print(f'\r{games} Spiele indiziert', end='', file=sys.stderr, flush=True)
+
+    with DatabaseManager(args.db) as db:
+        games = db.backfill_positions(progress=report)
+        print(f'\r{games} Spiele indiziert', file=sys.stderr)
+        entries = db.rebuild_opening_stats()
+    print(f'Eröffnungsbaum: {entries} Einträge', file=sys.stderr)
+
+
+__all__ = [
+    'PIECE_KEYS', 'BLACK_TO_MOVE_KEY', 'CASTLING_KEYS', 'EN_PASSANT_KEYS', 'hash_entries', 'hash_squares',
+    'hash_board_json', 'hash_fen', 'main',
+]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,337 @@
+"""Elo- und Glicko-2-Wertungen der Spieler.
+
+Jede beendete Partie wird einzeln gewertet (bei Glicko-2 bildet jede Partie
+eine eigene Bewertungsperiode): finish_game ruft rate_game für die aktuelle
+Wertung beider Spieler auf und schreibt die neuen Werte samt Verlauf
+(Tabelle rating_history) in derselben Transaktion.
+
+batch_ratings berechnet dieselben Wertungen für eine ganze Spielhistorie
+neu. Die Partien werden dazu in Runden eingeteilt, in denen jeder Spieler
+höchstens einmal vorkommt; innerhalb einer Runde hängen die Partien nicht
+voneinander ab und werden mit NumPy gemeinsam gerechnet. Die Reihenfolge je
+Spieler bleibt erhalten, das Ergebnis ist also dasselbe wie beim
+inkrementellen Werten Partie für Partie.
+
+Aufruf (alle Wertungen aus der Spielhistorie neu berechnen):
+    chess-recompute-ratings [--db chess.db]
+"""
+
+import argparse
+import math
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Startwerte neuer Spieler
+ELO_DEFAULT = 1500.0
+GLICKO_DEFAULT = 1500.0
+GLICKO_RD_DEFAULT = 350.0
+GLICKO_VOLATILITY_DEFAULT = 0.06
+
+# K-Faktor der Elo-Wertung
+ELO_K = 32.0
+
+# Glicko-2: Systemkonstante (Änderung der Volatilität) und Abbruchgrenze der Iteration
+GLICKO_TAU = 0.5
+GLICKO_EPSILON = 1e-6
+
+# Umrechnung zwischen Glicko- und Glicko-2-Skala
+_GLICKO2_SCALE = 173.7178
+
+# games.result -> Punkte für Weiß
+RESULT_SCORES = {'white_win': 1.0, 'draw': 0.5, 'black_win': 0.0}
+
+
+@dataclass(frozen=True)
+class Rating:
+    """
+    Wertung eines Spielers.
+
+    Attributes:
+        elo: Elo-Zahl
+        glicko: Glicko-2-Wertung (auf Glicko-Skala, Start 1500)
+        rd: Rating Deviation (Unsicherheit der Glicko-Wertung)
+        volatility: Glicko-2-Volatilität
+    """
+    elo: float = ELO_DEFAULT
+    glicko: float = GLICKO_DEFAULT
+    rd: float = GLICKO_RD_DEFAULT
+    volatility: float = GLICKO_VOLATILITY_DEFAULT
+
+
+def elo_expected(rating: float, opponent: float) -> float:
+    """Erwartete Punkte eines Spielers gegen einen Gegner (0..1)."""
+    return 1.0 / (1.0 + 10.0 ** ((opponent - rating) / 400.0))
+
+
+def elo_update(rating: float, opponent: float, score: float, k: float = ELO_K) -> float:
+    """
+    Neue Elo-Zahl nach einer Partie.
+
+    Args:
+        rating: Elo-Zahl des Spielers
+        opponent: Elo-Zahl des Gegners
+        score: Punkte des Spielers (1, 0.5 oder 0)
+        k: K-Faktor
+
+    Returns:
+        Neue Elo-Zahl
+    """
+    return rating + k * (score - elo_expected(rating, opponent))
+
+
+def glicko2_update(rating: float, rd: float, volatility: float,
+                   opponent: float, opponent_rd: float, score: float) -> tuple:
+    """
+    Glicko-2-Wertung nach einer Partie (eine Bewertungsperiode, ein Gegner).
+
+    Args:
+        rating, rd, volatility: Wertung des Spielers (Glicko-Skala)
+        opponent, opponent_rd: Wertung des Gegners (Glicko-Skala)
+        score: Punkte des Spielers (1, 0.5 oder 0)
+
+    Returns:
+        (rating, rd, volatility) nach der Partie
+    """
+    mu = (rating - GLICKO_DEFAULT) / _GLICKO2_SCALE
+    phi = rd / _GLICKO2_SCALE
+    mu_j = (opponent - GLICKO_DEFAULT) / _GLICKO2_SCALE
+    phi_j = opponent_rd / _GLICKO2_SCALE
+
+    g = 1.0 / math.sqrt(1.0 + 3.0 * phi_j ** 2 / math.pi ** 2)
+    expected = 1.0 / (1.0 + math.exp(-g * (mu - mu_j)))
+    v = 1.0 / (g ** 2 * expected * (1.0 - expected))
+    delta = v * g * (score - expected)
+
+    # Neue Volatilität: Nullstelle von f (Illinois-Verfahren)
+    a = math.log(volatility ** 2)
+
+    def f(x):
+        ex = math.exp(x)
+        return (ex * (delta ** 2 - phi ** 2 - v - ex) / (2.0 * (phi ** 2 + v + ex) ** 2)
+                - (x - a) / GLICKO_TAU ** 2)
+
+    low = a
+    if delta ** 2 > phi ** 2 + v:
+        high = math.log(delta ** 2 - phi ** 2 - v)
+    else:
+        k = 1
+        while f(a - k * GLICKO_TAU) < 0:
+            k += 1
+        high = a - k * GLICKO_TAU
+    f_low, f_high = f(low), f(high)
+    while abs(high - low) > GLICKO_EPSILON:
+        middle = low + (low - high) * f_low / (f_high - f_low)
+        f_middle = f(middle)
+        if f_middle * f_high <= 0:
+            low, f_low = high, f_high
+        else:
+            f_low /= 2.0
+        high, f_high = middle, f_middle
+    new_volatility = math.exp(low / 2.0)
+
+    phi_star = math.sqrt(phi ** 2 + new_volatility ** 2)
+    new_phi = 1.0 / math.sqrt(1.0 / phi_star ** 2 + 1.0 / v)
+    new_mu = mu + new_phi ** 2 * g * (score - expected)
+    return (new_mu * _GLICKO2_SCALE + GLICKO_DEFAULT, new_phi * _GLICKO2_SCALE, new_volatility)
+
+
+def rate_game(white: Rating, black: Rating, score: float) -> tuple:
+    """
+    Wertet eine Partie für beide Spieler.
+
+    Args:
+        white: Wertung von Weiß vor der Partie
+        black: Wertung von Schwarz vor der Partie
+        score: Punkte für Weiß (1, 0.5 oder 0)
+
+    Returns:
+        (Rating Weiß, Rating Schwarz) nach der Partie
+    """
+    return (
+        Rating(elo_update(white.elo, black.elo, score),
+               *glicko2_update(white.glicko, white.rd, white.volatility, black.glicko, black.rd, score)),
+        Rating(elo_update(black.elo, white.elo, 1.0 - score),
+               *glicko2_update(black.glicko, black.rd, black.volatility, white.glicko, white.rd, 1.0 - score)),
+    )
+
+
+# ==================== Neuberechnung mit NumPy ====================
+
+@dataclass
+class BatchRatings:
+    """
+    Ergebnis von batch_ratings.
+
+    Attributes:
+        elo, glicko, rd, volatility: Endstand je Spieler (Index wie player_index)
+        history: Wertung nach jeder Partie, Form (Partien, 2 Seiten, 3 Werte)
+                 mit Seite 0 = Weiß, 1 = Schwarz und Werten (elo, glicko, rd)
+    """
+    elo: 'np.ndarray'
+    glicko: 'np.ndarray'
+    rd: 'np.ndarray'
+    volatility: 'np.ndarray'
+    history: 'np.ndarray'
+
+
+def rounds(white: Sequence[int], black: Sequence[int]) -> list:
+    """
+    Teilt Partien in Runden, in denen jeder Spieler höchstens einmal vorkommt.
+
+    Jede Partie kommt in die erste Runde nach der letzten Partie ihrer beiden
+    Spieler; die Reihenfolge der Partien je Spieler bleibt so erhalten.
+
+    Args:
+        white: Spieler-Index von Weiß je Partie (chronologisch)
+        black: Spieler-Index von Schwarz je Partie
+
+    Returns:
+        Liste von Listen mit Partie-Indizes je Runde
+    """
+    last_round = {}
+    result = []
+    for game, players in enumerate(zip(white, black)):
+        number = max(last_round.get(players[0], -1), last_round.get(players[1], -1)) + 1
+        last_round[players[0]] = last_round[players[1]] = number
+        if number == len(result):
+            result.append([])
+        result[number].append(game)
+    return result
+
+
+def _glicko2_vector(np, mu, phi, sigma, mu_j, phi_j, score):
+    """glicko2_update für Arrays (Glicko-2-Skala); gibt (mu, phi, sigma) zurück."""
+    g = 1.0 / np.sqrt(1.0 + 3.0 * phi_j ** 2 / math.pi ** 2)
+    expected = 1.0 / (1.0 + np.exp(-g * (mu - mu_j)))
+    v = 1.0 / (g ** 2 * expected * (1.0 - expected))
+    delta = v * g * (score - expected)
+    a = np.log(sigma ** 2)
+
+    def f(x, index):
+        ex = np.exp(x)
+        phi2_v = phi[index] ** 2 + v[index]
+        return (ex * (delta[index] ** 2 - phi2_v - ex) / (2.0 * (phi2_v + ex) ** 2)
+                - (x - a[index]) / GLICKO_TAU ** 2)
+
+    everyone = np.arange(len(mu))
+    low = a.copy()
+    excess = delta ** 2 - phi ** 2 - v
+    high = np.where(excess > 0, np.log(np.where(excess > 0, excess, 1.0)), a - GLICKO_TAU)
+    searching = np.flatnonzero(excess <= 0)
+    k = 1
+    while searching.size:
+        searching = searching[f(a[searching] - k * GLICKO_TAU, searching) < 0]
+        k += 1
+        high[searching] = a[searching] - k * GLICKO_TAU
+
+    f_low, f_high = f(low, everyone), f(high, everyone)
+    open_ = np.flatnonzero(np.abs(high - low) > GLICKO_EPSILON)
+    while open_.size:
+        l, h, fl, fh = low[open_], high[open_], f_low[open_], f_high[open_]
+        middle = l + (l - h) * fl / (fh - fl)
+        f_middle = f(middle, open_)
+        swap = f_middle * fh <= 0
+        low[open_] = np.where(swap, h, l)
+        f_low[open_] = np.where(swap, fh, fl / 2.0)
+        high[open_] = middle
+        f_high[open_] = f_middle
+        open_ = open_[np.abs(middle - low[open_]) > GLICKO_EPSILON]
+    new_sigma = np.exp(low / 2.0)
+
+    phi_star = np.sqrt(phi ** 2 + new_sigma ** 2)
+    new_phi = 1.0 / np.sqrt(1.0 / phi_star ** 2 + 1.0 / v)
+    new_mu = mu + new_phi ** 2 * g * (score - expected)
+    return new_mu, new_phi, new_sigma
+
+
+def batch_ratings(white: Sequence[int], black: Sequence[int], scores: Sequence[float],
+                  player_count: int) -> BatchRatings:
+    """
+    Berechnet Elo und Glicko-2 für eine chronologische Spielhistorie neu.
+
+    Alle Spieler beginnen mit den Startwerten (ELO_DEFAULT, GLICKO_*).
+
+    Args:
+        white: Spieler-Index (0..player_count-1) von Weiß je Partie
+        black: Spieler-Index von Schwarz je Partie
+        scores: Punkte für Weiß je Partie (1, 0.5 oder 0)
+        player_count: Anzahl Spieler
+
+    Returns:
+        BatchRatings mit Endstand und Verlauf
+    """
+    import numpy as np
+
+    white = np.asarray(white, dtype=np.int64)
+    black = np.asarray(black, dtype=np.int64)
+    scores = np.asarray(scores, dtype=float)
+
+    elo = np.full(player_count, ELO_DEFAULT)
+    mu = np.zeros(player_count)
+    phi = np.full(player_count, GLICKO_RD_DEFAULT / _GLICKO2_SCALE)
+    sigma = np.full(player_count, GLICKO_VOLATILITY_DEFAULT)
+    history = np.empty((len(scores), 2, 3))
+
+    for games in rounds(white.tolist(), black.tolist()):
+        games = np.asarray(games)
+        w, b, s = white[games], black[games], scores[games]
+
+        expected = 1.0 / (1.0 + 10.0 ** ((elo[b] - elo[w]) / 400.0))
+        new_elo_w = elo[w] + ELO_K * (s - expected)
+        new_elo_b = elo[b] + ELO_K * (expected - s)
+
+        # Weiß und Schwarz gemeinsam: erst alle Weiß-, dann alle Schwarz-Seiten
+        sides_mu, sides_phi, sides_sigma = _glicko2_vector(
+            np,
+            np.concatenate((mu[w], mu[b])), np.concatenate((phi[w], phi[b])),
+            np.concatenate((sigma[w], sigma[b])),
+            np.concatenate((mu[b], mu[w])), np.concatenate((phi[b], phi[w])),
+            np.concatenate((s, 1.0 - s)),
+        )
+        count = len(games)
+        elo[w], elo[b] = new_elo_w, new_elo_b
+        mu[w], mu[b] = sides_mu[:count], sides_mu[count:]
+        phi[w], phi[b] = sides_phi[:count], sides_phi[count:]
+        sigma[w], sigma[b] = sides_sigma[:count], sides_sigma[count:]
+
+        history[games, 0, 0] = new_elo_w
+        history[games, 1, 0] = new_elo_b
+        history[games, :, 1] = (sides_mu * _GLICKO2_SCALE + GLICKO_DEFAULT).reshape(2, count).T
+        history[games, :, 2] = (sides_phi * _GLICKO2_SCALE).reshape(2, count).T
+
+    return BatchRatings(
+        elo=elo,
+        glicko=mu * _GLICKO2_SCALE + GLICKO_DEFAULT,
+        rd=phi * _GLICKO2_SCALE,
+        volatility=sigma,
+        history=history,
+    )
+
+
+def main(argv=None):
+    """Kommandozeile: alle Wertungen aus der Spielhistorie neu berechnen."""
+    from .database import DatabaseManager
+
+    parser = argparse.ArgumentParser(description='Elo- und Glicko-2-Wertungen der Schach-Datenbank neu berechnen.')
+    parser.add_argument('--db', default='chess.db', help='Pfad zur Datenbank (Standard: chess.db)')
+    args = parser.parse_args(argv)
+
+    with DatabaseManager(args.db) as db:
+        games = db.recompute_ratings()
+    print(f'{games} Partien gewertet', file=sys.stderr)
+
+
+__all__ = [
+    'ELO_DEFAULT', 'GLICKO_DEFAULT', 'GLICKO_RD_DEFAULT', 'GLICKO_VOLATILITY_DEFAULT',
+    'ELO_K', 'RESULT_SCORES', 'Rating', 'BatchRatings', 'elo_expected', 'elo_update',
+    'glicko2_update', 'rate_game', 'rounds', 'batch_ratings', 'main',
+]
+
+
+if __name__ == '__main__':
+    main()
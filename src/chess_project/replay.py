@@ -0,0 +1,317 @@
+"""Inkrementelle Navigation durch aufgezeichnete Spiele.
+
+Der ReplayNavigator hält ein lebendes Board und wendet beim Vor-/Zurückgehen
+nur die Änderungen zwischen zwei aufeinanderfolgenden Stellungen an. Ein
+vollständiger Snapshot wird nur bei Sprüngen (Anfang, Ende, beliebiger Index)
+auf das Board übertragen.
+
+Die Stellungen eines Spiels werden von DecodedGame einmalig in kompakte
+int8-Arrays dekodiert (erste Stellung sofort, der Rest im Hintergrund-Thread).
+Der ReplayCache hält die zuletzt angesehenen Spiele (LRU) im Speicher.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import numpy as np
+
+from .board import Board
+from .board_serialization import create_piece, decode_board_json
+
+
+# Kompakte Kodierung: 0 = leer, Weiß positiv, Schwarz negativ
+PIECE_CODES = {'P': 1, 'N': 2, 'B': 3, 'R': 4, 'Q': 5, 'K': 6}
+
+# Rückabbildung code -> (color, notation), Index = code + 6
+_CODE_ENTRIES: list[Optional[tuple]] = [None] * 13
+for _notation, _code in PIECE_CODES.items():
+    _CODE_ENTRIES[_code + 6] = ('white', _notation)
+    _CODE_ENTRIES[-_code + 6] = ('black', _notation)
+
+
+def encode_squares(squares: list) -> np.ndarray:
+    """Kodiert 64 (color, notation)-Einträge als int8-Array.
+
+    Args:
+        squares: Liste aus decode_board_json
+
+    Returns:
+        numpy int8 Array der Länge 64
+    """
+    codes = np.zeros(64, dtype=np.int8)
+    for index, entry in enumerate(squares):
+        if entry is not None:
+            color, notation = entry
+            code = PIECE_CODES[notation]
+            codes[index] = code if color == 'white' else -code
+    return codes
+
+
+def entry_for_code(code: int) -> Optional[tuple]:
+    """Gibt (color, notation) für einen int8-Code zurück (None = leer)."""
+    return _CODE_ENTRIES[int(code) + 6]
+
+
+class DecodedGame:
+    """Alle Stellungen eines Spiels als int8-Arrays plus Metadaten.
+
+    Die erste Stellung wird im Konstruktor synchron dekodiert, alle weiteren
+    in einem Daemon-Thread. Wird eine Stellung angefragt, bevor der Thread
+    sie erreicht hat, wird sie direkt dekodiert (das Ergebnis ist identisch).
+
+    Attribute:
+        game_data: Spieldaten aus DatabaseManager.get_game
+        boards: Board-Zeilen aus DatabaseManager.get_game_boards
+        positions: numpy int8 Array der Form (Anzahl Boards, 64)
+    """
+
+    def __init__(self, game_data: Optional[dict], boards: list[dict], background: bool = True):
+        self.game_data = game_data
+        self.boards = boards
+        self.positions = np.zeros((len(boards), 64), dtype=np.int8)
+        self._metadata: list[Optional[dict]] = [None] * len(boards)
+        self._decoded = [False] * len(boards)
+        self._thread: Optional[threading.Thread] = None
+
+        if boards:
+            self._decode(0)
+        if background and len(boards) > 1:
+            self._thread = threading.Thread(target=self._decode_all, daemon=True)
+            self._thread.start()
+
+    def __len__(self) -> int:
+        return len(self.boards)
+
+    @property
+    def is_complete(self) -> bool:
+        """True sobald alle Stellungen dekodiert sind."""
+        return all(self._decoded)
+
+    def wait(self, timeout: Optional[float] = None):
+        """Wartet bis der Hintergrund-Thread fertig ist."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def position(self, index: int) -> np.ndarray:
+        """Gibt die int8-Kodierung der Stellung index zurück."""
+        if not self._decoded[index]:
+            self._decode(index)
+        return self.positions[index]
+
+    def metadata(self, index: int) -> dict:
+        """Gibt die Metadaten (turn, Zeiten, Remis-Angebote) der Stellung index zurück."""
+        if not self._decoded[index]:
+            self._decode(index)
+        return self._metadata[index] or {}
+
+    def _decode(self, index: int):
+        squares, metadata = decode_board_json(self.boards[index]['board_JSON'])
+        self.positions[index] = encode_squares(squares)
+        self._metadata[index] = metadata
+        # Flag zuletzt setzen, damit Leser nie eine halbe Zeile sehen
+        self._decoded[index] = True
+
+    def _decode_all(self):
+        for index in range(len(self.boards)):
+            if not self._decoded[index]:
+                self._decode(index)
+
+
+class ReplayCache:
+    """LRU-Cache für dekodierte Spiele.
+
+    Erneutes Öffnen eines kürzlich angesehenen Spiels greift weder auf die
+    Datenbank noch auf den JSON-Parser zu.
+    """
+
+    def __init__(self, max_games: int = 8):
+        """
+        Args:
+            max_games: Anzahl der Spiele, die im Speicher gehalten werden
+        """
+        self.max_games = max_games
+        self._games: OrderedDict[int, DecodedGame] = OrderedDict()
+
+    def __contains__(self, game_id: int) -> bool:
+        return game_id in self._games
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def get(self, game_id: int, loader: Callable[[int], tuple]) -> Optional[DecodedGame]:
+        """Gibt das dekodierte Spiel zurück und lädt es bei Bedarf.
+
+        Nur beendete Spiele (mit end_time) werden gecacht, laufende Spiele
+        können sich noch ändern.
+
+        Args:
+            game_id: ID des Spiels
+            loader: Funktion game_id -> (game_data, boards), nur bei Cache-Miss
+
+        Returns:
+            DecodedGame oder None, falls das Spiel nicht existiert
+        """
+        game = self._games.get(game_id)
+        if game is not None:
+            self._games.move_to_end(game_id)
+            return game
+
+        game_data, boards = loader(game_id)
+        if not game_data:
+            return None
+
+        game = DecodedGame(game_data, boards)
+        if game_data.get('end_time'):
+            self._games[game_id] = game
+            while len(self._games) > self.max_games:
+                self._games.popitem(last=False)
+        return game
+
+    def invalidate(self, game_id: Optional[int] = None):
+        """Entfernt ein Spiel (oder alle Spiele) aus dem Cache."""
+        if game_id is None:
+            self._games.clear()
+        else:
+            self._games.pop(game_id, None)
+
+
+class ReplayNavigator:
+    """Navigiert durch die Board-Zustände eines gespeicherten Spiels.
+
+    Attribute:
+        board: Lebendes Board, das immer die aktuelle Stellung zeigt
+        index: Index der aktuellen Stellung (0 = Startposition)
+    """
+
+    def __init__(self, game: DecodedGame):
+        """
+        Args:
+            game: Dekodiertes Spiel (siehe DecodedGame / ReplayCache)
+        """
+        self.game = game
+
+        # Wiederverwendbare Figuren je (color, notation)
+        self._piece_pool: dict[tuple, list] = {}
+
+        self.board = Board()
+        self.index = -1
+
+        if len(game):
+            self.jump(0)
+        else:
+            self.board.setup_startpos()
+            self.index = 0
+
+    def __len__(self) -> int:
+        return len(self.game)
+
+    @property
+    def metadata(self) -> dict:
+        """Metadaten (turn, Zeiten, Remis-Angebote) der aktuellen Stellung."""
+        if not len(self.game):
+            return {}
+        return self.game.metadata(self.index)
+
+    def go_to(self, index: int):
+        """Navigiert zur Stellung mit dem angegebenen Index.
+
+        Nachbarstellungen werden inkrementell erreicht, alles andere per Sprung.
+
+        Args:
+            index: Zielindex (0 = Startposition)
+
+        Returns:
+            Das Board-Array der Zielstellung
+        """
+        if not len(self.game) or not 0 <= index < len(self.game):
+            raise IndexError(f'Replay-Index {index} außerhalb des Bereichs')
+
+        if index == self.index + 1:
+            self.step_forward()
+        elif index == self.index - 1:
+            self.step_back()
+        elif index != self.index:
+            self.jump(index)
+
+        return self.board.squares
+
+    def step_forward(self):
+        """Geht einen Halbzug vor, indem nur die geänderten Felder gesetzt werden."""
+        if self.index >= len(self.game) - 1:
+            return
+        self._apply_codes(self.game.position(self.index), self.game.position(self.index + 1))
+        self.index += 1
+
+    def step_back(self):
+        """Geht einen Halbzug zurück, indem die letzte Änderung rückgängig gemacht wird."""
+        if self.index <= 0:
+            return
+        self._apply_codes(self.game.position(self.index), self.game.position(self.index - 1))
+        self.index -= 1
+
+    def jump(self, index: int):
+        """Überträgt den vollständigen Snapshot einer Stellung auf das Board.
+
+        Args:
+            index: Zielindex (0 = Startposition)
+        """
+        position = self.game.position(index)
+        self._apply([(square, entry_for_code(code)) for square, code in enumerate(position)])
+        self.index = index
+
+    # ==================== Interne Hilfsmethoden ====================
+
+    def _apply_codes(self, current: np.ndarray, target: np.ndarray):
+        """Überträgt nur die Felder, in denen sich zwei Stellungen unterscheiden."""
+        changed = np.flatnonzero(current != target)
+        self._apply([(int(square), entry_for_code(target[square])) for square in changed])
+
+    def _apply(self, changes: list):
+        """Setzt Felder des lebenden Boards.
+
+        Zuerst werden alle verdrängten Figuren in den Pool gelegt, danach die
+        neuen Figuren platziert - so wird eine ziehende Figur wiederverwendet
+        statt neu erzeugt.
+
+        Args:
+            changes: Liste von (square, entry) mit entry = (color, notation) oder None
+        """
+        placements = []
+        for square, entry in changes:
+            row, col = divmod(square, 8)
+            current = self.board.squares[row, col]
+            if current is not None:
+                if entry == (current.color, current.notation):
+                    continue
+                self._release(current)
+                self.board.squares[row, col] = None
+            if entry is not None:
+                placements.append((row, col, entry))
+
+        for row, col, entry in placements:
+            self.board.squares[row, col] = self._acquire(entry, (row, col))
+
+    def _acquire(self, entry: tuple, position: tuple):
+        """Holt eine Figur aus dem Pool (oder erzeugt sie beim ersten Mal)."""
+        pool = self._piece_pool.get(entry)
+        if pool:
+            piece = pool.pop()
+            piece.move_to(position)
+        else:
+            piece = create_piece(entry[0], entry[1], position)
+
+        pieces = self.board.white_pieces if piece.color == 'white' else self.board.black_pieces
+        pieces.append(piece)
+        if piece.notation == 'K':
+            if piece.color == 'white':
+                self.board.white_king = piece
+            else:
+                self.board.black_king = piece
+        return piece
+
+    def _release(self, piece):
+        """Nimmt eine Figur vom Board und legt sie zurück in den Pool."""
+        pieces = self.board.white_pieces if piece.color == 'white' else self.board.black_pieces
+        pieces.remove(piece)
+        self._piece_pool.setdefault((piece.color, piece.notation), []).append(piece)
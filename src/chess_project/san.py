@@ -0,0 +1,290 @@
+"""Standard Algebraic Notation (SAN) für Schachzüge.
+
+SAN beschreibt einen Zug aus Sicht der aktuellen Stellung, z.B. "e4",
+"Nbd7", "exd5", "e8=Q+", "O-O-O". Dieses Modul liest SAN-Strings und
+sucht den passenden Zug über ChessLogic, ohne alle legalen Züge der
+Stellung zu berechnen: nur Figuren der genannten Art, die das Zielfeld
+erreichen, werden auf Legalität (eigener König im Schach) geprüft.
+
+In der Gegenrichtung erzeugt SanWriter die Notation eines Zugs aus der
+bereits berechneten Liste der legalen Züge der Stellung (für die
+Unterscheidung gleichartiger Figuren, die dasselbe Zielfeld erreichen)
+und findet SAN-Strings in dieser Liste wieder.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from .chess_logic import ChessLogic
+from .fen import square_name
+from .move import Move
+
+
+_SAN_PATTERN = re.compile(
+    r'^(?P<piece>[KQRBN])?'
+    r'(?P<from_file>[a-h])?(?P<from_rank>[1-8])?'
+    r'(?P<capture>x)?'
+    r'(?P<to>[a-h][1-8])'
+    r'(?:=?(?P<promotion>[QRBN]))?$'
+)
+
+# Schach-/Matt-Zeichen und Kommentare ("!", "?!", ...) am Zugende
+_SAN_SUFFIX = re.compile(r'[+#!?]+$')
+
+KINGSIDE = 'O-O'
+QUEENSIDE = 'O-O-O'
+
+
+@dataclass(frozen=True)
+class SanMove:
+    """
+    Zerlegter SAN-String.
+
+    Attributes:
+        piece: 'K', 'Q', 'R', 'B', 'N' oder 'P'
+        to_pos: Zielfeld als (row, col); bei Rochade None
+        from_col: Spalte zur Unterscheidung (oder None)
+        from_row: Reihe zur Unterscheidung (oder None)
+        capture: True bei "x"
+        promotion: Umwandlungsfigur (oder None)
+        castling: KINGSIDE, QUEENSIDE oder None
+    """
+    piece: str
+    to_pos: Optional[tuple] = None
+    from_col: Optional[int] = None
+    from_row: Optional[int] = None
+    capture: bool = False
+    promotion: Optional[str] = None
+    castling: Optional[str] = None
+
+
+def parse_san(san: str) -> SanMove:
+    """
+    Zerlegt einen SAN-String (ohne Stellung).
+
+    Args:
+        san: z.B. "Nbd7", "exd8=Q+" oder "O-O"
+
+    Returns:
+        SanMove
+
+    Raises:
+        ValueError: bei ungültiger Notation
+    """
+    text = _SAN_SUFFIX.sub('', san.strip()).replace('0', 'O')
+    if text in (KINGSIDE, QUEENSIDE):
+        return SanMove(piece='K', castling=text)
+
+    match = _SAN_PATTERN.match(text)
+    if not match:
+        raise ValueError(f'Ungültige Zugnotation: {san!r}')
+
+    to = match.group('to')
+    from_file = match.group('from_file')
+    from_rank = match.group('from_rank')
+    return SanMove(
+        piece=match.group('piece') or 'P',
+        to_pos=(8 - int(to[1]), ord(to[0]) - ord('a')),
+        from_col=ord(from_file) - ord('a') if from_file else None,
+        from_row=8 - int(from_rank) if from_rank else None,
+        capture=bool(match.group('capture')),
+        promotion=match.group('promotion'),
+    )
+
+
+def find_san_move(chess_logic: ChessLogic, san: str, turn: str,
+                  last_move: Optional[Move] = None, validate: bool = True) -> Move:
+    """
+    Sucht den Zug zu einem SAN-String in der aktuellen Stellung.
+
+    Args:
+        chess_logic: ChessLogic des Boards
+        san: SAN-String
+        turn: Spieler am Zug ('white' oder 'black')
+        last_move: Letzter Zug (für En passant)
+        validate: Wenn False, wird ein eindeutiger Kandidat ohne
+                  Schach-Prüfung übernommen (schneller Import geprüfter Partien)
+
+    Returns:
+        Move (bei Promotion mit gesetzter Umwandlungsfigur)
+
+    Raises:
+        ValueError: wenn der Zug ungültig, illegal oder mehrdeutig ist
+    """
+    parsed = parse_san(san)
+    board = chess_logic.board
+    king = board.white_king if turn == 'white' else board.black_king
+    if king is None:
+        raise ValueError('King not found!')
+
+    if parsed.castling:
+        target_col = 6 if parsed.castling == KINGSIDE else 2
+        for move in chess_logic.castle(king):
+            if move.to_pos[1] == target_col:
+                return move
+        raise ValueError(f'Rochade nicht möglich: {san!r}')
+
+    pieces = board.white_pieces if turn == 'white' else board.black_pieces
+    candidates = []
+    for piece in pieces:
+        if piece.notation != parsed.piece:
+            continue
+        row, col = piece.position
+        if parsed.from_col is not None and col != parsed.from_col:
+            continue
+        if parsed.from_row is not None and row != parsed.from_row:
+            continue
+        for move in piece.get_legal_moves(board):
+            if move.to_pos != parsed.to_pos:
+                continue
+            if move.en_passant and not chess_logic.en_passant(move.captured, last_move):
+                continue
+            candidates.append(move)
+
+    if validate or len(candidates) > 1:
+        candidates = [move for move in candidates if not chess_logic.would_leave_king_in_check(move, king)]
+
+    if not candidates:
+        raise ValueError(f'Illegaler Zug: {san!r}')
+    if len(candidates) > 1:
+        raise ValueError(f'Mehrdeutiger Zug: {san!r}')
+
+    move = candidates[0]
+    if move.promotion is not None:
+        if parsed.promotion is None:
+            raise ValueError(f'Umwandlungsfigur fehlt: {san!r}')
+        move.promotion = parsed.promotion
+    elif parsed.promotion is not None:
+        raise ValueError(f'Umwandlung nicht möglich: {san!r}')
+    return move
+
+
+class SanWriter:
+    """
+    Erzeugt SAN für die Züge einer Stellung.
+
+    Die Unterscheidung gleichartiger Figuren wird aus der bereits
+    berechneten Liste der legalen Züge gewonnen (keine zusätzliche
+    Zuggenerierung) und beim ersten Zug einmal je Stellung gruppiert:
+    (Farbe, Figur, Zielfeld) -> Ausgangsfelder.
+    """
+
+    def __init__(self, legal_moves: list):
+        """
+        Args:
+            legal_moves: Alle legalen Züge der Stellung (z.B. aus all_legal_moves)
+        """
+        self.legal_moves = legal_moves
+        self._origins: Optional[dict] = None
+
+    def origins(self, color: str, symbol: str, to_pos: tuple) -> set:
+        """Ausgangsfelder aller Figuren dieser Art, die to_pos legal erreichen."""
+        if self._origins is None:
+            self._origins = {}
+            for move in self.legal_moves:
+                if move.castelling is None:
+                    key = (move.piece.color, move.piece.notation, move.to_pos)
+                    self._origins.setdefault(key, set()).add(move.from_pos)
+        return self._origins.get((color, symbol, to_pos), set())
+
+    def san(self, move: Move, check: bool = False, mate: bool = False) -> str:
+        """
+        Erzeugt die SAN eines Zugs.
+
+        Args:
+            move: Legaler Zug der Stellung (vor oder nach dem Ausführen)
+            check: True, wenn der Zug Schach gibt ("+")
+            mate: True, wenn der Zug matt setzt ("#")
+
+        Returns:
+            SAN-String, z.B. "Nbd7", "exd5", "e8=Q+" oder "O-O"
+        """
+        suffix = '#' if mate else '+' if check else ''
+        if move.castelling:
+            return (KINGSIDE if move.to_pos[1] == 6 else QUEENSIDE) + suffix
+
+        symbol = move.piece.notation
+        target = square_name(move.to_pos)
+        from_row, from_col = move.from_pos
+        capture = move.captured is not None
+
+        if symbol == 'P':
+            san = (chr(ord('a') + from_col) + 'x' if capture else '') + target
+            if move.promotion:
+                san += '=' + move.promotion.upper()
+            return san + suffix
+
+        rivals = self.origins(move.piece.color, symbol, move.to_pos) - {move.from_pos}
+        origin = square_name(move.from_pos)
+        if not rivals:
+            disambiguation = ''
+        elif all(col != from_col for _, col in rivals):
+            disambiguation = origin[0]
+        elif all(row != from_row for row, _ in rivals):
+            disambiguation = origin[1]
+        else:
+            disambiguation = origin
+
+        return f"{symbol}{disambiguation}{'x' if capture else ''}{target}{suffix}"
+
+    def find(self, san: str) -> Move:
+        """
+        Sucht den Zug zu einem SAN-String unter den legalen Zügen.
+
+        Args:
+            san: SAN-String (Schach-/Mattzeichen werden ignoriert)
+
+        Returns:
+            Move (bei Promotion mit gesetzter Umwandlungsfigur)
+
+        Raises:
+            ValueError: wenn kein oder mehr als ein legaler Zug passt
+        """
+        parsed = parse_san(san)
+        if parsed.castling:
+            target_col = 6 if parsed.castling == KINGSIDE else 2
+            candidates = [move for move in self.legal_moves
+                          if move.castelling is not None and move.to_pos[1] == target_col]
+        else:
+            candidates = [
+                move for move in self.legal_moves
+                if move.castelling is None
+                and move.piece.notation == parsed.piece
+                and move.to_pos == parsed.to_pos
+                and parsed.from_col in (None, move.from_pos[1])
+                and parsed.from_row in (None, move.from_pos[0])
+            ]
+
+        if not candidates:
+            raise ValueError(f'Illegaler Zug: {san!r}')
+        if len(candidates) > 1:
+            raise ValueError(f'Mehrdeutiger Zug: {san!r}')
+
+        move = candidates[0]
+        if move.promotion is not None:
+            if parsed.promotion is None:
+                raise ValueError(f'Umwandlungsfigur fehlt: {san!r}')
+            move.promotion = parsed.promotion
+        elif parsed.promotion is not None:
+            raise ValueError(f'Umwandlung nicht möglich: {san!r}')
+        return move
+
+
+def move_to_san(move: Move, legal_moves: list, check: bool = False, mate: bool = False) -> str:
+    """
+    Erzeugt die SAN eines einzelnen Zugs (siehe SanWriter.san).
+
+    Args:
+        move: Legaler Zug in der aktuellen Stellung
+        legal_moves: Alle legalen Züge der Stellung
+        check: True, wenn der Zug Schach gibt ("+")
+        mate: True, wenn der Zug matt setzt ("#")
+
+    Returns:
+        SAN-String
+    """
+    return SanWriter(legal_moves).san(move, check=check, mate=mate)
+
+
+__all__ = ['SanMove', 'SanWriter', 'parse_san', 'find_san_move', 'move_to_san', 'KINGSIDE', 'QUEENSIDE']
@@ -0,0 +1,131 @@
+"""Import-Zeit-Profil des App-Starts (``chess --profile-startup``).
+
+Startet einen frischen Interpreter mit ``python -X importtime``, importiert
+das Einstiegsmodul und wertet die Ausgabe aus. Der Bericht zeigt die
+Gesamtzeit und die Module mit der höchsten Eigen- bzw. Gesamtzeit, z.B. um
+zu prüfen, dass numpy oder die Spiel-Screens beim Menü nicht geladen werden.
+"""
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Optional, TextIO
+
+
+DEFAULT_TARGET = 'chess_project.kivy_main'
+
+# Module, die beim Menü nicht gebraucht werden und im Bericht markiert werden
+WATCHED_MODULES = ('numpy', 'chess_project.ui.screens', 'chess_project.game_session')
+
+_PREFIX = 'import time:'
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """Eine Zeile der ``-X importtime``-Ausgabe.
+
+    Attributes:
+        module: Vollständiger Modulname
+        self_us: Zeit für das Modul selbst in Mikrosekunden
+        cumulative_us: Zeit inklusive aller dabei importierten Module
+        depth: Verschachtelungstiefe (0 = direkt vom Aufrufer importiert)
+    """
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(text: str) -> list[ImportTiming]:
+    """
+    Liest die ``-X importtime``-Ausgabe (stderr) ein.
+
+    Args:
+        text: Ausgabe des Interpreters; fremde Zeilen werden ignoriert
+
+    Returns:
+        Liste der ImportTimings in Ausgabereihenfolge
+    """
+    timings = []
+    for line in text.splitlines():
+        if not line.startswith(_PREFIX):
+            continue
+        fields = line[len(_PREFIX):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Kopfzeile "self [us] | cumulative | imported package"
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        timings.append(ImportTiming(
+            module=stripped,
+            self_us=int(fields[0]),
+            cumulative_us=int(fields[1]),
+            depth=(len(name) - len(stripped) - 1) // 2,
+        ))
+    return timings
+
+
+def format_report(timings: list[ImportTiming], target: str = DEFAULT_TARGET, top: int = 25) -> str:
+    """
+    Erstellt den Textbericht zu einem Import-Profil.
+
+    Args:
+        timings: Ergebnis von parse_importtime
+        target: Profiliertes Einstiegsmodul
+        top: Anzahl der aufgeführten Module pro Tabelle
+
+    Returns:
+        Mehrzeiliger Bericht
+    """
+    total_us = sum(t.cumulative_us for t in timings if t.depth == 0)
+    lines = [
+        f'Import-Profil für {target}: {total_us / 1000:.1f} ms, {len(timings)} Module',
+    ]
+
+    loaded = {t.module for t in timings}
+    for module in WATCHED_MODULES:
+        lines.append(f'  {module}: {"geladen" if module in loaded else "nicht geladen"}')
+
+    for title, key in (('Eigenzeit', 'self_us'), ('Gesamtzeit', 'cumulative_us')):
+        lines.append('')
+        lines.append(f'Top {top} nach {title}:')
+        ranked = sorted(timings, key=lambda t: getattr(t, key), reverse=True)[:top]
+        for timing in ranked:
+            lines.append(f'{getattr(timing, key) / 1000:9.1f} ms  {timing.module}')
+    return '\n'.join(lines)
+
+
+def profile_startup(target: str = DEFAULT_TARGET, top: int = 25,
+                    stream: Optional[TextIO] = None) -> list[ImportTiming]:
+    """
+    Misst die Importzeit des Einstiegsmoduls in einem neuen Interpreter.
+
+    Kivy wird dabei ohne Kommandozeilen-Auswertung und Konsolen-Log
+    importiert; ein Fenster wird nicht geöffnet.
+
+    Args:
+        target: Zu importierendes Modul
+        top: Anzahl der aufgeführten Module pro Tabelle
+        stream: Ausgabe für den Bericht (Standard: sys.stdout)
+
+    Returns:
+        Liste der ImportTimings
+
+    Raises:
+        RuntimeError: wenn der Import fehlschlägt
+    """
+    env = dict(os.environ, KIVY_NO_ARGS='1', KIVY_NO_CONSOLELOG='1')
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [*sys.path, env.get('PYTHONPATH')]))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {target}'],
+        capture_output=True, text=True, env=env,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'Import von {target} fehlgeschlagen:\n{result.stderr}')
+
+    timings = parse_importtime(result.stderr)
+    print(format_report(timings, target, top), file=stream or sys.stdout)
+    return timings
+
+
+__all__ = ['ImportTiming', 'parse_importtime', 'format_report', 'profile_startup']
@@ -0,0 +1,195 @@
+"""Bedenkzeit-Regelungen (Time Controls) für die Schachuhr.
+
+Eine TimeControl besteht aus einer oder mehreren Perioden (TimeStage).
+Unterstützt werden:
+- Fischer-Inkrement: nach jedem Zug werden Sekunden gutgeschrieben
+- US-Delay (einfache Verzögerung): die Uhr läuft erst nach der Verzögerung
+- Bronstein-Delay: verbrauchte Zeit wird bis zur Höhe der Verzögerung erstattet
+- Mehrere Perioden, z.B. 40 Züge in 90 Minuten, danach 30 Minuten
+
+Textformat (z.B. für Eingabefeld und Datenbank), Perioden durch Komma getrennt:
+    "10"              10 Minuten
+    "5+3"             5 Minuten + 3 Sekunden Inkrement
+    "5d3"             5 Minuten, 3 Sekunden US-Delay
+    "5b3"             5 Minuten, 3 Sekunden Bronstein-Delay
+    "40/90+30, 30+30" 90 Minuten für 40 Züge, danach 30 Minuten, jeweils +30s
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+
+DELAY_SIMPLE = 'simple'
+DELAY_BRONSTEIN = 'bronstein'
+
+_DELAY_CODES = {'d': DELAY_SIMPLE, 'b': DELAY_BRONSTEIN}
+
+_STAGE_PATTERN = re.compile(
+    r'^(?:(?P<moves>\d+)/)?'
+    r'(?P<minutes>\d+(?:\.\d+)?)'
+    r'(?:\+(?P<increment>\d+(?:\.\d+)?))?'
+    r'(?:(?P<delay_code>[db])(?P<delay>\d+(?:\.\d+)?))?$'
+)
+
+
+def _format_number(value: float) -> str:
+    """Formatiert Minuten/Sekunden ohne überflüssiges '.0'."""
+    return f'{value:g}'
+
+
+@dataclass(frozen=True)
+class TimeStage:
+    """Eine Periode einer Bedenkzeit-Regelung.
+
+    Attributes:
+        base_ms: Zeit, die zu Beginn der Periode gutgeschrieben wird
+        moves: Anzahl Züge in dieser Periode (None = bis Partieende)
+        increment_ms: Fischer-Inkrement pro Zug
+        delay_ms: Verzögerung pro Zug
+        delay_mode: DELAY_SIMPLE, DELAY_BRONSTEIN oder None
+    """
+    base_ms: int
+    moves: Optional[int] = None
+    increment_ms: int = 0
+    delay_ms: int = 0
+    delay_mode: Optional[str] = None
+
+    def chargeable_ms(self, used_ms: int) -> int:
+        """Gibt zurück, wie viel der verbrauchten Zugzeit von der Uhr abgeht.
+
+        Beim US-Delay zählt die Zeit erst nach Ablauf der Verzögerung.
+        Beim Bronstein-Delay läuft die Uhr sofort, die Erstattung erfolgt
+        erst nach dem Zug (siehe refund_ms).
+        """
+        if self.delay_mode == DELAY_SIMPLE:
+            return max(0, used_ms - self.delay_ms)
+        return used_ms
+
+    def refund_ms(self, used_ms: int) -> int:
+        """Gutschrift nach einem Zug (Inkrement plus ggf. Bronstein-Erstattung)."""
+        refund = self.increment_ms
+        if self.delay_mode == DELAY_BRONSTEIN:
+            refund += min(used_ms, self.delay_ms)
+        return refund
+
+    def to_spec(self) -> str:
+        spec = _format_number(self.base_ms / 60000)
+        if self.moves:
+            spec = f'{self.moves}/{spec}'
+        if self.increment_ms:
+            spec += f'+{_format_number(self.increment_ms / 1000)}'
+        if self.delay_mode:
+            code = 'd' if self.delay_mode == DELAY_SIMPLE else 'b'
+            spec += f'{code}{_format_number(self.delay_ms / 1000)}'
+        return spec
+
+
+@dataclass(frozen=True)
+class TimeControl:
+    """Bedenkzeit-Regelung aus einer oder mehreren Perioden.
+
+    Attributes:
+        stages: Perioden in Spielreihenfolge; nur die letzte darf
+                unbegrenzt sein (moves=None)
+    """
+    stages: tuple
+
+    def __post_init__(self):
+        if not self.stages:
+            raise ValueError('Eine Bedenkzeit braucht mindestens eine Periode!')
+        for stage in self.stages[:-1]:
+            if not stage.moves:
+                raise ValueError('Nur die letzte Periode darf ohne Zuganzahl sein!')
+
+    @classmethod
+    def from_minutes(cls, minutes: float, increment_seconds: float = 0) -> 'TimeControl':
+        """Erzeugt eine einfache Regelung mit fester Zeit (und optionalem Inkrement)."""
+        return cls((TimeStage(base_ms=int(round(minutes * 60000)),
+                              increment_ms=int(round(increment_seconds * 1000))),))
+
+    @classmethod
+    def parse(cls, spec: str) -> 'TimeControl':
+        """Liest eine Regelung im Textformat (siehe Moduldokumentation).
+
+        Args:
+            spec: z.B. "5+3" oder "40/90+30, 30+30"
+
+        Returns:
+            TimeControl
+
+        Raises:
+            ValueError: bei ungültigem Format oder einer Zeit von 0
+        """
+        stages = []
+        for part in str(spec).replace(' ', '').split(','):
+            match = _STAGE_PATTERN.match(part)
+            if not match:
+                raise ValueError(f'Ungültige Bedenkzeit: {spec!r}')
+
+            delay_code = match.group('delay_code')
+            stage = TimeStage(
+                base_ms=int(round(float(match.group('minutes')) * 60000)),
+                moves=int(match.group('moves')) if match.group('moves') else None,
+                increment_ms=int(round(float(match.group('increment') or 0) * 1000)),
+                delay_ms=int(round(float(match.group('delay') or 0) * 1000)),
+                delay_mode=_DELAY_CODES[delay_code] if delay_code else None,
+            )
+            if stage.base_ms <= 0 and not stages:
+                raise ValueError('Bitte positive Zeit eingeben!')
+            stages.append(stage)
+        return cls(tuple(stages))
+
+    @property
+    def initial_ms(self) -> int:
+        """Startzeit pro Spieler in Millisekunden."""
+        return self.stages[0].base_ms
+
+    @property
+    def initial_minutes(self) -> int:
+        """Startzeit in ganzen Minuten (für die Spalte games.time_per_player)."""
+        return self.stages[0].base_ms // 60000
+
+    def stage_for_move(self, move_number: int) -> int:
+        """Gibt den Index der Periode zurück, in der ein Zug gespielt wird.
+
+        Args:
+            move_number: Zugnummer des Spielers, beginnend bei 1
+        """
+        limit = 0
+        for index, stage in enumerate(self.stages):
+            if stage.moves is None:
+                return index
+            limit += stage.moves
+            if move_number <= limit:
+                return index
+        # Nach der letzten begrenzten Periode wiederholt sich diese
+        # (z.B. "40/120" = alle 40 Züge erneut 120 Minuten)
+        return len(self.stages) - 1
+
+    def time_added_after_move(self, move_number: int) -> int:
+        """Zeit aus einem Periodenwechsel nach dem Zug move_number (in ms)."""
+        index = self.stage_for_move(move_number)
+        stage = self.stages[index]
+        if stage.moves is None:
+            return 0
+
+        limit = sum(s.moves for s in self.stages[:index + 1])
+        if move_number < limit:
+            return 0
+        if index + 1 < len(self.stages):
+            return self.stages[index + 1].base_ms
+        # Letzte Periode wiederholt sich im Zug-Rhythmus
+        if (move_number - limit) % stage.moves == 0:
+            return stage.base_ms
+        return 0
+
+    def to_spec(self) -> str:
+        """Gibt die Regelung im Textformat zurück (Umkehrung von parse)."""
+        return ', '.join(stage.to_spec() for stage in self.stages)
+
+    def __str__(self) -> str:
+        return self.to_spec()
+
+
+__all__ = ['TimeControl', 'TimeStage', 'DELAY_SIMPLE', 'DELAY_BRONSTEIN']
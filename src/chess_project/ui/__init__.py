@@ -1,17 +1,36 @@
-"""UI Package mit Screens, Widgets und Popups."""
+"""UI Package mit Screens, Widgets und Popups.
+
+Die Klassen werden erst beim ersten Zugriff importiert (PEP 562), damit
+``from chess_project.ui.menu_screen import ...`` beim App-Start nicht alle
+Screens, Widgets und Popups mitlädt.
+"""
+
+import importlib
+
+_LAZY_IMPORTS = {
+    "ChessBoard": ".board_widgets",
+    "ChessSquare": ".board_widgets",
+    "GameOverPopup": ".popups",
+    "PromotionPopup": ".popups",
+    "GameHistoryScreen": ".screens",
+    "GameReplayScreen": ".screens",
+    "GameScreen": ".screens",
+    "LeaderboardScreen": ".screens",
+    "PauseMenuScreen": ".screens",
+    "PlayerSelectionScreen": ".screens",
+    "StartMenuScreen": ".menu_screen",
+    "StatsMenuScreen": ".screens",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-from .board_widgets import ChessBoard, ChessSquare
-from .popups import GameOverPopup, PromotionPopup
-from .screens import (
-    GameHistoryScreen,
-    GameReplayScreen,
-    GameScreen,
-    LeaderboardScreen,
-    PauseMenuScreen,
-    PlayerSelectionScreen,
-    StartMenuScreen,
-    StatsMenuScreen,
-)
 
 __all__ = [
     "ChessBoard",
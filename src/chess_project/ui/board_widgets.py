@@ -3,9 +3,10 @@
 from kivy.graphics import Color, Ellipse, Rectangle
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
-from kivy.uix.image import Image
 from kivy.uix.label import Label
 
+from .piece_atlas import get_piece_texture
+
 
 class ChessSquare(BoxLayout):
     """Ein einzelnes Schachfeld mit optionaler Figur."""
@@ -13,7 +14,8 @@ class ChessSquare(BoxLayout):
     def __init__(self, light, piece=None, **kwargs):
         super().__init__(**kwargs)
         self.light = light
-        self.piece = piece
+        self.piece = None
+        self.piece_key = None  # (color, notation) der aktuell gezeichneten Figur
         self.press_callback = None
         self.dot = None  # Ellipse highlight for legal move
         self.selection_overlay = None  # Rectangle für ausgewähltes Feld
@@ -28,15 +30,24 @@ class ChessSquare(BoxLayout):
                 Color(0.45, 0.55, 0.75)
             self.rect = Rectangle()
 
-        if piece:
-            self.piece_image = Image(source=piece.get_image_path(), fit_mode="contain")
-            self.add_widget(self.piece_image)
+        # Figur als Rectangle mit Atlas-Textur statt als Image-Widget
+        with self.canvas:
+            self.piece_color = Color(1, 1, 1, 0)
+            self.piece_rect = Rectangle()
+
+        self.set_piece(piece)
 
     def update_rect(self, *args):
         """Hält Hintergründe und Overlays synchron zur Widget-Größe."""
 
         self.rect.pos = self.pos
         self.rect.size = self.size
+
+        # Figur quadratisch und zentriert (wie fit_mode="contain")
+        side = min(self.width, self.height)
+        self.piece_rect.pos = (self.x + (self.width - side) / 2, self.y + (self.height - side) / 2)
+        self.piece_rect.size = (side, side)
+
         if self.dot is not None:
             d = min(self.width, self.height) * 0.25
             self.dot.pos = (
@@ -52,14 +63,27 @@ class ChessSquare(BoxLayout):
             self.check_overlay.size = self.size
 
     def set_piece(self, piece):
-        """Setzt oder aktualisiert die Figur auf diesem Feld."""
+        """Setzt oder aktualisiert die Figur auf diesem Feld.
 
-        self.clear_widgets()
-        self.piece = piece
+        Bei einem Wechsel wird nur die Atlas-Region des Rectangles getauscht
+        bzw. die Figur über den Alpha-Wert ausgeblendet.
 
-        if piece:
-            self.piece_image = Image(source=piece.get_image_path(), fit_mode="contain")
-            self.add_widget(self.piece_image)
+        Returns:
+            True, wenn sich die gezeichnete Figur geändert hat
+        """
+
+        self.piece = piece
+        key = (piece.color, piece.notation) if piece else None
+        if key == self.piece_key:
+            return False
+        self.piece_key = key
+
+        if key is None:
+            self.piece_color.a = 0
+        else:
+            self.piece_rect.texture = get_piece_texture(*key)
+            self.piece_color.a = 1
+        return True
 
     def set_press_callback(self, callback):
         """Setzt Callback, der bei Klick auf das Feld ausgelöst wird."""
@@ -196,12 +220,17 @@ class ChessBoard(GridLayout):
         self.bg_rect.size = self.size
 
     def update_board(self, board_array, checkmate_position: tuple = None):
-        """Aktualisiert das Brett mit einem neuen board_array."""
+        """Aktualisiert das Brett mit einem neuen board_array.
+
+        Es werden nur Felder angefasst, deren Figur sich geändert hat
+        (nach einem Zug typischerweise 2-4 Felder).
+        """
 
         self.board_array = board_array
         for (row, col), square in self.squares.items():
             piece = board_array[row, col] if board_array is not None else None
-            square.set_piece(piece)
+            if piece is not square.piece:
+                square.set_piece(piece)
 
             if checkmate_position is not None and (row, col) == checkmate_position:
                 square.add_check_highlight()
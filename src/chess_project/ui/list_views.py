@@ -0,0 +1,327 @@
+"""Virtualisierte Listen (RecycleView) für Zughistorie, Eröffnungsbaum, Rangliste und Spielhistorie.
+
+Statt für jeden Eintrag eigene Widgets anzulegen, halten die Views nur eine
+Datenliste (``data``); Kivy erzeugt Zeilen-Widgets nur für den sichtbaren
+Bereich und recycelt sie beim Scrollen.
+"""
+
+from kivy.graphics import Color, Rectangle
+from kivy.metrics import dp
+from kivy.uix.behaviors import ButtonBehavior
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.label import Label
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+
+
+def _bind_rect(widget, rect):
+    """Hält ein Hintergrund-Rectangle synchron zur Widget-Größe."""
+    widget.bind(
+        pos=lambda instance, value: setattr(rect, "pos", instance.pos),
+        size=lambda instance, value: setattr(rect, "size", instance.size),
+    )
+
+
+class _ListView(RecycleView):
+    """Basis-RecycleView mit vertikalem RecycleBoxLayout."""
+
+    row_height = 35
+
+    def __init__(self, spacing=3, padding=(5, 5), **kwargs):
+        super().__init__(**kwargs)
+        self.do_scroll_x = False
+        self.viewclass = self.row_class
+
+        layout = RecycleBoxLayout(
+            orientation="vertical",
+            size_hint_y=None,
+            default_size=(None, self.row_height),
+            default_size_hint=(1, None),
+            spacing=spacing,
+            padding=list(padding),
+        )
+        layout.bind(minimum_height=layout.setter("height"))
+        self.add_widget(layout)
+
+
+# ==================== ZUGHISTORIE ====================
+
+class MoveHistoryRow(RecycleDataViewBehavior, BoxLayout):
+    """Eine Zeile der Zughistorie: Zugnummer, weißer und schwarzer Zug."""
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation="horizontal", spacing=4, padding=[2, 2], **kwargs)
+
+        self.num_box = BoxLayout(size_hint_x=0.18, padding=[4, 2])
+        with self.num_box.canvas.before:
+            self.num_color = Color(0.25, 0.3, 0.4, 0.9)
+            num_rect = Rectangle()
+        _bind_rect(self.num_box, num_rect)
+        self.num_label = Label(font_size=dp(16), bold=True, color=(0.7, 0.8, 0.95, 1))
+        self.num_box.add_widget(self.num_label)
+        self.add_widget(self.num_box)
+
+        white_box = BoxLayout(size_hint_x=0.41, padding=[6, 2])
+        with white_box.canvas.before:
+            self.white_color = Color(0.2, 0.25, 0.35, 0.95)
+            white_rect = Rectangle()
+        _bind_rect(white_box, white_rect)
+        self.white_label = Label(font_size=dp(16), color=(0.95, 0.95, 1, 1), bold=True)
+        white_box.add_widget(self.white_label)
+        self.add_widget(white_box)
+
+        black_box = BoxLayout(size_hint_x=0.41, padding=[6, 2])
+        with black_box.canvas.before:
+            self.black_color = Color(0.15, 0.18, 0.25, 0.95)
+            black_rect = Rectangle()
+        _bind_rect(black_box, black_rect)
+        self.black_label = Label(font_size=dp(16), color=(0.85, 0.85, 0.9, 1))
+        black_box.add_widget(self.black_label)
+        self.add_widget(black_box)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Überträgt einen Dateneintrag auf die (recycelte) Zeile.
+
+        Die Basisimplementierung (setattr je Schlüssel) wird in allen Zeilen
+        dieses Moduls bewusst nicht aufgerufen: die Schlüssel sind keine
+        Widget-Properties (und "top" der Rangliste würde Widget.top
+        überschreiben); die Zeilen setzen ihre Labels direkt.
+        """
+        placeholder = data.get("placeholder", False)
+
+        self.num_label.text = data.get("number", "")
+        self.white_label.text = data.get("white", "")
+        self.black_label.text = data.get("black", "")
+
+        # Platzhalter ("Keine Züge") ohne Zellen-Hintergründe darstellen
+        self.num_color.a = 0 if placeholder else 0.9
+        self.white_color.a = 0 if placeholder else 0.95
+        self.black_color.a = 0 if placeholder or not data.get("black") else 0.95
+        self.white_label.italic = placeholder
+        self.white_label.bold = not placeholder
+        self.white_label.color = (0.6, 0.6, 0.7, 1) if placeholder else (0.95, 0.95, 1, 1)
+
+
+class MoveHistoryView(_ListView):
+    """Zughistorie mit einer Zeile pro Zugpaar (Weiß/Schwarz)."""
+
+    row_class = MoveHistoryRow
+    row_height = 35
+
+    EMPTY_ROW = {"number": "", "white": "Keine Züge", "black": "", "placeholder": True}
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.move_count = 0
+        self.data = [dict(self.EMPTY_ROW)]
+
+    def set_moves(self, notations):
+        """Ersetzt die komplette Historie (z.B. neues Spiel oder Replay)."""
+        rows = []
+        for i in range(0, len(notations), 2):
+            rows.append({
+                "number": f"{i // 2 + 1}.",
+                "white": notations[i],
+                "black": notations[i + 1] if i + 1 < len(notations) else "",
+            })
+        self.move_count = len(notations)
+        self.data = rows or [dict(self.EMPTY_ROW)]
+
+    def append_move(self, notation):
+        """Hängt einen einzelnen Zug an - nur die letzte Zeile ändert sich."""
+        if self.move_count == 0:
+            self.data = [{"number": "1.", "white": notation, "black": ""}]
+        elif self.move_count % 2 == 0:
+            self.data.append({"number": f"{self.move_count // 2 + 1}.", "white": notation, "black": ""})
+        else:
+            row = dict(self.data[-1])
+            row["black"] = notation
+            self.data[-1] = row
+        self.move_count += 1
+
+        # Neuesten Zug sichtbar halten
+        self.scroll_y = 0
+
+
+# ==================== ERÖFFNUNGSBAUM ====================
+
+class OpeningMoveRow(RecycleDataViewBehavior, BoxLayout):
+    """Eine Zeile des Eröffnungsbaums: Zug, Anzahl Partien und Ergebnisbalken."""
+
+    # Farben der Balkenabschnitte (Weiß gewinnt / Remis / Schwarz gewinnt)
+    SEGMENT_COLORS = ((0.9, 0.9, 0.92, 1), (0.55, 0.57, 0.62, 1), (0.12, 0.13, 0.16, 1))
+    LABEL_COLORS = ((0.1, 0.1, 0.1, 1), (1, 1, 1, 1), (0.9, 0.9, 0.9, 1))
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation="horizontal", spacing=4, padding=[2, 2], **kwargs)
+
+        self.move_label = Label(font_size=dp(15), bold=True, size_hint_x=0.22, color=(0.95, 0.95, 1, 1))
+        self.games_label = Label(font_size=dp(13), size_hint_x=0.18, color=(0.7, 0.8, 0.95, 1))
+        self.add_widget(self.move_label)
+        self.add_widget(self.games_label)
+
+        self.bar = BoxLayout(orientation="horizontal", size_hint_x=0.6)
+        self.segments = []
+        for color, label_color in zip(self.SEGMENT_COLORS, self.LABEL_COLORS):
+            segment = Label(font_size=dp(11), color=label_color)
+            with segment.canvas.before:
+                Color(*color)
+                rect = Rectangle()
+            _bind_rect(segment, rect)
+            self.bar.add_widget(segment)
+            self.segments.append(segment)
+        self.add_widget(self.bar)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Überträgt einen Dateneintrag auf die (recycelte) Zeile (ohne super(), siehe MoveHistoryRow)."""
+        placeholder = data.get("placeholder", False)
+
+        self.move_label.text = data.get("notation", "")
+        self.move_label.size_hint_x = 1 if placeholder else 0.22
+        self.move_label.bold = not placeholder
+        self.move_label.italic = placeholder
+        self.games_label.text = data.get("games", "")
+        self.games_label.size_hint_x = 0 if placeholder else 0.18
+        self.bar.size_hint_x = 0 if placeholder else 0.6
+
+        for segment, percent in zip(self.segments, data.get("percents", (0, 0, 0))):
+            # Leere Abschnitte ausblenden, kleine ohne Beschriftung
+            segment.size_hint_x = percent / 100
+            segment.opacity = 1 if percent else 0
+            segment.text = f"{percent:.0f}%" if percent >= 15 else ""
+
+
+class OpeningExplorerView(_ListView):
+    """Züge des Eröffnungsbaums zur angezeigten Stellung (häufigste zuerst)."""
+
+    row_class = OpeningMoveRow
+    row_height = 30
+
+    EMPTY_ROW = {"notation": "Keine Partien", "placeholder": True}
+
+    def __init__(self, **kwargs):
+        super().__init__(spacing=2, **kwargs)
+        self.data = [dict(self.EMPTY_ROW)]
+
+    def set_moves(self, moves):
+        """Zeigt eine Liste von ExplorerMove an."""
+        self.data = [{
+            "notation": move.notation,
+            "games": str(move.games),
+            "percents": (move.white_percent, move.draw_percent, move.black_percent),
+        } for move in moves] or [dict(self.EMPTY_ROW)]
+
+
+# ==================== RANGLISTE ====================
+
+class LeaderboardRow(RecycleDataViewBehavior, BoxLayout):
+    """Eine Zeile der Rangliste."""
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation="horizontal", padding=[10, 5], **kwargs)
+
+        with self.canvas.before:
+            self.bg_color = Color(0.1, 0.1, 0.15, 1)
+            bg_rect = Rectangle()
+        _bind_rect(self, bg_rect)
+
+        self.rank_label = Label(font_size="18sp", size_hint=(0.12, 1))
+        self.name_label = Label(font_size="18sp", size_hint=(0.3, 1), halign="left")
+        self.name_label.bind(size=lambda l, s: setattr(l, "text_size", (s[0], None)))
+        self.points_label = Label(font_size="18sp", size_hint=(0.16, 1))
+        self.elo_label = Label(font_size="18sp", size_hint=(0.16, 1))
+        self.games_label = Label(font_size="18sp", size_hint=(0.13, 1))
+        self.wins_label = Label(font_size="18sp", size_hint=(0.13, 1))
+
+        for label in (self.rank_label, self.name_label, self.points_label, self.elo_label,
+                      self.games_label, self.wins_label):
+            self.add_widget(label)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Überträgt einen Dateneintrag auf die (recycelte) Zeile (ohne super(), siehe MoveHistoryRow)."""
+        top = data.get("top", False)
+        placeholder = data.get("placeholder", False)
+
+        # Platzhalter ("Noch keine Spieler") nutzt die volle Zeilenbreite
+        self.name_label.size_hint_x = 1 if placeholder else 0.3
+        for label, width in ((self.rank_label, 0.12), (self.points_label, 0.16), (self.elo_label, 0.16),
+                             (self.games_label, 0.13), (self.wins_label, 0.13)):
+            label.size_hint_x = 0 if placeholder else width
+
+        self.rank_label.text = data.get("rank", "")
+        self.rank_label.color = data.get("rank_color", (1, 1, 1, 1))
+        self.rank_label.bold = top
+        self.name_label.text = data.get("name", "")
+        self.name_label.bold = top
+        self.points_label.text = data.get("points", "")
+        self.points_label.color = data.get("points_color", (1, 1, 1, 1))
+        self.elo_label.text = data.get("elo", "")
+        self.games_label.text = data.get("games", "")
+        self.wins_label.text = data.get("wins", "")
+        self.name_label.halign = "center" if placeholder else "left"
+        self.bg_color.rgba = (0.15, 0.15, 0.2, 1) if index % 2 else (0.1, 0.1, 0.15, 1)
+
+
+class LeaderboardView(_ListView):
+    """Virtualisierte Rangliste."""
+
+    row_class = LeaderboardRow
+    row_height = 50
+
+    def __init__(self, **kwargs):
+        super().__init__(spacing=2, padding=(0, 0), **kwargs)
+
+
+# ==================== SPIELHISTORIE ====================
+
+class GameHistoryRow(RecycleDataViewBehavior, ButtonBehavior, BoxLayout):
+    """Ein anklickbarer Eintrag der Spielhistorie."""
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation="vertical", padding=[10, 8], spacing=6, **kwargs)
+        self.game_id = None
+        self.rv = None
+
+        with self.canvas.before:
+            Color(0.22, 0.24, 0.30, 1)
+            bg_rect = Rectangle()
+        _bind_rect(self, bg_rect)
+
+        self.players_label = Label(font_size="19sp", markup=True, size_hint=(1, 0.35), halign="center", valign="middle")
+        self.result_label = Label(font_size="17sp", markup=True, size_hint=(1, 0.35), halign="center", valign="middle")
+        self.info_label = Label(font_size="14sp", markup=True, size_hint=(1, 0.25), halign="center", valign="middle")
+
+        for label in (self.players_label, self.result_label, self.info_label):
+            label.bind(size=lambda l, s: setattr(l, "text_size", (s[0], s[1])))
+            self.add_widget(label)
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Überträgt einen Dateneintrag auf die (recycelte) Zeile (ohne super(), siehe MoveHistoryRow)."""
+        self.rv = rv
+        self.game_id = data.get("game_id")
+        self.players_label.text = data.get("players", "")
+        self.result_label.text = data.get("result", "")
+        self.info_label.text = data.get("info", "")
+
+    def on_press(self):
+        if self.rv is not None and self.game_id is not None and self.rv.select_callback:
+            self.rv.select_callback(self.game_id)
+
+
+class GameHistoryView(_ListView):
+    """Virtualisierte Spielhistorie.
+
+    Attribute:
+        select_callback: Callback mit der game_id des angeklickten Eintrags
+    """
+
+    row_class = GameHistoryRow
+    row_height = 110
+
+    def __init__(self, select_callback=None, **kwargs):
+        super().__init__(spacing=5, **kwargs)
+        self.select_callback = select_callback
+
+
+__all__ = ["MoveHistoryView", "OpeningExplorerView", "LeaderboardView", "GameHistoryView"]
@@ -0,0 +1,114 @@
+"""Start-Menü und gemeinsame Screen-Mixins.
+
+Eigenes Modul, damit beim App-Start nur das Menü gebaut und importiert
+werden muss; alle übrigen Screens (screens.py) werden erst bei der ersten
+Navigation geladen.
+"""
+
+from kivy.app import App
+from kivy.graphics import Color, Rectangle
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.label import Label
+from kivy.uix.screenmanager import Screen
+from kivy.uix.widget import Widget
+
+
+# ==================== GEMEINSAME HILFSMETHODEN ====================
+
+class ScreenBackgroundMixin:
+    """Mixin für gemeinsame Background-Update Methode."""
+    
+    def update_bg(self, *args):
+        """Aktualisiert das Background-Rectangle."""
+        self.bg_rect.pos = self.pos
+        self.bg_rect.size = self.size
+
+
+class PanelMixin:
+    """Mixin für Panel und Separator Updates."""
+    
+    def _update_panel(self, instance, value):
+        """Aktualisiert das Panel-Rectangle."""
+        self.panel_rect.pos = instance.pos
+        self.panel_rect.size = instance.size
+    
+    def _update_separator(self, instance, value):
+        """Aktualisiert den Separator mit 20% Margin."""
+        margin = instance.width * 0.2
+        self.sep_rect.pos = (instance.x + margin, instance.y)
+        self.sep_rect.size = (instance.width * 0.6, 2)
+
+
+class StartMenuScreen(ScreenBackgroundMixin, PanelMixin, Screen):
+    """Start-Menü mit New Game, Settings, Quit Buttons."""
+
+    def __init__(self, controller=None, **kwargs):
+        super().__init__(**kwargs)
+        self.controller = controller
+
+        with self.canvas.before:
+            Color(0.1, 0.12, 0.18, 1)
+            self.bg_rect = Rectangle(pos=self.pos, size=self.size)
+
+        self.bind(pos=self.update_bg, size=self.update_bg)
+
+        main_layout = BoxLayout(orientation="vertical", padding=[150, 100, 150, 100], spacing=30)
+        panel = BoxLayout(orientation="vertical", spacing=20)
+
+        with panel.canvas.before:
+            Color(0.15, 0.17, 0.22, 0.95)
+            self.panel_rect = Rectangle()
+
+        panel.bind(pos=self._update_panel, size=self._update_panel)
+
+        title_box = BoxLayout(orientation="vertical", size_hint=(1, 0.2), padding=[0, 20, 0, 10])
+        title = Label(text="SCHACH", font_size="48sp", size_hint=(1, 1), bold=True, color=(0.95, 0.95, 1, 1))
+        title_box.add_widget(title)
+        panel.add_widget(title_box)
+
+        separator = Widget(size_hint=(1, 0.02))
+        with separator.canvas:
+            Color(0.4, 0.4, 0.5, 1)
+            self.sep_rect = Rectangle()
+        separator.bind(pos=self._update_separator, size=self._update_separator)
+        panel.add_widget(separator)
+
+        button_container = BoxLayout(orientation="vertical", spacing=20, size_hint=(1, 0.68), padding=[80, 20, 80, 20])
+
+        new_game_btn = Button(text="Neues Spiel", font_size="26sp", size_hint=(1, 0.33), background_color=(0.2, 0.7, 0.3, 1), bold=True)
+        new_game_btn.bind(on_press=self.start_game)
+        button_container.add_widget(new_game_btn)
+
+        stats_btn = Button(text="Statistiken", font_size="26sp", size_hint=(1, 0.33), background_color=(0.3, 0.4, 0.7, 1), bold=True)
+        stats_btn.bind(on_press=self.open_stats)
+        button_container.add_widget(stats_btn)
+
+        quit_btn = Button(text="Beenden", font_size="26sp", size_hint=(1, 0.33), background_color=(0.7, 0.2, 0.2, 1), bold=True)
+        quit_btn.bind(on_press=self.quit_app)
+        button_container.add_widget(quit_btn)
+
+        panel.add_widget(button_container)
+        main_layout.add_widget(panel)
+        self.add_widget(main_layout)
+
+    def start_game(self, instance):
+        if self.controller:
+            self.controller.go_to_player_selection()
+        else:
+            self.manager.current = "player_selection"
+
+    def open_stats(self, instance):
+        if self.controller:
+            self.controller.go_to_stats_menu()
+        else:
+            self.manager.current = "stats_menu"
+
+    def quit_app(self, instance):
+        if self.controller:
+            self.controller.quit_app()
+        else:
+            App.get_running_app().stop()
+
+
+__all__ = ["ScreenBackgroundMixin", "PanelMixin", "StartMenuScreen"]
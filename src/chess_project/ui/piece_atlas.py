@@ -0,0 +1,80 @@
+"""Textur-Atlas für die Figurenbilder.
+
+Alle 12 Figuren-PNGs werden beim ersten Zugriff einmalig geladen und in eine
+gemeinsame Textur gepackt (6 Spalten K,Q,R,B,N,P x 2 Zeilen Weiß/Schwarz).
+Die Felder zeichnen ihre Figur anschließend als Rectangle mit einer Region
+dieser Textur - es gibt keine Image-Widgets pro Feld und beim Zeichnen wird
+nur eine Textur gebunden.
+"""
+
+from typing import Optional
+
+from kivy.core.image import Image as CoreImage
+from kivy.graphics.texture import Texture
+
+from ..pieces import PIECE_COLORS, PIECE_NOTATIONS, image_path
+
+
+class PieceAtlas:
+    """Eine Textur mit allen Figurenbildern und ihren Regionen.
+
+    Attribute:
+        texture: Die gemeinsame Atlas-Textur
+        cell_size: Kantenlänge einer Figur in Pixeln
+    """
+
+    def __init__(self):
+        images = {
+            (color, notation): self._load(image_path(color, notation))
+            for color in PIECE_COLORS
+            for notation in PIECE_NOTATIONS
+        }
+        self.cell_size = max(max(texture.size) for texture in images.values())
+
+        self.texture = Texture.create(
+            size=(self.cell_size * len(PIECE_NOTATIONS), self.cell_size * len(PIECE_COLORS)),
+            colorfmt='rgba',
+        )
+
+        self._regions = {}
+        for (color, notation), texture in images.items():
+            x = PIECE_NOTATIONS.index(notation) * self.cell_size
+            y = PIECE_COLORS.index(color) * self.cell_size
+            width, height = texture.size
+            # Texture.pixels: RGBA, Ursprung unten links wie im Atlas
+            self.texture.blit_buffer(
+                texture.pixels,
+                size=(width, height),
+                colorfmt='rgba',
+                pos=(x, y),
+                bufferfmt='ubyte',
+            )
+            self._regions[(color, notation)] = self.texture.get_region(x, y, width, height)
+
+    @staticmethod
+    def _load(path: str):
+        """Lädt ein PNG als (temporäre, nicht zwischengespeicherte) Textur."""
+        return CoreImage(path, nocache=True).texture
+
+    def get(self, color: str, notation: str):
+        """Gibt die Texturregion einer Figur zurück."""
+        return self._regions[(color, notation)]
+
+
+_atlas: Optional[PieceAtlas] = None
+
+
+def get_atlas() -> PieceAtlas:
+    """Gibt den (beim ersten Aufruf erzeugten) Figuren-Atlas zurück."""
+    global _atlas
+    if _atlas is None:
+        _atlas = PieceAtlas()
+    return _atlas
+
+
+def get_piece_texture(color: str, notation: str):
+    """Gibt die Atlas-Region für eine Figur zurück."""
+    return get_atlas().get(color, notation)
+
+
+__all__ = ["PieceAtlas", "get_atlas", "get_piece_texture"]
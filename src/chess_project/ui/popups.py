@@ -7,6 +7,14 @@ from kivy.uix.label import Label
 from kivy.uix.popup import Popup
 
 
+# result_type -> Begründung bei Remis nach den Regeln
+DRAW_MESSAGES = {
+    "repetition": "Dreifache Stellungswiederholung",
+    "fifty_moves": "50-Züge-Regel",
+    "insufficient_material": "Ungenügendes Material",
+}
+
+
 class GameOverPopup(Popup):
     """Popup für Spielende (Checkmate oder Remis)."""
 
@@ -38,6 +46,10 @@ class GameOverPopup(Popup):
             title_text = "REMIS!"
             title_color = (0.7, 0.7, 0.3, 1)
             message = "Unentschieden!"
+        elif result_type in DRAW_MESSAGES:
+            title_text = "REMIS!"
+            title_color = (0.7, 0.7, 0.3, 1)
+            message = DRAW_MESSAGES[result_type]
         else:
             raise ValueError("Ungültiger Spielende-Typ für GameOverPopup!")
         
@@ -9,7 +9,6 @@ from kivy.graphics import Color, Rectangle
 from kivy.metrics import dp
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
-from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
 from kivy.uix.popup import Popup
 from kivy.uix.screenmanager import Screen
@@ -19,206 +18,10 @@ from kivy.uix.textinput import TextInput
 from kivy.uix.widget import Widget
 
 from .board_widgets import ChessBoard
+from .list_views import GameHistoryView, LeaderboardView, MoveHistoryView, OpeningExplorerView
+from .menu_screen import PanelMixin, ScreenBackgroundMixin, StartMenuScreen
 from .popups import GameOverPopup, PromotionPopup, RemisConfirmPopup
-
-
-# ==================== GEMEINSAME HILFSMETHODEN ====================
-
-class ScreenBackgroundMixin:
-    """Mixin für gemeinsame Background-Update Methode."""
-    
-    def update_bg(self, *args):
-        """Aktualisiert das Background-Rectangle."""
-        self.bg_rect.pos = self.pos
-        self.bg_rect.size = self.size
-
-
-class PanelMixin:
-    """Mixin für Panel und Separator Updates."""
-    
-    def _update_panel(self, instance, value):
-        """Aktualisiert das Panel-Rectangle."""
-        self.panel_rect.pos = instance.pos
-        self.panel_rect.size = instance.size
-    
-    def _update_separator(self, instance, value):
-        """Aktualisiert den Separator mit 20% Margin."""
-        margin = instance.width * 0.2
-        self.sep_rect.pos = (instance.x + margin, instance.y)
-        self.sep_rect.size = (instance.width * 0.6, 2)
-
-
-def create_move_history_display(container, moves_list):
-    """
-    Gemeinsame Hilfsfunktion zum Erstellen der Zughistorie-Anzeige.
-    
-    Args:
-        container: BoxLayout Container für die Züge
-        moves_list: Liste von Zugnotationen (Strings)
-    """
-    container.clear_widgets()
-    
-    if not moves_list:
-        empty_label = Label(
-            text="Keine Züge",
-            font_size=dp(18),
-            size_hint_y=None,
-            height=40,
-            color=(0.6, 0.6, 0.7, 1),
-            italic=True
-        )
-        container.add_widget(empty_label)
-        return
-
-    # Gruppiere Züge paarweise (Weiß und Schwarz)
-    move_pairs = []
-    for i in range(0, len(moves_list), 2):
-        white_move = moves_list[i]
-        black_move = moves_list[i + 1] if i + 1 < len(moves_list) else None
-        move_pairs.append((white_move, black_move))
-
-    for move_num, (white_move, black_move) in enumerate(move_pairs, 1):
-        # Container für ein Zugpaar (eine Zeile)
-        move_row = BoxLayout(
-            orientation="horizontal",
-            size_hint_y=None,
-            height=35,
-            spacing=4,
-            padding=[2, 2]
-        )
-
-        # Zugnummer Box
-        num_box = BoxLayout(size_hint_x=0.18, padding=[4, 2])
-        with num_box.canvas.before:
-            Color(0.25, 0.3, 0.4, 0.9)
-            num_rect = Rectangle()
-        num_box.bind(
-            pos=lambda instance, value, r=num_rect: setattr(r, "pos", instance.pos),
-            size=lambda instance, value, r=num_rect: setattr(r, "size", instance.size)
-        )
-        
-        num_label = Label(
-            text=f"{move_num}.",
-            font_size=dp(16),
-            bold=True,
-            color=(0.7, 0.8, 0.95, 1)
-        )
-        num_box.add_widget(num_label)
-        move_row.add_widget(num_box)
-
-        # Weißer Zug Box
-        white_box = BoxLayout(size_hint_x=0.41, padding=[6, 2])
-        with white_box.canvas.before:
-            Color(0.2, 0.25, 0.35, 0.95)
-            white_rect = Rectangle()
-        white_box.bind(
-            pos=lambda instance, value, r=white_rect: setattr(r, "pos", instance.pos),
-            size=lambda instance, value, r=white_rect: setattr(r, "size", instance.size)
-        )
-        
-        white_label = Label(
-            text=white_move,
-            font_size=dp(16),
-            color=(0.95, 0.95, 1, 1),
-            bold=True
-        )
-        white_box.add_widget(white_label)
-        move_row.add_widget(white_box)
-
-        # Schwarzer Zug Box (falls vorhanden)
-        if black_move:
-            black_box = BoxLayout(size_hint_x=0.41, padding=[6, 2])
-            with black_box.canvas.before:
-                Color(0.15, 0.18, 0.25, 0.95)
-                black_rect = Rectangle()
-            black_box.bind(
-                pos=lambda instance, value, r=black_rect: setattr(r, "pos", instance.pos),
-                size=lambda instance, value, r=black_rect: setattr(r, "size", instance.size)
-            )
-            
-            black_label = Label(
-                text=black_move,
-                font_size=dp(16),
-                color=(0.85, 0.85, 0.9, 1)
-            )
-            black_box.add_widget(black_label)
-            move_row.add_widget(black_box)
-        else:
-            # Leere Box wenn nur weißer Zug vorhanden
-            move_row.add_widget(Widget(size_hint_x=0.41))
-
-        container.add_widget(move_row)
-
-
-class StartMenuScreen(ScreenBackgroundMixin, PanelMixin, Screen):
-    """Start-Menü mit New Game, Settings, Quit Buttons."""
-
-    def __init__(self, controller=None, **kwargs):
-        super().__init__(**kwargs)
-        self.controller = controller
-
-        with self.canvas.before:
-            Color(0.1, 0.12, 0.18, 1)
-            self.bg_rect = Rectangle(pos=self.pos, size=self.size)
-
-        self.bind(pos=self.update_bg, size=self.update_bg)
-
-        main_layout = BoxLayout(orientation="vertical", padding=[150, 100, 150, 100], spacing=30)
-        panel = BoxLayout(orientation="vertical", spacing=20)
-
-        with panel.canvas.before:
-            Color(0.15, 0.17, 0.22, 0.95)
-            self.panel_rect = Rectangle()
-
-        panel.bind(pos=self._update_panel, size=self._update_panel)
-
-        title_box = BoxLayout(orientation="vertical", size_hint=(1, 0.2), padding=[0, 20, 0, 10])
-        title = Label(text="SCHACH", font_size="48sp", size_hint=(1, 1), bold=True, color=(0.95, 0.95, 1, 1))
-        title_box.add_widget(title)
-        panel.add_widget(title_box)
-
-        separator = Widget(size_hint=(1, 0.02))
-        with separator.canvas:
-            Color(0.4, 0.4, 0.5, 1)
-            self.sep_rect = Rectangle()
-        separator.bind(pos=self._update_separator, size=self._update_separator)
-        panel.add_widget(separator)
-
-        button_container = BoxLayout(orientation="vertical", spacing=20, size_hint=(1, 0.68), padding=[80, 20, 80, 20])
-
-        new_game_btn = Button(text="Neues Spiel", font_size="26sp", size_hint=(1, 0.33), background_color=(0.2, 0.7, 0.3, 1), bold=True)
-        new_game_btn.bind(on_press=self.start_game)
-        button_container.add_widget(new_game_btn)
-
-        stats_btn = Button(text="Statistiken", font_size="26sp", size_hint=(1, 0.33), background_color=(0.3, 0.4, 0.7, 1), bold=True)
-        stats_btn.bind(on_press=self.open_stats)
-        button_container.add_widget(stats_btn)
-
-        quit_btn = Button(text="Beenden", font_size="26sp", size_hint=(1, 0.33), background_color=(0.7, 0.2, 0.2, 1), bold=True)
-        quit_btn.bind(on_press=self.quit_app)
-        button_container.add_widget(quit_btn)
-
-        panel.add_widget(button_container)
-        main_layout.add_widget(panel)
-        self.add_widget(main_layout)
-
-    def start_game(self, instance):
-        if self.controller:
-            self.controller.go_to_player_selection()
-        else:
-            self.manager.current = "player_selection"
-
-    def open_stats(self, instance):
-        if self.controller:
-            self.controller.go_to_stats_menu()
-        else:
-            self.manager.current = "stats_menu"
-
-    def quit_app(self, instance):
-        if self.controller:
-            self.controller.quit_app()
-        else:
-            App.get_running_app().stop()
+from ..time_control import TimeControl
 
 
 class PlayerSelectionScreen(ScreenBackgroundMixin, PanelMixin, Screen):
@@ -382,24 +185,24 @@ class PlayerSelectionScreen(ScreenBackgroundMixin, PanelMixin, Screen):
         
         self.time_input = TextInput(
             text="10", 
+            hint_text="5+3",
             multiline=False, 
             size_hint=(None, None), 
-            size=(90, 50), 
+            size=(170, 50), 
             font_size="22sp", 
-            input_filter="int", 
             disabled=True,
             background_color=(0.22, 0.24, 0.28, 1), 
             foreground_color=(1, 1, 1, 1), 
             padding=[15, 12], 
             halign="center"
         )
-        self.time_input.bind(text=lambda instance, value: self.limit_name_length(instance, value, 2))
+        self.time_input.bind(text=lambda instance, value: self.limit_name_length(instance, value, 20))
         timer_controls.add_widget(self.time_input)
         
         time_label = Label(
-            text="Minuten", 
+            text="Min + Sek", 
             size_hint=(None, 1), 
-            width=100, 
+            width=110, 
             font_size="19sp", 
             color=(0.75, 0.78, 0.88, 1)
         )
@@ -555,19 +358,17 @@ class PlayerSelectionScreen(ScreenBackgroundMixin, PanelMixin, Screen):
         black_player = self._get_or_create_player(black_name), black_name
 
         use_timer = self.timer_checkbox.active
-        time_per_player = None
+        time_control = None
         if use_timer:
+            # Minuten, optional mit Inkrement/Delay/Perioden (z.B. 5+3, 40/90+30, 30+30)
             try:
-                time_per_player = int(self.time_input.text)
-                if time_per_player <= 0:
-                    self._show_popup("Fehler", "Bitte positive Zeit eingeben!")
-                    return
+                time_control = TimeControl.parse(self.time_input.text)
             except ValueError:
-                self._show_popup("Fehler", "Bitte gültige Zahl für Zeit eingeben!")
+                self._show_popup("Fehler", "Bitte gültige Bedenkzeit eingeben (z.B. 10, 5+3 oder 40/90+30, 30+30)!")
                 return
 
         if self.controller:
-            self.controller.set_players(white_player, black_player, use_timer, time_per_player)
+            self.controller.set_players(white_player, black_player, use_timer, time_control=time_control)
             self.controller.start_new_game()
             self.controller.go_to_game()
         else:
@@ -685,7 +486,7 @@ class GameScreen(Screen):
         separator = Widget(size_hint=(1, 0.02))
         right_panel.add_widget(separator)
 
-        history_box = BoxLayout(orientation="vertical", size_hint=(1, 0.48), spacing=8, padding=[10, 10])
+        history_box = BoxLayout(orientation="vertical", size_hint=(1, 0.3), spacing=8, padding=[10, 10])
         with history_box.canvas.before:
             Color(0.3, 0.4, 0.6, 0.8)
             self.history_border_rect = Rectangle()
@@ -696,15 +497,24 @@ class GameScreen(Screen):
         history_title = Label(text="ZUGHISTORIE", font_size="20sp", size_hint=(1, None), height=30, bold=True, color=(0.9, 0.92, 1, 1))
         history_box.add_widget(history_title)
 
-        scroll = ScrollView(size_hint=(1, 1), do_scroll_x=False)
+        self.history_view = MoveHistoryView(size_hint=(1, 1))
+        history_box.add_widget(self.history_view)
 
-        self.history_container = BoxLayout(orientation="vertical", size_hint_y=None, spacing=3, padding=[5, 5])
-        self.history_container.bind(minimum_height=self.history_container.setter("height"))
+        right_panel.add_widget(history_box)
 
-        scroll.add_widget(self.history_container)
-        history_box.add_widget(scroll)
+        # Eröffnungsbaum zur aktuellen Stellung
+        explorer_box = BoxLayout(orientation="vertical", size_hint=(1, 0.18), spacing=4, padding=[10, 6])
+        with explorer_box.canvas.before:
+            Color(0.15, 0.18, 0.22, 0.9)
+            self.explorer_bg_rect = Rectangle()
+        explorer_box.bind(pos=self._update_explorer_box, size=self._update_explorer_box)
 
-        right_panel.add_widget(history_box)
+        explorer_title = Label(text="ERÖFFNUNGEN", font_size="16sp", size_hint=(1, None), height=24, bold=True, color=(0.9, 0.92, 1, 1))
+        explorer_box.add_widget(explorer_title)
+
+        self.explorer_view = OpeningExplorerView(size_hint=(1, 1))
+        explorer_box.add_widget(self.explorer_view)
+        right_panel.add_widget(explorer_box)
         
         # Remis-Button unter der Zughistorie
         draw_button = Button(
@@ -725,7 +535,7 @@ class GameScreen(Screen):
         self.white_player = None
         self.black_player = None
         self.use_timer = False
-        self.time_per_player = None
+        self.time_control = None
 
         if self.controller:
             self.controller.set_board_widget(self.board)
@@ -746,6 +556,10 @@ class GameScreen(Screen):
         self.history_bg_rect.pos = (instance.x + border_width, instance.y + border_width)
         self.history_bg_rect.size = (instance.width - 2 * border_width, instance.height - 2 * border_width)
 
+    def _update_explorer_box(self, instance, value):
+        self.explorer_bg_rect.pos = instance.pos
+        self.explorer_bg_rect.size = instance.size
+
     def _update_white_timer_bg(self, instance, value):
         self.white_timer_bg.pos = instance.pos
         self.white_timer_bg.size = instance.size
@@ -763,22 +577,22 @@ class GameScreen(Screen):
         self.board.width = size
         self.board.height = size
 
-    def set_players(self, white_player, black_player, use_timer=False, time_per_player=None):
+    def set_players(self, white_player, black_player, use_timer=False, time_control=None):
         self.white_player = white_player
         self.black_player = black_player
         self.use_timer = use_timer
-        self.time_per_player = time_per_player
+        self.time_control = time_control
 
         self.info_label.text = f"{white_player[1]} (Weiß) vs {black_player[1]} (Schwarz)"
 
         white_name = white_player[1] if isinstance(white_player, tuple) else white_player.get("username", "Weiß")
         black_name = black_player[1] if isinstance(black_player, tuple) else black_player.get("username", "Schwarz")
 
-        if use_timer and time_per_player:
+        if use_timer and time_control:
             # Countdown-Modus
-            minutes = time_per_player
-            self.white_timer_label.text = f"{white_name}: {minutes:02d}:00"
-            self.black_timer_label.text = f"{black_name}: {minutes:02d}:00"
+            minutes, seconds = divmod(time_control.initial_ms // 1000, 60)
+            self.white_timer_label.text = f"{white_name}: {minutes:02d}:{seconds:02d}"
+            self.black_timer_label.text = f"{black_name}: {minutes:02d}:{seconds:02d}"
         else:
             # Stopwatch-Modus (beginnt bei 00:00)
             self.white_timer_label.text = f"{white_name}: 00:00"
@@ -799,10 +613,21 @@ class GameScreen(Screen):
             self.info_label.text = "[b][color=FFFFFF]SCHWARZ IST AM ZUG[/color][/b]"
 
     def update_move_history(self, move_history):
-        # Konvertiere Move-Objekte zu Notationen
+        self.update_opening_explorer()
+        # Nach einem normalen Zug wird nur der neue Zug angehängt
+        if len(move_history) == self.history_view.move_count + 1:
+            self.history_view.append_move(self.controller.get_move_notation(move_history[-1]))
+            return
+        # Neues Spiel o.ä.: komplette Historie neu setzen
         move_notations = [self.controller.get_move_notation(move) for move in move_history]
-        # Verwende gemeinsame Hilfsfunktion
-        create_move_history_display(self.history_container, move_notations)
+        self.history_view.set_moves(move_notations)
+
+    def update_opening_explorer(self):
+        """Zeigt die gespielten Züge aus der aktuellen Stellung (Eröffnungsbaum)."""
+        if not self.controller or self.controller.board is None:
+            return
+        moves = self.controller.get_opening_moves(self.controller.board.squares, self.controller.current_turn)
+        self.explorer_view.set_moves(moves)
 
     def show_pause_menu(self, instance):
         if self.controller:
@@ -1038,11 +863,12 @@ class LeaderboardScreen(ScreenBackgroundMixin, PanelMixin, Screen):
         panel.add_widget(separator)
 
         header = BoxLayout(orientation="horizontal", size_hint=(1, 0.08), padding=[10, 5])
-        header.add_widget(Label(text="Rang", font_size="18sp", bold=True, size_hint=(0.15, 1), color=(0.9, 0.9, 1, 1)))
-        header.add_widget(Label(text="Spieler", font_size="18sp", bold=True, size_hint=(0.35, 1), halign="left", color=(0.9, 0.9, 1, 1)))
-        header.add_widget(Label(text="Punkte", font_size="18sp", bold=True, size_hint=(0.2, 1), color=(0.9, 0.9, 1, 1)))
-        header.add_widget(Label(text="Spiele", font_size="18sp", bold=True, size_hint=(0.15, 1), color=(0.9, 0.9, 1, 1)))
-        header.add_widget(Label(text="Siege", font_size="18sp", bold=True, size_hint=(0.15, 1), color=(0.9, 0.9, 1, 1)))
+        header.add_widget(Label(text="Rang", font_size="18sp", bold=True, size_hint=(0.12, 1), color=(0.9, 0.9, 1, 1)))
+        header.add_widget(Label(text="Spieler", font_size="18sp", bold=True, size_hint=(0.3, 1), halign="left", color=(0.9, 0.9, 1, 1)))
+        header.add_widget(Label(text="Punkte", font_size="18sp", bold=True, size_hint=(0.16, 1), color=(0.9, 0.9, 1, 1)))
+        header.add_widget(Label(text="Elo", font_size="18sp", bold=True, size_hint=(0.16, 1), color=(0.9, 0.9, 1, 1)))
+        header.add_widget(Label(text="Spiele", font_size="18sp", bold=True, size_hint=(0.13, 1), color=(0.9, 0.9, 1, 1)))
+        header.add_widget(Label(text="Siege", font_size="18sp", bold=True, size_hint=(0.13, 1), color=(0.9, 0.9, 1, 1)))
 
         with header.canvas.before:
             Color(0.2, 0.25, 0.3, 1)
@@ -1051,13 +877,8 @@ class LeaderboardScreen(ScreenBackgroundMixin, PanelMixin, Screen):
 
         panel.add_widget(header)
 
-        scroll = ScrollView(size_hint=(1, 0.65))
-
-        self.leaderboard_container = BoxLayout(orientation="vertical", size_hint_y=None, spacing=2)
-        self.leaderboard_container.bind(minimum_height=self.leaderboard_container.setter("height"))
-
-        scroll.add_widget(self.leaderboard_container)
-        panel.add_widget(scroll)
+        self.leaderboard_view = LeaderboardView(size_hint=(1, 0.65))
+        panel.add_widget(self.leaderboard_view)
 
         back_btn = Button(text="Zurück", font_size="22sp", size_hint=(1, 0.1), background_color=(0.6, 0.3, 0.3, 1), bold=True)
         back_btn.bind(on_press=self.go_back)
@@ -1074,59 +895,32 @@ class LeaderboardScreen(ScreenBackgroundMixin, PanelMixin, Screen):
         self.load_leaderboard()
 
     def load_leaderboard(self):
-        self.leaderboard_container.clear_widgets()
-
         if not self.controller:
+            self.leaderboard_view.data = []
             return
 
         players = self.controller.get_leaderboard(50)
 
         if not players:
-            empty_label = Label(text="Noch keine Spieler registriert.", font_size="20sp", size_hint_y=None, height=100)
-            self.leaderboard_container.add_widget(empty_label)
+            self.leaderboard_view.data = [{"name": "Noch keine Spieler registriert.", "placeholder": True}]
             return
 
-        for i, player in enumerate(players, 1):
-            row = BoxLayout(orientation="horizontal", size_hint_y=None, height=50, padding=[10, 5])
-
-            if i == 1:
-                rank_text = "1."
-                rank_color = (1, 0.84, 0, 1)
-            elif i == 2:
-                rank_text = "2."
-                rank_color = (0.75, 0.75, 0.75, 1)
-            elif i == 3:
-                rank_text = "3."
-                rank_color = (0.8, 0.5, 0.2, 1)
-            else:
-                rank_text = f"{i}."
-                rank_color = (1, 1, 1, 1)
-
-            rank_label = Label(text=rank_text, font_size="18sp", bold=i <= 3, size_hint=(0.15, 1), color=rank_color)
-            row.add_widget(rank_label)
-
-            name_label = Label(text=player["username"], font_size="18sp", bold=i <= 3, size_hint=(0.35, 1), halign="left", text_size=(None, None))
-            name_label.bind(size=lambda l, s: setattr(l, "text_size", (s[0], None)))
-            row.add_widget(name_label)
-
-            points_label = Label(text=str(player["points"]), font_size="18sp", size_hint=(0.2, 1), color=(0.3, 1, 0.3, 1) if player["points"] > 0 else (1, 1, 1, 1))
-            row.add_widget(points_label)
-
-            games_label = Label(text=str(player["games_played"]), font_size="18sp", size_hint=(0.15, 1))
-            row.add_widget(games_label)
-
-            wins_label = Label(text=str(player["games_won"]), font_size="18sp", size_hint=(0.15, 1))
-            row.add_widget(wins_label)
-
-            with row.canvas.before:
-                if i % 2 == 0:
-                    Color(0.15, 0.15, 0.2, 1)
-                else:
-                    Color(0.1, 0.1, 0.15, 1)
-                row_rect = Rectangle()
-            row.bind(pos=lambda r, v, rect=row_rect: setattr(rect, "pos", r.pos), size=lambda r, v, rect=row_rect: setattr(rect, "size", r.size))
-
-            self.leaderboard_container.add_widget(row)
+        rank_colors = {1: (1, 0.84, 0, 1), 2: (0.75, 0.75, 0.75, 1), 3: (0.8, 0.5, 0.2, 1)}
+
+        self.leaderboard_view.data = [
+            {
+                "rank": f"{i}.",
+                "rank_color": rank_colors.get(i, (1, 1, 1, 1)),
+                "top": i <= 3,
+                "name": player["username"],
+                "points": str(player["points"]),
+                "points_color": (0.3, 1, 0.3, 1) if player["points"] > 0 else (1, 1, 1, 1),
+                "elo": f"{player['elo']:.0f}",
+                "games": str(player["games_played"]),
+                "wins": str(player["games_won"]),
+            }
+            for i, player in enumerate(players, 1)
+        ]
 
     def go_back(self, instance):
         if self.controller:
@@ -1136,11 +930,16 @@ class LeaderboardScreen(ScreenBackgroundMixin, PanelMixin, Screen):
 
 
 class GameHistoryScreen(ScreenBackgroundMixin, PanelMixin, Screen):
-    """Spielhistorie-Anzeige."""
+    """Spielhistorie-Anzeige (seitenweise nachgeladen beim Scrollen)."""
+
+    PAGE_SIZE = 30
 
     def __init__(self, controller=None, **kwargs):
         super().__init__(**kwargs)
         self.controller = controller
+        self.filters = {}  # player_id, result, game_type, date_from, date_to
+        self._page_cursor = None  # (start_time, id) des zuletzt geladenen Spiels
+        self._has_more = False
 
         with self.canvas.before:
             Color(0.1, 0.12, 0.18, 1)
@@ -1164,13 +963,9 @@ class GameHistoryScreen(ScreenBackgroundMixin, PanelMixin, Screen):
         separator.bind(pos=self._update_separator, size=self._update_separator)
         panel.add_widget(separator)
 
-        scroll = ScrollView(size_hint=(1, 0.75))
-
-        self.games_container = BoxLayout(orientation="vertical", size_hint_y=None, spacing=5, padding=[5, 5])
-        self.games_container.bind(minimum_height=self.games_container.setter("height"))
-
-        scroll.add_widget(self.games_container)
-        panel.add_widget(scroll)
+        self.games_view = GameHistoryView(size_hint=(1, 0.75), select_callback=self.view_game)
+        self.games_view.bind(scroll_y=self._on_scroll)
+        panel.add_widget(self.games_view)
 
         back_btn = Button(text="Zurück", font_size="22sp", size_hint=(1, 0.1), background_color=(0.6, 0.3, 0.3, 1), bold=True)
         back_btn.bind(on_press=self.go_back)
@@ -1188,125 +983,112 @@ class GameHistoryScreen(ScreenBackgroundMixin, PanelMixin, Screen):
         self.load_game_history()
 
     def load_game_history(self):
-        self.games_container.clear_widgets()
+        """Lädt die Historie neu, beginnend mit der ersten Seite."""
+        self._page_cursor = None
+        self._has_more = False
 
         if not self.controller:
+            self.games_view.data = []
             return
 
-        games = self.controller.get_games_list(limit=50)
+        games = self._fetch_page()
 
         if not games:
-            empty_label = Label(text="Noch keine Spiele gespielt.", font_size="20sp", size_hint_y=None, height=100, color=(0.7, 0.7, 0.8, 1))
-            self.games_container.add_widget(empty_label)
+            self.games_view.data = [{"players": "[color=B3B3CC]Noch keine Spiele gespielt.[/color]"}]
+            return
+
+        self.games_view.data = [self._game_row_data(game) for game in games]
+        self.games_view.scroll_y = 1
+
+    def load_next_page(self):
+        """Hängt die nächste Seite an die Liste an (falls vorhanden)."""
+        if not self.controller or not self._has_more:
             return
 
-        for game in games:
-            white = self.controller.get_player_by_id(game["white_player_id"])
-            black = self.controller.get_player_by_id(game["black_player_id"])
-
-            if not white or not black:
-                continue
-
-            # Ergebnis und Ergebnistyp
-            result = game.get("result", "")
-            result_type = game.get("final_position", "")
-            
-            if result == "white_win":
-                winner_name = white['username']
-                if result_type == "checkmate":
-                    result_text = f"{winner_name} - Schachmatt"
-                elif result_type == "timeover":
-                    result_text = f"{winner_name} - Zeit"
-                else:
-                    result_text = f"{winner_name} gewinnt"
-                result_color = (0.3, 0.8, 0.3, 1)
-            elif result == "black_win":
-                winner_name = black['username']
-                if result_type == "checkmate":
-                    result_text = f"{winner_name} - Schachmatt"
-                elif result_type == "timeover":
-                    result_text = f"{winner_name} - Zeit"
-                else:
-                    result_text = f"{winner_name} gewinnt"
-                result_color = (0.3, 0.8, 0.3, 1)
-            elif result == "draw":
-                if result_type == "Patt":
-                    result_text = "Patt"
-                elif result_type == "Remis":
-                    result_text = "Remis vereinbart"
-                else:
-                    result_text = "Remis"
-                result_color = (0.8, 0.8, 0.3, 1)
+        self.games_view.data.extend(self._game_row_data(game) for game in self._fetch_page())
+
+    def _fetch_page(self):
+        """Holt die nächste Seite per Keyset-Pagination und merkt sich den Cursor."""
+        games = self.controller.get_games_list(limit=self.PAGE_SIZE, after=self._page_cursor, **self.filters)
+        self._has_more = len(games) == self.PAGE_SIZE
+        if games:
+            self._page_cursor = (games[-1]["start_time"], games[-1]["id"])
+        return games
+
+    def _on_scroll(self, scroll, scroll_y):
+        # scroll_y == 0 entspricht dem unteren Ende der Liste
+        if scroll_y <= 0.05 and self._has_more:
+            self.load_next_page()
+
+    def _game_row_data(self, game):
+        """Erzeugt den RecycleView-Dateneintrag für ein Spiel."""
+        # Spielernamen kommen per JOIN aus list_games
+        white_name = game["white_username"]
+        black_name = game["black_username"]
+
+        # Ergebnis und Ergebnistyp
+        result = game.get("result", "")
+        result_type = game.get("final_position", "")
+        
+        if result == "white_win":
+            winner_name = white_name
+            if result_type == "checkmate":
+                result_text = f"{winner_name} - Schachmatt"
+            elif result_type == "timeover":
+                result_text = f"{winner_name} - Zeit"
+            else:
+                result_text = f"{winner_name} gewinnt"
+            result_color = (0.3, 0.8, 0.3, 1)
+        elif result == "black_win":
+            winner_name = black_name
+            if result_type == "checkmate":
+                result_text = f"{winner_name} - Schachmatt"
+            elif result_type == "timeover":
+                result_text = f"{winner_name} - Zeit"
             else:
-                result_text = "Nicht beendet"
-                result_color = (0.6, 0.6, 0.7, 1)
+                result_text = f"{winner_name} gewinnt"
+            result_color = (0.3, 0.8, 0.3, 1)
+        elif result == "draw":
+            if result_type == "Patt":
+                result_text = "Patt"
+            elif result_type == "Remis":
+                result_text = "Remis vereinbart"
+            else:
+                result_text = f"Remis - {result_type}" if result_type else "Remis"
+            result_color = (0.8, 0.8, 0.3, 1)
+        else:
+            result_text = "Nicht beendet"
+            result_color = (0.6, 0.6, 0.7, 1)
 
-            game_type = "Timer" if game["game_type"] == "timed" else "Ohne Timer"
-            start_time = game["start_time"][:16].replace("T", " ")
+        from ..database import UNKNOWN_START_TIME
 
-            # Widget-Container statt Button für bessere Kontrolle
-            game_widget = BoxLayout(orientation="vertical", size_hint_y=None, height=110, padding=[10, 8], spacing=6)
-            
-            # Hintergrund
-            with game_widget.canvas.before:
-                Color(0.22, 0.24, 0.30, 1)
-                game_rect = Rectangle()
-            game_widget.bind(
-                pos=lambda instance, value, r=game_rect: setattr(r, "pos", instance.pos),
-                size=lambda instance, value, r=game_rect: setattr(r, "size", instance.size)
-            )
+        game_type = self._time_control_text(game)
+        if game["start_time"] == UNKNOWN_START_TIME:
+            start_time = "Datum unbekannt"
+        else:
+            start_time = game["start_time"][:16].replace("T", " ")
 
-            # Spielernamen
-            players_label = Label(
-                text=f"[b][color=FFFFFF]{white['username']}[/color][/b]  vs  [b][color=DDDDDD]{black['username']}[/color][/b]", 
-                font_size="19sp", 
-                markup=True, 
-                size_hint=(1, 0.35), 
-                halign="center",
-                valign="middle"
-            )
-            players_label.bind(size=lambda l, s: setattr(l, "text_size", (s[0], s[1])))
-            game_widget.add_widget(players_label)
-
-            # Ergebnis
-            result_label = Label(
-                text=f"[color={self._rgb_to_hex(result_color)}][b]{result_text}[/b][/color]", 
-                font_size="17sp", 
-                markup=True,
-                size_hint=(1, 0.35),
-                halign="center",
-                valign="middle"
-            )
-            result_label.bind(size=lambda l, s: setattr(l, "text_size", (s[0], s[1])))
-            game_widget.add_widget(result_label)
-
-            # Typ und Zeit
-            info_label = Label(
-                text=f"[color=AAAAAA]{game_type}  •  {start_time}[/color]",
-                font_size="14sp",
-                markup=True,
-                size_hint=(1, 0.25),
-                halign="center",
-                valign="middle"
-            )
-            info_label.bind(size=lambda l, s: setattr(l, "text_size", (s[0], s[1])))
-            game_widget.add_widget(info_label)
-
-            # Mache das Widget klickbar
-            from kivy.uix.behaviors import ButtonBehavior
-            
-            class ClickableBox(ButtonBehavior, BoxLayout):
-                pass
-            
-            clickable_widget = ClickableBox(orientation="vertical", size_hint_y=None, height=110)
-            clickable_widget.add_widget(game_widget)
-            clickable_widget.bind(on_press=lambda instance, g=game: self.view_game(g))
-            
-            self.games_container.add_widget(clickable_widget)
-
-    def view_game(self, game):
+        return {
+            "game_id": game["id"],
+            "players": f"[b][color=FFFFFF]{white_name}[/color][/b]  vs  [b][color=DDDDDD]{black_name}[/color][/b]",
+            "result": f"[color={self._rgb_to_hex(result_color)}][b]{result_text}[/b][/color]",
+            "info": f"[color=AAAAAA]{game_type}  •  {start_time}[/color]",
+        }
+
+    @staticmethod
+    def _time_control_text(game):
+        """Beschreibt die Bedenkzeit eines Spiels (z.B. "Timer 5+3")."""
+        if game["game_type"] != "timed":
+            return "Ohne Timer"
+        if game.get("time_control"):
+            return f"Timer {game['time_control']}"
+        if game.get("time_per_player"):
+            return f"Timer {game['time_per_player']} min"
+        return "Timer"
+
+    def view_game(self, game_id):
         if self.controller:
-            self.controller.view_game_replay(game["id"])
+            self.controller.view_game_replay(game_id)
 
     def go_back(self, instance):
         if self.controller:
@@ -1324,6 +1106,8 @@ class GameReplayScreen(ScreenBackgroundMixin, Screen):
         self.current_move_index = 0
         self.moves = []
         self.game_data = None
+        self.white_name = "Weiß"
+        self.black_name = "Schwarz"
 
         with self.canvas.before:
             Color(0.1, 0.12, 0.18, 1)
@@ -1373,7 +1157,7 @@ class GameReplayScreen(ScreenBackgroundMixin, Screen):
 
         right_panel = BoxLayout(orientation="vertical", size_hint=(0.3, 1), spacing=10)
 
-        move_info_box = BoxLayout(orientation="vertical", size_hint=(1, 0.2), padding=[10, 10])
+        move_info_box = BoxLayout(orientation="vertical", size_hint=(1, 0.12), padding=[10, 10])
         with move_info_box.canvas.before:
             Color(0.15, 0.18, 0.22, 0.9)
             self.move_info_bg = Rectangle()
@@ -1427,7 +1211,7 @@ class GameReplayScreen(ScreenBackgroundMixin, Screen):
 
         right_panel.add_widget(Widget(size_hint=(1, 0.02)))
 
-        history_box = BoxLayout(orientation="vertical", size_hint=(1, 0.45), padding=[10, 10])
+        history_box = BoxLayout(orientation="vertical", size_hint=(1, 0.3), padding=[10, 10])
         with history_box.canvas.before:
             Color(0.15, 0.18, 0.22, 0.9)
             self.history_bg = Rectangle()
@@ -1436,14 +1220,23 @@ class GameReplayScreen(ScreenBackgroundMixin, Screen):
         history_title = Label(text="ZÜGE", font_size="18sp", size_hint=(1, None), height=30, bold=True, color=(0.9, 0.92, 1, 1))
         history_box.add_widget(history_title)
 
-        scroll = ScrollView(size_hint=(1, 1), do_scroll_x=False)
+        self.history_view = MoveHistoryView(size_hint=(1, 1))
+        history_box.add_widget(self.history_view)
+        right_panel.add_widget(history_box)
+
+        # Eröffnungsbaum zur angezeigten Stellung
+        explorer_box = BoxLayout(orientation="vertical", size_hint=(1, 0.23), spacing=4, padding=[10, 6])
+        with explorer_box.canvas.before:
+            Color(0.15, 0.18, 0.22, 0.9)
+            self.explorer_bg = Rectangle()
+        explorer_box.bind(pos=self._update_explorer_bg, size=self._update_explorer_bg)
 
-        self.history_container = BoxLayout(orientation="vertical", size_hint_y=None, spacing=3, padding=[5, 5])
-        self.history_container.bind(minimum_height=self.history_container.setter("height"))
+        explorer_title = Label(text="ERÖFFNUNGEN", font_size="16sp", size_hint=(1, None), height=24, bold=True, color=(0.9, 0.92, 1, 1))
+        explorer_box.add_widget(explorer_title)
 
-        scroll.add_widget(self.history_container)
-        history_box.add_widget(scroll)
-        right_panel.add_widget(history_box)
+        self.explorer_view = OpeningExplorerView(size_hint=(1, 1))
+        explorer_box.add_widget(self.explorer_view)
+        right_panel.add_widget(explorer_box)
 
         game_layout.add_widget(right_panel)
         main_layout.add_widget(game_layout)
@@ -1482,22 +1275,34 @@ class GameReplayScreen(ScreenBackgroundMixin, Screen):
         white_player = self.controller.get_player_by_id(self.game_data["white_player_id"])
         black_player = self.controller.get_player_by_id(self.game_data["black_player_id"])
 
+        # Namen einmal pro Spiel merken (nicht bei jedem Schritt abfragen)
+        self.white_name = white_player.get('username', 'Weiß') if white_player else "Weiß"
+        self.black_name = black_player.get('username', 'Schwarz') if black_player else "Schwarz"
+
         # Spielergebnis formatieren
         result = self.game_data.get("result", "")
         result_type = self.game_data.get("final_position", "")
         if result == "white_win":
-            result_text = f"[color=4dcc4d]{white_player['username']} hat gewonnen[/color]"
+            result_text = f"[color=4dcc4d]{self.white_name} hat gewonnen[/color]"
         elif result == "black_win":
-            result_text = f"[color=4dcc4d]{black_player['username']} hat gewonnen[/color]"
+            result_text = f"[color=4dcc4d]{self.black_name} hat gewonnen[/color]"
         elif result == "draw":
             if result_type == "Remis":
                 result_text = "[color=cccc4d]REMIS[/color]"
             elif result_type == "Patt":
                 result_text = "[color=cccc4d]PATT[/color]"
+            else:
+                result_text = f"[color=cccc4d]REMIS ({result_type})[/color]" if result_type else "[color=cccc4d]REMIS[/color]"
         else:
             result_text = "[color=9999aa]Nicht beendet[/color]"
 
-        self.game_info_label.text = f"[b]{white_player['username']}[/b] vs [b]{black_player['username']}[/b]\n{result_text}"
+        time_control = self.game_data.get("time_control")
+        if time_control:
+            result_text = f"{result_text}  [color=9999aa]({time_control})[/color]"
+
+        self.game_info_label.text = f"[b]{self.white_name}[/b] vs [b]{self.black_name}[/b]\n{result_text}"
+
+        self.update_history_display()
 
         self.current_move_index = 0
         self.show_position()
@@ -1510,6 +1315,8 @@ class GameReplayScreen(ScreenBackgroundMixin, Screen):
 
         if board_array is not None:
             self.board.update_board(board_array)
+            turn = self.controller.get_replay_metadata().get('turn', 'white')
+            self.explorer_view.set_moves(self.controller.get_opening_moves(board_array, turn))
 
         # Zähle Züge ohne Startposition (board_number=0)
         total_moves = (len(self.boards) - 1) if hasattr(self, 'boards') else 0
@@ -1518,8 +1325,6 @@ class GameReplayScreen(ScreenBackgroundMixin, Screen):
         # Timer und Remis-Angebot aktualisieren
         self._update_timer_and_draw_offer()
 
-        self.update_history_display()
-
     def _update_timer_and_draw_offer(self):
         """Aktualisiert Timer und Remis-Angebot-Anzeige aus den Board-Daten."""
         if not hasattr(self, 'boards') or not self.boards:
@@ -1528,73 +1333,53 @@ class GameReplayScreen(ScreenBackgroundMixin, Screen):
         if self.current_move_index < 0 or self.current_move_index >= len(self.boards):
             return
 
-        # Hole das aktuelle Board
-        board_data = self.boards[self.current_move_index]
-        board_json = board_data.get('board_JSON', '')
-
-        if not board_json:
+        # Metadaten der aktuellen Position (bereits vom Replay-Navigator dekodiert)
+        metadata = self.controller.get_replay_metadata()
+        if not metadata:
             return
 
-        try:
-            import json
-            board_array = json.loads(board_json)
-
-            # Das letzte Element enthält Metadaten (turn, white_time, black_time, draw_offers)
-            if board_array and isinstance(board_array[-1], dict):
-                metadata = board_array[-1]
-
-                # Timer aktualisieren
-                white_time = metadata.get('white_time')
-                black_time = metadata.get('black_time')
-
-                if self.game_data:
-                    white_player = self.controller.get_player_by_id(self.game_data["white_player_id"])
-                    black_player = self.controller.get_player_by_id(self.game_data["black_player_id"])
-                    white_name = white_player.get('username', 'Weiß')
-                    black_name = black_player.get('username', 'Schwarz')
-                else:
-                    white_name = "Weiß"
-                    black_name = "Schwarz"
-
-                if white_time is not None:
-                    white_minutes = int(white_time) // 60
-                    white_seconds = int(white_time) % 60
-                    self.white_timer_label.text = f"{white_name}: {white_minutes:02d}:{white_seconds:02d}"
-                else:
-                    self.white_timer_label.text = f"{white_name}: --:--"
-
-                if black_time is not None:
-                    black_minutes = int(black_time) // 60
-                    black_seconds = int(black_time) % 60
-                    self.black_timer_label.text = f"{black_name}: {black_minutes:02d}:{black_seconds:02d}"
-                else:
-                    self.black_timer_label.text = f"{black_name}: --:--"
-
-                # Remis-Angebot aktualisieren
-                draw_offers = metadata.get('draw_offers', {})
-                
-                # Wenn Spiel Remis (vereinbart) ist und wir am letzten Board, setze beide auf True
-                if self.game_data and self.game_data.get('result') == 'draw' and self.game_data.get('final_position') == 'Remis' and self.current_move_index == len(self.boards) - 1:
-                    draw_offers = {"white": True, "black": True}
-                
-                if draw_offers and (draw_offers.get('white') or draw_offers.get('black')):
-                    # Zeige Remis-Angebot an
-                    if draw_offers.get('white') and draw_offers.get('black'):
-                        self.draw_offer_label.text = "Remis wurde akzeptiert"
-                    elif draw_offers.get('white'):
-                        self.draw_offer_label.text = "Weiß hat Remis angeboten"
-                    elif draw_offers.get('black'):
-                        self.draw_offer_label.text = "Schwarz hat Remis angeboten"
-                    # Setze Hintergrund auf sichtbar (gelb)
-                    self.draw_offer_color.a = 1
-                else:
-                    # Kein Remis-Angebot - verstecke Box
-                    self.draw_offer_label.text = ""
-                    self.draw_offer_color.a = 0
-
-        except (json.JSONDecodeError, KeyError, IndexError) as e:
-            # Falls Fehler beim Parsen: Ignorieren
-            pass
+        # Timer aktualisieren
+        white_time = metadata.get('white_time')
+        black_time = metadata.get('black_time')
+
+        white_name = self.white_name
+        black_name = self.black_name
+
+        if white_time is not None:
+            white_minutes = int(white_time) // 60
+            white_seconds = int(white_time) % 60
+            self.white_timer_label.text = f"{white_name}: {white_minutes:02d}:{white_seconds:02d}"
+        else:
+            self.white_timer_label.text = f"{white_name}: --:--"
+
+        if black_time is not None:
+            black_minutes = int(black_time) // 60
+            black_seconds = int(black_time) % 60
+            self.black_timer_label.text = f"{black_name}: {black_minutes:02d}:{black_seconds:02d}"
+        else:
+            self.black_timer_label.text = f"{black_name}: --:--"
+
+        # Remis-Angebot aktualisieren
+        draw_offers = metadata.get('draw_offers', {})
+        
+        # Wenn Spiel Remis (vereinbart) ist und wir am letzten Board, setze beide auf True
+        if self.game_data and self.game_data.get('result') == 'draw' and self.game_data.get('final_position') == 'Remis' and self.current_move_index == len(self.boards) - 1:
+            draw_offers = {"white": True, "black": True}
+        
+        if draw_offers and (draw_offers.get('white') or draw_offers.get('black')):
+            # Zeige Remis-Angebot an
+            if draw_offers.get('white') and draw_offers.get('black'):
+                self.draw_offer_label.text = "Remis wurde akzeptiert"
+            elif draw_offers.get('white'):
+                self.draw_offer_label.text = "Weiß hat Remis angeboten"
+            elif draw_offers.get('black'):
+                self.draw_offer_label.text = "Schwarz hat Remis angeboten"
+            # Setze Hintergrund auf sichtbar (gelb)
+            self.draw_offer_color.a = 1
+        else:
+            # Kein Remis-Angebot - verstecke Box
+            self.draw_offer_label.text = ""
+            self.draw_offer_color.a = 0
 
     def update_history_display(self):
         # Extrahiere Notationen aus den Board-Daten (ohne Startposition)
@@ -1603,8 +1388,7 @@ class GameReplayScreen(ScreenBackgroundMixin, Screen):
             move_notations = [board['notation'] for board in self.boards if board['notation'] != "Startposition"]
         else:
             move_notations = []
-        # Verwende gemeinsame Hilfsfunktion
-        create_move_history_display(self.history_container, move_notations)
+        self.history_view.set_moves(move_notations)
 
     def go_to_first(self, instance):
         self.current_move_index = 0
@@ -1668,6 +1452,10 @@ class GameReplayScreen(ScreenBackgroundMixin, Screen):
         self.history_bg.pos = instance.pos
         self.history_bg.size = instance.size
 
+    def _update_explorer_bg(self, instance, value):
+        self.explorer_bg.pos = instance.pos
+        self.explorer_bg.size = instance.size
+
 
 class PauseMenuScreen(ScreenBackgroundMixin, PanelMixin, Screen):
     """Pause-Menü mit Resume, Restart, Main Menu."""
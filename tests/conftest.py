@@ -0,0 +1,20 @@
+"""Gemeinsame Fixtures der Unit Tests."""
+
+import os
+import tempfile
+
+import pytest
+from chess_project.database import DatabaseManager
+
+
+@pytest.fixture
+def temp_db():
+    """Erstellt eine temporäre Test-Datenbank (samt WAL-Dateien wieder entfernt)."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    db = DatabaseManager(path)
+    yield db
+    db.close()
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
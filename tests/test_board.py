@@ -3,6 +3,7 @@
 import pytest
 import numpy as np
 from chess_project.board import Board
+from chess_project.move import Move
 from chess_project.pieces import King, Queen, Rook, Bishop, Knight, Pawn
 
 
@@ -196,3 +197,75 @@ class TestBoard:
         
         # Feld weit weg wird nicht angegriffen
         assert not board.is_square_attacked_by((5, 4), 'black')
+
+
+def _shuffle_knights(board, times):
+    """Zieht beide Springer der g-Linie times-mal hin und zurück."""
+    for _ in range(times):
+        for from_pos, to_pos in (((7, 6), (5, 5)), ((0, 6), (2, 5)), ((5, 5), (7, 6)), ((2, 5), (0, 6))):
+            board.make_move(Move(from_pos, to_pos, board.squares[from_pos]))
+
+
+class TestDrawDetection:
+    """Test-Suite für Stellungswiederholung, 50-Züge-Regel und Material."""
+
+    def test_threefold_repetition(self):
+        """Test: Die Startstellung steht nach zwei Springer-Runden zum dritten Mal auf dem Brett."""
+        board = Board()
+        board.setup_startpos()
+
+        _shuffle_knights(board, 1)
+        assert board.repetition_count() == 2
+        assert not board.is_threefold_repetition()
+
+        _shuffle_knights(board, 1)
+        assert board.is_threefold_repetition()
+        assert len(board.position_history) == 9
+
+    def test_irreversible_move_limits_scan(self):
+        """Test: Stellungen vor einem Bauernzug zählen nicht mit."""
+        board = Board()
+        board.setup_startpos()
+        _shuffle_knights(board, 2)
+        board.make_move(Move((6, 4), (4, 4), board.squares[6, 4]))
+
+        assert board.halfmove_clock == 0
+        assert board.repetition_count() == 1
+
+    def test_castling_rights_in_key(self):
+        """Test: Gleiche Figurenstellung mit anderen Rochaderechten ist keine Wiederholung."""
+        with_rights = Board.from_fen('r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1')
+        without = Board.from_fen('r3k2r/8/8/8/8/8/8/R3K2R w - - 0 1')
+
+        assert with_rights.position_key() != without.position_key()
+
+    def test_en_passant_only_if_capturable(self):
+        """Test: Ein En-passant-Feld zählt nur, wenn ein Bauer schlagen kann."""
+        plain = 'rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq {} 0 1'
+        assert Board.from_fen(plain.format('e3')).position_key() == Board.from_fen(plain.format('-')).position_key()
+
+        capturable = 'rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b KQkq {} 0 1'
+        assert (Board.from_fen(capturable.format('e3')).position_key()
+                != Board.from_fen(capturable.format('-')).position_key())
+
+    def test_fifty_move_rule(self):
+        """Test: Nach 100 Halbzügen ohne Bauernzug oder Schlag greift die 50-Züge-Regel."""
+        board = Board.from_fen('4k3/8/8/8/8/8/4P3/4K1N1 w - - 99 80')
+        assert not board.is_fifty_move_rule()
+
+        board.make_move(Move((7, 6), (5, 5), board.squares[7, 6]))
+
+        assert board.is_fifty_move_rule()
+
+    @pytest.mark.parametrize('fen, insufficient', [
+        ('4k3/8/8/8/8/8/8/4K3 w - - 0 1', True),
+        ('4k3/8/8/8/8/8/8/4KN2 w - - 0 1', True),
+        ('4kb2/8/8/8/8/8/8/2B1K3 w - - 0 1', True),
+        ('4k1b1/8/8/8/8/8/8/2B1K3 w - - 0 1', False),
+        ('4k3/8/8/8/8/8/8/3NKN2 w - - 0 1', False),
+        ('4k3/8/8/8/8/8/4P3/4K3 w - - 0 1', False),
+        ('4k3/8/8/8/8/8/8/4KR2 w - - 0 1', False),
+    ])
+    def test_insufficient_material(self, fen, insufficient):
+        """Test: Erkennung von Stellungen, in denen kein Matt mehr möglich ist."""
+        assert Board.from_fen(fen).has_insufficient_material() == insufficient
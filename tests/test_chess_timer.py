@@ -0,0 +1,224 @@
+"""Unit Tests für ChessTimer."""
+
+import asyncio
+import sys
+
+import pytest
+from chess_project.chess_timer import ChessTimer
+from chess_project.clock_sources import AsyncioClockSource, ClockSource, ManualClock
+from chess_project.time_control import TimeControl
+
+
+@pytest.fixture
+def clock():
+    return ManualClock(start=1000.0)
+
+
+@pytest.fixture
+def timer(clock):
+    timer = ChessTimer(5, clock=clock)
+    yield timer
+    timer.stop()
+
+
+class TestChessTimer:
+    """Test-Suite für ChessTimer."""
+
+    def test_initial_time(self, timer):
+        """Test: Beide Spieler starten mit der vollen Zeit."""
+        assert timer.white_time == 300
+        assert timer.black_time == 300
+
+    def test_switch_charges_exact_milliseconds(self, timer, clock):
+        """Test: Beim Zugwechsel wird die Zeit millisekundengenau abgerechnet."""
+        timer.start()
+        clock.advance(2.345)
+        timer.switch_player()
+
+        assert timer.get_time_ms('white') == 300000 - 2345
+        assert timer.current_player == 'black'
+
+        clock.advance(0.5)
+        assert timer.get_time_ms('black') == 299500
+        assert timer.get_time_ms('white') == 297655
+
+    def test_no_drift_from_ticks(self, timer, clock):
+        """Test: Verzögerte Ticks verfälschen die Zeit nicht."""
+        timer.start()
+        for _ in range(10):
+            clock.advance(0.37)
+            timer._tick(5.0)  # dt wird ignoriert
+
+        assert timer.get_time_ms('white') == 300000 - 3700
+
+    def test_pause_stops_clock(self, timer, clock):
+        """Test: Während der Pause läuft keine Zeit ab."""
+        timer.start()
+        clock.advance(1.25)
+        timer.pause()
+        clock.advance(60)
+        timer.resume()
+        clock.advance(0.75)
+
+        assert timer.get_time_ms('white') == 298000
+
+    def test_time_up_on_tick(self, clock):
+        """Test: Zeitablauf wird beim nächsten Tick gemeldet."""
+        flagged = []
+        timer = ChessTimer(1, on_time_up_callback=flagged.append, clock=clock)
+        timer.start()
+        clock.advance(60.05)
+
+        assert flagged == ['white']
+        assert timer.white_time == 0
+        assert not timer.is_running
+
+    def test_time_up_on_late_move(self, clock):
+        """Test: Ein Zug nach Ablauf der Zeit wird nicht mehr gewertet."""
+        flagged = []
+        timer = ChessTimer(1, on_time_up_callback=flagged.append, clock=clock)
+        timer.start()
+        clock.advance(61)
+        timer.switch_player()
+
+        assert flagged == ['white']
+        assert timer.current_player == 'white'
+
+    def test_stopwatch_counts_up(self, clock):
+        """Test: Im Stoppuhr-Modus wird die verbrauchte Zeit hochgezählt."""
+        timer = ChessTimer(0, stopwatch_mode=True, clock=clock)
+        timer.start()
+        clock.advance(3.5)
+        timer.switch_player()
+        clock.advance(1.25)
+
+        assert timer.white_time == 3.5
+        assert timer.black_time == 1.25
+        timer.stop()
+
+
+class TestChessTimerTimeControls:
+    """Test-Suite für Inkrement, Delay und Perioden."""
+
+    def _play_move(self, timer, clock, seconds):
+        clock.advance(seconds)
+        timer.switch_player()
+
+    def test_fischer_increment(self, clock):
+        """Test: Inkrement wird nach dem Zug gutgeschrieben."""
+        timer = ChessTimer(time_control=TimeControl.parse('3+2'), clock=clock)
+        timer.start()
+        self._play_move(timer, clock, 5)
+
+        assert timer.get_time_ms('white') == 180000 - 5000 + 2000
+        timer.stop()
+
+    def test_simple_delay(self, clock):
+        """Test: Beim US-Delay läuft die Uhr erst nach der Verzögerung."""
+        timer = ChessTimer(time_control=TimeControl.parse('3d3'), clock=clock)
+        timer.start()
+        clock.advance(2)
+        assert timer.get_time_ms('white') == 180000
+        clock.advance(3)
+        assert timer.get_time_ms('white') == 178000
+        timer.switch_player()
+
+        assert timer.get_time_ms('white') == 178000
+        timer.stop()
+
+    def test_bronstein_delay(self, clock):
+        """Test: Beim Bronstein-Delay wird höchstens die Verzögerung erstattet."""
+        timer = ChessTimer(time_control=TimeControl.parse('3b3'), clock=clock)
+        timer.start()
+        self._play_move(timer, clock, 2)
+        assert timer.get_time_ms('white') == 180000
+
+        self._play_move(timer, clock, 1)
+        self._play_move(timer, clock, 5)
+        assert timer.get_time_ms('white') == 178000
+        timer.stop()
+
+    def test_delay_survives_pause(self, clock):
+        """Test: Der Delay gilt pro Zug, auch über eine Pause hinweg."""
+        timer = ChessTimer(time_control=TimeControl.parse('3d3'), clock=clock)
+        timer.start()
+        clock.advance(2)
+        timer.pause()
+        clock.advance(30)
+        timer.resume()
+        clock.advance(2)
+
+        assert timer.get_time_ms('white') == 179000
+        timer.stop()
+
+    def test_stage_bonus(self, clock):
+        """Test: Nach Ende der ersten Periode kommt die Zeit der zweiten hinzu."""
+        timer = ChessTimer(time_control=TimeControl.parse('2/10, 5'), clock=clock)
+        timer.start()
+        for _ in range(4):
+            self._play_move(timer, clock, 1)
+
+        assert timer.get_time_ms('white') == 600000 - 2000 + 300000
+        assert timer.moves_made == {'white': 2, 'black': 2}
+        timer.stop()
+
+
+class TestClockSources:
+    """Test-Suite für die Clock-Sources der Schachuhr."""
+
+    def test_manual_clock_fires_ticks(self):
+        """Test: ManualClock löst fällige Ticks beim Vorstellen aus."""
+        clock = ManualClock()
+        calls = []
+        event = clock.schedule_interval(calls.append, 0.5)
+        clock.advance(1.2)
+        assert calls == [0.5, 0.5]
+        assert clock.now() == pytest.approx(1.2)
+
+        event.cancel()
+        clock.advance(5)
+        assert len(calls) == 2
+
+    def test_manual_clock_updates_display(self, clock):
+        """Test: Anzeige-Updates kommen nur bei Sekundenwechsel."""
+        timer = ChessTimer(5, clock=clock)
+        updates = []
+        timer.on_timer_update = lambda white, black, player: updates.append(int(white))
+        timer.start()
+        clock.advance(3.05)
+
+        assert updates == [299, 298, 297]
+        timer.stop()
+
+    def test_incomplete_clock_source_rejected(self):
+        """Test: Eine Clock-Source ohne schedule_interval kann nicht erzeugt werden."""
+        class NowOnly(ClockSource):
+            pass
+
+        with pytest.raises(TypeError):
+            NowOnly()
+
+    def test_asyncio_clock(self):
+        """Test: Die Uhr läuft in einer asyncio-Eventloop ohne Kivy."""
+        flagged = []
+
+        async def play():
+            timer = ChessTimer(time_control=TimeControl.parse('0.005'), clock=AsyncioClockSource(),
+                               on_time_up_callback=flagged.append)
+            timer.start()
+            await asyncio.sleep(0.05)
+            timer.switch_player()
+            await asyncio.sleep(0.6)
+            return timer
+
+        timer = asyncio.run(play())
+        assert flagged == ['black']
+        assert 0 < timer.white_time < 0.3
+        assert not timer.is_running
+
+    def test_timer_module_without_kivy(self):
+        """Test: chess_timer und game_controller importieren Kivy nicht."""
+        import subprocess
+        code = ("import sys, chess_project.chess_timer, chess_project.game_controller; "
+                "sys.exit(any(m.startswith('kivy') for m in sys.modules))")
+        assert subprocess.run([sys.executable, '-c', code]).returncode == 0
@@ -0,0 +1,172 @@
+"""Unit Tests für den gemeinsamen Datenbankzugriff mehrerer Threads."""
+
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from chess_project.connection_pool import ConnectionPool
+from chess_project.database import DatabaseManager
+
+
+def _in_thread(function, *args):
+    """Führt function in einem eigenen Thread aus und gibt das Ergebnis zurück."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(function, *args).result(timeout=10)
+
+
+class TestConnectionPool:
+    """Test-Suite für Schreib- und Leseverbindungen."""
+
+    def test_wal_and_read_only_readers(self, temp_db):
+        """Test: Dateien laufen im WAL-Modus, Leseverbindungen lehnen Schreibzugriffe ab."""
+        pool = temp_db._pool
+        assert pool.writer.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+        def write_while_reading():
+            with pool.reading() as conn:
+                assert conn is not pool.writer
+                conn.execute("INSERT INTO players (username) VALUES ('X')")
+
+        with pytest.raises(sqlite3.OperationalError):
+            _in_thread(write_while_reading)
+
+    def test_in_memory_shares_writer(self):
+        """Test: In-Memory-Datenbanken lesen über die Schreibverbindung."""
+        pool = ConnectionPool(':memory:')
+        try:
+            def reads_writer():
+                with pool.reading() as conn:
+                    return conn is pool.writer
+
+            assert reads_writer()
+            assert _in_thread(reads_writer)
+        finally:
+            pool.close()
+
+    def test_nested_writing_releases_after_commit(self):
+        """Test: Eine offene Transaktion hält die Schreibverbindung bis zum commit()."""
+        pool = ConnectionPool(':memory:')
+        try:
+            with pool.writing() as conn:
+                with pool.writing():
+                    conn.execute('CREATE TABLE t (x INTEGER)')
+            with pool.writing() as conn:
+                conn.execute('INSERT INTO t VALUES (1)')
+            assert not pool._lock.acquire(blocking=False)
+
+            pool.commit()
+
+            assert pool._lock.acquire(blocking=False)
+            pool._lock.release()
+        finally:
+            pool.close()
+
+
+class TestConcurrentDatabase:
+    """Test-Suite für den DatabaseManager aus mehreren Threads."""
+
+    def test_readers_see_only_committed_data(self, temp_db):
+        """Test: Andere Threads lesen während eines Imports den letzten committeten Stand."""
+        temp_db.ensure_players(['Alice'])
+        # Die Bulk-Methoden committen nicht, die Transaktion bleibt offen
+        assert temp_db.get_player_by_username('Alice') is not None
+
+        assert _in_thread(temp_db.get_player_by_username, 'Alice') is None
+        assert _in_thread(temp_db.get_leaderboard) == []
+
+        temp_db.commit()
+
+        assert _in_thread(temp_db.get_player_by_username, 'Alice')['username'] == 'Alice'
+        assert [row['username'] for row in _in_thread(temp_db.get_leaderboard)] == ['Alice']
+
+    def test_writer_waits_for_open_transaction(self, temp_db):
+        """Test: Ein zweiter Schreiber wartet, bis die offene Transaktion abgeschlossen ist."""
+        temp_db.ensure_players(['Alice'])
+        created = threading.Event()
+
+        def create():
+            player_id = temp_db.create_player('Bob')
+            created.set()
+            return player_id
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(create)
+            assert not created.wait(0.2)
+            temp_db.commit()
+            assert future.result(timeout=10) is not None
+
+        assert {p['username'] for p in temp_db.get_all_players()} == {'Alice', 'Bob'}
+
+    def test_concurrent_games(self, temp_db):
+        """Test: Mehrere Threads spielen gleichzeitig Partien, Statistiken bleiben konsistent."""
+        ids = [temp_db.create_player(f'P{index}') for index in range(8)]
+
+        def play(index):
+            white, black = ids[index % 8], ids[(index + 1) % 8]
+            game_id = temp_db.create_game(white, black, 'untimed')
+            temp_db.add_board(game_id, 1, '{}', 'Startposition', '00:00', '00:00')
+            temp_db.finish_game(game_id, 'white_win', 'checkmate')
+            return temp_db.get_leaderboard(3)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(play, range(40)))
+
+        players = temp_db.get_all_players()
+        assert sum(p['games_played'] for p in players) == 80
+        assert sum(p['games_won'] for p in players) == 40
+        assert len(temp_db.list_games(limit=100)) == 40
+        assert temp_db.get_leaderboard(3) == _in_thread(temp_db.get_leaderboard, 3)
+
+    def test_own_commits_keep_caches(self, temp_db):
+        """Test: Eigene Züge (add_board) verwerfen die Rangliste in keinem Thread, fremde Commits schon."""
+        alice = temp_db.create_player('Alice')
+        game_id = temp_db.create_game(alice, alice, 'untimed')
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leaderboard = temp_db.get_leaderboard()
+            assert executor.submit(temp_db.get_leaderboard).result(timeout=10) == leaderboard
+            generation = temp_db._cache_generation
+
+            temp_db.add_board(game_id, 1, '{}', 'Startposition', '00:00', '00:00')
+
+            assert temp_db.get_leaderboard() == leaderboard
+            assert executor.submit(temp_db.get_leaderboard).result(timeout=10) == leaderboard
+            assert temp_db._cache_generation == generation
+
+            other = DatabaseManager(temp_db.db_path)
+            try:
+                other.update_player_stats(alice, 3, won=True)
+            finally:
+                other.close()
+
+            assert executor.submit(temp_db.get_leaderboard).result(timeout=10)[0]['points'] == 3
+            assert temp_db._cache_generation != generation
+
+    def test_failed_create_player_releases_writer(self, temp_db):
+        """Test: Ein doppelter Username hält die Schreibverbindung nicht fest."""
+        temp_db.create_player('Alice')
+
+        assert temp_db.create_player('Alice') is None
+        assert _in_thread(temp_db.create_player, 'Bob') is not None
+
+    def test_failed_write_releases_writer(self, temp_db):
+        """Test: Eine fehlgeschlagene Schreibmethode verwirft ihre Transaktion und gibt die Verbindung frei."""
+        player_id = temp_db.create_player('Alice')
+
+        with pytest.raises(sqlite3.IntegrityError):
+            temp_db.create_game(None, player_id, 'untimed')
+
+        assert not temp_db._pool.writer.in_transaction
+        assert _in_thread(temp_db.create_player, 'Bob') is not None
+
+    def test_failure_keeps_outer_transaction(self, temp_db):
+        """Test: Schlägt ein Aufruf innerhalb einer offenen Transaktion fehl, verwirft der Aufrufer sie."""
+        temp_db.ensure_players(['Alice'])
+
+        with pytest.raises(sqlite3.IntegrityError):
+            temp_db.create_game(None, 1, 'untimed')
+
+        assert temp_db._pool.writer.in_transaction
+        temp_db.rollback()
+        assert _in_thread(temp_db.get_player_by_username, 'Alice') is None
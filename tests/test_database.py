@@ -3,6 +3,7 @@
 import pytest
 import os
 import tempfile
+import sqlite3
 from chess_project.database import DatabaseManager
 
 
@@ -196,6 +197,97 @@ class TestDatabaseManager:
         assert leaderboard[1]['username'] == "Player1"  # 10 Punkte
         assert leaderboard[2]['username'] == "Player2"  # 5 Punkte
     
+    def test_leaderboard_uses_index(self, temp_db):
+        """Test: Die Rangliste wird aus dem Index gelesen, ohne die Tabelle zu sortieren."""
+        plan = ' '.join(row['detail'] for row in temp_db.conn.execute(
+            'EXPLAIN QUERY PLAN SELECT * FROM players ORDER BY points DESC, games_won DESC LIMIT 10'
+        ))
+        
+        assert 'idx_players_leaderboard' in plan
+        assert 'TEMP B-TREE' not in plan
+    
+    def test_leaderboard_cache_invalidation(self, temp_db):
+        """Test: Die zwischengespeicherte Rangliste folgt eigenen und fremden Änderungen."""
+        alice = temp_db.create_player("Alice")
+        bob = temp_db.create_player("Bob")
+        temp_db.update_player_stats(alice, 3, won=True)
+        assert temp_db.get_leaderboard(1)[0]['username'] == "Alice"
+        
+        # Eigene Änderung
+        game_id = temp_db.create_game(alice, bob, 'untimed')
+        temp_db.finish_game(game_id, 'black_win', 'checkmate')
+        temp_db.finish_game(temp_db.create_game(alice, bob, 'untimed'), 'black_win', 'checkmate')
+        assert temp_db.get_leaderboard(1)[0]['username'] == "Bob"
+        
+        # Änderung über eine zweite Verbindung
+        other = DatabaseManager(temp_db.db_path)
+        try:
+            other.update_player_stats(alice, 10, won=True)
+        finally:
+            other.close()
+        assert temp_db.get_leaderboard(1)[0]['username'] == "Alice"
+    
+    def test_player_results_grouped(self, temp_db):
+        """Test: Ergebnisse eines Spielers nach Farbe, Bedenkzeit, Gegner und Spielende."""
+        alice = temp_db.create_player("Alice")
+        bob = temp_db.create_player("Bob")
+        carol = temp_db.create_player("Carol")
+        temp_db.finish_game(temp_db.create_game(alice, bob, 'timed', 5, '5+3'), 'white_win', 'checkmate')
+        temp_db.finish_game(temp_db.create_game(bob, alice, 'untimed'), 'white_win', 'timeover')
+        temp_db.finish_game(temp_db.create_game(carol, alice, 'untimed'), 'draw', 'Patt')
+        temp_db.create_game(alice, carol, 'untimed')  # nicht beendet
+        
+        assert temp_db.get_player_results(alice, 'by_color') == [
+            {'color': 'black', 'games': 2, 'wins': 0, 'draws': 1, 'losses': 1},
+            {'color': 'white', 'games': 1, 'wins': 1, 'draws': 0, 'losses': 0},
+        ]
+        assert [(r['time_control'], r['games']) for r in temp_db.get_player_results(alice, 'by_time_control')] == [
+            (None, 2), ('5+3', 1)]
+        assert [(r['opponent'], r['wins'], r['losses']) for r in temp_db.get_player_results(alice, 'by_opponent')] == [
+            ('Bob', 1, 1), ('Carol', 0, 0)]
+        assert [r['final_position'] for r in temp_db.get_player_results(alice, 'by_termination')] == [
+            'Patt', 'checkmate', 'timeover']
+        assert len(temp_db.get_player_results(alice, 'by_month')) == 1
+        with pytest.raises(ValueError):
+            temp_db.get_player_results(alice, 'by_weekday')
+    
+    def test_player_analytics_cache(self, temp_db):
+        """Test: Auswertungen werden zwischengespeichert und bei neuen Ergebnissen verworfen."""
+        alice = temp_db.create_player("Alice")
+        bob = temp_db.create_player("Bob")
+        game_id = temp_db.create_game(alice, bob, 'untimed')
+        for number, notation in enumerate(('Startposition', 'e4', 'e5')):
+            temp_db.add_board(game_id, number, '{}', notation, '0', '0')
+        temp_db.finish_game(game_id, 'white_win', 'checkmate')
+        
+        analytics = temp_db.get_player_analytics(alice)
+        assert analytics['lengths']['games'] == 1
+        assert analytics['lengths']['average_plies'] == 2
+        analytics['by_color'].clear()  # Rückgabe ist eine Kopie
+        assert temp_db.get_player_analytics(alice)['by_color'][0]['wins'] == 1
+        
+        temp_db.finish_game(temp_db.create_game(bob, alice, 'untimed'), 'white_win', 'checkmate')
+        
+        assert [r['games'] for r in temp_db.get_player_analytics(alice)['by_color']] == [1, 1]
+        assert temp_db.get_player_analytics(alice)['lengths']['games'] == 2
+    
+    def test_finish_game_is_atomic(self, temp_db, monkeypatch):
+        """Test: Schlägt ein Teil von finish_game fehl, bleibt alles unverändert."""
+        white_id = temp_db.create_player("White")
+        black_id = temp_db.create_player("Black")
+        game_id = temp_db.create_game(white_id, black_id, 'untimed')
+        
+        def fail(rows):
+            raise sqlite3.OperationalError('disk I/O error')
+        monkeypatch.setattr(temp_db, 'add_opening_moves', fail)
+        
+        with pytest.raises(sqlite3.OperationalError):
+            temp_db.finish_game(game_id, 'white_win', 'checkmate')
+        
+        assert temp_db.get_game(game_id)['result'] is None
+        assert temp_db.get_player(white_id)['points'] == 0
+        assert temp_db.get_player(white_id)['games_played'] == 0
+    
     def test_get_all_games(self, temp_db):
         """Test: Alle Spiele werden abgerufen."""
         white_id = temp_db.create_player("White")
@@ -210,3 +302,136 @@ class TestDatabaseManager:
         game_ids = [g['id'] for g in games]
         assert game1_id in game_ids
         assert game2_id in game_ids
+    
+    def test_list_games_includes_player_names(self, temp_db):
+        """Test: Spielernamen werden per JOIN mitgeliefert."""
+        white_id = temp_db.create_player("Alice")
+        black_id = temp_db.create_player("Bob")
+        
+        temp_db.create_game(white_id, black_id, 'untimed')
+        temp_db.create_game(black_id, white_id, 'timed', 5)
+        
+        games = temp_db.list_games(limit=10)
+        names = {(g['white_username'], g['black_username']) for g in games}
+        assert names == {("Alice", "Bob"), ("Bob", "Alice")}
+        
+        # Filter nach Spieler liefert ebenfalls Namen
+        games = temp_db.list_games(player_id=white_id)
+        assert all(g['white_username'] and g['black_username'] for g in games)
+    
+    def test_list_games_page_keyset(self, temp_db):
+        """Test: Keyset-Pagination liefert alle Spiele genau einmal."""
+        white_id = temp_db.create_player("White")
+        black_id = temp_db.create_player("Black")
+        created = [temp_db.create_game(white_id, black_id, 'untimed') for _ in range(5)]
+        
+        seen = []
+        after = None
+        while True:
+            page = temp_db.list_games_page(after=after, limit=2)
+            if not page:
+                break
+            seen.extend(g['id'] for g in page)
+            after = (page[-1]['start_time'], page[-1]['id'])
+        
+        assert seen == sorted(created, reverse=True)
+    
+    def test_list_games_page_filters(self, temp_db):
+        """Test: Filter nach Ergebnis, Spieltyp, Spieler und Datum."""
+        white_id = temp_db.create_player("White")
+        black_id = temp_db.create_player("Black")
+        other_id = temp_db.create_player("Other")
+        
+        timed = temp_db.create_game(white_id, black_id, 'timed', 5)
+        untimed = temp_db.create_game(white_id, black_id, 'untimed')
+        other = temp_db.create_game(other_id, black_id, 'untimed')
+        temp_db.finish_game(timed, 'white_win', 'checkmate')
+        
+        assert [g['id'] for g in temp_db.list_games_page(result='white_win')] == [timed]
+        assert [g['id'] for g in temp_db.list_games_page(game_type='timed')] == [timed]
+        assert {g['id'] for g in temp_db.list_games_page(player_id=other_id)} == {other}
+        assert {g['id'] for g in temp_db.list_games_page(player_id=white_id)} == {timed, untimed}
+        assert temp_db.list_games_page(date_from='2999-01-01') == []
+        assert len(temp_db.list_games_page(date_to='2999-01-01')) == 3
+    
+    def test_create_game_with_time_control(self, temp_db):
+        """Test: Bedenkzeit-Regelung wird mit dem Spiel gespeichert."""
+        white_id = temp_db.create_player("White")
+        black_id = temp_db.create_player("Black")
+        
+        game_id = temp_db.create_game(white_id, black_id, 'timed', 5, time_control='5+3')
+        
+        assert temp_db.get_game(game_id)['time_control'] == '5+3'
+        assert temp_db.list_games_page()[0]['time_control'] == '5+3'
+    
+    def test_migrates_games_without_time_control(self):
+        """Test: Ältere Datenbanken erhalten die Spalte time_control."""
+        import sqlite3
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        try:
+            conn = sqlite3.connect(path)
+            conn.execute('''
+                CREATE TABLE games (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    white_player_id INTEGER NOT NULL,
+                    black_player_id INTEGER NOT NULL,
+                    game_type TEXT NOT NULL,
+                    time_per_player INTEGER,
+                    start_time TEXT NOT NULL,
+                    end_time TEXT,
+                    result TEXT,
+                    final_position TEXT
+                )
+            ''')
+            conn.commit()
+            conn.close()
+            
+            db = DatabaseManager(path)
+            game_id = db.create_game(1, 2, 'timed', 3, time_control='3+2')
+            assert db.get_game(game_id)['time_control'] == '3+2'
+            db.close()
+        finally:
+            os.remove(path)
+    
+    def test_find_games_by_position(self, temp_db):
+        """Test: Spiele werden über den Positionsindex gefunden (Hash oder FEN)."""
+        from chess_project.board import Board
+        from chess_project.board_serialization import serialize_board
+        from chess_project.position_hash import hash_fen
+        
+        white_id = temp_db.create_player("White")
+        black_id = temp_db.create_player("Black")
+        after_e4 = 'rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1'
+        games = []
+        for fens in (['startpos', after_e4], ['startpos']):
+            game_id = temp_db.create_game(white_id, black_id, 'untimed')
+            games.append(game_id)
+            for number, fen in enumerate(fens):
+                board = Board.from_fen() if fen == 'startpos' else Board.from_fen(fen)
+                temp_db.add_board(game_id, number, serialize_board(board.squares, board.turn),
+                                  'e4' if number else 'Startposition', '0', '0')
+        
+        found = temp_db.find_games_by_position(after_e4)
+        assert [(g['id'], g['ply'], g['white_username']) for g in found] == [(games[0], 1, 'White')]
+        assert {g['id'] for g in temp_db.find_games_by_position(hash_fen(Board.from_fen().to_fen()))} == set(games)
+        assert temp_db.find_games_by_position(after_e4.replace(' b ', ' w ')) == []
+    
+    def test_backfill_positions(self, temp_db):
+        """Test: Der Positionsindex wird für ältere Spiele nachgetragen."""
+        from chess_project.board import Board
+        from chess_project.board_serialization import serialize_board
+        
+        white_id = temp_db.create_player("White")
+        game_id = temp_db.create_game(white_id, white_id, 'untimed')
+        board = Board.from_fen()
+        temp_db.add_board(game_id, 0, serialize_board(board.squares, 'white'), 'Startposition', '0', '0')
+        temp_db.conn.execute('DELETE FROM positions')
+        temp_db.conn.commit()
+        assert temp_db.find_games_by_position(board.to_fen()) == []
+        
+        progress = []
+        assert temp_db.backfill_positions(progress=progress.append) == 1
+        assert progress == [1]
+        assert [g['id'] for g in temp_db.find_games_by_position(board.to_fen())] == [game_id]
+        assert temp_db.backfill_positions() == 0
@@ -0,0 +1,137 @@
+"""Unit Tests für FEN- und EPD-Unterstützung."""
+
+import pytest
+from chess_project.board import Board
+from chess_project.chess_logic import ChessLogic
+from chess_project.fen import START_FEN, parse_epd, parse_fen, parse_square, read_epd, square_name
+from chess_project.move import Move
+
+
+KIWIPETE = 'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1'
+
+
+class TestFen:
+    """Test-Suite für Board.from_fen/to_fen."""
+
+    def test_start_position(self):
+        """Test: Die Start-FEN entspricht setup_startpos."""
+        board = Board.from_fen(START_FEN)
+        reference = Board()
+        reference.setup_startpos()
+
+        for row in range(8):
+            for col in range(8):
+                piece, expected = board.squares[row, col], reference.squares[row, col]
+                assert (piece and (piece.color, piece.notation)) == (expected and (expected.color, expected.notation))
+        assert len(board.white_pieces) == len(board.black_pieces) == 16
+        assert reference.to_fen() == START_FEN
+
+    @pytest.mark.parametrize('fen', [
+        START_FEN,
+        KIWIPETE,
+        '8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1',
+        'rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8',
+        'rnbqkbnr/ppp1pppp/8/3pP3/8/8/PPPP1PPP/RNBQKBNR w Kq d6 0 3',
+    ])
+    def test_roundtrip(self, fen):
+        """Test: from_fen und to_fen sind zueinander invers."""
+        assert Board.from_fen(fen).to_fen() == fen
+
+    def test_castling_rights_map_to_moved_flags(self):
+        """Test: Rochaderechte setzen die moved-Flags von König und Türmen."""
+        board = Board.from_fen('r3k2r/8/8/8/8/8/8/R3K2R w Kq - 0 1')
+
+        assert not board.white_king.moved
+        assert not board.squares[7, 7].moved
+        assert board.squares[7, 0].moved
+        assert not board.black_king.moved
+        assert not board.squares[0, 0].moved
+        assert board.squares[0, 7].moved
+
+        castles = ChessLogic(board).castle(board.white_king)
+        assert [move.to_pos for move in castles] == [(7, 6)]
+
+    def test_pawn_moved_flags(self):
+        """Test: Nur Bauern auf ihrer Grundreihe dürfen einen Doppelschritt ziehen."""
+        board = Board.from_fen('4k3/8/8/8/8/4P3/3P4/4K3 w - - 0 1')
+
+        assert not board.squares[6, 3].moved
+        assert board.squares[5, 4].moved
+
+    def test_en_passant_square(self):
+        """Test: Das En-passant-Feld erlaubt den Schlag über den rekonstruierten Zug."""
+        board = Board.from_fen('rnbqkbnr/ppp1pppp/8/3pP3/8/8/PPPP1PPP/RNBQKBNR w KQkq d6 0 3')
+        last_move = board.en_passant_move()
+
+        assert board.en_passant_square == (2, 3)
+        assert last_move.from_pos == (1, 3) and last_move.to_pos == (3, 3)
+
+        moves = ChessLogic(board).all_legal_moves(last_move, 'white')
+        assert any(move.en_passant and move.to_pos == (2, 3) for move in moves)
+
+    def test_make_move_updates_state(self):
+        """Test: make_move schreibt Spieler am Zug, En-passant-Feld und Zähler fort."""
+        board = Board.from_fen(START_FEN)
+        board.make_move(Move((6, 4), (4, 4), board.squares[6, 4]))
+        assert board.to_fen() == 'rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1'
+
+        board.make_move(Move((0, 6), (2, 5), board.squares[0, 6]))
+        assert board.to_fen() == 'rnbqkb1r/pppppppp/5n2/8/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 1 2'
+
+        board.make_move(Move((7, 4), (6, 4), board.squares[7, 4]))
+        assert board.castling_rights() == 'kq'
+
+    def test_castling_move_is_one_ply(self):
+        """Test: Bei der Rochade zählt der Turmzug nicht als eigener Halbzug."""
+        board = Board.from_fen('r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1')
+        king = board.white_king
+        board.make_move(Move((7, 4), (7, 6), king, castelling=board.squares[7, 7]))
+
+        assert board.to_fen() == 'r3k2r/8/8/8/8/8/8/R4RK1 b kq - 1 1'
+
+    @pytest.mark.parametrize('fen', [
+        '',
+        'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w KQkq - 0 1',
+        'rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1',
+        'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x KQkq - 0 1',
+        'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkx - 0 1',
+        'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq e9 0 1',
+        'rnbq1bnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQ - 0 1',
+    ])
+    def test_invalid_fen(self, fen):
+        """Test: Ungültige FEN-Strings werfen einen ValueError."""
+        with pytest.raises(ValueError):
+            Board.from_fen(fen)
+
+    def test_squares(self):
+        """Test: Feldnamen und Koordinaten werden ineinander umgerechnet."""
+        assert parse_square('e2') == (6, 4)
+        assert square_name((0, 0)) == 'a8'
+        assert parse_fen(KIWIPETE).castling == 'KQkq'
+
+
+class TestEpd:
+    """Test-Suite für den EPD-Parser."""
+
+    def test_classic_epd(self):
+        """Test: Operationen mit Strings und Zugzähler aus hmvc/fmvn."""
+        record = parse_epd('r3k2r/8/8/8/8/8/8/R3K2R w KQkq - bm O-O; id "castle; kurz"; hmvc 4; fmvn 12;')
+
+        assert record.fen == 'r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 4 12'
+        assert record.operations['bm'] == 'O-O'
+        assert record.id == 'castle; kurz'
+
+    def test_perft_suite_line(self):
+        """Test: Perft-Zeilen mit vollständigem FEN und Tiefenangaben."""
+        record = parse_epd(KIWIPETE + ' ;D1 48 ;D2 2039')
+
+        assert record.fen == KIWIPETE
+        assert record.operations == {'D1': '48', 'D2': '2039'}
+
+    def test_read_epd_skips_comments(self):
+        """Test: Leere Zeilen und Kommentare werden übersprungen."""
+        lines = ['# Testsammlung', '', START_FEN + ' ;D1 20', '8/8/8/8/8/8/8/K6k w - -']
+        records = list(read_epd(lines))
+
+        assert [r.fen for r in records] == [START_FEN, '8/8/8/8/8/8/8/K6k w - - 0 1']
+        assert Board.from_fen(records[1].fen).white_king.position == (7, 0)
@@ -0,0 +1,146 @@
+"""Unit Tests für den asyncio-Spielserver."""
+
+import asyncio
+import random
+import sqlite3
+
+import pytest
+from chess_project.game_server import AsyncDatabase, GameServer
+from chess_project.time_control import TimeControl
+
+
+async def _random_player(game, color, rng, max_plies):
+    """Simulierter Spieler: zieht zufällig, bietet nach max_plies Halbzügen Remis an bzw. nimmt es an."""
+    while await game.wait_for_turn(color):
+        await asyncio.sleep(0)  # Anderen Partien den Vortritt lassen
+        if game.session.draw_offer:
+            game.accept_draw()
+        else:
+            game.play_move(rng.choice(game.session.valid_moves))
+            if len(game.session.move_history) >= max_plies:
+                game.offer_draw()
+
+
+class TestAsyncDatabase:
+    """Test-Suite für die asynchrone Datenbank-Hülle."""
+
+    def test_methods_as_coroutines(self, temp_db):
+        """Test: Methoden des DatabaseManager laufen im Thread-Pool, Generatoren sind ausgenommen."""
+        async def run():
+            adb = AsyncDatabase(temp_db)
+            try:
+                player_id = await adb.create_player('Alice')
+                player = await adb.get_player(player_id)
+                with pytest.raises(AttributeError):
+                    adb.iter_games
+                with pytest.raises(AttributeError):
+                    adb._create_tables
+                return player
+            finally:
+                await adb.close()
+
+        assert asyncio.run(run())['username'] == 'Alice'
+
+
+class TestGameServer:
+    """Test-Suite für Partien im GameServer."""
+
+    def test_fools_mate_is_saved(self, temp_db):
+        """Test: Züge und Ergebnis werden über die Warteschlange gespeichert."""
+        async def run():
+            async with GameServer(temp_db) as server:
+                game = await server.create_game('Alice', 'Bob')
+                assert server.games == {game.key: game}
+                for san in ('f3', 'e5', 'g4', 'Qh4#'):
+                    game.play_san(san)
+                result = await game.wait_finished()
+                assert server.games == {}
+                return game.game_id, result
+
+        game_id, result = asyncio.run(run())
+
+        assert result == ('checkmate', 'black')
+        assert temp_db.get_game(game_id)['result'] == 'black_win'
+        assert [board['notation'] for board in temp_db.get_game_boards(game_id)] == [
+            'Startposition', 'f3', 'e5', 'g4', 'Qh4#']
+
+    def test_players_wait_for_turn(self):
+        """Test: wait_for_turn kehrt erst nach dem Zug des Gegners zurück, ohne Datenbank."""
+        async def run():
+            async with GameServer() as server:
+                game = await server.create_game('Alice', 'Bob')
+                waiter = asyncio.create_task(game.wait_for_turn('black'))
+                await asyncio.sleep(0)
+                assert not waiter.done()
+                game.play_san('e4')
+                assert await waiter
+                game.accept_draw()
+                assert not await game.wait_for_turn('white')
+                return await game.wait_finished()
+
+        assert asyncio.run(run()) == ('remis', None)
+
+    def test_time_control_flags_in_event_loop(self, temp_db):
+        """Test: Die Uhr läuft in der Eventloop und beendet die Partie bei Zeitablauf."""
+        async def run():
+            async with GameServer(temp_db) as server:
+                game = await server.create_game('Alice', 'Bob', TimeControl.parse('0.002'))
+                game.play_san('e4')
+                return game.game_id, await asyncio.wait_for(game.wait_finished(), timeout=5)
+
+        game_id, result = asyncio.run(run())
+
+        assert result == ('timeover', 'white')
+        assert temp_db.get_game(game_id)['final_position'] == 'timeover'
+
+    def test_failed_write_keeps_server_running(self, temp_db):
+        """Test: Schlägt das Speichern einer Partie fehl, speichern die anderen Partien weiter."""
+        async def run():
+            async with GameServer(temp_db) as server:
+                broken = await server.create_game('Alice', 'Bob')
+                game = await server.create_game('Carol', 'Dave')
+                with temp_db._pool.writing() as conn:
+                    conn.execute(f'''
+                        CREATE TRIGGER reject_boards BEFORE INSERT ON boards
+                        WHEN NEW.game_id = {broken.game_id}
+                        BEGIN SELECT RAISE(ABORT, 'kaputt'); END
+                    ''')
+                    conn.commit()
+
+                broken.play_san('e4')
+                with pytest.raises(sqlite3.IntegrityError):
+                    await broken.flush()
+                for san in ('f3', 'e5', 'g4', 'Qh4#'):
+                    game.play_san(san)
+                return game.game_id, await game.wait_finished()
+
+        game_id, result = asyncio.run(asyncio.wait_for(run(), timeout=10))
+
+        assert result == ('checkmate', 'black')
+        assert len(temp_db.get_game_boards(game_id)) == 5
+        assert temp_db.get_game(game_id)['result'] == 'black_win'
+
+    def test_many_concurrent_games(self, temp_db):
+        """Test: Simulierte Spieler spielen viele Partien gleichzeitig, alles wird gespeichert."""
+        names = [f'P{index}' for index in range(6)]
+        rng = random.Random(3)
+
+        async def run():
+            async with GameServer(temp_db) as server:
+                games = []
+                for index in range(12):
+                    game = await server.create_game(names[index % 6], names[(index + 1) % 6])
+                    games.append(game)
+                players = [_random_player(game, color, rng, 20) for game in games for color in ('white', 'black')]
+                await asyncio.gather(*players)
+                results = [await game.wait_finished() for game in games]
+                return games, results, await server.db.get_leaderboard(6)
+
+        games, results, leaderboard = asyncio.run(run())
+
+        assert all(result is not None for result in results)
+        assert sum(player['games_played'] for player in leaderboard) == 24
+        for game in games:
+            boards = temp_db.get_game_boards(game.game_id)
+            assert len(boards) == len(game.session.move_history) + 1
+            assert temp_db.get_game(game.game_id)['end_time'] is not None
@@ -0,0 +1,186 @@
+"""Unit Tests für GameSession (Spielablauf ohne UI)."""
+
+import copy
+
+import pytest
+from chess_project.clock_sources import ManualClock
+from chess_project.game_session import GameSession
+from chess_project.time_control import TimeControl
+
+
+# Narrenmatt: 1. f3 e5 2. g4 Dh4#
+FOOLS_MATE = [((6, 5), (5, 5)), ((1, 4), (3, 4)), ((6, 6), (4, 6)), ((0, 3), (4, 7))]
+
+
+def _session(**kwargs):
+    kwargs.setdefault('clock', ManualClock())
+    session = GameSession((1, 'Alice'), (2, 'Bob'), **kwargs)
+    session.start()
+    return session
+
+
+class TestGameSession:
+    """Test-Suite für GameSession."""
+
+    def test_start_position(self):
+        """Test: Weiß beginnt mit 20 legalen Zügen."""
+        session = _session()
+
+        assert session.current_turn == 'white'
+        assert len(session.valid_moves) == 20
+        assert session.timer.is_running
+        session.stop()
+
+    def test_play_moves_and_events(self):
+        """Test: Züge werden ausgeführt und per on_move gemeldet."""
+        session = _session()
+        played = []
+        session.on_move = played.append
+
+        move = session.play((6, 4), (4, 4))
+
+        assert played == [move]
+        assert session.current_turn == 'black'
+        assert session.board.squares[4, 4].notation == 'P'
+        session.stop()
+
+    def test_illegal_move_rejected(self):
+        """Test: Illegale Züge werfen einen ValueError."""
+        session = _session()
+
+        with pytest.raises(ValueError):
+            session.play((6, 4), (3, 4))
+        session.stop()
+
+    def test_checkmate_ends_game(self):
+        """Test: Matt beendet das Spiel und meldet den Gewinner."""
+        session = _session()
+        results = []
+        session.on_game_over = lambda result_type, winner: results.append((result_type, winner))
+
+        for from_pos, to_pos in FOOLS_MATE:
+            session.play(from_pos, to_pos)
+
+        assert results == [('checkmate', 'black')]
+        assert session.game_is_over
+        assert session.valid_moves == []
+        assert not session.timer.is_running
+        with pytest.raises(ValueError):
+            session.play((6, 0), (5, 0))
+
+    def test_timeover(self):
+        """Test: Zeitablauf über die virtuelle Uhr beendet das Spiel."""
+        clock = ManualClock()
+        session = _session(use_timer=True, time_control=TimeControl.parse('1'), clock=clock)
+        session.play((6, 4), (4, 4))
+        clock.advance(61)
+
+        assert session.result == ('timeover', 'white')
+
+    def test_move_after_timeover_is_rejected(self, temp_db):
+        """Test: Bemerkt erst der Zug den Zeitablauf, gewinnt der Gegner und der Zug zählt nicht."""
+        clock = ManualClock()
+        session = _session(db=temp_db, use_timer=True, time_control=TimeControl.parse('1'), clock=clock)
+        # Zeit vergeht, ohne dass ein Tick fällig wird (z.B. blockierte Eventloop)
+        clock._now += 61
+
+        session.play_san('e4')
+
+        assert session.result == ('timeover', 'black')
+        assert session.move_history == []
+        assert session.move_notations == []
+        assert temp_db.get_game(session.game_id)['result'] == 'black_win'
+        assert [board['notation'] for board in temp_db.get_game_boards(session.game_id)] == ['Startposition']
+
+    def test_draw_agreement(self):
+        """Test: Angenommenes Remis beendet das Spiel ohne Gewinner."""
+        session = _session()
+        session.offer_draw()
+        session.accept_draw()
+
+        assert session.result == ('remis', None)
+
+    def test_persists_game(self, temp_db):
+        """Test: Spiel, Züge und Ergebnis werden in der Datenbank gespeichert."""
+        session = _session(db=temp_db, use_timer=True, time_control=TimeControl.parse('3+2'))
+        for from_pos, to_pos in FOOLS_MATE:
+            session.play(from_pos, to_pos)
+
+        game = temp_db.get_game(session.game_id)
+        assert game['result'] == 'black_win'
+        assert game['final_position'] == 'checkmate'
+        assert game['time_control'] == '3+2'
+        boards = temp_db.get_game_boards(session.game_id)
+        assert [board['notation'] for board in boards] == ['Startposition', 'f3', 'e5', 'g4', 'Qh4#']
+
+    def test_san_notation_and_play_san(self):
+        """Test: Züge per SAN spielen, Notation mit Unterscheidung und Schach."""
+        session = _session(fen='3k4/8/8/8/8/5N2/8/1N3K1R w - - 0 1')
+
+        session.play_san('Nbd2')
+        session.play_san('Ke8')
+        move = session.play_san('Rh8+')
+
+        assert [session.notation(m) for m in session.move_history] == ['Nbd2', 'Ke8', 'Rh8+']
+        assert session.notation(move) == 'Rh8+'
+        assert session.notation(copy.copy(move)) == 'Rh8+'
+        assert session.move_notations == ['Nbd2', 'Ke8', 'Rh8+']
+        with pytest.raises(ValueError):
+            session.play_san('Kd8')
+        session.stop()
+
+    def test_start_from_fen(self):
+        """Test: Eine Partie kann aus einer FEN-Stellung mit Schwarz am Zug starten."""
+        session = _session(fen='rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1')
+
+        assert session.current_turn == 'black'
+        assert session.timer.current_player == 'black'
+        session.play((1, 4), (3, 4))
+        assert session.board.to_fen() == 'rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6 0 2'
+        session.stop()
+
+    def test_finished_start_position_keeps_clock_stopped(self):
+        """Test: Ist die Startstellung schon Patt, läuft die Uhr nicht an."""
+        clock = ManualClock()
+        session = _session(fen='7k/5Q2/6K1/8/8/8/8/8 b - - 0 1', use_timer=True,
+                           time_control=TimeControl.parse('1'), clock=clock)
+        clock.advance(5)
+
+        assert session.result == ('stalemate', None)
+        assert not session.timer.is_running
+        assert session.timer.black_time == 60
+
+    def test_threefold_repetition_ends_game(self, temp_db):
+        """Test: Dreifache Stellungswiederholung beendet das Spiel als Remis."""
+        session = _session(db=temp_db)
+        for _ in range(2):
+            for san in ('Nf3', 'Nf6', 'Ng1', 'Ng8'):
+                session.play_san(san)
+
+        assert session.result == ('repetition', None)
+        game = temp_db.get_game(session.game_id)
+        assert game['result'] == 'draw'
+        assert game['final_position'] == 'Stellungswiederholung'
+        with pytest.raises(ValueError):
+            session.play_san('Nf3')
+
+    def test_fifty_move_rule_ends_game(self):
+        """Test: Der hundertste Halbzug ohne Bauernzug oder Schlag beendet das Spiel."""
+        session = _session(fen='4k3/8/8/8/8/8/4P3/4K1N1 w - - 99 80')
+        session.play_san('Nf3')
+
+        assert session.result == ('fifty_moves', None)
+
+    def test_checkmate_beats_fifty_move_rule(self):
+        """Test: Ein Matt mit dem hundertsten Halbzug zählt als Matt."""
+        session = _session(fen='k7/8/1K6/8/8/8/8/7R w - - 99 80')
+        session.play_san('Rh8#')
+
+        assert session.result == ('checkmate', 'white')
+
+    def test_insufficient_material_ends_game(self):
+        """Test: Schlägt der König die letzte Figur, endet das Spiel als Remis."""
+        session = _session(fen='4k3/8/8/8/8/8/3q4/4K3 w - - 0 1')
+        session.play_san('Kxd2')
+
+        assert session.result == ('insufficient_material', None)
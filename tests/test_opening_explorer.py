@@ -0,0 +1,99 @@
+"""Unit Tests für den Eröffnungsbaum."""
+
+from chess_project.clock_sources import ManualClock
+from chess_project.fen import START_FEN
+from chess_project.game_session import GameSession
+from chess_project.opening_explorer import MAX_PLY, OpeningExplorer, merge_rows, opening_rows
+from chess_project.pgn import read_pgn
+from chess_project.pgn_import import PgnImporter
+
+
+PGN = """\
+[White "Alice"]
+[Black "Bob"]
+[Result "1-0"]
+
+1. e4 e5 2. Nf3 1-0
+
+[White "Bob"]
+[Black "Alice"]
+[Result "1/2-1/2"]
+
+1. e4 c5 1/2-1/2
+
+[White "Carol"]
+[Black "Alice"]
+[Result "0-1"]
+
+1. d4 d5 0-1
+
+[White "Carol"]
+[Black "Bob"]
+[Result "*"]
+
+1. d4 Nf6 *
+"""
+
+
+def _summary(moves):
+    return [(m.notation, m.games, m.white_wins, m.draws, m.black_wins) for m in moves]
+
+
+class TestOpeningRows:
+    """Test-Suite für das Erzeugen der Tabellenzeilen."""
+
+    def test_rows_per_ply(self):
+        """Test: Eine Zeile je Zug mit dem Ergebnis der Partie."""
+        rows = opening_rows([(1, 'Startposition'), (2, 'e4'), (3, 'e5')], 'black_win')
+
+        assert rows == [(1, 2, 'e4', 1, 0, 0, 1), (2, 3, 'e5', 1, 0, 0, 1)]
+
+    def test_unfinished_and_depth(self):
+        """Test: Offene Partien zählen nicht, Züge nach MAX_PLY werden abgeschnitten."""
+        plies = [(index, str(index)) for index in range(MAX_PLY + 10)]
+
+        assert opening_rows(plies, None) == []
+        assert len(opening_rows(plies, 'draw')) == MAX_PLY
+
+    def test_merge(self):
+        """Test: Gleiche Züge mehrerer Partien werden aufsummiert."""
+        rows = opening_rows([(1, ''), (2, 'e4')], 'white_win') + opening_rows([(1, ''), (2, 'e4')], 'draw')
+
+        assert merge_rows(rows) == [(1, 2, 'e4', 2, 1, 1, 0)]
+
+
+class TestOpeningExplorer:
+    """Test-Suite für Aktualisierung und Abfrage des Eröffnungsbaums."""
+
+    def test_import_and_query(self, temp_db):
+        """Test: Der PGN-Import füllt den Baum, Abfragen liefern die häufigsten Züge zuerst."""
+        PgnImporter(temp_db).import_games(read_pgn(PGN.splitlines(True)))
+        explorer = OpeningExplorer(temp_db)
+
+        assert _summary(explorer.moves_for_fen(START_FEN)) == [('e4', 2, 1, 1, 0), ('d4', 1, 0, 0, 1)]
+        assert _summary(explorer.moves_for_fen(START_FEN, limit=1)) == [('e4', 2, 1, 1, 0)]
+
+        after_e4 = explorer.moves_for_fen(START_FEN)[0].next_hash
+        assert _summary(explorer.moves(after_e4)) == [('c5', 1, 0, 1, 0), ('e5', 1, 1, 0, 0)]
+        assert explorer.moves(after_e4)[1].white_percent == 100.0
+
+    def test_finish_game_updates_incrementally(self, temp_db):
+        """Test: finish_game trägt das beendete Spiel in den Baum ein."""
+        session = GameSession((None, 'Alice'), (None, 'Bob'), db=temp_db, clock=ManualClock())
+        session.start()
+        session.play_san('e4')
+        explorer = OpeningExplorer(temp_db)
+        assert explorer.moves_for_fen(START_FEN) == []
+
+        session.accept_draw()
+
+        assert _summary(explorer.moves_for_fen(START_FEN)) == [('e4', 1, 0, 1, 0)]
+
+    def test_rebuild_matches_incremental(self, temp_db):
+        """Test: Der Neuaufbau ergibt denselben Baum wie die inkrementelle Aktualisierung."""
+        PgnImporter(temp_db).import_games(read_pgn(PGN.splitlines(True)))
+        query = 'SELECT * FROM opening_stats ORDER BY hash, next_hash'
+        incremental = [tuple(row) for row in temp_db.conn.execute(query)]
+
+        assert temp_db.rebuild_opening_stats() == len(incremental)
+        assert [tuple(row) for row in temp_db.conn.execute(query)] == incremental
@@ -0,0 +1,210 @@
+"""Unit Tests für PGN-Reader und PGN-Import."""
+
+import io
+import sqlite3
+
+import pytest
+from chess_project.database import UNKNOWN_START_TIME, DatabaseManager
+from chess_project.pgn import PgnGame, format_pgn, read_pgn
+from chess_project.pgn_export import export_games
+from chess_project.pgn_import import PgnImporter, main
+
+
+PGN = """\
+[Event "Test"]
+[Date "2024.03.01"]
+[Time "18:30:00"]
+[White "Alice"]
+[Black "Bob"]
+[Result "0-1"]
+[TimeControl "180+2"]
+
+1. f3 {[%clk 0:03:00]} e5 {[%clk 0:02:59.5]} 2. g4 (2. e4 Nc6) $2
+2... Qh4# 0-1
+
+[Event "Test"]
+[White "Bob"]
+[Black "Carol"]
+[Result "1/2-1/2"]
+
+1. e4 e5 ; Zeilenkommentar
+2. Nf3 {Ein Kommentar
+über zwei Zeilen} Nc6 1/2-1/2
+
+[Event "Kaputt"]
+[White "Carol"]
+[Black "Alice"]
+[Result "1-0"]
+
+1. e4 e5 2. Ke3 Ke7 1-0
+"""
+
+
+class TestReadPgn:
+    """Test-Suite für den PGN-Reader."""
+
+    def test_games_and_headers(self):
+        """Test: Partien werden einzeln mit Tags gelesen."""
+        games = list(read_pgn(PGN.splitlines(True)))
+
+        assert len(games) == 3
+        assert games[0].headers['White'] == 'Alice'
+        assert games[1].result == '1/2-1/2'
+
+    def test_movetext(self):
+        """Test: Varianten, NAGs und Kommentare werden übersprungen, Uhrzeiten gelesen."""
+        game = next(read_pgn(PGN.splitlines(True)))
+
+        assert game.moves == ['f3', 'e5', 'g4', 'Qh4#']
+        assert game.clocks == [180, 179.5, None, None]
+        assert game.result == '0-1'
+
+    def test_multiline_comment(self):
+        """Test: Kommentare über mehrere Zeilen stören den Zugtext nicht."""
+        game = list(read_pgn(PGN.splitlines(True)))[1]
+
+        assert game.moves == ['e4', 'e5', 'Nf3', 'Nc6']
+
+    def test_is_lazy(self):
+        """Test: Der Reader liest nur so weit wie nötig (Generator)."""
+        consumed = []
+
+        def lines():
+            for line in PGN.splitlines(True):
+                consumed.append(line)
+                yield line
+
+        next(read_pgn(lines()))
+        assert len(consumed) < len(PGN.splitlines())
+
+
+class TestFormatPgn:
+    """Test-Suite für das Schreiben von PGN."""
+
+    def test_round_trip(self):
+        """Test: Geschriebene Partien werden unverändert wieder gelesen."""
+        game = next(read_pgn(PGN.splitlines(True)))
+        text = format_pgn(game)
+
+        assert text.startswith('[Event "Test"]\n[Site "?"]\n')
+        assert '1. f3 {[%clk 0:03:00]} 1... e5 {[%clk 0:02:59.5]} 2. g4 Qh4# 0-1' in text
+        again = next(read_pgn(text.splitlines(True)))
+        assert (again.moves, again.clocks, again.result) == (game.moves, game.clocks, game.result)
+        assert again.headers == {**game.headers, 'Site': '?', 'Round': '?'}
+
+    def test_fen_start_and_line_length(self):
+        """Test: Zugnummern ab FEN mit Schwarz am Zug, Zeilen höchstens 80 Zeichen."""
+        game = PgnGame(headers={'FEN': '4k3/8/8/8/8/8/8/4K3 b - - 0 30', 'White': 'A "B"'},
+                       moves=['Kd7', 'Kd2'] * 30, result='1/2-1/2')
+        text = format_pgn(game)
+        movetext = text.split('\n\n')[1]
+
+        assert movetext.startswith('30... Kd7 31. Kd2 Kd7')
+        assert max(len(line) for line in movetext.splitlines()) <= 80
+        assert '[White "A \\"B\\""]' in text
+        assert next(read_pgn(text.splitlines(True))).moves == game.moves
+
+
+class TestPgnImport:
+    """Test-Suite für den Datenbank-Import."""
+
+    def test_import(self, temp_db):
+        """Test: Gültige Partien werden mit Boards und Spielern importiert."""
+        progress = []
+        importer = PgnImporter(temp_db, batch_size=2, progress=lambda stats: progress.append(stats.games))
+        stats = importer.import_games(read_pgn(PGN.splitlines(True)))
+
+        assert stats.games == 2
+        assert stats.skipped == 1
+        assert stats.moves == 8
+        assert progress == [2, 2]
+
+        games = temp_db.list_games(limit=10)
+        mate = next(g for g in games if g['white_username'] == 'Alice')
+        assert mate['result'] == 'black_win'
+        assert mate['final_position'] == 'checkmate'
+        assert mate['time_control'] == '3+2'
+        assert mate['start_time'] == '2024-03-01T18:30:00'
+
+        boards = temp_db.get_game_boards(mate['id'])
+        assert [b['notation'] for b in boards] == ['Startposition', 'f3', 'e5', 'g4', 'Qh4#']
+        assert float(boards[2]['black_time']) == 179.5
+
+        bob = temp_db.get_player_by_username('Bob')
+        assert bob['games_played'] == 2
+        assert bob['points'] == 4
+
+    def test_ids_continue_after_existing_games(self, temp_db):
+        """Test: Importierte Spiele bekommen IDs nach den vorhandenen Spielen."""
+        player_id = temp_db.create_player('Dave')
+        game_id = temp_db.create_game(player_id, player_id, 'untimed')
+        PgnImporter(temp_db).import_games(read_pgn(PGN.splitlines(True)))
+
+        ids = sorted(g['id'] for g in temp_db.list_games(limit=10))
+        assert ids == [game_id, game_id + 1, game_id + 2]
+
+    def test_game_without_date_is_oldest(self, temp_db):
+        """Test: Partien ohne Date-Tag bekommen kein Importdatum, sondern gelten als älteste."""
+        PgnImporter(temp_db).import_games(read_pgn(PGN.splitlines(True)))
+
+        games = temp_db.list_games(limit=10)
+        undated = games[-1]
+        assert undated['white_username'] == 'Bob'
+        assert undated['start_time'] == undated['end_time'] == UNKNOWN_START_TIME
+        assert [g['white_username'] for g in temp_db.iter_games()] == ['Bob', 'Alice']
+
+        stream = io.StringIO()
+        export_games(temp_db, stream)
+        exported = list(read_pgn(stream.getvalue().splitlines(True)))
+        assert exported[0].headers['Date'] == '????.??.??'
+        assert 'Time' not in exported[0].headers
+
+    def test_reuse_after_failed_batch(self, temp_db):
+        """Test: Nach einem verworfenen Block werden die Spieler erneut angelegt."""
+        with temp_db._pool.writing() as conn:
+            conn.execute("CREATE TRIGGER reject_games BEFORE INSERT ON games BEGIN SELECT RAISE(ABORT, 'kaputt'); END")
+            conn.commit()
+        importer = PgnImporter(temp_db)
+        with pytest.raises(sqlite3.IntegrityError):
+            importer.import_games(read_pgn(PGN.splitlines(True)))
+        assert temp_db.get_all_players() == []
+
+        with temp_db._pool.writing() as conn:
+            conn.execute('DROP TRIGGER reject_games')
+            conn.commit()
+        importer.import_games(read_pgn(PGN.splitlines(True)))
+
+        assert len(temp_db.list_games(limit=10)) == 2
+        assert {p['username'] for p in temp_db.get_all_players()} == {'Alice', 'Bob', 'Carol'}
+
+    def test_replay_does_not_hold_writer(self, temp_db, monkeypatch):
+        """Test: Beim Nachspielen ist die Schreibverbindung für andere Threads frei."""
+        from chess_project import pgn_import
+
+        writer_free = []
+
+        def replay_game(game, validate=True):
+            free = temp_db._pool._lock.acquire(blocking=False)
+            if free:
+                temp_db._pool._lock.release()
+            writer_free.append(free)
+            return original(game, validate)
+
+        original = pgn_import.replay_game
+        monkeypatch.setattr(pgn_import, 'replay_game', replay_game)
+        PgnImporter(temp_db, batch_size=1).import_games(read_pgn(PGN.splitlines(True)))
+
+        assert writer_free == [True, True, True]
+        assert len(temp_db.list_games(limit=10)) == 2
+
+    def test_cli(self, tmp_path, capsys):
+        """Test: Die Kommandozeile importiert eine Datei und meldet den Durchsatz."""
+        pgn_file = tmp_path / 'archiv.pgn'
+        pgn_file.write_text(PGN, encoding='utf-8')
+        db_path = tmp_path / 'import.db'
+
+        main([str(pgn_file), '--db', str(db_path)])
+
+        assert 'Partien/min' in capsys.readouterr().err
+        with DatabaseManager(str(db_path)) as db:
+            assert len(db.list_games(limit=10)) == 2
@@ -0,0 +1,97 @@
+"""Unit Tests für den PGN-Export."""
+
+import io
+
+from chess_project.board_serialization import decode_board_json
+from chess_project.clock_sources import ManualClock
+from chess_project.database import DatabaseManager
+from chess_project.game_session import GameSession
+from chess_project.pgn import read_pgn
+from chess_project.pgn_export import export_games, main
+from chess_project.pgn_import import PgnImporter
+from chess_project.time_control import TimeControl
+
+
+# Narrenmatt: 1. f3 e5 2. g4 Dh4#
+FOOLS_MATE = [((6, 5), (5, 5)), ((1, 4), (3, 4)), ((6, 6), (4, 6)), ((0, 3), (4, 7))]
+
+
+def _play(db, moves, white='Alice', black='Bob', **kwargs):
+    session = GameSession((None, white), (None, black), db=db, clock=ManualClock(), **kwargs)
+    session.start()
+    for from_pos, to_pos in moves:
+        session.play(from_pos, to_pos)
+    session.stop()
+    return session
+
+
+def _export(db, **filters):
+    stream = io.StringIO()
+    count = export_games(db, stream, **filters)
+    return count, list(read_pgn(io.StringIO(stream.getvalue())))
+
+
+class TestPgnExport:
+    """Test-Suite für den PGN-Export aus der Datenbank."""
+
+    def test_played_game_as_san(self, temp_db):
+        """Test: Gespielte Züge werden als SAN mit Mattzeichen exportiert."""
+        _play(temp_db, FOOLS_MATE)
+
+        count, games = _export(temp_db)
+
+        assert count == 1
+        game = games[0]
+        assert game.moves == ['f3', 'e5', 'g4', 'Qh4#']
+        assert game.result == '0-1'
+        assert game.headers['White'] == 'Alice'
+        assert 'FEN' not in game.headers
+
+    def test_disambiguation_check_and_setup(self, temp_db):
+        """Test: Startstellung per FEN, Unterscheidung gleicher Figuren und Schach."""
+        _play(temp_db, [((7, 1), (6, 3)), ((0, 3), (0, 4)), ((7, 7), (0, 7))],
+              fen='3k4/8/8/8/8/5N2/8/1N3K1R w - - 0 1')
+
+        _, games = _export(temp_db)
+
+        game = games[0]
+        assert game.moves == ['Nbd2', 'Ke8', 'Rh8+']
+        assert game.headers['SetUp'] == '1'
+        assert game.headers['FEN'] == '3k4/8/8/8/8/5N2/8/1N3K1R w - - 0 1'
+        assert game.result == '*'
+
+    def test_clocks_for_timed_games(self, temp_db):
+        """Test: Bei Spielen mit Bedenkzeit werden Restzeiten als %clk exportiert."""
+        _play(temp_db, FOOLS_MATE[:2], use_timer=True, time_control=TimeControl.parse('3+2'))
+
+        _, games = _export(temp_db)
+
+        assert games[0].headers['TimeControl'] == '180+2'
+        assert games[0].clocks == [180, 180]
+
+    def test_filters(self, temp_db):
+        """Test: Export nach Spieler und Ergebnis filtern."""
+        _play(temp_db, FOOLS_MATE)
+        _play(temp_db, FOOLS_MATE[:1], white='Carol', black='Dave')
+        carol = temp_db.get_player_by_username('Carol')
+
+        assert _export(temp_db, player_id=carol['id'])[0] == 1
+        assert _export(temp_db, result='black_win')[0] == 1
+        assert _export(temp_db, date_from='2999-01-01')[0] == 0
+
+    def test_round_trip(self, temp_db, tmp_path):
+        """Test: Exportierte Partien lassen sich wieder importieren."""
+        _play(temp_db, FOOLS_MATE)
+        pgn_file = tmp_path / 'export.pgn.gz'
+        db_path = tmp_path / 'copy.db'
+        temp_db.conn.commit()
+
+        main(['--db', temp_db.db_path, '-o', str(pgn_file)])
+        with DatabaseManager(str(db_path)) as copy:
+            stats = PgnImporter(copy).import_file(str(pgn_file))
+            assert stats.games == 1
+            boards = copy.get_game_boards(copy.list_games()[0]['id'])
+
+        original = temp_db.get_game_boards(temp_db.list_games()[0]['id'])
+        assert ([decode_board_json(b['board_JSON'])[0] for b in boards]
+                == [decode_board_json(b['board_JSON'])[0] for b in original])
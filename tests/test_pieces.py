@@ -3,6 +3,8 @@
 import pytest
 import numpy as np
 from chess_project.board import Board
+from chess_project.chess_logic import ChessLogic
+from chess_project import pieces
 from chess_project.pieces import King, Queen, Rook, Bishop, Knight, Pawn
 from chess_project.move import Move
 
@@ -24,6 +26,15 @@ class TestPawn:
         black_pawn = Pawn('black', (6, 0))
         assert white_pawn.get_image_path().endswith('white_P.png')
         assert black_pawn.get_image_path().endswith('black_P.png')
+
+    def test_image_path_is_cached(self, monkeypatch):
+        """Test: Bildpfade werden nur einmal je (color, notation) aufgelöst."""
+        monkeypatch.setattr(pieces, '_IMAGE_PATHS', {})
+        pieces.warm_image_paths()
+        assert len(pieces._IMAGE_PATHS) == 12
+
+        monkeypatch.setattr(pieces.importlib.resources, 'files', None)
+        assert Pawn('white', (6, 0)).get_image_path() == pieces._IMAGE_PATHS[('white', 'P')]
     
     def test_pawn_single_move_forward(self):
         """Test: Bauer kann ein Feld vorwärts ziehen."""
@@ -50,6 +61,32 @@ class TestPawn:
         assert (3, 4) in move_targets  # Doppelzug möglich
 
 
+    @pytest.mark.parametrize('fen, from_pos, to_pos', [
+        # a- und h-Linie; das Feld vor dem Bauern ist jeweils besetzt
+        ('4k3/8/r7/Pp6/8/8/8/4K3 w - b6 0 2', (3, 0), (2, 1)),
+        ('4k3/8/7r/6pP/8/8/8/4K3 w - g6 0 2', (3, 7), (2, 6)),
+    ])
+    def test_en_passant_on_edge_file(self, fen, from_pos, to_pos):
+        """Test: En passant von der a-/h-Linie, auch wenn das Feld vor dem Bauern besetzt ist."""
+        board = Board.from_fen(fen)
+        pawn = board.squares[from_pos]
+
+        en_passant = [move for move in pawn.get_legal_moves(board) if move.en_passant]
+
+        assert [move.to_pos for move in en_passant] == [to_pos]
+        assert en_passant[0].captured is board.squares[from_pos[0], to_pos[1]]
+
+        legal = ChessLogic(board).all_legal_moves(board.en_passant_move(), 'white')
+        assert any(move.en_passant and move.to_pos == to_pos for move in legal)
+
+    def test_no_en_passant_onto_occupied_square(self):
+        """Test: Ist das Feld hinter dem gegnerischen Bauern besetzt, gibt es kein En passant."""
+        board = Board.from_fen('4k3/8/1n6/Pp6/8/8/8/4K3 w - - 0 2')
+        pawn = board.squares[3, 0]
+
+        assert not any(move.en_passant for move in pawn.get_legal_moves(board))
+
+
 class TestKnight:
     """Test-Suite für Knight-Klasse."""
     
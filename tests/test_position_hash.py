@@ -0,0 +1,47 @@
+"""Unit Tests für Positions-Hashes (Zobrist)."""
+
+from chess_project.board import Board
+from chess_project.board_serialization import serialize_board
+from chess_project.chess_logic import ChessLogic
+from chess_project.fen import START_FEN
+from chess_project.position_hash import hash_board_json, hash_fen, hash_squares
+from chess_project.san import find_san_move
+
+
+class TestPositionHash:
+    """Test-Suite für position_hash."""
+
+    def test_representations_agree(self):
+        """Test: Board, Board-JSON und FEN ergeben denselben Hash."""
+        board = Board.from_fen('r3k2r/pPp2ppp/8/3pP3/8/5N2/P4PPP/RN2K2R b KQkq - 0 1')
+
+        expected = hash_squares(board.squares, board.turn)
+        assert hash_board_json(serialize_board(board.squares, turn=board.turn)) == expected
+        assert hash_fen(board.to_fen()) == expected
+
+    def test_distinguishes_turn_and_pieces(self):
+        """Test: Spieler am Zug und Figurenstellung gehen in den Hash ein."""
+        start = hash_fen(START_FEN)
+
+        assert hash_fen(START_FEN.replace(' w ', ' b ')) != start
+        assert hash_fen('rnbqkbnr/pppppppp/8/8/8/5N2/PPPPPPPP/RNBQKB1R w KQkq - 0 1') != start
+        # Rochaderechte und Zugzähler zählen nicht
+        assert hash_fen('rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 5 9') == start
+
+    def test_signed_64_bit(self):
+        """Test: Hashes passen in einen SQLite-INTEGER."""
+        value = hash_fen(START_FEN)
+
+        assert -(1 << 63) <= value < (1 << 63)
+
+    def test_transposition(self):
+        """Test: Dieselbe Stellung über verschiedene Zugfolgen ergibt denselben Hash."""
+        hashes = []
+        for order in (['Nf3', 'Nf6', 'Nc3'], ['Nc3', 'Nf6', 'Nf3']):
+            board = Board.from_fen()
+            logic = ChessLogic(board)
+            for san in order:
+                board.make_move(find_san_move(logic, san, board.turn))
+            hashes.append(hash_squares(board.squares, board.turn))
+
+        assert hashes[0] == hashes[1]
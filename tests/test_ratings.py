@@ -0,0 +1,149 @@
+"""Unit Tests für Elo- und Glicko-2-Wertungen."""
+
+import os
+import random
+import sqlite3
+import tempfile
+
+import numpy as np
+import pytest
+from chess_project.database import DatabaseManager
+from chess_project.pgn import read_pgn
+from chess_project.pgn_import import PgnImporter
+from chess_project.ratings import (
+    ELO_DEFAULT, Rating, batch_ratings, elo_expected, elo_update, rate_game, rounds,
+)
+
+
+class TestRatingFormulas:
+    """Test-Suite für die Wertung einzelner Partien."""
+
+    def test_elo(self):
+        """Test: Gleich starke Spieler tauschen K/2 Punkte aus."""
+        assert elo_expected(1500, 1500) == 0.5
+        assert elo_expected(1900, 1500) == pytest.approx(0.909, abs=1e-3)
+        assert elo_update(1500, 1500, 1.0) == 1516.0
+        assert elo_update(1500, 1500, 0.5) == 1500.0
+
+    def test_glicko2_new_players(self):
+        """Test: Sieg zwischen zwei neuen Spielern (Referenzwerte Glicko-2)."""
+        white, black = rate_game(Rating(), Rating(), 1.0)
+
+        assert white.glicko == pytest.approx(1662.31, abs=0.01)
+        assert black.glicko == pytest.approx(1337.69, abs=0.01)
+        assert white.rd == pytest.approx(290.32, abs=0.01)
+        assert white.volatility == pytest.approx(0.06, abs=1e-4)
+
+    def test_draw_between_equals(self):
+        """Test: Remis gleich starker Spieler ändert nur die Unsicherheit."""
+        white, black = rate_game(Rating(), Rating(), 0.5)
+
+        assert white.elo == black.elo == ELO_DEFAULT
+        assert white.glicko == pytest.approx(1500.0)
+        assert white.rd < Rating().rd
+
+
+class TestBatchRatings:
+    """Test-Suite für die Neuberechnung ganzer Spielhistorien."""
+
+    def test_rounds_keep_order_per_player(self):
+        """Test: Jeder Spieler kommt je Runde höchstens einmal vor, in Spielreihenfolge."""
+        white = [0, 2, 0, 1, 3]
+        black = [1, 3, 2, 2, 0]
+
+        assert rounds(white, black) == [[0, 1], [2], [3, 4]]
+
+    def test_matches_incremental(self):
+        """Test: Die vektorisierte Neuberechnung ergibt dieselben Werte wie Partie für Partie."""
+        rng = random.Random(7)
+        players = 12
+        white = [rng.randrange(players) for _ in range(500)]
+        black = [(w + rng.randrange(1, players)) % players for w in white]
+        scores = [rng.choice((1.0, 0.5, 0.0)) for _ in white]
+
+        ratings = [Rating()] * players
+        history = []
+        for w, b, score in zip(white, black, scores):
+            ratings[w], ratings[b] = rate_game(ratings[w], ratings[b], score)
+            history.append([[r.elo, r.glicko, r.rd] for r in (ratings[w], ratings[b])])
+
+        batch = batch_ratings(white, black, scores, players)
+
+        assert np.allclose(batch.elo, [r.elo for r in ratings])
+        assert np.allclose(batch.glicko, [r.glicko for r in ratings])
+        assert np.allclose(batch.rd, [r.rd for r in ratings])
+        assert np.allclose(batch.volatility, [r.volatility for r in ratings])
+        assert np.allclose(batch.history, history)
+
+
+class TestDatabaseRatings:
+    """Test-Suite für Wertungen in der Datenbank."""
+
+    def _play(self, db, white, black, result):
+        game_id = db.create_game(white, black, 'untimed')
+        db.finish_game(game_id, result, 'checkmate')
+        return game_id
+
+    def test_finish_game_rates_and_records_history(self, temp_db):
+        """Test: finish_game schreibt neue Wertungen und je Spieler einen Verlaufseintrag."""
+        alice = temp_db.create_player('Alice')
+        bob = temp_db.create_player('Bob')
+        first = self._play(temp_db, alice, bob, 'white_win')
+        second = self._play(temp_db, bob, alice, 'draw')
+
+        rating = temp_db.get_player_rating(alice)
+        assert rating.elo > ELO_DEFAULT
+        assert temp_db.get_player(alice)['elo'] == rating.elo
+        history = temp_db.get_rating_history(alice)
+        assert [entry['game_id'] for entry in history] == [first, second]
+        assert history[0]['elo'] == 1516.0
+        assert history[-1]['glicko_rating'] == rating.glicko
+
+    def test_recompute_matches_incremental(self, temp_db):
+        """Test: recompute_ratings stellt die inkrementell berechneten Werte wieder her."""
+        ids = [temp_db.create_player(name) for name in ('A', 'B', 'C')]
+        for white, black, result in ((0, 1, 'white_win'), (1, 2, 'draw'), (2, 0, 'black_win'), (0, 1, 'black_win')):
+            self._play(temp_db, ids[white], ids[black], result)
+        incremental = [temp_db.get_player_rating(player_id) for player_id in ids]
+        histories = [temp_db.get_rating_history(player_id) for player_id in ids]
+
+        assert temp_db.recompute_ratings() == 4
+
+        for player_id, rating, history in zip(ids, incremental, histories):
+            recomputed = temp_db.get_player_rating(player_id)
+            assert recomputed.elo == pytest.approx(rating.elo)
+            assert recomputed.glicko == pytest.approx(rating.glicko)
+            assert recomputed.volatility == pytest.approx(rating.volatility)
+            assert [e['game_id'] for e in temp_db.get_rating_history(player_id)] == [e['game_id'] for e in history]
+
+    def test_import_orders_by_end_time(self, temp_db):
+        """Test: Nach dem PGN-Import werden alle Spiele chronologisch neu gewertet."""
+        alice = temp_db.create_player('Alice')
+        bob = temp_db.create_player('Bob')
+        self._play(temp_db, alice, bob, 'white_win')
+        pgn = '[Date "2001.01.01"]\n[White "Bob"]\n[Black "Alice"]\n[Result "1-0"]\n\n1. e4 1-0\n'
+
+        PgnImporter(temp_db).import_games(read_pgn(pgn.splitlines(True)))
+
+        # Die importierte Partie von 2001 wird vor der heutigen gewertet
+        history = temp_db.get_rating_history(alice)
+        assert [entry['elo'] for entry in history] == [1484.0, pytest.approx(1484.0 + 32 * (1 - elo_expected(1484, 1516)))]
+
+    def test_migrates_players_without_ratings(self):
+        """Test: Ältere Datenbanken erhalten die Wertungsspalten mit Startwerten."""
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        try:
+            conn = sqlite3.connect(path)
+            conn.execute('CREATE TABLE players (id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE NOT NULL, '
+                         'points INTEGER DEFAULT 0, games_played INTEGER DEFAULT 0, games_won INTEGER DEFAULT 0, '
+                         'created_at TEXT DEFAULT CURRENT_TIMESTAMP)')
+            conn.execute("INSERT INTO players (username) VALUES ('Alt')")
+            conn.commit()
+            conn.close()
+
+            with DatabaseManager(path) as db:
+                player = db.get_player_by_username('Alt')
+                assert db.get_player_rating(player['id']) == Rating()
+        finally:
+            os.remove(path)
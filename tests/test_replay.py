@@ -0,0 +1,186 @@
+"""Unit Tests für ReplayNavigator, DecodedGame und ReplayCache."""
+
+import pytest
+from chess_project.board import Board
+from chess_project.board_serialization import serialize_board, decode_board_json
+from chess_project.move import Move
+from chess_project.replay import DecodedGame, ReplayCache, ReplayNavigator, entry_for_code
+
+
+def _snapshot(board, turn, ply):
+    """Erstellt eine Board-Zeile wie sie get_game_boards liefert."""
+    return {
+        'board_number': ply,
+        'board_JSON': serialize_board(board.squares, turn, white_time=600 - ply, black_time=600),
+        'notation': 'Startposition' if ply == 0 else f'ply{ply}',
+    }
+
+
+def _position(squares):
+    """Wandelt ein Board-Array in vergleichbare (color, notation)-Einträge um."""
+    return [
+        (squares[r, c].color, squares[r, c].notation) if squares[r, c] else None
+        for r in range(8) for c in range(8)
+    ]
+
+
+@pytest.fixture
+def recorded_game():
+    """Spielt 1. e4 d5 2. exd5 Qxd5 und zeichnet alle Stellungen auf."""
+    board = Board()
+    board.setup_startpos()
+    boards = [_snapshot(board, 'white', 0)]
+
+    moves = [((6, 4), (4, 4)), ((1, 3), (3, 3)), ((4, 4), (3, 3)), ((0, 3), (3, 3))]
+    turn = 'white'
+    for ply, (from_pos, to_pos) in enumerate(moves, 1):
+        piece = board.squares[from_pos]
+        captured = board.squares[to_pos]
+        board.make_move(Move(from_pos, to_pos, piece, captured))
+        turn = 'black' if turn == 'white' else 'white'
+        boards.append(_snapshot(board, turn, ply))
+    return boards
+
+
+class TestReplayNavigator:
+    """Test-Suite für ReplayNavigator."""
+
+    def test_starts_at_first_position(self, recorded_game):
+        """Test: Navigator zeigt zu Beginn die Startposition."""
+        navigator = ReplayNavigator(DecodedGame(None, recorded_game))
+
+        assert navigator.index == 0
+        expected, _ = decode_board_json(recorded_game[0]['board_JSON'])
+        assert _position(navigator.board.squares) == expected
+        assert len(navigator.board.white_pieces) == 16
+        assert len(navigator.board.black_pieces) == 16
+
+    def test_step_forward_matches_snapshots(self, recorded_game):
+        """Test: Schrittweises Vorgehen ergibt exakt die gespeicherten Stellungen."""
+        navigator = ReplayNavigator(DecodedGame(None, recorded_game))
+
+        for index in range(1, len(recorded_game)):
+            squares = navigator.go_to(index)
+            expected, metadata = decode_board_json(recorded_game[index]['board_JSON'])
+            assert _position(squares) == expected
+            assert navigator.metadata == metadata
+
+        # Nach 2. exd5 Qxd5 fehlt je ein Bauer
+        assert len(navigator.board.white_pieces) == 15
+        assert len(navigator.board.black_pieces) == 15
+
+    def test_step_back_restores_captured_pieces(self, recorded_game):
+        """Test: Zurückgehen stellt geschlagene Figuren wieder her."""
+        navigator = ReplayNavigator(DecodedGame(None, recorded_game))
+        navigator.jump(len(recorded_game) - 1)
+
+        for index in range(len(recorded_game) - 2, -1, -1):
+            squares = navigator.go_to(index)
+            expected, _ = decode_board_json(recorded_game[index]['board_JSON'])
+            assert _position(squares) == expected
+
+        assert len(navigator.board.white_pieces) == 16
+        assert len(navigator.board.black_pieces) == 16
+
+    def test_steps_reuse_piece_objects(self, recorded_game):
+        """Test: Hin- und Herschalten erzeugt keine neuen Figuren."""
+        navigator = ReplayNavigator(DecodedGame(None, recorded_game))
+        navigator.go_to(1)
+        navigator.go_to(0)
+
+        pawn = navigator.board.squares[6, 4]
+        navigator.go_to(1)
+        assert navigator.board.squares[4, 4] is pawn
+        assert pawn.position == (4, 4)
+
+        navigator.go_to(0)
+        assert navigator.board.squares[6, 4] is pawn
+
+    def test_jump_keeps_king_references(self, recorded_game):
+        """Test: Sprünge halten die König-Referenzen des Boards aktuell."""
+        navigator = ReplayNavigator(DecodedGame(None, recorded_game))
+        navigator.go_to(4)
+
+        assert navigator.board.white_king is navigator.board.squares[7, 4]
+        assert navigator.board.black_king is navigator.board.squares[0, 4]
+
+    def test_out_of_range_index(self, recorded_game):
+        """Test: Ungültige Indizes werden abgelehnt."""
+        navigator = ReplayNavigator(DecodedGame(None, recorded_game))
+
+        with pytest.raises(IndexError):
+            navigator.go_to(len(recorded_game))
+
+
+class TestDecodedGame:
+    """Test-Suite für DecodedGame."""
+
+    def test_first_position_decoded_synchronously(self, recorded_game):
+        """Test: Die erste Stellung ist sofort verfügbar."""
+        game = DecodedGame(None, recorded_game, background=False)
+
+        assert game._decoded[0]
+        assert not any(game._decoded[1:])
+        assert entry_for_code(game.positions[0][60]) == ('white', 'K')
+        assert entry_for_code(game.positions[0][4]) == ('black', 'K')
+
+    def test_background_decodes_all_positions(self, recorded_game):
+        """Test: Der Hintergrund-Thread dekodiert alle Stellungen."""
+        game = DecodedGame(None, recorded_game)
+        game.wait(timeout=5)
+
+        assert game.is_complete
+        assert game.positions.dtype.name == 'int8'
+        for index, row in enumerate(recorded_game):
+            expected, metadata = decode_board_json(row['board_JSON'])
+            assert [entry_for_code(code) for code in game.positions[index]] == expected
+            assert game.metadata(index) == metadata
+
+
+class TestReplayCache:
+    """Test-Suite für ReplayCache."""
+
+    def _loader(self, recorded_game, calls, end_time='2024-01-01T10:00:00'):
+        def load(game_id):
+            calls.append(game_id)
+            return {'id': game_id, 'end_time': end_time}, recorded_game
+        return load
+
+    def test_cache_hit_skips_loader(self, recorded_game):
+        """Test: Erneutes Öffnen greift nicht auf die Datenbank zu."""
+        cache = ReplayCache()
+        calls = []
+        loader = self._loader(recorded_game, calls)
+
+        first = cache.get(1, loader)
+        second = cache.get(1, loader)
+
+        assert first is second
+        assert calls == [1]
+
+    def test_lru_eviction(self, recorded_game):
+        """Test: Das am längsten nicht angesehene Spiel wird verdrängt."""
+        cache = ReplayCache(max_games=2)
+        calls = []
+        loader = self._loader(recorded_game, calls)
+
+        cache.get(1, loader)
+        cache.get(2, loader)
+        cache.get(1, loader)
+        cache.get(3, loader)
+
+        assert 1 in cache
+        assert 2 not in cache
+        assert 3 in cache
+
+    def test_unfinished_games_not_cached(self, recorded_game):
+        """Test: Laufende Spiele werden nicht gecacht."""
+        cache = ReplayCache()
+        calls = []
+        loader = self._loader(recorded_game, calls, end_time=None)
+
+        cache.get(1, loader)
+        cache.get(1, loader)
+
+        assert calls == [1, 1]
+        assert len(cache) == 0
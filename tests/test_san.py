@@ -0,0 +1,137 @@
+"""Unit Tests für SAN (Standard Algebraic Notation)."""
+
+import pytest
+from chess_project.board import Board
+from chess_project.chess_logic import ChessLogic
+from chess_project.san import SanWriter, find_san_move, move_to_san, parse_san
+
+
+def _find(fen, san, validate=True):
+    board = Board.from_fen(fen)
+    return find_san_move(ChessLogic(board), san, board.turn, board.en_passant_move(), validate=validate)
+
+
+class TestParseSan:
+    """Test-Suite für das Zerlegen von SAN-Strings."""
+
+    def test_piece_move_with_disambiguation(self):
+        """Test: Figur, Ausgangsspalte, Schlag und Zielfeld werden erkannt."""
+        parsed = parse_san('Nbxd7+')
+
+        assert parsed.piece == 'N'
+        assert parsed.from_col == 1
+        assert parsed.from_row is None
+        assert parsed.capture
+        assert parsed.to_pos == (1, 3)
+
+    def test_pawn_promotion_and_castling(self):
+        """Test: Umwandlung und Rochade (auch mit Nullen) werden erkannt."""
+        assert parse_san('exd8=Q#').promotion == 'Q'
+        assert parse_san('e8Q').promotion == 'Q'
+        assert parse_san('0-0-0').castling == 'O-O-O'
+        assert parse_san('O-O!?').castling == 'O-O'
+
+    @pytest.mark.parametrize('san', ['', 'Xe4', 'e9', 'Nbd', 'e8=K'])
+    def test_invalid(self, san):
+        """Test: Ungültige Notation wirft einen ValueError."""
+        with pytest.raises(ValueError):
+            parse_san(san)
+
+
+class TestFindSanMove:
+    """Test-Suite für das Auflösen von SAN in der Stellung."""
+
+    def test_disambiguation_by_file(self):
+        """Test: Zwei Springer, die d2 erreichen, werden über die Spalte unterschieden."""
+        fen = '4k3/8/8/8/8/5N2/8/1N2K3 w - - 0 1'
+        assert _find(fen, 'Nbd2').from_pos == (7, 1)
+        assert _find(fen, 'Nfd2').from_pos == (5, 5)
+        with pytest.raises(ValueError):
+            _find(fen, 'Nd2')
+
+    def test_pinned_piece_needs_no_disambiguation(self):
+        """Test: Ein gefesselter Springer zählt nicht als zweiter Kandidat."""
+        fen = '4k3/4r3/8/8/8/8/2N1N3/4K3 w - - 0 1'
+        move = _find(fen, 'Nd4', validate=False)
+
+        assert move.from_pos == (6, 2)
+
+    def test_illegal_move_rejected(self):
+        """Test: Ein Zug, der den eigenen König im Schach lässt, wird abgelehnt."""
+        with pytest.raises(ValueError):
+            _find('4k3/4r3/8/8/8/8/4N3/4K3 w - - 0 1', 'Nd4')
+
+    def test_promotion(self):
+        """Test: Die Umwandlungsfigur wird in den Move übernommen."""
+        move = _find('4k3/P7/8/8/8/8/8/4K3 w - - 0 1', 'a8=N')
+
+        assert move.promotion == 'N'
+        with pytest.raises(ValueError):
+            _find('4k3/P7/8/8/8/8/8/4K3 w - - 0 1', 'a8')
+
+    def test_en_passant(self):
+        """Test: En passant auf der a-Linie über das FEN-En-passant-Feld."""
+        move = _find('4k3/8/8/Pp6/8/8/8/4K3 w - b6 0 1', 'axb6')
+
+        assert move.en_passant
+        assert move.captured.position == (3, 1)
+
+    def test_castling(self):
+        """Test: Rochade wird nur mit Rochaderecht gefunden."""
+        move = _find('r3k2r/8/8/8/8/8/8/R3K2R b Qk - 0 1', 'O-O')
+
+        assert move.to_pos == (0, 6)
+        assert move.castelling is not None
+        with pytest.raises(ValueError):
+            _find('r3k2r/8/8/8/8/8/8/R3K2R b Qk - 0 1', 'O-O-O')
+
+
+class TestMoveToSan:
+    """Test-Suite für das Erzeugen von SAN."""
+
+    def _san(self, fen, from_pos, to_pos, **kwargs):
+        board = Board.from_fen(fen)
+        legal_moves = ChessLogic(board).all_legal_moves(board.en_passant_move(), board.turn)
+        move = next(m for m in legal_moves if m.from_pos == from_pos and m.to_pos == to_pos)
+        return move_to_san(move, legal_moves, **kwargs)
+
+    def test_disambiguation(self):
+        """Test: Spalte, Reihe oder beides je nach konkurrierender Figur."""
+        assert self._san('4k3/8/8/8/8/5N2/8/1N2K3 w - - 0 1', (7, 1), (6, 3)) == 'Nbd2'
+        assert self._san('4k3/8/8/R7/8/8/8/R3K3 w - - 0 1', (7, 0), (5, 0)) == 'R1a3'
+        assert self._san('4k3/8/8/8/8/Q1Q5/8/Q3K3 w - - 0 1', (5, 0), (6, 1)) == 'Qa3b2'
+
+    def test_pinned_rival_is_ignored(self):
+        """Test: Ein gefesselter Springer erzwingt keine Unterscheidung."""
+        assert self._san('4k3/4r3/8/8/8/8/2N1N3/4K3 w - - 0 1', (6, 2), (4, 3)) == 'Nd4'
+
+    def test_pawns_castling_and_suffixes(self):
+        """Test: Bauernschlag mit Spalte, Umwandlung, Rochade und Schach/Matt."""
+        assert self._san('4k3/8/8/Pp6/8/8/8/4K3 w - b6 0 1', (3, 0), (2, 1)) == 'axb6'
+        assert self._san('4k3/P7/8/8/8/8/8/4K3 w - - 0 1', (1, 0), (0, 0), check=True) == 'a8=Q+'
+        assert self._san('4k3/8/8/8/8/8/8/4K2R w K - 0 1', (7, 4), (7, 6)) == 'O-O'
+        assert self._san('4k3/8/8/8/8/8/8/R3K3 w Q - 0 1', (7, 4), (7, 2), mate=True) == 'O-O-O#'
+
+
+class TestSanWriter:
+    """Test-Suite für SanWriter (SAN aus der legalen Zugliste)."""
+
+    def _writer(self, fen):
+        board = Board.from_fen(fen)
+        return SanWriter(ChessLogic(board).all_legal_moves(board.en_passant_move(), board.turn))
+
+    def test_round_trip(self):
+        """Test: Jeder legale Zug wird über seine SAN wiedergefunden."""
+        writer = self._writer('r3k2r/pPp2ppp/8/3pP3/8/5N2/P4PPP/RN2K2R w KQkq d6 0 1')
+
+        for move in writer.legal_moves:
+            assert writer.find(writer.san(move)) is move
+
+    def test_find_errors(self):
+        """Test: Mehrdeutige, illegale und unvollständige Züge werden abgelehnt."""
+        writer = self._writer('4k3/8/8/8/8/5N2/8/1N2K3 w - - 0 1')
+
+        assert writer.find('Nbd2+').from_pos == (7, 1)
+        for san in ('Nd2', 'Nd3', 'Ke3x'):
+            with pytest.raises(ValueError):
+                writer.find(san)
@@ -0,0 +1,47 @@
+"""Unit Tests für das Startprofil und den schlanken App-Start."""
+
+import os
+import subprocess
+import sys
+
+from chess_project.startup_profile import format_report, parse_importtime
+
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        300 |     numpy.core
+import time:      1500 |       1800 |   numpy
+import time:        80 |       2000 | chess_project.board
+"""
+
+
+class TestStartupProfile:
+    """Test-Suite für die Auswertung von -X importtime."""
+
+    def test_parse_importtime(self):
+        """Test: Zeilen werden mit Zeiten und Tiefe eingelesen, der Kopf ignoriert."""
+        timings = parse_importtime(SAMPLE + "Traceback: irgendwas\n")
+
+        assert [t.module for t in timings] == ['_io', 'numpy.core', 'numpy', 'chess_project.board']
+        assert timings[2].self_us == 1500
+        assert timings[2].cumulative_us == 1800
+        assert [t.depth for t in timings] == [1, 2, 1, 0]
+
+    def test_format_report(self):
+        """Test: Der Bericht nennt Gesamtzeit, markierte Module und die Top-Liste."""
+        report = format_report(parse_importtime(SAMPLE), target='chess_project.board', top=2)
+
+        assert report.splitlines()[0] == 'Import-Profil für chess_project.board: 2.0 ms, 4 Module'
+        assert '  numpy: geladen' in report
+        assert '  chess_project.ui.screens: nicht geladen' in report
+        assert '      1.5 ms  numpy' in report
+        assert 'numpy.core' not in report.split('Gesamtzeit')[1]
+
+    def test_controller_starts_lazily(self, tmp_path):
+        """Test: GameController lädt weder numpy noch öffnet er chess.db beim Erstellen."""
+        code = ("import sys, os; from chess_project.game_controller import GameController; "
+                "GameController(None, None); "
+                "sys.exit('numpy' in sys.modules or os.path.exists('chess.db'))")
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        assert subprocess.run([sys.executable, '-c', code], cwd=tmp_path, env=env).returncode == 0
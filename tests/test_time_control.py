@@ -0,0 +1,59 @@
+"""Unit Tests für TimeControl."""
+
+import pytest
+from chess_project.time_control import DELAY_BRONSTEIN, DELAY_SIMPLE, TimeControl
+
+
+class TestTimeControl:
+    """Test-Suite für TimeControl."""
+
+    def test_parse_minutes(self):
+        """Test: Reine Minutenangabe ohne Inkrement."""
+        control = TimeControl.parse('10')
+        assert control.initial_ms == 600000
+        assert control.stages[0].increment_ms == 0
+        assert control.to_spec() == '10'
+
+    def test_parse_increment(self):
+        """Test: Fischer-Inkrement in Sekunden."""
+        control = TimeControl.parse('5+3')
+        assert control.initial_ms == 300000
+        assert control.stages[0].increment_ms == 3000
+        assert control.to_spec() == '5+3'
+
+    def test_parse_delays(self):
+        """Test: US- und Bronstein-Delay."""
+        simple = TimeControl.parse('5d3').stages[0]
+        bronstein = TimeControl.parse('5b3').stages[0]
+        assert (simple.delay_mode, simple.delay_ms) == (DELAY_SIMPLE, 3000)
+        assert (bronstein.delay_mode, bronstein.delay_ms) == (DELAY_BRONSTEIN, 3000)
+
+    def test_parse_multi_stage(self):
+        """Test: Mehrere Perioden (40 Züge in 90 Minuten, dann 30 Minuten)."""
+        control = TimeControl.parse('40/90+30, 30+30')
+        assert len(control.stages) == 2
+        assert control.stages[0].moves == 40
+        assert control.stages[1].base_ms == 1800000
+        assert control.to_spec() == '40/90+30, 30+30'
+
+    @pytest.mark.parametrize('spec', ['', 'abc', '5+', '0', '90, 30', '5x3'])
+    def test_parse_invalid(self, spec):
+        """Test: Ungültige Angaben werden abgelehnt."""
+        with pytest.raises(ValueError):
+            TimeControl.parse(spec)
+
+    def test_stage_transition(self):
+        """Test: Nach dem 40. Zug wird die Zeit der nächsten Periode gutgeschrieben."""
+        control = TimeControl.parse('40/90+30, 30+30')
+        assert control.stage_for_move(40) == 0
+        assert control.stage_for_move(41) == 1
+        assert control.time_added_after_move(39) == 0
+        assert control.time_added_after_move(40) == 1800000
+        assert control.time_added_after_move(80) == 0
+
+    def test_repeating_last_stage(self):
+        """Test: Eine begrenzte letzte Periode wiederholt sich."""
+        control = TimeControl.parse('40/120')
+        assert control.time_added_after_move(40) == 7200000
+        assert control.time_added_after_move(60) == 0
+        assert control.time_added_after_move(80) == 7200000